@@ -0,0 +1,78 @@
+"""Synthetic Keras models of configurable size used by the toolchain benchmarks.
+
+Every model is a stack of ``depth`` layers of the same kind, with ``width`` units (or filters), and deterministic weights,
+so the benchmarks measure the same model on every run.
+"""
+
+import numpy as np
+
+
+def dense_model(depth, width):
+    """A multilayer perceptron: ``depth`` fully connected layers of ``width`` units with ReLU activations."""
+    from tensorflow.keras.layers import Dense, Input
+    from tensorflow.keras.models import Model
+
+    x_in = Input(shape=(width,), name='x')
+    x = x_in
+    for i in range(depth):
+        x = Dense(width, activation='relu', name=f'dense_{i}')(x)
+    x = Dense(10, name='output')(x)
+    return Model(inputs=x_in, outputs=x)
+
+
+def conv_model(depth, width):
+    """A convolutional network: ``depth`` 3x3 convolutions with ``width`` filters on an 8x8 image, then a dense layer."""
+    from tensorflow.keras.layers import Conv2D, Dense, Flatten, Input
+    from tensorflow.keras.models import Model
+
+    x_in = Input(shape=(8, 8, 3), name='x')
+    x = x_in
+    for i in range(depth):
+        x = Conv2D(width, (3, 3), padding='same', activation='relu', name=f'conv_{i}')(x)
+    x = Flatten(name='flatten')(x)
+    x = Dense(10, name='output')(x)
+    return Model(inputs=x_in, outputs=x)
+
+
+def rnn_model(depth, width):
+    """A recurrent network: ``depth`` LSTM layers of ``width`` units over a sequence of 8 steps, then a dense layer."""
+    from tensorflow.keras.layers import LSTM, Dense, Input
+    from tensorflow.keras.models import Model
+
+    x_in = Input(shape=(8, width), name='x')
+    x = x_in
+    for i in range(depth):
+        x = LSTM(width, return_sequences=i < depth - 1, name=f'lstm_{i}')(x)
+    x = Dense(10, name='output')(x)
+    return Model(inputs=x_in, outputs=x)
+
+
+models = {
+    'mlp': dense_model,
+    'cnn': conv_model,
+    'rnn': rnn_model,
+}
+
+
+def make_model(name, depth, width, seed=0):
+    """Create one of the synthetic models.
+
+    Args:
+        name (str): Kind of model, one of ``models``.
+        depth (int): Number of hidden layers.
+        width (int): Number of units or filters of the hidden layers.
+        seed (int, optional): Seed of the random initialization of the weights. Defaults to 0.
+
+    Returns:
+        keras.Model: The model.
+    """
+    import tensorflow as tf
+
+    tf.keras.utils.set_random_seed(seed)
+    return models[name](depth, width)
+
+
+def make_inputs(model, n_samples, seed=0):
+    """Create random C-contiguous inputs for a model, as expected by ``ModelGraph.predict``."""
+    rng = np.random.default_rng(seed)
+    return np.ascontiguousarray(rng.uniform(-1, 1, size=(n_samples, *model.input_shape[1:])))
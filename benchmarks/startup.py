@@ -0,0 +1,72 @@
+"""Benchmarks of the start-up cost of hls4ml: importing the package and creating the backends on first use.
+
+The benchmarks follow the conventions of airspeed velocity (asv): the code returned by a ``timeraw_*`` method is timed in a
+new Python process, so the cost of the imports is included. They can also be run without asv with
+``python benchmarks/startup.py``.
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+backends = ['Vivado', 'Vitis', 'Quartus', 'oneAPI', 'Catapult', 'SymbolicExpression']
+
+
+class ImportSuite:
+    def timeraw_import_hls4ml(self):
+        return 'import hls4ml'
+
+    def timeraw_import_converters(self):
+        return 'from hls4ml.converters import convert_from_keras_model'
+
+    def timeraw_keras_handlers(self):
+        # Importing the Keras layer handlers, done when the first Keras model is converted
+        return 'hls4ml.converters.get_supported_keras_layers()', 'import hls4ml'
+
+    def timeraw_model_passes(self):
+        # Importing the backend-independent optimizer passes
+        return 'hls4ml.model.optimizer.get_optimizer("eliminate_linear_activation")', 'import hls4ml'
+
+
+class BackendSuite:
+    params = backends
+    param_names = ['backend']
+
+    def timeraw_get_backend(self, backend):
+        return f'hls4ml.backends.get_backend({backend!r})', 'import hls4ml'
+
+
+def _time_in_new_process(code, setup='', repeat=5):
+    script = f'''
+import time
+{setup}
+start = time.perf_counter()
+{code}
+print(time.perf_counter() - start)
+'''
+    times = []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, '-c', script], check=True, capture_output=True, text=True)
+        times.append(float(result.stdout.split()[-1]))
+    return statistics.median(times)
+
+
+def main():
+    cases = []
+    import_suite = ImportSuite()
+    for name in ('import_hls4ml', 'import_converters', 'keras_handlers', 'model_passes'):
+        cases.append((name, getattr(import_suite, 'timeraw_' + name)()))
+    backend_suite = BackendSuite()
+    for backend in backends:
+        cases.append((f'get_backend({backend})', backend_suite.timeraw_get_backend(backend)))
+
+    start = time.perf_counter()
+    for name, code in cases:
+        code, setup = (code, '') if isinstance(code, str) else code
+        print(f'{name:<40} {_time_in_new_process(code, setup) * 1e3:>10.1f} ms')
+    print(f'Total benchmark time: {time.perf_counter() - start:.1f} s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+"""Benchmarks of the Python toolchain of hls4ml on synthetic models: conversion, optimization flows, writing, compiling
+and running the C simulation of the compiled model.
+
+The benchmarks follow the conventions of airspeed velocity (asv): ``time_*`` methods are timed and ``peakmem_*`` methods
+report the peak resident memory of the process running them, setup included. Every stage starts from a model prepared
+by ``setup`` in a new output directory, so the stages can be timed independently. They can also be run without asv with
+``python -m benchmarks.toolchain``, which reports the time and the peak memory allocated by Python during each stage.
+"""
+
+import argparse
+import itertools
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from .models import make_inputs, make_model, models
+
+depths = [2, 8]
+widths = [8, 32]
+io_types = ['io_parallel', 'io_stream']
+backends = ['Vivado', 'Vitis', 'Quartus']
+
+# Combinations of model, io_type and backend that hls4ml does not support
+unsupported = {
+    ('rnn', 'io_stream', 'Quartus'),
+}
+
+n_predict_samples = 1000
+
+
+class ToolchainSuite:
+    params = (list(models), depths, widths, io_types, backends)
+    param_names = ['model', 'depth', 'width', 'io_type', 'backend']
+    number = 1
+    timeout = 1200
+
+    def setup(self, model, depth, width, io_type, backend):
+        if (model, io_type, backend) in unsupported:
+            raise NotImplementedError(f'{model} models in {io_type} are not supported by the {backend} backend')
+        self.keras_model = make_model(model, depth, width)
+        self.output_dir = tempfile.mkdtemp(prefix='hls4mlprj_benchmark_')
+
+    def teardown(self, model, depth, width, io_type, backend):
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    def convert(self, backend, io_type, flows=None):
+        import hls4ml
+
+        config = hls4ml.utils.config_from_keras_model(
+            self.keras_model, granularity='name', default_precision='fixed<16,6>', backend=backend
+        )
+        if backend == 'Quartus':
+            config['Model']['Strategy'] = 'Resource'
+        if flows is not None:
+            config['Flows'] = flows
+        return hls4ml.converters.convert_from_keras_model(
+            self.keras_model, hls_config=config, output_dir=self.output_dir, backend=backend, io_type=io_type
+        )
+
+
+class ConvertSuite(ToolchainSuite):
+    """Conversion of the Keras model to a ``ModelGraph``, without applying any flow."""
+
+    def time_convert(self, model, depth, width, io_type, backend):
+        self.convert(backend, io_type, flows=[])
+
+    def peakmem_convert(self, model, depth, width, io_type, backend):
+        self.convert(backend, io_type, flows=[])
+
+
+class FlowSuite(ToolchainSuite):
+    """Application of the default flow of the backend (e.g., ``vivado:ip``) to a converted model."""
+
+    def setup(self, model, depth, width, io_type, backend):
+        super().setup(model, depth, width, io_type, backend)
+        self.hls_model = self.convert(backend, io_type, flows=[])
+
+    def time_apply_flow(self, model, depth, width, io_type, backend):
+        self.hls_model.apply_flow(self.hls_model.config.backend.get_default_flow())
+
+    def peakmem_apply_flow(self, model, depth, width, io_type, backend):
+        self.hls_model.apply_flow(self.hls_model.config.backend.get_default_flow())
+
+
+class WriteSuite(ToolchainSuite):
+    """Writing of the HLS project of an optimized model, including the writer flow of the backend."""
+
+    def setup(self, model, depth, width, io_type, backend):
+        super().setup(model, depth, width, io_type, backend)
+        self.hls_model = self.convert(backend, io_type)
+
+    def time_write(self, model, depth, width, io_type, backend):
+        self.hls_model.write()
+
+    def peakmem_write(self, model, depth, width, io_type, backend):
+        self.hls_model.write()
+
+
+class CompileSuite(ToolchainSuite):
+    """Compilation of the written project into the library used by ``predict`` (``build_lib.sh``)."""
+
+    def setup(self, model, depth, width, io_type, backend):
+        super().setup(model, depth, width, io_type, backend)
+        self.hls_model = self.convert(backend, io_type)
+        self.hls_model.write()
+
+    def time_compile(self, model, depth, width, io_type, backend):
+        self.hls_model._compile()
+
+
+class PredictSuite(ToolchainSuite):
+    """C simulation of the compiled model on a batch of samples."""
+
+    def setup(self, model, depth, width, io_type, backend):
+        super().setup(model, depth, width, io_type, backend)
+        self.hls_model = self.convert(backend, io_type)
+        self.hls_model.compile()
+        self.x = make_inputs(self.keras_model, n_predict_samples)
+
+    def time_predict(self, model, depth, width, io_type, backend):
+        self.hls_model.predict(self.x)
+
+    def peakmem_predict(self, model, depth, width, io_type, backend):
+        self.hls_model.predict(self.x)
+
+
+stages = [
+    ('convert', ConvertSuite),
+    ('apply_flow', FlowSuite),
+    ('write', WriteSuite),
+    ('compile', CompileSuite),
+    ('predict', PredictSuite),
+]
+
+
+def _run_stage(suite_cls, method, params, trace_memory):
+    suite = suite_cls()
+    suite.setup(*params)
+    try:
+        if trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        getattr(suite, method)(*params)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+        suite.teardown(*params)
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the toolchain benchmarks without asv.')
+    parser.add_argument('--model', nargs='+', default=['mlp'], choices=list(models))
+    parser.add_argument('--depth', nargs='+', type=int, default=[2])
+    parser.add_argument('--width', nargs='+', type=int, default=[16])
+    parser.add_argument('--io-type', nargs='+', default=['io_parallel'], choices=io_types)
+    parser.add_argument('--backend', nargs='+', default=['Vivado'], choices=backends)
+    parser.add_argument('--stage', nargs='+', default=[name for name, _ in stages], choices=[name for name, _ in stages])
+    parser.add_argument('--no-memory', action='store_true', help='Do not measure the memory allocated by each stage')
+    args = parser.parse_args()
+
+    for params in itertools.product(args.model, args.depth, args.width, args.io_type, args.backend):
+        print(', '.join(f'{name}={value}' for name, value in zip(ToolchainSuite.param_names, params)))
+        for name, suite_cls in stages:
+            if name not in args.stage:
+                continue
+            try:
+                elapsed, _ = _run_stage(suite_cls, 'time_' + name, params, trace_memory=False)
+            except NotImplementedError as e:
+                print(f'    {name:<12} skipped: {e}')
+                break
+            line = f'    {name:<12} {elapsed:>10.3f} s'
+            # Tracing the allocations slows down the stage, so the memory is measured in a separate run
+            if not args.no_memory and hasattr(suite_cls, 'peakmem_' + name):
+                _, peak = _run_stage(suite_cls, 'peakmem_' + name, params, trace_memory=True)
+                line += f' {peak / 2**20:>10.1f} MiB'
+            print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,5 @@
 from hls4ml import converters, report, utils  # noqa: F401, E402
+from hls4ml.model.graph import compile_many  # noqa: F401, E402
 
 try:
     from ._version import version as __version__
@@ -1,20 +1,33 @@
+import importlib
+
 from hls4ml.backends.backend import Backend, get_available_backends, get_backend, register_backend  # noqa: F401
 from hls4ml.backends.fpga.fpga_backend import FPGABackend  # noqa: F401
-from hls4ml.backends.oneapi.oneapi_backend import OneAPIBackend
-from hls4ml.backends.quartus.quartus_backend import QuartusBackend
-from hls4ml.backends.symbolic.symbolic_backend import SymbolicExpressionBackend
-from hls4ml.backends.vivado.vivado_backend import VivadoBackend
-from hls4ml.backends.vivado_accelerator.vivado_accelerator_backend import VivadoAcceleratorBackend
 from hls4ml.backends.vivado_accelerator.vivado_accelerator_config import VivadoAcceleratorConfig  # noqa: F401
 
-from hls4ml.backends.catapult.catapult_backend import CatapultBackend  # isort: skip
+# The backends are imported and created on first use, see get_backend()
+_backend_modules = {
+    'VivadoBackend': 'hls4ml.backends.vivado.vivado_backend',
+    'VivadoAcceleratorBackend': 'hls4ml.backends.vivado_accelerator.vivado_accelerator_backend',
+    'VitisBackend': 'hls4ml.backends.vitis.vitis_backend',
+    'QuartusBackend': 'hls4ml.backends.quartus.quartus_backend',
+    'CatapultBackend': 'hls4ml.backends.catapult.catapult_backend',
+    'SymbolicExpressionBackend': 'hls4ml.backends.symbolic.symbolic_backend',
+    'OneAPIBackend': 'hls4ml.backends.oneapi.oneapi_backend',
+}
+
+
+def __getattr__(name):
+    if name in _backend_modules:
+        return getattr(importlib.import_module(_backend_modules[name]), name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
-from hls4ml.backends.vitis.vitis_backend import VitisBackend  # isort: skip
 
-register_backend('Vivado', VivadoBackend)
-register_backend('VivadoAccelerator', VivadoAcceleratorBackend)
-register_backend('Vitis', VitisBackend)
-register_backend('Quartus', QuartusBackend)
-register_backend('Catapult', CatapultBackend)
-register_backend('SymbolicExpression', SymbolicExpressionBackend)
-register_backend('oneAPI', OneAPIBackend)
+register_backend('Vivado', 'hls4ml.backends.vivado.vivado_backend.VivadoBackend')
+register_backend(
+    'VivadoAccelerator', 'hls4ml.backends.vivado_accelerator.vivado_accelerator_backend.VivadoAcceleratorBackend'
+)
+register_backend('Vitis', 'hls4ml.backends.vitis.vitis_backend.VitisBackend')
+register_backend('Quartus', 'hls4ml.backends.quartus.quartus_backend.QuartusBackend')
+register_backend('Catapult', 'hls4ml.backends.catapult.catapult_backend.CatapultBackend')
+register_backend('SymbolicExpression', 'hls4ml.backends.symbolic.symbolic_backend.SymbolicExpressionBackend')
+register_backend('oneAPI', 'hls4ml.backends.oneapi.oneapi_backend.OneAPIBackend')
@@ -1,3 +1,4 @@
+import importlib
 import inspect
 import os
 from pathlib import Path
@@ -151,27 +152,76 @@ class Backend:
 
 
 backend_map = {}
+_backend_classes = {}
+_backends_loading = set()
 
 
 def register_backend(name, backend_cls):
-    """Create the backend instance and add it to the registry.
+    """Add the backend to the registry.
+
+    The backend is instantiated, registering its optimizers, templates and flows, the first time it is used. The class
+    can also be given by its import path (e.g., ``'hls4ml.backends.vivado.vivado_backend.VivadoBackend'``), in which case
+    its module is only imported when the backend is first used.
 
     Args:
         name (str): Name of the backend.
-        backend_cls (class): Backend class to instantiate. Class must implement a constructor without parameters.
+        backend_cls (class or str): Backend class to instantiate, or its import path. Class must implement a constructor
+            without parameters.
 
     Raises:
         Exception: If the backend has already been registered.
     """
-    if name.lower() in backend_map:
+    if name.lower() in backend_map or name.lower() in _backend_classes:
         raise Exception(f'Backend {name} already registered')
 
-    backend_map[name.lower()] = backend_cls()
+    _backend_classes[name.lower()] = backend_cls
 
 
 def get_backend(name):
-    return backend_map[name.lower()]
+    """Return the backend with the given name, creating it on first use.
+
+    Args:
+        name (str): Name of the backend (case-insensitive).
+
+    Raises:
+        KeyError: If no backend with the given name is registered.
+
+    Returns:
+        Backend: The backend instance.
+    """
+    name = name.lower()
+    if name not in backend_map:
+        backend_cls = _backend_classes[name]
+        if isinstance(backend_cls, str):
+            module_name, cls_name = backend_cls.rsplit('.', 1)
+            backend_cls = getattr(importlib.import_module(module_name), cls_name)
+        _backends_loading.add(name)
+        try:
+            backend_map[name] = backend_cls()
+        finally:
+            _backends_loading.remove(name)
+    return backend_map[name]
+
+
+def load_backend(name):
+    """Create the backend with the given name if it is registered and hasn't been created yet.
+
+    Used by the registries of flows and optimizers, which are populated by the backends. Unlike ``get_backend``, unknown
+    names and backends that are currently being created are ignored.
+
+    Args:
+        name (str): Name of the backend (case-insensitive).
+    """
+    name = name.lower()
+    if name in _backend_classes and name not in backend_map and name not in _backends_loading:
+        get_backend(name)
+
+
+def load_all_backends():
+    """Create all registered backends."""
+    for name in _backend_classes:
+        load_backend(name)
 
 
 def get_available_backends():
-    return list(backend_map.keys())
+    return list(_backend_classes.keys())
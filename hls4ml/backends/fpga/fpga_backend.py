@@ -1,4 +1,5 @@
 import math
+import os
 import re
 import subprocess
 from bisect import bisect_left
@@ -46,6 +47,7 @@ from hls4ml.model.types import (
     XnorPrecisionType,
 )
 from hls4ml.utils import attribute_descriptions as descriptions
+from hls4ml.utils.compile_cache import get_compile_cache
 from hls4ml.writer import get_writer
 
 
@@ -160,7 +162,20 @@ class FPGABackend(Backend):
             string: Returns the name of the compiled library.
         """
 
-        lib_name = None
+        lib_name = '{}/firmware/{}-{}.so'.format(
+            model.config.get_output_dir(), model.config.get_project_name(), model.config.get_config_value('Stamp')
+        )
+
+        compile_cache = get_compile_cache()
+        env = None
+        if compile_cache is not None:
+            cache_key = compile_cache.get_key(model)
+            if compile_cache.load(cache_key, lib_name):
+                return lib_name
+            if compile_cache.precompiled_headers:
+                # The precompiled headers of the template libraries are shared between all projects
+                env = dict(os.environ, PCH_DIR=str(compile_cache.pch_path))
+
         ret_val = subprocess.run(
             ['./build_lib.sh'],
             shell=True,
@@ -168,13 +183,14 @@ class FPGABackend(Backend):
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             cwd=model.config.get_output_dir(),
+            env=env,
         )
         if ret_val.returncode != 0:
             print(ret_val.stdout)
             raise Exception(f'Failed to compile project "{model.config.get_project_name()}"')
-        lib_name = '{}/firmware/{}-{}.so'.format(
-            model.config.get_output_dir(), model.config.get_project_name(), model.config.get_config_value('Stamp')
-        )
+
+        if compile_cache is not None:
+            compile_cache.store(cache_key, lib_name)
 
         return lib_name
 
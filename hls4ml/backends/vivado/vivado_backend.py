@@ -201,7 +201,10 @@ class VivadoBackend(FPGABackend):
         io_type='io_parallel',
         namespace=None,
         write_weights_txt=True,
+        weights_format='txt',
+        raw_weights=False,
         write_tar=False,
+        split_layers=False,
         **_,
     ):
         """Create initial configuration of the Vivado backend.
@@ -215,7 +218,13 @@ class VivadoBackend(FPGABackend):
             namespace (str, optional): If defined, place all generated code within a namespace. Defaults to None.
             write_weights_txt (bool, optional): If True, writes weights to .txt files which speeds up compilation.
                 Defaults to True.
+            weights_format (str, optional): Format of the weight files read by the C++ simulation, 'txt' or 'bin'. The
+                binary files are faster to write and load for large models. Defaults to 'txt'.
+            raw_weights (bool, optional): If True, fixed-point weights are quantized when writing the project and written
+                as the integer codes of their bits instead of decimal literals. Defaults to False.
             write_tar (bool, optional): If True, compresses the output directory into a .tar.gz file. Defaults to False.
+            split_layers (bool, optional): If True, writes each layer to its own translation unit, so that the C++
+                library is compiled in parallel and only the changed layers are recompiled. Defaults to False.
 
         Returns:
             dict: initial configuration.
@@ -230,7 +239,10 @@ class VivadoBackend(FPGABackend):
         config['WriterConfig'] = {
             'Namespace': namespace,
             'WriteWeightsTxt': write_weights_txt,
+            'WeightsFormat': weights_format,
+            'RawWeights': raw_weights,
             'WriteTar': write_tar,
+            'SplitLayers': split_layers,
         }
 
         return config
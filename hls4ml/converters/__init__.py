@@ -1,6 +1,3 @@
-import importlib
-import os
-
 import yaml
 
 from hls4ml.converters.keras_to_hls import KerasFileReader  # noqa: F401
@@ -8,10 +5,10 @@ from hls4ml.converters.keras_to_hls import KerasModelReader  # noqa: F401
 from hls4ml.converters.keras_to_hls import KerasReader  # noqa: F401
 from hls4ml.converters.keras_to_hls import get_supported_keras_layers  # noqa: F401
 from hls4ml.converters.keras_to_hls import parse_keras_model  # noqa: F401
-from hls4ml.converters.keras_to_hls import keras_to_hls, register_keras_layer_handler
+from hls4ml.converters.keras_to_hls import keras_to_hls, register_keras_layer_handler  # noqa: F401
 from hls4ml.converters.onnx_to_hls import get_supported_onnx_layers  # noqa: F401
 from hls4ml.converters.onnx_to_hls import parse_onnx_model  # noqa: F401
-from hls4ml.converters.onnx_to_hls import onnx_to_hls, register_onnx_layer_handler
+from hls4ml.converters.onnx_to_hls import onnx_to_hls, register_onnx_layer_handler  # noqa: F401
 from hls4ml.converters.pytorch_to_hls import (  # noqa: F401
     get_supported_pytorch_layers,
     pytorch_to_hls,
@@ -22,33 +19,6 @@ from hls4ml.utils.config import create_config
 from hls4ml.utils.dependency import requires
 from hls4ml.utils.symbolic_utils import LUTFunction
 
-# ----------Layer handling register----------#
-model_types = ['keras', 'pytorch', 'onnx']
-
-for model_type in model_types:
-    for module in os.listdir(os.path.dirname(__file__) + f'/{model_type}'):
-        if module == '__init__.py' or module[-3:] != '.py':
-            continue
-        try:
-            lib = importlib.import_module(__name__ + f'.{model_type}.' + module[:-3])
-            for _, func in list(lib.__dict__.items()):
-                # if 'func' is callable (i.e., function, class...)
-                # and has 'handles' attribute
-                # and is defined in this module (i.e., not imported)
-                if callable(func) and hasattr(func, 'handles') and func.__module__ == lib.__name__:
-                    for layer in func.handles:  # type: ignore
-                        if model_type == 'keras':
-                            register_keras_layer_handler(layer, func)
-                        elif model_type == 'pytorch':
-                            register_pytorch_layer_handler(layer, func)
-                        elif model_type == 'onnx':
-                            register_onnx_layer_handler(layer, func)
-
-        except ImportError as err:
-            print(f'WARNING: Failed to import handlers from {module}: {err.msg}.')
-            continue
-
-
 def parse_yaml_config(config_file):
     """Parse conversion configuration from the provided YAML file.
 
@@ -138,6 +108,9 @@ def _check_hls_config(config, hls_config):
     if 'SkipOptimizers' in hls_config:
         config['HLSConfig']['SkipOptimizers'] = hls_config['SkipOptimizers']
 
+    if 'ProfileFlows' in hls_config:
+        config['HLSConfig']['ProfileFlows'] = hls_config['ProfileFlows']
+
     return
 
 
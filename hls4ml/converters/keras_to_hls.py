@@ -1,7 +1,8 @@
 import json
 
-import h5py
+import numpy as np
 
+from hls4ml.converters.utils import load_layer_handlers
 from hls4ml.model import ModelGraph
 
 MAXMULT = 4096
@@ -12,73 +13,149 @@ class KerasReader:
         raise NotImplementedError
 
 
-class KerasFileReader(KerasReader):
-    def __init__(self, config):
-        self.config = config
-        self.h5file = h5py.File(config['KerasH5'], mode='r')
+class KerasH5File:
+    """An open Keras .h5 file with an index of the groups and datasets it contains.
+
+    The file is traversed once when it is opened, so finding the weights of a layer doesn't require visiting the group of
+    the layer again. Uncompressed, contiguous datasets are memory-mapped (copy-on-write), their data is only read from the
+    file when it is used.
+
+    Args:
+        path (str): Path to the .h5 file.
+    """
+
+    # Datasets smaller than this (in bytes) are read immediately
+    min_mmap_size = 1024
+
+    def __init__(self, path):
+        import h5py
+
+        self.path = path
+        self.h5file = h5py.File(path, mode='r')
+        self._buffer = None
+        self._found = {}
+        self._mapped = set()
+
+        # Names of all objects below each group, relative to the group and in the order they are visited by h5py
+        self.index = {'': []}
+
+        def index_visitor(name, info):
+            name = name.decode('utf-8')
+            if info.type == h5py.h5o.TYPE_GROUP:
+                self.index[name] = []
+            parts = name.split('/')
+            for i in range(len(parts)):
+                self.index['/'.join(parts[:i])].append('/'.join(parts[i:]))
+
+        # The low-level visit doesn't create an h5py object for every group and dataset
+        h5py.h5o.visit(self.h5file.id, index_visitor, info=True)
 
     def __del__(self):
-        if self.h5file:
+        if getattr(self, 'h5file', None):
             self.h5file.close()
 
-    def _find_data(self, layer_name, var_name):
-        def h5_visitor_func(name):
-            if var_name in name:
-                return name
+    def has_model_weights(self):
+        """True if the file was saved with ``model.save()``, which stores the weights in the ``model_weights`` group."""
+        return 'model_weights' in self.index
+
+    def find(self, group_path, var_name):
+        """Find the first object below the group whose name (relative to the group) contains ``var_name``.
+
+        Args:
+            group_path (str): Path of the group, e.g., the group of a layer.
+            var_name (str): Name of the variable.
+
+        Raises:
+            KeyError: If the group doesn't exist.
+
+        Returns:
+            str: The absolute path of the object, or None if not found.
+        """
+        key = (group_path, var_name)
+        if key not in self._found:
+            if group_path not in self.index:
+                raise KeyError(f'Unable to find "{group_path}" in {self.path}')
+            data_path = next((name for name in self.index[group_path] if var_name in name), None)
+            self._found[key] = f'/{group_path}/{data_path}' if data_path is not None else None
+        return self._found[key]
+
+    def read(self, data_path):
+        """Return the data of a dataset, memory-mapped if possible.
+
+        The memory-mapped arrays share the (copy-on-write) mapping of the file, so a dataset is only mapped the first time it
+        is read. Later reads return a copy, unaffected by changes made to the first array.
+
+        Args:
+            data_path (str): Absolute path of the dataset.
+
+        Returns:
+            ndarray: The data.
+        """
+        dataset = self.h5file[data_path]
+        offset = dataset.id.get_offset()
+        if (
+            dataset.nbytes < self.min_mmap_size
+            or dataset.chunks is not None
+            or dataset.dtype.kind not in 'biuf'
+            or offset is None
+            or data_path in self._mapped
+        ):
+            return dataset[()]
+
+        if self._buffer is None:
+            self._buffer = np.memmap(self.path, dtype=np.uint8, mode='c')
+        self._mapped.add(data_path)
+        return self._buffer[offset : offset + dataset.nbytes].view(dataset.dtype).reshape(dataset.shape)
 
-        if 'model_weights' in list(self.h5file.keys()):  # h5 file comes from model.save()
-            layer_path = f'model_weights/{layer_name}'
+
+class KerasFileReader(KerasReader):
+    def __init__(self, config):
+        self.config = config
+        self.file = KerasH5File(config['KerasH5'])
+        self.h5file = self.file.h5file
+
+    def _get_layer_path(self, layer_name):
+        if self.file.has_model_weights():  # h5 file comes from model.save()
+            return f'model_weights/{layer_name}'
         else:
-            layer_path = layer_name
+            return layer_name
 
-        data_path = self.h5file[layer_path].visit(h5_visitor_func)
+    def _find_data(self, layer_name, var_name):
+        data_path = self.file.find(self._get_layer_path(layer_name), var_name)
         if data_path:
-            return self.h5file[f'/{layer_path}/{data_path}']
+            return self.h5file[data_path]
         else:
             return None
 
     def get_weights_data(self, layer_name, var_name):
-        data = self._find_data(layer_name, var_name)
-        if data:
-            return data[()]
+        data_path = self.file.find(self._get_layer_path(layer_name), var_name)
+        if data_path:
+            return self.file.read(data_path)
         else:
             return None
 
 
 class KerasNestedFileReader(KerasFileReader):
     def __init__(self, data_reader, nested_path):
-        super().__init__(data_reader.config)
+        # Shares the open file and its index with the reader of the enclosing model
+        self.config = data_reader.config
+        self.file = data_reader.file
+        self.h5file = self.file.h5file
         self.nested_path = nested_path
 
-    def _find_data(self, layer_name, var_name):
-        def h5_visitor_func(name):
-            if var_name in name:
-                return name
-
-        layer_path = f'model_weights/{self.nested_path}/{layer_name}'
-
-        data_path = self.h5file[layer_path].visit(h5_visitor_func)
-        if data_path:
-            return self.h5file[f'/{layer_path}/{data_path}']
-        else:
-            return None
+    def _get_layer_path(self, layer_name):
+        return f'model_weights/{self.nested_path}/{layer_name}'
 
 
 class KerasWrappedLayerFileReader(KerasFileReader):
     def __init__(self, data_reader, layer_path):
-        super().__init__(data_reader.config)
+        self.config = data_reader.config
+        self.file = data_reader.file
+        self.h5file = self.file.h5file
         self.layer_path = f'model_weights/{layer_path}'
 
-    def _find_data(self, layer_name, var_name):
-        def h5_visitor_func(name):
-            if var_name in name:
-                return name
-
-        data_path = self.h5file[self.layer_path].visit(h5_visitor_func)
-        if data_path:
-            return self.h5file[f'/{self.layer_path}/{data_path}']
-        else:
-            return None
+    def _get_layer_path(self, layer_name):
+        return self.layer_path
 
 
 class KerasModelReader(KerasReader):
@@ -125,7 +202,12 @@ def get_weights_data(data_reader, layer_name, var_name):
 layer_handlers = {}
 
 
+def _load_layer_handlers():
+    load_layer_handlers('keras', layer_handlers)
+
+
 def get_layer_handlers():
+    _load_layer_handlers()
     return layer_handlers
 
 
@@ -142,6 +224,7 @@ def register_keras_layer_handler(layer_cname, handler_func):
     Raises:
         Exception: If the layer class has already been registered.
     """
+    _load_layer_handlers()
     if layer_cname in layer_handlers:
         raise Exception(f'Layer {layer_cname} already registered')
     else:
@@ -157,6 +240,7 @@ def get_supported_keras_layers():
     Returns:
         list: The names of supported Keras layers.
     """
+    _load_layer_handlers()
     return list(layer_handlers.keys())
 
 
@@ -206,6 +290,8 @@ def get_model_arch(config):
         reader = KerasFileReader(config)
     elif 'KerasH5' in config:
         # Model arch and weights are in H5 file (from model.save() function)
+        import h5py
+
         with h5py.File(config['KerasH5'], mode='r') as h5file:
             # Load the configuration from h5 using json's decode
             model_arch = h5file.attrs.get('model_config')
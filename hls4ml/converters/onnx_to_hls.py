@@ -1,3 +1,4 @@
+from hls4ml.converters.utils import load_layer_handlers
 from hls4ml.model import ModelGraph
 from hls4ml.utils.dependency import requires
 
@@ -136,7 +137,12 @@ def compute_pads_2d(operation, layer):
 layer_handlers = {}
 
 
+def _load_layer_handlers():
+    load_layer_handlers('onnx', layer_handlers)
+
+
 def register_onnx_layer_handler(layer_name, handler_func):
+    _load_layer_handlers()
     if layer_name in layer_handlers:
         raise Exception(f'Layer {layer_name} already registered')
     else:
@@ -144,6 +150,7 @@ def register_onnx_layer_handler(layer_name, handler_func):
 
 
 def get_supported_onnx_layers():
+    _load_layer_handlers()
     return list(layer_handlers.keys())
 
 
@@ -1,5 +1,6 @@
 import numpy as np
 
+from hls4ml.converters.utils import load_layer_handlers
 from hls4ml.model import ModelGraph
 from hls4ml.utils.dependency import requires
 
@@ -65,7 +66,12 @@ def get_weights_data(data_reader, layer_name, var_name):
 layer_handlers = {}
 
 
+def _load_layer_handlers():
+    load_layer_handlers('pytorch', layer_handlers)
+
+
 def register_pytorch_layer_handler(layer_name, handler_func):
+    _load_layer_handlers()
     if layer_name in layer_handlers:
         raise Exception(f'Layer {layer_name} already registered')
     else:
@@ -73,6 +79,7 @@ def register_pytorch_layer_handler(layer_name, handler_func):
 
 
 def get_supported_pytorch_layers():
+    _load_layer_handlers()
     return list(layer_handlers.keys())
 
 
@@ -1,4 +1,6 @@
+import importlib
 import math
+import os
 
 
 def parse_data_format(input_shape, data_format='channels_last'):
@@ -287,3 +289,44 @@ def compute_padding_2d_pytorch(
             pad_left = pad_width
 
     return (out_height, out_width, pad_top, pad_bottom, pad_left, pad_right)
+
+
+_loaded_handlers = set()
+
+
+def load_layer_handlers(model_type, layer_handlers):
+    """Import the handler modules of a framework and register their handlers, on the first call for the framework.
+
+    The handlers are functions with a ``handles`` attribute (set by the ``keras_handler``, ``pytorch_handler`` and
+    ``onnx_handler`` decorators), defined in the modules in ``hls4ml/converters/<model_type>``. They are only imported
+    when a model of the framework is first converted, so that importing hls4ml doesn't import framework-specific code.
+
+    Args:
+        model_type (str): The framework, one of ``keras``, ``pytorch`` or ``onnx``.
+        layer_handlers (dict): The registry of the framework to add the handlers to.
+
+    Raises:
+        Exception: If a layer has already been registered.
+    """
+    if model_type in _loaded_handlers:
+        return
+    _loaded_handlers.add(model_type)
+
+    for module in sorted(os.listdir(os.path.dirname(__file__) + f'/{model_type}')):
+        if module == '__init__.py' or module[-3:] != '.py':
+            continue
+        try:
+            lib = importlib.import_module(__package__ + f'.{model_type}.' + module[:-3])
+            for _, func in list(lib.__dict__.items()):
+                # if 'func' is callable (i.e., function, class...)
+                # and has 'handles' attribute
+                # and is defined in this module (i.e., not imported)
+                if callable(func) and hasattr(func, 'handles') and func.__module__ == lib.__name__:
+                    for layer in func.handles:  # type: ignore
+                        if layer in layer_handlers:
+                            raise Exception(f'Layer {layer} already registered')
+                        layer_handlers[layer] = func
+
+        except ImportError as err:
+            print(f'WARNING: Failed to import handlers from {module}: {err.msg}.')
+            continue
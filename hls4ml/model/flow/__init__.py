@@ -6,3 +6,4 @@ from hls4ml.model.flow.flow import (  # noqa: F401
     register_flow,
     update_flow,
 )
+from hls4ml.model.flow.profile import FlowProfile  # noqa: F401
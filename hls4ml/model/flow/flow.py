@@ -127,7 +127,16 @@ def update_flow(flow_name, add_optimizers=None, remove_optimizers=None):
             flow._remove_optimizer(opt)
 
 
+def _load_backend(name):
+    # Backends register their flows and passes when they are first used
+    from hls4ml.backends.backend import load_backend
+
+    load_backend(name)
+
+
 def get_flow(name):
+    if name not in flow_map and ':' in name:
+        _load_backend(name.split(':')[0])
     if name in flow_map:
         return flow_map[name]
     else:
@@ -135,8 +144,12 @@ def get_flow(name):
 
 
 def get_backend_flows(backend):
+    _load_backend(backend)
     return [flow for flow in flow_map.keys() if flow.startswith(backend.lower() + ':')]
 
 
 def get_available_flows():
+    from hls4ml.backends.backend import load_all_backends
+
+    load_all_backends()
     return list(flow_map.keys())
@@ -0,0 +1,188 @@
+import json
+import time
+
+
+class FlowProfile:
+    """Records the time spent in the flows and optimizer passes applied to a model.
+
+    For every application of a flow, the profile stores its wall time (including the flows it requires) and the number
+    of nodes in the model graph before and after. For every pass of the flow, it stores the wall time, the number of
+    ``match`` calls, the number of transforms applied (and how many of them changed the graph) and the number of nodes
+    before the pass was first run and after it was last run.
+
+    The profile is enabled with ``ProfileFlows`` in the HLS config and can be accessed as ``ModelGraph.flow_profile``.
+    """
+
+    def __init__(self):
+        self.flows = []
+        self._stack = []
+        self._events = []
+        self._t0 = time.perf_counter()
+
+    def begin_flow(self, name, n_nodes):
+        """Start recording a flow. Flows required by this flow are nested inside it.
+
+        Args:
+            name (str): Name of the flow.
+            n_nodes (int): Number of nodes in the model graph.
+        """
+        flow = {
+            'name': name,
+            'parent': self._stack[-1]['name'] if self._stack else None,
+            'start': time.perf_counter() - self._t0,
+            'time': 0.0,
+            'nodes_before': n_nodes,
+            'nodes_after': n_nodes,
+            'passes': {},
+        }
+        self.flows.append(flow)
+        self._stack.append(flow)
+
+    def end_flow(self, n_nodes):
+        """Finish recording the most recently started flow.
+
+        Args:
+            n_nodes (int): Number of nodes in the model graph.
+        """
+        flow = self._stack.pop()
+        flow['time'] = time.perf_counter() - self._t0 - flow['start']
+        flow['nodes_after'] = n_nodes
+        self._events.append(('flow', flow['name'], flow['start'], flow['time'], {'parent': flow['parent']}))
+
+    def add_pass(self, name, start, n_matches, n_transforms, n_changes, nodes_before, nodes_after):
+        """Record a run of a pass over the nodes in its worklist.
+
+        Args:
+            name (str): Name of the pass.
+            start (float): Start of the run, as returned by ``time.perf_counter()``.
+            n_matches (int): Number of ``match`` calls.
+            n_transforms (int): Number of transforms applied.
+            n_changes (int): Number of transforms that changed the model graph.
+            nodes_before (int): Number of nodes in the model graph before the run.
+            nodes_after (int): Number of nodes in the model graph after the run.
+        """
+        end = time.perf_counter()
+        flow = self._stack[-1] if self._stack else None
+        passes = flow['passes'] if flow is not None else self._orphan_passes(nodes_before)
+        stats = passes.get(name)
+        if stats is None:
+            stats = passes[name] = {
+                'time': 0.0,
+                'runs': 0,
+                'matches': 0,
+                'transforms': 0,
+                'changes': 0,
+                'nodes_before': nodes_before,
+                'nodes_after': nodes_after,
+            }
+        stats['time'] += end - start
+        stats['runs'] += 1
+        stats['matches'] += n_matches
+        stats['transforms'] += n_transforms
+        stats['changes'] += n_changes
+        stats['nodes_after'] = nodes_after
+        if flow is None:
+            self.flows[-1]['nodes_after'] = nodes_after
+
+        args = {
+            'flow': flow['name'] if flow is not None else None,
+            'matches': n_matches,
+            'transforms': n_transforms,
+            'changes': n_changes,
+        }
+        self._events.append(('pass', name, start - self._t0, end - start, args))
+
+    def _orphan_passes(self, n_nodes):
+        # Passes run with optimize_model() directly, outside of any flow, are grouped under a flow named None
+        if not self.flows or self.flows[-1]['name'] is not None:
+            self.begin_flow(None, n_nodes)
+            self._stack.pop()
+        return self.flows[-1]['passes']
+
+    def clear(self):
+        """Remove all the recorded flows and passes."""
+        self.flows = []
+        self._stack = []
+        self._events = []
+        self._t0 = time.perf_counter()
+
+    def pass_totals(self):
+        """Return the statistics of each pass summed over all flows it was applied in.
+
+        Returns:
+            dict: Dictionary of pass names to their statistics, sorted by the time spent in the pass, longest first.
+        """
+        totals = {}
+        for flow in self.flows:
+            for name, stats in flow['passes'].items():
+                total = totals.setdefault(name, {'time': 0.0, 'runs': 0, 'matches': 0, 'transforms': 0, 'changes': 0})
+                for key in total:
+                    total[key] += stats[key]
+        return dict(sorted(totals.items(), key=lambda item: item[1]['time'], reverse=True))
+
+    def to_dict(self):
+        """Return the profile as a dictionary.
+
+        Returns:
+            dict: Dictionary with the list of applied ``flows`` (in the order they were started, with their ``passes``)
+            and the ``passes`` totals.
+        """
+        return {'flows': self.flows, 'passes': self.pass_totals()}
+
+    def to_json(self, path=None):
+        """Export the profile as JSON.
+
+        Args:
+            path (str, optional): File to write the JSON to. If None, the JSON string is returned instead.
+
+        Returns:
+            str: The JSON string, if no path was given.
+        """
+        if path is None:
+            return json.dumps(self.to_dict(), indent=2)
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def to_chrome_trace(self, path):
+        """Write the profile in the Chrome trace event format.
+
+        The file can be opened in ``chrome://tracing`` or https://ui.perfetto.dev. Flows and the runs of passes are shown
+        as nested slices on a timeline.
+
+        Args:
+            path (str): File to write the trace to.
+        """
+        events = []
+        for category, name, start, duration, args in self._events:
+            events.append(
+                {
+                    'name': name,
+                    'cat': category,
+                    'ph': 'X',
+                    'ts': start * 1e6,
+                    'dur': duration * 1e6,
+                    'pid': 0,
+                    'tid': 0,
+                    'args': args,
+                }
+            )
+        events.sort(key=lambda event: (event['ts'], -event['dur']))
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+    def summary(self, n_passes=20):
+        """Return a table of the passes that took the most time.
+
+        Args:
+            n_passes (int, optional): Number of passes to include. Defaults to 20.
+
+        Returns:
+            str: The table.
+        """
+        lines = [f'{"Pass":<50} {"Time [ms]":>10} {"Runs":>6} {"Matches":>8} {"Transforms":>10} {"Changes":>8}']
+        for name, stats in list(self.pass_totals().items())[:n_passes]:
+            lines.append(
+                f'{name:<50} {stats["time"] * 1e3:>10.2f} {stats["runs"]:>6} {stats["matches"]:>8} '
+                f'{stats["transforms"]:>10} {stats["changes"]:>8}'
+            )
+        return '\n'.join(lines)
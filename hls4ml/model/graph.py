@@ -1,13 +1,15 @@
 import ctypes
 import os
 import platform
-from collections import OrderedDict
+import time
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import numpy as np
 import numpy.ctypeslib as npc
 
 from hls4ml.backends import get_backend
-from hls4ml.model.flow import get_flow
+from hls4ml.model.flow import FlowProfile, get_flow
 from hls4ml.model.layers import layer_map
 from hls4ml.model.optimizer import get_available_passes, optimize_model
 from hls4ml.utils.string_utils import convert_to_snake_case
@@ -239,6 +241,8 @@ class HLSConfig:
         if self.flows is None:
             self.flows = [self.backend.get_default_flow()]
 
+        self.profile_flows = bool(hls_config.get('ProfileFlows', False))
+
         # TODO this is now effectively broken
         self.optimizers = hls_config.get('Optimizers')
         if 'SkipOptimizers' in hls_config:
@@ -271,6 +275,7 @@ class HLSConfig:
             self.model_compression = bool(model_cfg.get('Compression', 0))
             self.pipeline_style = model_cfg.get('PipelineStyle', 'auto')
             self.pipeline_ii = model_cfg.get('PipelineInterval', None)
+            self.trace_output = self.trace_output or bool(model_cfg.get('TraceOutput', False))
 
         layer_type_cfg = hls_config.get('LayerType')
         if layer_type_cfg is not None:
@@ -308,6 +313,232 @@ class HLSConfig:
                 self.parse_name_config(layer_name, layer_cfg)
 
 
+class LayerGraph(MutableMapping):
+    """The ordered mapping of node names to nodes (layers) of a ModelGraph.
+
+    Besides the order of the nodes, the graph keeps an index of the tensors (the names in the inputs and outputs of the
+    nodes) to the nodes producing and consuming them. The index is updated when nodes are added or removed and when the
+    ``inputs`` or ``outputs`` of a node in the graph change, so finding the neighbours of a node doesn't require a scan
+    of the whole graph. Nodes can be inserted anywhere in the graph in constant time with ``insert_after`` and
+    ``insert_before``.
+
+    Args:
+        items (iterable, optional): Pairs of names and nodes to add to the graph, in order.
+    """
+
+    _label_gap = 1 << 20
+
+    def __init__(self, items=None):
+        self._nodes = {}
+        self._links = {None: [None, None]}  # name -> [previous name, next name], None is the start and end of the list
+        self._labels = {}  # Increasing along the list, used to order nodes without traversing it
+        self._producers = {}
+        self._consumers = {}
+        self._change_sets = []
+        if items is not None:
+            for name, node in items:
+                self[name] = node
+
+    def __getitem__(self, name):
+        return self._nodes[name]
+
+    def get(self, name, default=None):
+        return self._nodes.get(name, default)
+
+    def __contains__(self, name):
+        return name in self._nodes
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __iter__(self):
+        links = self._links
+        name = links[None][1]
+        while name is not None:
+            next_name = links[name][1]  # Allows removing the current node while iterating
+            yield name
+            name = next_name
+
+    def __reversed__(self):
+        links = self._links
+        name = links[None][0]
+        while name is not None:
+            prev_name = links[name][0]
+            yield name
+            name = prev_name
+
+    def __setitem__(self, name, node):
+        if name in self._nodes:
+            self._unindex(self._nodes[name])
+            self._nodes[name] = node
+            self._index(node)
+        else:
+            self.insert_before(None, name, node)
+
+    def __delitem__(self, name):
+        node = self._nodes.pop(name)
+        self._unindex(node)
+        prev_name, next_name = self._links.pop(name)
+        self._links[prev_name][1] = next_name
+        self._links[next_name][0] = prev_name
+        del self._labels[name]
+
+    def __repr__(self):
+        return f'{type(self).__name__}({list(self.items())!r})'
+
+    def insert_after(self, ref_name, name, node):
+        """Insert a node after the node ``ref_name``, or at the start of the graph if ``ref_name`` is None.
+
+        Args:
+            ref_name (str): Name of the node after which the new node is inserted.
+            name (str): Name of the new node.
+            node (Layer): The new node.
+        """
+        self._link(ref_name, self._links[ref_name][1], name, node)
+
+    def insert_before(self, ref_name, name, node):
+        """Insert a node before the node ``ref_name``, or at the end of the graph if ``ref_name`` is None.
+
+        Args:
+            ref_name (str): Name of the node before which the new node is inserted.
+            name (str): Name of the new node.
+            node (Layer): The new node.
+        """
+        self._link(self._links[ref_name][0], ref_name, name, node)
+
+    def replace(self, old_name, name, node):
+        """Replace the node ``old_name`` with a new node, at the same position.
+
+        Args:
+            old_name (str): Name of the node to replace.
+            name (str): Name of the new node.
+            node (Layer): The new node.
+        """
+        if name == old_name:
+            self[name] = node
+        else:
+            self.insert_after(old_name, name, node)
+            del self[old_name]
+
+    def _link(self, prev_name, next_name, name, node):
+        if name in self._nodes:
+            raise Exception(f'Node {name} already exists in the graph')
+        labels = self._labels
+        prev_label = labels[prev_name] if prev_name is not None else None
+        next_label = labels[next_name] if next_name is not None else None
+        if prev_label is None:
+            label = next_label - self._label_gap if next_label is not None else 0
+        elif next_label is None:
+            label = prev_label + self._label_gap
+        elif next_label - prev_label > 1:
+            label = (prev_label + next_label) // 2
+        else:
+            # No space left between the neighbours, spread the labels of all nodes again
+            self._relabel()
+            label = (labels[prev_name] + labels[next_name]) // 2
+
+        self._nodes[name] = node
+        self._links[name] = [prev_name, next_name]
+        self._links[prev_name][1] = name
+        self._links[next_name][0] = name
+        labels[name] = label
+        self._index(node)
+
+    def _relabel(self):
+        for i, name in enumerate(self):
+            self._labels[name] = i * self._label_gap
+
+    def _index(self, node):
+        for output in node.outputs:
+            self._producers.setdefault(output, []).append(node)
+        for inp in node.inputs:
+            self._consumers.setdefault(inp, []).append(node)
+        for changes in self._change_sets:
+            changes.add(node)
+
+    def _unindex(self, node):
+        if self._change_sets:
+            # The neighbours are recorded too, they lose their connection to the node
+            neighbours = [node]
+            for inp in node.inputs:
+                neighbours.extend(self._producers.get(inp, ()))
+            for output in node.outputs:
+                neighbours.extend(self._consumers.get(output, ()))
+            for changes in self._change_sets:
+                changes.update(neighbours)
+        for tensors, index in ((node.outputs, self._producers), (node.inputs, self._consumers)):
+            for tensor in set(tensors):
+                nodes = [n for n in index.get(tensor, ()) if n is not node]
+                if nodes:
+                    index[tensor] = nodes
+                else:
+                    index.pop(tensor, None)
+
+    def track_changes(self):
+        """Start recording the nodes that are added, removed or whose inputs or outputs change.
+
+        The nodes connected to a changed node before the change are recorded as well.
+
+        Returns:
+            set: The set to which the changed nodes are added, until ``untrack_changes`` is called with it.
+        """
+        changes = set()
+        self._change_sets.append(changes)
+        return changes
+
+    def untrack_changes(self, changes):
+        """Stop recording changes to the given set, returned by ``track_changes``."""
+        self._change_sets = [c for c in self._change_sets if c is not changes]
+
+    def order_key(self, name):
+        """Return a key that sorts the nodes in the order of the graph.
+
+        Args:
+            name (str): Name of the node.
+
+        Returns:
+            int: The sort key.
+        """
+        return self._labels[name]
+
+    def _sorted(self, nodes):
+        labels = self._labels
+        return sorted(nodes, key=lambda node: labels[node.name])
+
+    def get_producer(self, tensor):
+        """Return the node producing the given tensor.
+
+        Args:
+            tensor (str): Name of the tensor.
+
+        Returns:
+            Layer: The first node (in the order of the graph) with the tensor in its outputs, or None.
+        """
+        nodes = self._producers.get(tensor)
+        if not nodes:
+            return None
+        if len(nodes) == 1:
+            return nodes[0]
+        return self._sorted(nodes)[0]
+
+    def get_consumers(self, tensor):
+        """Return the nodes consuming the given tensor.
+
+        Args:
+            tensor (str): Name of the tensor.
+
+        Returns:
+            list: The nodes with the tensor in their inputs, in the order of the graph. A node taking the tensor as
+            several of its inputs is listed once for each of them.
+        """
+        nodes = self._consumers.get(tensor)
+        if not nodes:
+            return []
+        if len(nodes) == 1:
+            return list(nodes)
+        return self._sorted(nodes)
+
+
 class ModelGraph:
     """The ModelGraph represents the network that is being processed by hls4ml.
 
@@ -324,6 +555,9 @@ class ModelGraph:
         # keep track of the applied flows
         self._applied_flows = []
 
+        # time spent in the flows and passes, if enabled
+        self.flow_profile = FlowProfile() if self.config.profile_flows else None
+
         # If not provided, assumes layer_list[0] is the input layer, and layer_list[-1] is output layer
 
         # Note, these are actually the variable names, which may differ from the layer name
@@ -338,10 +572,11 @@ class ModelGraph:
         self.outputs = self._find_output_variable_names(layer_list, output_layers)
 
         self.index = 0
-        self.graph = OrderedDict()  # where the nodes are stored
+        self.graph = LayerGraph()  # where the nodes are stored
         self.output_vars = {}
 
         self._top_function_lib = None
+        self._top_functions = {}
 
         self._make_graph(layer_list)
 
@@ -415,16 +650,23 @@ class ModelGraph:
             return
         flow = get_flow(flow_name)
 
+        profile = self.flow_profile
+        if profile is not None:
+            profile.begin_flow(flow.name, len(self.graph))
+
         for sub_flow in flow.requires:
             if sub_flow not in applied_flows.keys():
                 self._apply_sub_flow(sub_flow, applied_flows)
 
         if len(flow.optimizers) > 0:
-            applied_passes = optimize_model(self, flow.optimizers)
+            applied_passes = optimize_model(self, flow.optimizers, profile=profile)
         else:
             applied_passes = set()
         applied_flows[flow.name] = applied_passes
 
+        if profile is not None:
+            profile.end_flow(len(self.graph))
+
     def make_node(self, kind, name, attributes, inputs, outputs=None):
         """Make a new node not connected to the model graph.
 
@@ -488,13 +730,12 @@ class ModelGraph:
 
         prev_node = node.get_input_node(node.inputs[0])
         next_nodes = []
-        for x in self.graph.values():
-            overlap = [value for value in x.inputs if value in prev_node.outputs]
-            if overlap:
-                next_nodes.append(x)
+        for output in prev_node.outputs:
+            next_nodes.extend(x for x in self.graph.get_consumers(output) if x not in next_nodes)
+        next_nodes.sort(key=lambda x: self.graph.order_key(x.name))
 
         if before is None:
-            next_node = next((x for x in self.graph.values() if x.inputs and x.inputs[0] in prev_node.outputs), None)
+            next_node = next((x for x in next_nodes if x.inputs[0] in prev_node.outputs), None)
         else:
             if before not in next_nodes:
                 raise Exception(
@@ -509,13 +750,7 @@ class ModelGraph:
         else:
             self.outputs = [node.outputs[0] if name == prev_node.outputs[0] else name for name in self.outputs]
 
-        new_graph = OrderedDict()
-        for k, v in self.graph.items():
-            new_graph[k] = v
-            if k == prev_node.name:
-                new_graph[node.name] = node
-
-        self.graph = new_graph
+        self.graph.insert_after(prev_node.name, node.name, node)
 
     def remove_node(self, node):
         """Removes a node from the graph.
@@ -554,7 +789,7 @@ class ModelGraph:
                 f'Input and output shapes do not match for {node.name}: {inp_var.shape} -> {out_var.shape}'
             # fmt: on
 
-            next_nodes = [x for x in self.graph.values() if node.outputs[0] in x.inputs]
+            next_nodes = list(dict.fromkeys(self.graph.get_consumers(node.outputs[0])))
             for next_node in next_nodes:
                 # Connect inputs -> next
                 for i, nxt_inp in enumerate(next_node.inputs):
@@ -582,16 +817,9 @@ class ModelGraph:
 
         repl = {old_name: new_name for old_name, new_name in zip(old_node.outputs, new_node.outputs)}
         repl.update({old_name: new_name for old_name, new_name in zip(old_node.inputs, new_node.inputs)})
+        self._rename_tensors(repl)
 
-        for node in self.graph.values():
-            for i, n in enumerate(node.inputs):
-                if n in repl:
-                    node.inputs[i] = repl[n]
-            for i, n in enumerate(node.outputs):
-                if n in repl:
-                    node.outputs[i] = repl[n]
-
-        self.graph = OrderedDict((new_node.name, new_node) if k == old_node.name else (k, v) for k, v in self.graph.items())
+        self.graph.replace(old_node.name, new_node.name, new_node)
 
         old_name = old_node.name
         if old_name in self.outputs:
@@ -617,8 +845,21 @@ class ModelGraph:
 
         repl = {old_name: new_name for old_name, new_name in zip(old_node.outputs, new_node2.outputs)}
         repl.update({old_name: new_name for old_name, new_name in zip(old_node.inputs, new_node1.inputs)})
+        self._rename_tensors(repl)
+
+        self.graph.replace(old_node.name, new_node1.name, new_node1)
+        self.graph.insert_after(new_node1.name, new_node2.name, new_node2)
 
-        for node in self.graph.values():
+        if old_node.name in self.outputs:
+            self.outputs = [new_node2.name if name == old_node.name else name for name in self.outputs]
+
+    def _rename_tensors(self, repl):
+        """Rename the tensors in the inputs and outputs of the nodes in the graph, as given by the ``repl`` dictionary."""
+        nodes = {}
+        for old_name in repl:
+            for node in self.graph.get_consumers(old_name) + self.graph._producers.get(old_name, []):
+                nodes[node.name] = node
+        for node in sorted(nodes.values(), key=lambda node: self.graph.order_key(node.name)):
             for i, n in enumerate(node.inputs):
                 if n in repl:
                     node.inputs[i] = repl[n]
@@ -626,17 +867,28 @@ class ModelGraph:
                 if n in repl:
                     node.outputs[i] = repl[n]
 
-        new_graph = OrderedDict()
-        for key, value in self.graph.items():
-            if key == old_node.name:
-                new_graph[new_node1.name] = new_node1
-                new_graph[new_node2.name] = new_node2
-            else:
-                new_graph[key] = value
-        self.graph = new_graph
+    def get_producer(self, tensor_name):
+        """Return the node producing the given tensor.
 
-        if old_node.name in self.outputs:
-            self.outputs = [new_node2.name if name == old_node.name else name for name in self.outputs]
+        Args:
+            tensor_name (str): Name of the tensor (an output of a node).
+
+        Returns:
+            Layer: The node with the tensor in its outputs, or None if no node in the graph produces it.
+        """
+        return self.graph.get_producer(tensor_name)
+
+    def get_consumers(self, tensor_name):
+        """Return the nodes consuming the given tensor.
+
+        Args:
+            tensor_name (str): Name of the tensor (an input of a node).
+
+        Returns:
+            list: The nodes with the tensor in their inputs, in the order of the graph. A node taking the tensor as
+            several of its inputs is listed once for each of them.
+        """
+        return self.graph.get_consumers(tensor_name)
 
     def next_layer(self):
         self.index += 1
@@ -692,6 +944,9 @@ class ModelGraph:
 
     def _compile(self):
         lib_name = self.config.backend.compile(self)
+        self._load_lib(lib_name)
+
+    def _load_lib(self, lib_name):
         if self._top_function_lib is not None:
             if platform.system() == "Linux":
                 libdl_libs = ['libdl.so', 'libdl.so.2']
@@ -708,8 +963,9 @@ class ModelGraph:
             dlclose_func.restype = ctypes.c_int
             dlclose_func(self._top_function_lib._handle)
         self._top_function_lib = ctypes.cdll.LoadLibrary(lib_name)
+        self._top_functions = {}
 
-    def _get_top_function(self, x):
+    def _get_top_function(self, x, batch=False, raw=False):
         if self._top_function_lib is None:
             raise Exception('Model not compiled')
         if len(self.get_input_variables()) == 1:
@@ -725,11 +981,16 @@ class ModelGraph:
                 raise Exception('Array must be c_contiguous, try using numpy.ascontiguousarray(x)')
 
         x0 = xlist[0]
-        if x0.dtype in [np.single, np.float32]:
-            top_function = getattr(self._top_function_lib, self.config.get_project_name() + '_float')
+        if raw:
+            if x0.dtype != np.int64:
+                raise Exception(f'Invalid type ({x0.dtype}) of numpy array. Raw inputs must be int64 arrays.')
+            fn_name = self.config.get_project_name() + '_raw'
+            ctype = ctypes.c_longlong
+        elif x0.dtype in [np.single, np.float32]:
+            fn_name = self.config.get_project_name() + '_float'
             ctype = ctypes.c_float
         elif x0.dtype in [np.double, np.float64]:
-            top_function = getattr(self._top_function_lib, self.config.get_project_name() + '_double')
+            fn_name = self.config.get_project_name() + '_double'
             ctype = ctypes.c_double
         else:
             raise Exception(
@@ -738,8 +999,29 @@ class ModelGraph:
                 )
             )
 
-        top_function.restype = None
-        top_function.argtypes = [npc.ndpointer(ctype, flags="C_CONTIGUOUS") for i in range(len(xlist) + n_outputs)]
+        if batch:
+            fn_name += '_batch'
+
+        # The functions are resolved and their argument types set once per loaded library
+        top_function = self._top_functions.get(fn_name)
+        if top_function is None:
+            if raw:
+                for var in self.get_input_variables() + self.get_output_variables():
+                    if var.type.precision.width > 64:
+                        raise Exception(
+                            f'The bit patterns of {var.name} ({var.type.precision}) do not fit in 64-bit integers'
+                        )
+                if not hasattr(self._top_function_lib, fn_name):
+                    raise Exception(f'Raw inputs are not supported by the {self.config.backend.name} backend')
+            top_function = getattr(self._top_function_lib, fn_name)
+
+            argtypes = [npc.ndpointer(ctype, flags="C_CONTIGUOUS") for i in range(len(xlist) + n_outputs)]
+            if batch:
+                argtypes += [ctypes.c_size_t, ctypes.c_size_t]
+
+            top_function.restype = None
+            top_function.argtypes = argtypes
+            self._top_functions[fn_name] = top_function
 
         return top_function, ctype
 
@@ -762,30 +1044,37 @@ class ModelGraph:
 
         return int(n_sample)
 
-    def predict(self, x):
-        top_function, ctype = self._get_top_function(x)
-        n_samples = self._compute_n_samples(x)
-        n_inputs = len(self.get_input_variables())
-        n_outputs = len(self.get_output_variables())
+    def predict(self, x, n_threads=1, raw=False):
+        """Run the C simulation of the compiled model on the given inputs.
 
-        output = []
-        if n_samples == 1 and n_inputs == 1:
-            x = [x]
+        Args:
+            x (np.ndarray or list(np.ndarray)): C-contiguous float32 or float64 input array, or a list of arrays
+                for a model with multiple inputs. The first dimension of the arrays is the batch dimension.
+            n_threads (int, optional): Number of native threads the batch is split across. Models whose layers keep
+                state between samples (``io_stream`` projects, static recurrent layers) always run on a single thread.
+                Defaults to 1.
+            raw (bool, optional): If True, the inputs are integer arrays holding the bit patterns of the fixed-point
+                input types, i.e., the values times ``2**fractional_bits``, and the outputs are int64 arrays holding
+                the bit patterns of the output types (sign-extended for signed types). The inputs are then passed to
+                the model as is, without being converted from floating-point values. Defaults to False.
 
-        for i in range(n_samples):
-            predictions = [np.zeros(yj.size(), dtype=ctype) for yj in self.get_output_variables()]
-            if n_inputs == 1:
-                inp = [np.asarray(x[i])]
-            else:
-                inp = [np.asarray(xj[i]) for xj in x]
-            argtuple = inp
-            argtuple += predictions
-            argtuple = tuple(argtuple)
-            top_function(*argtuple)
-            output.append(predictions)
+        Returns:
+            np.ndarray or list(np.ndarray): The flattened outputs of the model, one array per output.
+        """
+        if raw:
+            xlist = [x] if len(self.get_input_variables()) == 1 else x
+            for xi in xlist:
+                if not isinstance(xi, np.ndarray) or not np.issubdtype(xi.dtype, np.integer):
+                    raise Exception(f'Raw inputs must be numpy arrays of integers, but got {getattr(xi, "dtype", type(xi))}')
+            xlist = [np.ascontiguousarray(xi, dtype=np.int64) for xi in xlist]
+            x = xlist[0] if len(self.get_input_variables()) == 1 else xlist
+
+        _, ctype = self._get_top_function(x, batch=True, raw=raw)
+        n_samples = self._compute_n_samples(x)
+        n_outputs = len(self.get_output_variables())
 
-        # Convert to list of numpy arrays (one for each output)
-        output = [np.asarray([output[i_sample][i_output] for i_sample in range(n_samples)]) for i_output in range(n_outputs)]
+        output = [np.empty((n_samples, yj.size()), dtype=ctype) for yj in self.get_output_variables()]
+        self.predict_into(x, output if n_outputs > 1 else output[0], n_threads=n_threads, raw=raw)
 
         if n_samples == 1 and n_outputs == 1:
             return output[0][0]
@@ -796,80 +1085,139 @@ class ModelGraph:
         else:
             return output
 
-    def trace(self, x):
-        print(f'Recompiling {self.config.get_project_name()} with tracing')
-        self.config.trace_output = True
-        self.compile()
+    def predict_into(self, x, out, n_threads=1, raw=False):
+        """Run the C simulation of the compiled model on the given inputs, writing the outputs into the given arrays.
 
-        top_function, ctype = self._get_top_function(x)
+        This is the low-level variant of ``predict`` for repeated calls, e.g., on batches of the same size: the arrays
+        are passed to the compiled library without being copied, and no memory is allocated for the outputs.
+
+        Args:
+            x (np.ndarray or list(np.ndarray)): C-contiguous float32 or float64 input array, or a list of arrays
+                for a model with multiple inputs. The first dimension of the arrays is the batch dimension.
+            out (np.ndarray or list(np.ndarray)): C-contiguous, writeable output array of the same type as the inputs,
+                or a list of arrays for a model with multiple outputs. Each array must have ``n_samples * size``
+                elements, where ``size`` is the size of the output, e.g., an array of shape ``(n_samples, size)``.
+            n_threads (int, optional): Number of native threads the batch is split across, see ``predict``.
+                Defaults to 1.
+            raw (bool, optional): If True, the inputs and outputs are int64 arrays holding the bit patterns of the
+                fixed-point types, see ``predict``. Defaults to False.
+
+        Raises:
+            Exception: If the output arrays don't match the inputs or the outputs of the model.
+
+        Returns:
+            np.ndarray or list(np.ndarray): The output arrays, ``out``.
+        """
+        if not isinstance(n_threads, int) or n_threads < 1:
+            raise Exception(f'Number of threads must be a positive integer, got {n_threads}')
+
+        top_function, ctype = self._get_top_function(x, batch=True, raw=raw)
         n_samples = self._compute_n_samples(x)
-        n_inputs = len(self.get_input_variables())
-        n_outputs = len(self.get_output_variables())
+        output_vars = self.get_output_variables()
+
+        xlist = [x] if len(self.get_input_variables()) == 1 else x
+        outlist = [out] if len(output_vars) == 1 else out
+        if len(outlist) != len(output_vars):
+            raise Exception(f'Expected {len(output_vars)} output arrays, but got {len(outlist)}')
+        for out_i, var in zip(outlist, output_vars):
+            if not isinstance(out_i, np.ndarray):
+                raise Exception(f'Expected numpy.ndarray, but got {type(out_i)}')
+            if out_i.dtype != np.dtype(ctype):
+                raise Exception(f'Output arrays must have the type of the inputs ({np.dtype(ctype)}), but got {out_i.dtype}')
+            if not out_i.flags['C_CONTIGUOUS'] or not out_i.flags['WRITEABLE']:
+                raise Exception('Output arrays must be C-contiguous and writeable')
+            if out_i.size != n_samples * var.size():
+                raise Exception(
+                    f'Output array for {var.name} has {out_i.size} elements, expected {n_samples * var.size()} '
+                    f'({n_samples} samples of size {var.size()})'
+                )
 
-        class TraceData(ctypes.Structure):
-            _fields_ = [('name', ctypes.c_char_p), ('data', ctypes.c_void_p)]
+        # Inputs are C-contiguous, so they already have the flat (n_samples, size) layout the batched wrapper expects.
+        # The whole batch is processed with a single call into the library, writing into one buffer per output.
+        top_function(*xlist, *outlist, n_samples, n_threads)
 
-        trace_output = {}
-        layer_sizes = {}
-        n_traced = 0
-        for layer in self.get_layers():
-            if layer.get_attr('function_cpp', None) and layer.get_attr('trace', False):
-                n_traced += len(layer.get_variables())
-                trace_output[layer.name] = []
-                layer_sizes[layer.name] = layer.get_output_variable().shape
+        return out
 
-        collect_func = self._top_function_lib.collect_trace_output
-        collect_func.argtypes = [ctypes.POINTER(TraceData)]
-        collect_func.restype = None
-        trace_data = (TraceData * n_traced)()
+    def _get_compiled_trace_layers(self):
+        if self._top_function_lib is None:
+            return None
+        try:
+            get_trace_layers = self._top_function_lib.get_trace_layers
+        except AttributeError:
+            return None  # Library compiled by an older version of hls4ml
+        get_trace_layers.argtypes = []
+        get_trace_layers.restype = ctypes.POINTER(ctypes.c_char_p)
+        names = get_trace_layers()
+        compiled_layers = set()
+        i = 0
+        while names[i] is not None:
+            compiled_layers.add(names[i].decode('utf-8'))
+            i += 1
+        return compiled_layers
 
-        alloc_func = self._top_function_lib.allocate_trace_storage
-        alloc_func.argtypes = [ctypes.c_size_t]
-        alloc_func.restype = None
+    def trace(self, x):
+        """Run the C simulation of the compiled model and save the outputs of the layers that have tracing enabled.
 
-        free_func = self._top_function_lib.free_trace_storage
-        free_func.argtypes = None
-        free_func.restype = None
+        Saving the layer outputs is built into the compiled library when ``TraceOutput`` is enabled in the configuration
+        of the model, and is only active during calls to ``trace``. If the model was compiled without it, or a layer has
+        been configured for tracing since, the model is compiled again with ``TraceOutput`` enabled, so compile the
+        model with ``TraceOutput`` enabled to avoid this. The whole batch is processed with a single call into the
+        library, which writes the layer outputs directly into the returned arrays.
 
-        curr_dir = os.getcwd()
-        os.chdir(self.config.get_output_dir() + '/firmware')
+        Args:
+            x (np.ndarray or list(np.ndarray)): C-contiguous float32 or float64 input array, or a list of arrays
+                for a model with multiple inputs. The first dimension of the arrays is the batch dimension.
 
-        output = []
-        if n_samples == 1 and n_inputs == 1:
+        Returns:
+            tuple: The outputs of the model, as returned by ``predict``, and a dictionary of the outputs of the traced
+            layers, mapping layer names to arrays of shape ``(n_samples, *output_shape)``.
+        """
+        trace_layers = [
+            layer for layer in self.get_layers() if layer.get_attr('function_cpp', None) and layer.get_attr('trace', False)
+        ]
+        compiled_layers = self._get_compiled_trace_layers()
+        if compiled_layers is None or not compiled_layers.issuperset(layer.name for layer in trace_layers):
+            print(f'Recompiling {self.config.get_project_name()} with tracing')
+            self.config.trace_output = True
+            self.compile()
+
+        top_function, ctype = self._get_top_function(x, batch=True)
+        n_samples = self._compute_n_samples(x)
+        n_inputs = len(self.get_input_variables())
+        n_outputs = len(self.get_output_variables())
+
+        if n_inputs == 1:
             x = [x]
 
+        output = [np.zeros((n_samples, yj.size()), dtype=ctype) for yj in self.get_output_variables()]
+        trace_output = {
+            layer.name: np.zeros((n_samples, *layer.get_output_variable().shape), dtype=ctype) for layer in trace_layers
+        }
+
+        enable_func = self._top_function_lib.enable_trace
+        enable_func.argtypes = [
+            ctypes.POINTER(ctypes.c_char_p),
+            ctypes.POINTER(ctypes.c_void_p),
+            ctypes.c_size_t,
+            ctypes.c_size_t,
+        ]
+        enable_func.restype = None
+
+        disable_func = self._top_function_lib.disable_trace
+        disable_func.argtypes = []
+        disable_func.restype = None
+
+        n_traced = len(trace_output)
+        layer_names = (ctypes.c_char_p * n_traced)(*[name.encode('utf-8') for name in trace_output.keys()])
+        buffers = (ctypes.c_void_p * n_traced)(*[buffer.ctypes.data for buffer in trace_output.values()])
+
+        # The library writes the outputs of the traced layers of each sample after the ones of the previous sample, so
+        # the batch runs on a single thread
+        enable_func(layer_names, buffers, n_traced, ctypes.sizeof(ctype))
         try:
-            alloc_func(ctypes.sizeof(ctype))
-
-            for i in range(n_samples):
-                predictions = [np.zeros(yj.size(), dtype=ctype) for yj in self.get_output_variables()]
-                if n_inputs == 1:
-                    inp = [np.asarray(x[i])]
-                else:
-                    inp = [np.asarray(xj[i]) for xj in x]
-                argtuple = inp
-                argtuple += predictions
-                argtuple = tuple(argtuple)
-                top_function(*argtuple)
-                output.append(predictions)
-                collect_func(trace_data)
-                for trace in trace_data:
-                    layer_name = str(trace.name, 'utf-8')
-                    layer_data = ctypes.cast(trace.data, ctypes.POINTER(ctype))
-                    np_array = np.ctypeslib.as_array(layer_data, shape=layer_sizes[layer_name])
-                    trace_output[layer_name].append(np.copy(np_array))
-
-            for key in trace_output.keys():
-                trace_output[key] = np.asarray(trace_output[key])
-
-            # Convert to list of numpy arrays (one for each output)
-            output = [
-                np.asarray([output[i_sample][i_output] for i_sample in range(n_samples)]) for i_output in range(n_outputs)
-            ]
-
-            free_func()
+            top_function(*x, *output, n_samples, 1)
         finally:
-            os.chdir(curr_dir)
+            disable_func()
 
         if n_samples == 1 and n_outputs == 1:
             return output[0][0], trace_output
@@ -890,3 +1238,64 @@ class ModelGraph:
             self.write()
 
         return self.config.backend.build(self, **kwargs)
+
+
+def compile_many(models, max_workers=None, verbose=True):
+    """Compile multiple models concurrently and link the libraries into their ``ModelGraph``.
+
+    The projects are written one after the other, then the C++ builds of the projects run in parallel, each one in its
+    own compiler processes. This is useful for scans over the configuration (precision, reuse factor, etc.) of a model,
+    where most of the time is spent compiling the generated code. A failed build doesn't stop the others, the failures
+    are listed in the returned report.
+
+    Args:
+        models (list): List of ``ModelGraph`` to compile. Each model must have a distinct output directory.
+        max_workers (int, optional): Maximum number of projects built at the same time. Defaults to the number of CPUs.
+        verbose (bool, optional): Print the build time of each model and the failures. Defaults to True.
+
+    Raises:
+        Exception: If several models share the same output directory.
+
+    Returns:
+        list: One dictionary per model, in the order of ``models``, with the keys ``model``, ``output_dir``,
+            ``success``, ``time`` (build time in seconds) and ``error`` (the exception raised by a failed build, or
+            None).
+    """
+    models = list(models)
+    output_dirs = [os.path.abspath(model.config.get_output_dir()) for model in models]
+    if len(set(output_dirs)) != len(output_dirs):
+        raise Exception('Models compiled together must have distinct output directories')
+
+    for model in models:
+        model.write()
+
+    def build(model):
+        start = time.perf_counter()
+        lib_name = model.config.backend.compile(model)
+        return lib_name, time.perf_counter() - start
+
+    report = [
+        {'model': model, 'output_dir': output_dir, 'success': False, 'time': None, 'error': None}
+        for model, output_dir in zip(models, output_dirs)
+    ]
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        futures = {executor.submit(build, model): entry for model, entry in zip(models, report)}
+        for future in as_completed(futures):
+            entry = futures[future]
+            try:
+                lib_name, entry['time'] = future.result()
+                entry['model']._load_lib(lib_name)
+                entry['success'] = True
+            except Exception as e:
+                entry['error'] = e
+
+    if verbose:
+        n_success = sum(entry['success'] for entry in report)
+        print(f'Compiled {n_success} of {len(report)} models')
+        for entry in report:
+            if entry['success']:
+                print(f'  {entry["output_dir"]}: {entry["time"]:.1f} s')
+            else:
+                print(f'  {entry["output_dir"]}: FAILED ({entry["error"]})')
+
+    return report
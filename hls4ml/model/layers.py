@@ -39,6 +39,48 @@ class classproperty:
         return self.func(owner)
 
 
+def _updates_index(method):
+    def wrapper(self, *args, **kwargs):
+        graph = self.node._indexing_graph()
+        if graph is None:
+            return method(self, *args, **kwargs)
+        graph._unindex(self.node)
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            graph._index(self.node)
+
+    wrapper.__name__ = method.__name__
+    return wrapper
+
+
+class TensorList(list):
+    """The list of the input or output tensors of a layer.
+
+    Changes to the list are reflected in the index of the tensors of the model graph containing the layer.
+    """
+
+    def __init__(self, node, tensors=()):
+        super().__init__(tensors)
+        self.node = node
+
+    def __reduce__(self):
+        return TensorList, (self.node, list(self))
+
+    __setitem__ = _updates_index(list.__setitem__)
+    __delitem__ = _updates_index(list.__delitem__)
+    __iadd__ = _updates_index(list.__iadd__)
+    __imul__ = _updates_index(list.__imul__)
+    append = _updates_index(list.append)
+    extend = _updates_index(list.extend)
+    insert = _updates_index(list.insert)
+    pop = _updates_index(list.pop)
+    remove = _updates_index(list.remove)
+    clear = _updates_index(list.clear)
+    sort = _updates_index(list.sort)
+    reverse = _updates_index(list.reverse)
+
+
 class Layer:
     """The base class for all layers, which are the nodes in the model graph.
     Note:  they don't necessarily correspond 1:1 with the network layers.
@@ -91,6 +133,12 @@ class Layer:
         self.attributes = AttributeDict(self)
         self.attributes.update(attributes)
 
+        # Attributes holding the lists the layer was created with share the tensor lists of the layer, so they see the
+        # changes made to them
+        for key, tensors in (('inputs', inputs), ('outputs', outputs)):
+            if tensors is not None and attributes.get(key) is tensors:
+                self.attributes[key] = getattr(self, key)
+
         self.set_attr('index', self.index)
 
         self.weights = WeightMapping(self.attributes)
@@ -119,6 +167,42 @@ class Layer:
         self.initialize()
         self._validate_attributes()
 
+    @property
+    def inputs(self):
+        """list: Names of the input tensors of the layer."""
+        return self._inputs
+
+    @inputs.setter
+    def inputs(self, inputs):
+        self._set_tensors('_inputs', inputs)
+
+    @property
+    def outputs(self):
+        """list: Names of the output tensors of the layer."""
+        return self._outputs
+
+    @outputs.setter
+    def outputs(self, outputs):
+        self._set_tensors('_outputs', outputs)
+
+    def _set_tensors(self, key, tensors):
+        if tensors is not None:
+            tensors = TensorList(self, tensors)
+        graph = self._indexing_graph()
+        if graph is None:
+            self.__dict__[key] = tensors
+            return
+        graph._unindex(self)
+        self.__dict__[key] = tensors
+        graph._index(self)
+
+    def _indexing_graph(self):
+        # The graph indexing the tensors of the layer, if the layer is one of the nodes of its model
+        graph = getattr(self.__dict__.get('model'), 'graph', None)
+        if graph is None or not hasattr(graph, 'get_consumers') or graph.get(self.__dict__.get('name')) is not self:
+            return None
+        return graph
+
     @property
     def class_name(self, include_wrapped=False):
         if include_wrapped:
@@ -195,11 +279,7 @@ class Layer:
                 input_name = self.inputs[0]
             else:
                 return None
-        nodes = [node for node in self.model.graph.values() if input_name in node.outputs]
-        if len(nodes) == 0:
-            return None
-        else:
-            return nodes[0]
+        return self.model.get_producer(input_name)
 
     def get_input_variable(self, input_name=None):
         if input_name is not None:
@@ -210,11 +290,7 @@ class Layer:
     def get_output_use_map(self):
         output_map = {}
         for output in self.outputs:
-            output_map[output] = []
-            for layer in self.model.get_layers():
-                for inp in layer.inputs:
-                    if output == inp:
-                        output_map[output].append(layer)
+            output_map[output] = self.model.get_consumers(output)
         return output_map
 
     def get_output_nodes(self, output_name=None):
@@ -224,10 +300,7 @@ class Layer:
         else:
             outputs = self.outputs
         for output in outputs:
-            for layer in self.model.get_layers():
-                for inp in layer.inputs:
-                    if output == inp:
-                        output_nodes.append(layer)
+            output_nodes.extend(self.model.get_consumers(output))
         return output_nodes
 
     def get_output_variable(self, output_name=None):
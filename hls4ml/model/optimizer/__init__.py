@@ -1,5 +1,3 @@
-import os
-
 from hls4ml.model.flow.flow import register_flow
 from hls4ml.model.optimizer.optimizer import (  # noqa: F401
     ConfigurableOptimizerPass,
@@ -19,17 +17,6 @@ from hls4ml.model.optimizer.optimizer import (  # noqa: F401
     register_pass,
 )
 
-opt_path = os.path.dirname(__file__) + '/passes'
-module_path = __name__ + '.passes'
-
-optimizers = extract_optimizers_from_path(opt_path, module_path)
-for opt_name, opt in optimizers.items():
-    register_pass(opt_name, opt)
-
-del opt_path
-del module_path
-del optimizers
-
 register_flow(
     'parse_qonnx',
     [
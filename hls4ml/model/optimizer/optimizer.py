@@ -1,6 +1,8 @@
+import heapq
 import importlib
 import inspect
 import os
+import time
 
 from hls4ml.utils.string_utils import convert_to_snake_case
 
@@ -213,6 +215,25 @@ def extract_optimizers_from_object(clazz):
 # Optimizer registry
 
 optimizer_map = {}
+_model_passes_loaded = False
+
+
+def _load_model_passes():
+    # The passes in hls4ml/model/optimizer/passes are imported and registered the first time the registry is used
+    global _model_passes_loaded
+    if _model_passes_loaded:
+        return
+    _model_passes_loaded = True
+    opt_path = os.path.dirname(__file__) + '/passes'
+    for opt_name, opt in extract_optimizers_from_path(opt_path, __package__ + '.passes').items():
+        register_pass(opt_name, opt)
+
+
+def _load_backend(name):
+    # Backends register their flows and passes when they are first used
+    from hls4ml.backends.backend import load_backend
+
+    load_backend(name)
 
 
 def _get_backend_name_prefix(name, backend):
@@ -237,6 +258,7 @@ def register_pass(name, opt_cls, backend=None):
     Returns:
         str: The name of the registered optimizer.
     """
+    _load_model_passes()
     name = _get_backend_name_prefix(name, backend)
 
     if name in optimizer_map:
@@ -264,6 +286,10 @@ def get_optimizer(name):
     Returns:
         OptimizerPass: The optimizer from the registry.
     """
+    if name not in optimizer_map:
+        _load_model_passes()
+        if ':' in name:
+            _load_backend(name.split(':')[0])
     if name in optimizer_map:
         return optimizer_map[name]
     else:
@@ -279,6 +305,7 @@ def get_backend_passes(backend):
     Returns:
         list: List of optimizer names registered with the given backend.
     """
+    _load_backend(backend)
     return [opt for opt in optimizer_map.keys() if opt.startswith(backend.lower() + ':')]
 
 
@@ -288,41 +315,219 @@ def get_available_passes():
     Returns:
         list: List of registered passes.
     """
+    from hls4ml.backends.backend import load_all_backends
+
+    _load_model_passes()
+    load_all_backends()
     return list(optimizer_map.keys())
 
 
-def optimize_model(model, passes):
+class _GraphTracker:
+    """Tracks the nodes of the model graph that changed while optimizing the model.
+
+    The state of a node (its connections, attributes and the types of its variables) is compared after a transform. A
+    changed node and its producers and consumers are added to the worklist (``pending``) of every pass that can match
+    them, the other nodes don't need to be matched again by the passes that already visited them. The nodes added to,
+    removed from or connected differently in the graph are recorded by the graph itself, with their former neighbours.
+    """
+
+    def __init__(self, model, optimizers):
+        self.model = model
+        self.optimizers = optimizers
+        self.states = {}
+        self.pending = {opt_name: set() for opt_name in optimizers}
+        self.structure_version = 0
+        self._passes_by_class = {}
+        self._model_state = None
+        self._changes = model.graph.track_changes()
+        self.refresh()
+
+    def close(self):
+        """Stop tracking the changes of the model graph."""
+        self.model.graph.untrack_changes(self._changes)
+
+    @staticmethod
+    def _value_state(value):
+        if isinstance(value, (bool, int, float, str, type(None))):
+            return value
+        if isinstance(value, (list, tuple)):
+            return tuple(_GraphTracker._value_state(v) for v in value)
+        if hasattr(value, 'precision'):  # NamedType
+            return (id(value), value.name, str(value.precision))
+        if hasattr(value, 'type') and hasattr(value.type, 'precision'):  # Variables
+            return (id(value), value.name, id(value.type), value.type.name, str(value.type.precision))
+        return id(value)
+
+    def _node_state(self, node):
+        value_state = self._value_state
+        return (
+            tuple(node.inputs),
+            tuple(node.outputs),
+            tuple((key, value_state(value)) for key, value in node.attributes.attributes.items()),
+        )
+
+    def _neighbours(self, node):
+        graph = self.model.graph
+        neighbours = [graph.get_producer(inp) for inp in node.inputs]
+        for output in node.outputs:
+            neighbours.extend(graph.get_consumers(output))
+        return [n for n in neighbours if n is not None]
+
+    def passes_for(self, node):
+        """Return the names of the passes that can match the node, indexed by the layer class of the passes."""
+        node_class = type(node)
+        if node_class not in self._passes_by_class:
+            self._passes_by_class[node_class] = [
+                opt_name
+                for opt_name, opt in self.optimizers.items()
+                if not (isinstance(opt, LayerOptimizerPass) and type(opt).match is WrappedOptimizerPass.match)
+                or isinstance(node, opt.layer_class)
+            ]
+        return self._passes_by_class[node_class]
+
+    def touched_by(self, node):
+        """Return the matched node and its neighbours, the nodes checked for changes after a transform."""
+        return [node] + self._neighbours(node)
+
+    def refresh(self, nodes=None):
+        """Detect the changes of the given nodes (or of the whole graph) and mark them for matching again.
+
+        Args:
+            nodes (list, optional): The nodes possibly changed by a transform, besides the ones added, removed or
+                connected differently. If None, the whole graph is checked.
+
+        Returns:
+            set: The names of the nodes to match again.
+        """
+        graph = self.model.graph
+        recorded = list(self._changes)
+        self._changes.clear()
+
+        model_state = (tuple(self.model.inputs), tuple(self.model.outputs))
+        if model_state != self._model_state:
+            # Inputs or outputs of the model changed, match everything again
+            self._model_state = model_state
+            self.states.clear()
+            nodes = None
+
+        if nodes is None:
+            nodes = list(graph.values()) + [node for name, (node, _) in self.states.items() if graph.get(name) is not node]
+        else:
+            nodes = list(nodes) + recorded
+
+        changed = []
+        for node in nodes:
+            if graph.get(node.name) is not node:
+                # Removed from the graph, its former neighbours have to be matched again
+                if node.name in self.states and self.states[node.name][0] is node:
+                    del self.states[node.name]
+                continue
+            state = self._node_state(node)
+            old = self.states.get(node.name)
+            if old is None or old[0] is not node or old[1] != state:
+                changed.append(node)
+                self.states[node.name] = (node, state)
+
+        if recorded:
+            self.structure_version += 1
+        elif not changed:
+            return set()
+
+        # The former neighbours of a rewired node were recorded by the graph, the current ones are added here
+        touched = changed + recorded
+        for node in changed:
+            touched.extend(self._neighbours(node))
+
+        names = set()
+        for node in touched:
+            if node.name in names or graph.get(node.name) is not node:
+                continue
+            names.add(node.name)
+            for opt_name in self.passes_for(node):
+                self.pending[opt_name].add(node.name)
+
+        return names
+
+
+def optimize_model(model, passes, profile=None):
     """Optimize a given model with the given passes.
 
     The passes are attempted until all passes no longer match or no changes to the model graph occur.
 
+    The passes are tried in order on the nodes of the graph, in order. Once a transform changes the graph, the passes are
+    tried again from the first one. Only the nodes that changed since a pass last visited them, or whose producers or
+    consumers changed, are matched again, and the passes wrapping a layer optimizer are only tried on nodes of their
+    layer class. A node's state includes its connections, attributes and the types of its variables.
+
     Args:
         model (ModelGraph): The model to optimize.
         passes (list): List of passes to apply.
+        profile (FlowProfile, optional): If given, the time spent in each pass and the number of matches and transforms
+            are recorded in it. Defaults to None.
 
     Returns:
         set: The set of applied passes (the passes that matched the predicate).
     """
     optimizers = {opt_pass: get_optimizer(opt_pass) for opt_pass in passes}
     applied_passes = set()
+    tracker = _GraphTracker(model, optimizers)
+    try:
+        _run_passes(model, optimizers, tracker, applied_passes, profile)
+    finally:
+        tracker.close()
+
+    return applied_passes
+
+
+def _run_passes(model, optimizers, tracker, applied_passes, profile):
+    graph_key = None
     optimization_done = False
     while not optimization_done:
         for opt_name, opt in optimizers.items():
             if isinstance(opt, ModelOptimizerPass) and opt_name not in applied_passes:
+                start, n_nodes = time.perf_counter(), len(model.graph)
                 res = opt.transform(model)
                 if res:
                     applied_passes.add(opt_name)
+                if profile is not None:
+                    profile.add_pass(opt_name, start, 0, 1, int(bool(res)), n_nodes, len(model.graph))
+                tracker.refresh()
                 continue
-            for node in model.graph.values():
+            pending = tracker.pending[opt_name]
+            if not pending:
+                continue
+            start, n_nodes = time.perf_counter(), len(model.graph)
+            n_matches = n_transforms = 0
+            if graph_key != (id(model.graph), len(model.graph), tracker.structure_version):
+                graph_key = (id(model.graph), len(model.graph), tracker.structure_version)
+                nodes = list(model.graph.values())
+                position = {node.name: i for i, node in enumerate(nodes)}
+            worklist = [position[name] for name in pending if name in position]
+            heapq.heapify(worklist)
+            res = False
+            while worklist:
+                i = heapq.heappop(worklist)
+                node = nodes[i]
+                if node.name not in pending:
+                    continue  # Already visited
+                pending.discard(node.name)
+                n_matches += 1
                 if opt.match(node):
+                    touched = tracker.touched_by(node)
                     res = opt.transform(model, node)
+                    n_transforms += 1
                     applied_passes.add(opt_name)
                     if res:
+                        tracker.refresh(touched)
                         break
-            else:
-                continue
-            break
+                    # Nodes further in the graph changed by the transform are visited in this round
+                    for name in tracker.refresh(touched + tracker.touched_by(node)):
+                        if name in pending and position.get(name, -1) > i:
+                            heapq.heappush(worklist, position[name])
+                    pending.discard(node.name)
+            if profile is not None:
+                profile.add_pass(opt_name, start, n_matches, n_transforms, int(bool(res)), n_nodes, len(model.graph))
+            if res:
+                break
         else:
             optimization_done = True
-
-    return applied_passes
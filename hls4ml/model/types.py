@@ -447,19 +447,97 @@ class WeightVariable(Variable):
         self.quantizer = quantizer
 
     def __iter__(self):
-        self._iterator = np.nditer(self.data, order='C')
+        self._iterator = iter(self.format_values())
         return self
 
     def __next__(self):
-        if not self._iterator.finished:
-            value = self._iterator[0]
-            self._iterator.iternext()
-            return self.precision_fmt.format(value)
-        else:
-            raise StopIteration
+        return next(self._iterator)
 
     next = __next__
 
+    def format_values(self, raw=False):
+        """Format all the values of the tensor at once, as they are written in the C++ initializer of the weights.
+
+        The values are converted to Python scalars in bulk and formatted without going through the iterator protocol,
+        which is much faster than iterating over large arrays.
+
+        Args:
+            raw (bool, optional): If True, the values are formatted as the integer codes returned by ``raw_values()``.
+                Defaults to False.
+
+        Returns:
+            list: The formatted values, in C order.
+        """
+        if raw:
+            return list(map(str, self.raw_values().tolist()))
+        return list(map(self.precision_fmt.format, np.ravel(self.data, order='C').tolist()))
+
+    def supports_raw_values(self):
+        """Check if the values of the tensor can be represented by the integer codes of ``raw_values()``.
+
+        Returns:
+            bool: True for fixed-point types of at most 53 bits (so that the codes are computed exactly in double
+            precision), False otherwise.
+        """
+        precision = self.type.precision
+        if not isinstance(precision, FixedPrecisionType) or precision.width > 53:
+            return False
+        # The saturation bits of the wrap mode are not supported
+        return precision.saturation_mode != SaturationMode.WRAP or precision.saturation_bits == 0
+
+    def raw_values(self):
+        """Quantize the values of the tensor to its fixed-point precision and return their integer codes.
+
+        The code of a value ``x`` of type ``fixed<W,I>`` is the ``W``-bit integer nearest to ``x * 2**(W-I)`` according to
+        the rounding mode of the type, with overflows handled according to its saturation mode. It is the bit pattern of
+        the quantized value, interpreted as a signed integer for signed types.
+
+        Raises:
+            Exception: If the precision of the tensor is not supported, see ``supports_raw_values()``.
+
+        Returns:
+            ndarray: The codes, in C order.
+        """
+        if not self.supports_raw_values():
+            raise Exception(f'Cannot represent the values of {self.name} with precision {self.type.precision} as raw codes')
+
+        precision = self.type.precision
+        # Scaling by a power of two is exact
+        x = np.ravel(self.data, order='C').astype(np.float64) * 2.0**precision.fractional
+
+        rounding_mode = precision.rounding_mode
+        if rounding_mode == RoundingMode.TRN:
+            x = np.floor(x)
+        elif rounding_mode == RoundingMode.TRN_ZERO:
+            x = np.trunc(x)
+        elif rounding_mode == RoundingMode.RND:
+            x = np.floor(x + 0.5)
+        elif rounding_mode == RoundingMode.RND_ZERO:
+            x = np.sign(x) * np.ceil(np.abs(x) - 0.5)
+        elif rounding_mode == RoundingMode.RND_INF:
+            x = np.sign(x) * np.floor(np.abs(x) + 0.5)
+        elif rounding_mode == RoundingMode.RND_MIN_INF:
+            x = np.ceil(x - 0.5)
+        elif rounding_mode == RoundingMode.RND_CONV:
+            x = np.rint(x)
+
+        if precision.signed:
+            min_code, max_code = -(2.0 ** (precision.width - 1)), 2.0 ** (precision.width - 1) - 1
+        else:
+            min_code, max_code = 0.0, 2.0**precision.width - 1
+
+        saturation_mode = precision.saturation_mode
+        if saturation_mode == SaturationMode.WRAP:
+            x = np.mod(x - min_code, 2.0**precision.width) + min_code
+        elif saturation_mode == SaturationMode.SAT:
+            x = np.clip(x, min_code, max_code)
+        elif saturation_mode == SaturationMode.SAT_ZERO:
+            x = np.where((x < min_code) | (x > max_code), 0.0, x)
+        elif saturation_mode == SaturationMode.SAT_SYM:
+            x = np.clip(x, min_code + 1 if precision.signed else min_code, max_code)
+
+        return x.astype(np.int64)
+
     def update_precision(self, new_precision):
         self.type.precision = new_precision
         if isinstance(new_precision, UnspecifiedPrecisionType):
@@ -520,16 +598,25 @@ class CompressedWeightVariable(WeightVariable):
 
         self.data = weights
 
-    def __iter__(self):
-        self._iterator = iter(self.data)
-        return self
+    def supports_raw_values(self):
+        return False
 
-    def __next__(self):
-        value = next(self._iterator)
-        value_fmt = self.precision_fmt.format(value[2])
-        return f'{{{value[1]}, {value[0]}, {value_fmt}}}'
+    def format_values(self, raw=False):
+        """Format all the values of the tensor at once, as ``{row_index, col_index, weight}`` structs.
 
-    next = __next__
+        Args:
+            raw (bool, optional): Not supported by compressed weights. Defaults to False.
+
+        Returns:
+            list: The formatted values, sorted by column and row index.
+        """
+        if raw:
+            raise Exception(f'Cannot represent the values of {self.name} as raw codes')
+        if len(self.data) == 0:
+            return []
+        cols, rows, weights = zip(*self.data)
+        weights = map(self.precision_fmt.format, np.asarray(weights).tolist())
+        return list(map('{{{}, {}, {}}}'.format, rows, cols, weights))
 
 
 class ExponentWeightVariable(WeightVariable):
@@ -557,17 +644,23 @@ class ExponentWeightVariable(WeightVariable):
         y = (np.log2(np.abs(y)) / np.log2(2.0)).astype('int')
         return np.stack((sign, y), axis=-1)
 
-    def __iter__(self):
-        data = self._format()
-        self._iterator = iter(data.reshape((np.product(data.shape[:-1]), 2)))
-        return self
+    def supports_raw_values(self):
+        return False
 
-    def __next__(self):
-        value = next(self._iterator)
-        value_fmt = self.precision_fmt.format(value[1])
-        return f'{{{value[0]}, {value_fmt}}}'
+    def format_values(self, raw=False):
+        """Format all the values of the tensor at once, as ``{sign, weight}`` structs.
 
-    next = __next__
+        Args:
+            raw (bool, optional): Not supported by exponent weights. Defaults to False.
+
+        Returns:
+            list: The formatted values, in C order.
+        """
+        if raw:
+            raise Exception(f'Cannot represent the values of {self.name} as raw codes')
+        data = self._format().reshape(-1, 2)
+        weights = map(self.precision_fmt.format, data[:, 1].tolist())
+        return list(map('{{{}, {}}}'.format, data[:, 0].tolist(), weights))
 
 
 # endregion
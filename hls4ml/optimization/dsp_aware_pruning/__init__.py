@@ -32,6 +32,9 @@ def optimize_keras_model_for_hls4ml(
     tuner='Bayesian',
     knapsack_solver='CBC_MIP',
     regularization_range=default_regularization_range,
+    ranking_batch_size=None,
+    hutchinson_samples=0,
+    resume=False,
 ):
     '''
     Top-level function for optimizing a Keras model, given hls4ml config and a hardware objective(s)
@@ -68,8 +71,14 @@ def optimize_keras_model_for_hls4ml(
         directory (string): Directory to store temporary results
         tuner (str): Tuning algorithm, choose between Bayesian, Hyperband and None
         knapsack_solver (str): Algorithm to solve Knapsack problem when optimizing;
-            default usually works well; for very large networks, greedy algorithm might be more suitable
+            default usually works well; for very large networks, greedy or lagrangian algorithms might be more suitable
         regularization_range (list): List of suitable hyperparameters for weight decay
+        ranking_batch_size (int): Number of samples processed at once when computing the gradients or second derivatives
+            used for ranking weights (oracle and saliency metrics); if None, the training batch size is used
+        hutchinson_samples (int): If positive, the second derivatives for the saliency metric are estimated
+            with Hutchinson's method, with the given number of random vectors per batch
+        resume (boolean): Continue an interrupted optimization from the checkpoint in directory;
+            the checkpoint is updated after every sparsity step and, if there is none, optimization starts from scratch
 
     Returns:
         keras.Model: Optimized model
@@ -105,4 +114,7 @@ def optimize_keras_model_for_hls4ml(
         tuner=tuner,
         knapsack_solver=knapsack_solver,
         regularization_range=regularization_range,
+        ranking_batch_size=ranking_batch_size,
+        hutchinson_samples=hutchinson_samples,
+        resume=resume,
     )
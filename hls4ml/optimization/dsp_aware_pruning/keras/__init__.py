@@ -1,3 +1,4 @@
+import json
 import os
 import time
 
@@ -6,7 +7,7 @@ import tensorflow as tf
 
 import hls4ml.optimization.dsp_aware_pruning.keras.utils as utils
 from hls4ml.optimization.dsp_aware_pruning.config import SUPPORTED_STRUCTURES
-from hls4ml.optimization.dsp_aware_pruning.keras.builder import build_optimizable_model, remove_custom_regularizers
+from hls4ml.optimization.dsp_aware_pruning.keras.builder import build_optimizable_model, co, remove_custom_regularizers
 from hls4ml.optimization.dsp_aware_pruning.keras.config import SUPPORTED_LAYERS, SUPPORTED_METRICS, TMP_DIRECTORY
 from hls4ml.optimization.dsp_aware_pruning.keras.masking import get_model_masks
 from hls4ml.optimization.dsp_aware_pruning.keras.reduction import reduce_model
@@ -41,6 +42,9 @@ def optimize_model(
     tuner='Bayesian',
     knapsack_solver='CBC_MIP',
     regularization_range=default_regularization_range,
+    ranking_batch_size=None,
+    hutchinson_samples=0,
+    resume=False,
 ):
     '''
     Top-level function for optimizing a Keras model, given objectives
@@ -78,8 +82,14 @@ def optimize_model(
         directory (string): Directory to store temporary results
         tuner (str): Tuning algorithm, choose between Bayesian, Hyperband and None
         knapsack_solver (str): Algorithm to solve Knapsack problem when optimizing;
-            default usually works well; for very large networks, greedy algorithm might be more suitable
+            default usually works well; for very large networks, greedy or lagrangian algorithms might be more suitable
         regularization_range (list): List of suitable hyperparameters for weight decay
+        ranking_batch_size (int): Number of samples processed at once when computing the gradients or second derivatives
+            used for ranking weights (oracle and saliency metrics); if None, the training batch size is used
+        hutchinson_samples (int): If positive, the second derivatives for the saliency metric are estimated
+            with Hutchinson's method, with the given number of random vectors per batch
+        resume (boolean): Continue an interrupted optimization from the checkpoint in directory;
+            the checkpoint is updated after every sparsity step and, if there is none, optimization starts from scratch
 
     Returns:
         keras.Model: Optimized model
@@ -112,20 +122,32 @@ def optimize_model(
     validation_dataset = tf.data.Dataset.from_tensor_slices((X_val, y_val))
     validation_dataset = validation_dataset.shuffle(buffer_size=1024).batch(batch_size)
 
-    # Evaluate baseline performance
-    # Use built-in function, and return as list - the metric is the second element (loss if first)
-    model.compile(optimizer, loss_fn, metrics=[validation_metric])
-    baseline_performance = model.evaluate(validation_dataset, verbose=0, return_dict=False)[-1]
-    if verbose:
-        print(f'Baseline performance on validation set: {baseline_performance}')
-
-    # Save best weights
-    # Always save weights to a file, to reduce memory utilization
     if not os.path.isdir(directory):
         os.mkdir(directory)
     if not os.path.isdir(f'{directory}/optimization'):
         os.mkdir(f'{directory}/optimization')
-    model.save_weights(f'{directory}/optimization/best_weights.h5')
+
+    # When resuming, the model (with the tuned regularizers), the state of its optimizer, the scheduler and the
+    # progress of the optimization are restored from the last completed sparsity step
+    optimizable_model, state = (
+        _load_checkpoint(directory, scheduler, optimizer, loss_fn, validation_metric) if resume else (None, None)
+    )
+
+    if state is None:
+        # Evaluate baseline performance
+        # Use built-in function, and return as list - the metric is the second element (loss if first)
+        model.compile(optimizer, loss_fn, metrics=[validation_metric])
+        baseline_performance = model.evaluate(validation_dataset, verbose=0, return_dict=False)[-1]
+
+        # Save best weights
+        # Always save weights to a file, to reduce memory utilization
+        model.save_weights(f'{directory}/optimization/best_weights.h5')
+    else:
+        baseline_performance = state['baseline_performance']
+        if verbose:
+            print(f'Resuming optimization after step {state["step"]}, at a target sparsity of {scheduler.get_sparsity()}')
+    if verbose:
+        print(f'Baseline performance on validation set: {baseline_performance}')
 
     # Identify optimizable layers, given the current objective
     last_optimizable_layer = utils.get_last_layer_with_weights(model)
@@ -151,22 +173,31 @@ def optimize_model(
             model_attributes[layer.name].optimization_attributes = None
 
     # Add regularization loss to optimizable layers
-    optimizable_model = build_optimizable_model(
-        model,
-        model_attributes,
-        optimizer,
-        loss_fn,
-        validation_metric,
-        increasing,
-        train_dataset,
-        validation_dataset,
-        batch_size,
-        epochs // 2,
-        verbose=verbose,
-        directory=directory,
-        tuner=tuner,
-        regularization_range=regularization_range,
-    )
+    # The result of the tuning is checkpointed before pruning, so it is not repeated if the optimization is interrupted
+    if state is None:
+        optimizable_model = build_optimizable_model(
+            model,
+            model_attributes,
+            optimizer,
+            loss_fn,
+            validation_metric,
+            increasing,
+            train_dataset,
+            validation_dataset,
+            batch_size,
+            epochs // 2,
+            verbose=verbose,
+            directory=directory,
+            tuner=tuner,
+            regularization_range=regularization_range,
+        )
+        state = {
+            'step': 0,
+            'bad_trials': 0,
+            'sparsity_conditions': True,
+            'baseline_performance': float(baseline_performance),
+        }
+        _save_checkpoint(directory, optimizable_model, scheduler, state)
 
     # Create class for masked backprop (weight freezing)
     masked_backprop = MaskedBackprop(optimizable_model, loss_fn, model_attributes)
@@ -174,17 +205,37 @@ def optimize_model(
     # In certain cases, the model might underperform at the current sparsity level, but perform better at a higher sparsity
     # Therefore, monitor the models performance over several sparsity levels and
     # Only stop pruning after high loss over several trials
-    bad_trials = 0
-    sparsity_conditions = True
+    bad_trials = state['bad_trials']
+    sparsity_conditions = state['sparsity_conditions']
     target_sparsity = scheduler.get_sparsity()
+    step = state['step']
+
+    # Gradients and second derivatives are accumulated over batches, so large data sets fit in memory
+    if ranking_batch_size is None:
+        ranking_batch_size = batch_size
+
+    # The resources estimated by the objective don't change between sparsity steps, so they are only estimated once
+    # The Lagrangian knapsack solver is warm-started from the solution at the previous sparsity
+    resource_estimates = {}
+    knapsack_state = {}
 
     while sparsity_conditions:
-        # TODO - This might cause OOM issues on large models / data sets, since it is not done in batches
         gradients = (
-            utils.get_model_gradients(optimizable_model, loss_fn, X_train, y_train) if ranking_metric == 'gradients' else {}
+            utils.get_model_gradients(optimizable_model, loss_fn, X_train, y_train, batch_size=ranking_batch_size)
+            if ranking_metric == 'oracle'
+            else {}
         )
         hessians = (
-            utils.get_model_hessians(optimizable_model, loss_fn, X_train, y_train) if ranking_metric == 'saliency' else {}
+            utils.get_model_hessians(
+                optimizable_model,
+                loss_fn,
+                X_train,
+                y_train,
+                batch_size=ranking_batch_size,
+                hutchinson_samples=hutchinson_samples,
+            )
+            if ranking_metric == 'saliency'
+            else {}
         )
 
         # Mask weights
@@ -198,6 +249,8 @@ def optimize_model(
             gradients=gradients,
             hessians=hessians,
             knapsack_solver=knapsack_solver,
+            resource_estimates=resource_estimates,
+            knapsack_state=knapsack_state,
         )
         for layer in optimizable_model.layers:
             if isinstance(layer, SUPPORTED_LAYERS) and model_attributes[layer.name].optimizable:
@@ -249,9 +302,12 @@ def optimize_model(
         else:
             bad_trials += 1
             sparsity_conditions, target_sparsity = scheduler.repair_step()
+        step += 1
 
         # If the model performed poorly over several sparsity levels, stop optimization [maximum sparsity reached]
         if bad_trials > cutoff_bad_trials:
+            state.update(step=step, bad_trials=bad_trials, sparsity_conditions=False)
+            _save_checkpoint(directory, optimizable_model, scheduler, state)
             break
 
         # Train model without weight freezing [rewinding]
@@ -266,6 +322,10 @@ def optimize_model(
             verbose=verbose,
         )
 
+        # Checkpoint the completed step; masks are not stored, as they are obtained from the weights in the next step
+        state.update(step=step, bad_trials=bad_trials, sparsity_conditions=sparsity_conditions)
+        _save_checkpoint(directory, optimizable_model, scheduler, state)
+
     # Load best weights
     optimizable_model.load_weights(f'{directory}/optimization/best_weights.h5')
 
@@ -294,6 +354,81 @@ def optimize_model(
     return optimizable_model
 
 
+def _save_checkpoint(directory, model, scheduler, state):
+    '''
+    Helper function saving the state of the optimization after a completed sparsity step
+
+    The architecture of the model (including the tuned regularizers), its weights and the state of the optimizer
+    are saved for every step, next to the state of the scheduler and the progress of the optimization.
+    The state file is replaced last and atomically, so an interruption while saving leaves the previous checkpoint valid.
+
+    Args:
+        directory (string): Directory of the optimization
+        model (keras.Model): Model being optimized
+        scheduler (hls4ml.optimization.scheduler.OptimizationScheduler): Sparsity scheduler
+        state (dict): Progress of the optimization - step, bad trials etc.
+    '''
+    checkpoint_dir = f'{directory}/optimization/checkpoint'
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    prefix = f'step_{state["step"]}'
+    with open(f'{checkpoint_dir}/{prefix}.json', 'w') as f:
+        f.write(model.to_json())
+    tf.train.Checkpoint(model=model, optimizer=model.optimizer).write(f'{checkpoint_dir}/{prefix}')
+
+    state = dict(state, prefix=prefix, scheduler=type(scheduler).__name__, scheduler_state=vars(scheduler))
+    with open(f'{checkpoint_dir}/state.json.tmp', 'w') as f:
+        json.dump(state, f)
+    os.replace(f'{checkpoint_dir}/state.json.tmp', f'{checkpoint_dir}/state.json')
+
+    # Remove the checkpoints of previous steps
+    for file in os.listdir(checkpoint_dir):
+        if file.startswith('step_') and not file.startswith(f'{prefix}.'):
+            os.remove(f'{checkpoint_dir}/{file}')
+
+
+def _load_checkpoint(directory, scheduler, optimizer, loss_fn, validation_metric):
+    '''
+    Helper function restoring the state of the optimization saved by _save_checkpoint
+
+    Args:
+        directory (string): Directory of the optimization
+        scheduler (hls4ml.optimization.scheduler.OptimizationScheduler): Sparsity scheduler, updated in place
+        optimizer (keras.optimizers.Optimizer or equivalent-string description): Optimizer used during training
+        loss_fn (keras.losses.Loss): Loss function used during training
+        validation_metric (keras.metrics.Metric or equivalent loss description): Validation metric
+
+    Returns:
+        tuple containing
+
+        - model (keras.Model) - Model with the tuned regularizers, weights and optimizer state; None without checkpoint
+        - state (dict) - Progress of the optimization; None without checkpoint
+    '''
+    checkpoint_dir = f'{directory}/optimization/checkpoint'
+    if not os.path.isfile(f'{checkpoint_dir}/state.json'):
+        return None, None
+
+    with open(f'{checkpoint_dir}/state.json') as f:
+        state = json.load(f)
+    if state['scheduler'] != type(scheduler).__name__:
+        raise Exception(
+            f'Cannot resume the optimization in {directory} with {type(scheduler).__name__}, '
+            f'the checkpoint was saved with {state["scheduler"]}'
+        )
+    vars(scheduler).update(state.pop('scheduler_state'))
+
+    prefix = f'{checkpoint_dir}/{state.pop("prefix")}'
+    with open(f'{prefix}.json') as f:
+        model = tf.keras.models.model_from_json(f.read(), custom_objects=co)
+    model.compile(optimizer, loss_fn, metrics=[validation_metric])
+    # Create the optimizer variables, so that they are restored immediately, rather than on the first update
+    # Legacy optimizers restore their variables when they are created
+    if hasattr(model.optimizer, 'build'):
+        model.optimizer.build(model.trainable_variables)
+    tf.train.Checkpoint(model=model, optimizer=model.optimizer).read(prefix).assert_existing_objects_matched()
+
+    return model, state
+
+
 class MaskedBackprop:
     '''
     A helper class to perform masked backprop (training with frozen weights)
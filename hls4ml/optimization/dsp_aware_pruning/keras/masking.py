@@ -2,7 +2,6 @@ import logging
 import sys
 
 import numpy as np
-import tensorflow as tf
 from qkeras import QConv2D, QDense
 from tensorflow.keras.layers import Conv2D, Dense
 
@@ -21,6 +20,8 @@ def get_model_masks(
     gradients=None,
     hessians=None,
     knapsack_solver='CBC_MIP',
+    resource_estimates=None,
+    knapsack_state=None,
 ):
     '''
     Function calculating a binary mask for all optimizable layers
@@ -53,7 +54,11 @@ def get_model_masks(
         hessians (dict): A layer-wise dictionary of second gradients
             (needed for saliency ranking)
         knapsack_solver (str): Algorithm for solving Knapsack problem; recommended is to use default.
-            Unless dealing with highly dimensional problems, in which case greedy is better.
+            Unless dealing with highly dimensional problems, in which case greedy or lagrangian are better.
+        resource_estimates (dict): Layer-wise cache of the resources and savings estimated by the objective;
+            they only depend on the layer attributes, so the same dictionary can be passed at every sparsity step
+        knapsack_state (dict): State of the Lagrangian knapsack solver, used as a warm start at the next sparsity step;
+            in local masking, a layer-wise dictionary of states
 
     Returns:
         tuple containing
@@ -71,17 +76,52 @@ def get_model_masks(
     if metric == 'saliency' and hessians is None:
         raise Exception('Saliency ranking requires second order derivatives')
 
+    if resource_estimates is None:
+        resource_estimates = {}
+
+    if knapsack_state is None:
+        knapsack_state = {}
+
     if local:
         return __get_masks_local(
-            keras_model, model_attributes, sparsity, objective, metric, gradients, hessians, knapsack_solver
+            keras_model,
+            model_attributes,
+            sparsity,
+            objective,
+            metric,
+            gradients,
+            hessians,
+            knapsack_solver,
+            resource_estimates,
+            knapsack_state,
         )
     else:
         return __get_masks_global(
-            keras_model, model_attributes, sparsity, objective, metric, gradients, hessians, knapsack_solver
+            keras_model,
+            model_attributes,
+            sparsity,
+            objective,
+            metric,
+            gradients,
+            hessians,
+            knapsack_solver,
+            resource_estimates,
+            knapsack_state,
         )
 
 
-def __get_masks_local(keras_model, model_attributes, sparsity, objective, metric, gradients, hessians, knapsack_solver):
+def __get_masks_local(
+    keras_model,
+    model_attributes,
+    sparsity,
+    objective,
+    metric,
+    gradients,
+    hessians,
+    knapsack_solver,
+    resource_estimates,
+    knapsack_state,
+):
     '''
     Function calculating a layer-wise binary mask for all optimizable layers
     This function performs layer-wise masking, so all layers have the same sparsity (with respect to the objective)
@@ -101,534 +141,99 @@ def __get_masks_local(keras_model, model_attributes, sparsity, objective, metric
         # So not masking a group without saving is as expected;
         # However, if solved through greedy knaspack an exception will be thrown (division by zero)
         if isinstance(layer, SUPPORTED_LAYERS) and model_attributes[layer.name].optimizable:
-            layer_savings = objective.layer_savings(model_attributes[layer.name])
-            layer_resources = objective.layer_resources(model_attributes[layer.name])
-            target_resources = ((1 - sparsity) * np.array(layer_resources)).astype(int)
-            structure_type = model_attributes[layer.name].optimization_attributes.structure_type
+            layer_savings, layer_resources = __get_layer_resources(
+                layer.name, model_attributes[layer.name], objective, resource_estimates
+            )
+            target_resources = ((1 - sparsity) * layer_resources).astype(int)
+
+            weights = layer.get_weights()[0]
+            groups = __get_weight_groups(
+                layer, weights, model_attributes[layer.name], metric, gradients, hessians, normalize=False
+            )
+            if groups is None:
+                continue
+            values, sharing, means = groups
 
             # All the groups (structures, patterns, blocks) have the same resource utilisation in one layer
             # So we can greedily prune the groups with the lowest "loss" (magnitude, saliency etc.)
             # Greedily pruning the groups with the lowest loss is a special case of the Knapsack problem with equal weights
-            value = layer.get_weights()[0]
-            if metric == 'oracle':
-                value = np.abs(np.multiply(value, gradients[layer.name]))
-                norm = 1
-            elif metric == 'saliency':
-                value = np.multiply(np.square(value), hessians[layer.name])
-                norm = 1
-            elif metric == 'l1':
-                norm = 1
-            else:
-                norm = 2
-
-            if structure_type == SUPPORTED_STRUCTURES.UNSTRUCTURED:
-                if model_attributes[layer.name].optimization_attributes.weight_sharing:
-                    logging.warn('Weight sharing not suitable for unstructured pruning. Ignoring....')
-
-                if model_attributes[layer.name].optimization_attributes.pruning:
-                    # Since no norm is taken, calculate absolute value [avoids removing large negative weights]
-                    value = np.abs(value)
-
-                    # Get all posible indices in the weight tensor
-                    indices = np.indices(value.shape).reshape(value.ndim, -1).T
-
-                    # Find weights with the lowest loss
-                    groups = []
-                    for i in indices:
-                        groups.append(__WeightGroups__(value[tuple(i)], layer_savings, tuple(i)))
-                    _, selected = solve_knapsack(
-                        np.array([g.value for g in groups]),
-                        np.array([g.resources for g in groups]).T,
-                        target_resources,
-                        implementation=knapsack_solver,
-                    )
-
-                    # Selected weights are not masked
-                    mask = np.zeros(value.shape, dtype=value.dtype)
-                    for i in selected:
-                        mask[groups[i].layer_position] = 1
-
-                    # Offsets are always zero (weight sharing not applicable to unstructured)
-                    masks[layer.name] = mask
-                    offsets[layer.name] = np.zeros(value.shape, dtype=value.dtype)
-
-            if structure_type == SUPPORTED_STRUCTURES.STRUCTURED:
-                # Dense -> Masking neurons (columns)
-                if isinstance(layer, (Dense, QDense)):
-                    # If pruning enabled, find cost associated with pruning each neuron
-                    if model_attributes[layer.name].optimization_attributes.pruning:
-                        vals_norm = np.linalg.norm(value, axis=0, ord=norm)
-                    else:
-                        vals_norm = np.full((value.shape[1]), sys.float_info.max, dtype=value.dtype)
-
-                    # If weight sharing enabled, find cost asociated with quantizing nerons to their mean
-                    if model_attributes[layer.name].optimization_attributes.weight_sharing:
-                        vals_var = np.var(value, axis=0)
-                    else:
-                        vals_var = np.full((value.shape[1]), sys.float_info.max, dtype=value.dtype)
-
-                    # Choose min(pruning, weight sharing)
-                    groups = []
-                    for i in range(vals_norm.shape[0]):
-                        if vals_norm[i] <= vals_var[i]:
-                            groups.append(__WeightGroups__(vals_norm[i], layer_savings, i, optimization_type='pruning'))
-                        else:
-                            groups.append(__WeightGroups__(vals_var[i], layer_savings, i, optimization_type='sharing'))
-
-                    # Select neurons with the lowest loss
-                    _, selected = solve_knapsack(
-                        np.array([g.value for g in groups]),
-                        np.array([g.resources for g in groups]).T,
-                        target_resources,
-                        implementation=knapsack_solver,
-                    )
-
-                    # Selected neurons are not masked
-                    mask = np.zeros(value.shape, value.dtype)
-                    for i in selected:
-                        mask[:, groups[i].layer_position] = 1
-
-                    # Masked neurons can either be pruned or quantized
-                    # If quantized, add the corresponding offset
-                    offset = np.zeros(value.shape, value.dtype)
-                    zeros = np.where(~np.all(mask, axis=0))[0]
-                    for i in zeros:
-                        if groups[i].optimization_type == 'sharing':
-                            offset[:, i] = np.mean(layer.get_weights()[0][:, i])
-                    masks[layer.name] = mask
-                    offsets[layer.name] = offset
-
-                # Conv2D -> Masking filters (W x H x C)
-                elif isinstance(layer, (Conv2D, QConv2D)):
-                    if model_attributes[layer.name].optimization_attributes.pruning:
-                        vals_norm = np.linalg.norm(np.linalg.norm(value, axis=(0, 1), ord='fro'), axis=0, ord=norm)
-                    else:
-                        vals_norm = np.full((value.shape[3]), sys.float_info.max, dtype=value.dtype)
-
-                    if model_attributes[layer.name].optimization_attributes.weight_sharing:
-                        vals_var = np.var(np.linalg.norm(value, axis=(0, 1), ord='fro'), axis=0)
-                    else:
-                        vals_var = np.full((value.shape[3]), sys.float_info.max, dtype=value.dtype)
-
-                    groups = []
-                    for i in range(vals_norm.shape[0]):
-                        if vals_norm[i] <= vals_var[i]:
-                            groups.append(__WeightGroups__(vals_norm[i], layer_savings, i, optimization_type='pruning'))
-                        else:
-                            groups.append(__WeightGroups__(vals_var[i], layer_savings, i, optimization_type='sharing'))
-
-                    _, selected = solve_knapsack(
-                        np.array([g.value for g in groups]),
-                        np.array([g.resources for g in groups]).T,
-                        target_resources,
-                        implementation=knapsack_solver,
-                    )
-
-                    mask = np.zeros(value.shape, value.dtype)
-                    for i in selected:
-                        mask[:, :, :, groups[i].layer_position] = 1
-
-                    offset = np.zeros(value.shape, value.dtype)
-                    zeros = np.where(~np.all(mask, axis=(0, 1, 2)))[0]
-                    for i in zeros:
-                        if groups[i].optimization_type == 'sharing':
-                            offset[:, :, :, i] = np.mean(layer.get_weights()[0][:, :, :, i])
-
-                    masks[layer.name] = mask
-                    offsets[layer.name] = offset
-
-            if structure_type == SUPPORTED_STRUCTURES.PATTERN:
-                pattern_offset = model_attributes[layer.name].optimization_attributes.pattern_offset
-                consecutive_patterns = model_attributes[layer.name].optimization_attributes.consecutive_patterns
-
-                if (np.prod(value.shape)) % pattern_offset != 0:
-                    raise Exception('Pattern offset needs to be a factor of matrix size')
-
-                if pattern_offset % consecutive_patterns != 0:
-                    raise Exception('Consecutive patterns need to be a factor of matrix size')
-
-                # Transpose, as done in hls4ml Resource strategy
-                if isinstance(layer, (Dense, QDense)):
-                    value = value.T
-                    transposed_shape = value.shape
-                elif isinstance(layer, (Conv2D, QConv2D)):
-                    value = np.transpose(value, axes=[3, 0, 1, 2])
-                    transposed_shape = value.shape
-
-                # Reshape weight matrix into [number_of_patterns, pattern_offset]
-                # Note, swapping the axis will mess up the weight order
-                # In the case of hls4ml, number_of_patterns is equivalent to reuse factor
-                # And, pattern_offset, is the number of multiplications done in parallel
-                number_of_patterns = np.prod(transposed_shape) // pattern_offset
-                target_shape = (pattern_offset, number_of_patterns)
-                reshaped = np.reshape(value, target_shape)
-
-                # Group consecutive patterns (rows) into blocks and reshape
-                total_blocks = pattern_offset // consecutive_patterns
-                blocks = np.reshape(
-                    tf.image.extract_patches(
-                        np.expand_dims(np.expand_dims(reshaped, 2), 0),
-                        [1, consecutive_patterns, number_of_patterns, 1],
-                        [1, consecutive_patterns, number_of_patterns, 1],
-                        [1, 1, 1, 1],
-                        'SAME',
-                    ).numpy(),
-                    (total_blocks, -1),
-                )
-
-                # If pruning enabled, find cost associated with pruning each neuron
-                if model_attributes[layer.name].optimization_attributes.pruning:
-                    vals_norm = np.linalg.norm(blocks, axis=1, ord=norm)
-                else:
-                    vals_norm = np.full((blocks.shape[0],), sys.float_info.max, dtype=value.dtype)
-
-                # If weight sharing enabled, find cost asociated with quantizing nerons to their mean
-                if model_attributes[layer.name].optimization_attributes.weight_sharing:
-                    vals_var = np.var(blocks, axis=1)
-                else:
-                    vals_var = np.full((blocks.shape[0],), sys.float_info.max, dtype=value.dtype)
-
-                # Choose min(pruning, weight sharing)
-                groups = []
-                for i in range(vals_norm.shape[0]):
-                    if vals_norm[i] <= vals_var[i]:
-                        groups.append(__WeightGroups__(vals_norm[i], layer_savings, i, optimization_type='pruning'))
-                    else:
-                        groups.append(__WeightGroups__(vals_var[i], layer_savings, i, optimization_type='sharing'))
-
-                # Select groups with highest importance
-                _, selected = solve_knapsack(
-                    np.array([g.value for g in groups]),
-                    np.array([g.resources for g in groups]).T,
-                    target_resources,
-                    implementation=knapsack_solver,
-                )
-
-                # Decode masked groups into transposed shape and set selected groups to one
-                mask = np.zeros((np.prod(transposed_shape),), value.dtype)
-                for i in selected:
-                    pos = i * number_of_patterns * consecutive_patterns
-                    for j in range(pos, pos + number_of_patterns * consecutive_patterns, number_of_patterns):
-                        mask[range(j, j + number_of_patterns)] = 1
-
-                        # Decode offset
-                not_selected = [i for i in range(len(groups)) if i not in selected]
-                offset = np.zeros((np.prod(transposed_shape),), value.dtype)
-                for i in not_selected:
-                    if groups[i].optimization_type == 'sharing':
-                        mean = np.mean(blocks[i, :])
-                        pos = i * number_of_patterns * consecutive_patterns
-                        for j in range(pos, pos + number_of_patterns * consecutive_patterns, number_of_patterns):
-                            offset[range(j, j + number_of_patterns)] = mean
-
-                            # Reshape into original shape and store result
-                if isinstance(layer, (Dense, QDense)):
-                    mask = np.reshape(mask, transposed_shape).T
-                    offset = np.reshape(offset, transposed_shape).T
-                elif isinstance(layer, (Conv2D, QConv2D)):
-                    mask = np.transpose(np.reshape(mask, transposed_shape), (1, 2, 3, 0))
-                    offset = np.transpose(np.reshape(offset, transposed_shape), (1, 2, 3, 0))
-                masks[layer.name] = mask
-                offsets[layer.name] = offset
-
-            if structure_type == SUPPORTED_STRUCTURES.BLOCK:
-                if len(value.shape) != 2:
-                    raise Exception('Block pruning is supported for 2-dimensional weight matrices')
-
-                block_shape = model_attributes[layer.name].optimization_attributes.block_shape
-                if (value.shape[0] % block_shape[0]) != 0 or (value.shape[1] % block_shape[1] != 0):
-                    raise Exception('Block sizes need to be fators of weight matrix dimensions')
-
-                # TensorFlow has a built-in method for exctracting sub-tensors of given shape and stride
-                # This method is commonly used to perform im2col,
-                # Docs: https://www.tensorflow.org/api_docs/python/tf/image/extract_patches
-                total_blocks = (value.shape[0] * value.shape[1]) // (block_shape[0] * block_shape[1])
-                blocks_in_row = value.shape[1] // block_shape[1]
-                blocks = np.reshape(
-                    tf.image.extract_patches(
-                        np.expand_dims(np.expand_dims(value, 2), 0),
-                        [1, block_shape[0], block_shape[1], 1],
-                        [1, block_shape[0], block_shape[1], 1],
-                        [1, 1, 1, 1],
-                        'SAME',
-                    ).numpy(),
-                    (total_blocks, block_shape[0] * block_shape[1]),
-                )
-
-                # If pruning enabled, find cost associated with pruning each neuron
-                if model_attributes[layer.name].optimization_attributes.pruning:
-                    vals_norm = np.linalg.norm(blocks, axis=1, ord=norm)
-                else:
-                    vals_norm = np.full((blocks.shape[0],), sys.float_info.max, dtype=value.dtype)
-
-                # If weight sharing enabled, find cost asociated with quantizing nerons to their mean
-                if model_attributes[layer.name].optimization_attributes.weight_sharing:
-                    vals_var = np.var(blocks, axis=1)
-                else:
-                    vals_var = np.full((blocks.shape[0],), sys.float_info.max, dtype=value.dtype)
-
-                # Choose min(pruning, weight sharing)
-                groups = []
-                for i in range(vals_norm.shape[0]):
-                    if vals_norm[i] <= vals_var[i]:
-                        groups.append(__WeightGroups__(vals_norm[i], layer_savings, i, optimization_type='pruning'))
-                    else:
-                        groups.append(__WeightGroups__(vals_var[i], layer_savings, i, optimization_type='sharing'))
-
-                # Select groups with highest importance
-                _, selected = solve_knapsack(
-                    np.array([g.value for g in groups]),
-                    np.array([g.resources for g in groups]).T,
-                    target_resources,
-                    implementation=knapsack_solver,
-                )
-
-                # Decode position of masked weights and set selected weights to one
-                mask = np.zeros(value.shape, value.dtype)
-                for i in selected:
-                    row = block_shape[0] * (i // blocks_in_row)
-                    col = block_shape[1] * (i % blocks_in_row)
-                    cols = np.linspace(col, col + block_shape[1], block_shape[1], endpoint=False, dtype=np.int32)
-                    rows = np.linspace(row, row + block_shape[0], block_shape[0], endpoint=False, dtype=np.int32)
-                    zeros = np.array(np.meshgrid(rows, cols)).T.reshape(-1, 2)
-                    mask[zeros[:, 0], zeros[:, 1]] = 1
-
-                # Calculate offset
-                not_selected = [i for i in range(len(groups)) if i not in selected]
-                offset = np.zeros(value.shape, value.dtype)
-                for i in not_selected:
-                    if groups[i].optimization_type == 'sharing':
-                        mean = np.mean(blocks[i, :])
-                        row = block_shape[0] * (i // blocks_in_row)
-                        col = block_shape[1] * (i % blocks_in_row)
-                        cols = np.linspace(col, col + block_shape[1], block_shape[1], endpoint=False, dtype=np.int32)
-                        rows = np.linspace(row, row + block_shape[0], block_shape[0], endpoint=False, dtype=np.int32)
-                        pos = np.array(np.meshgrid(rows, cols)).T.reshape(-1, 2)
-                        offset[pos[:, 0], pos[:, 1]] = mean
-
-                masks[layer.name] = mask
-                offsets[layer.name] = offset
+            _, selected = solve_knapsack(
+                values,
+                np.repeat(layer_savings[:, np.newaxis], values.shape[0], axis=1),
+                target_resources,
+                implementation=knapsack_solver,
+                state=knapsack_state.setdefault(layer.name, {}),
+            )
+
+            # Selected groups are not masked
+            selected_groups = __to_boolean(selected, values.shape[0])
+            masks[layer.name], offsets[layer.name] = __decode_masks(
+                layer, weights, model_attributes[layer.name], selected_groups, sharing, means
+            )
 
     return masks, offsets
 
 
-def __get_masks_global(keras_model, model_attributes, sparsity, objective, metric, gradients, hessians, knapsack_solver):
+def __get_masks_global(
+    keras_model,
+    model_attributes,
+    sparsity,
+    objective,
+    metric,
+    gradients,
+    hessians,
+    knapsack_solver,
+    resource_estimates,
+    knapsack_state,
+):
     '''
     Function calculating a layer-wise binary mask for all optimizable layers
     Global masking, with layers of different sparsity; masks are calculated by solving a Knapsack problem
     Most of the logic remains similar to local masking; comments describing implementation are given in the function above
     '''
-    groups = []
+    values = []
+    resources = []
     total_resources = []
+    layer_groups = {}
 
-    # Iterate through all layers and create a list of all the optimizable groups (single weight, structure, pattern, block)
-    # Each entry contains the value associated with the group,
-    # Alongside the layer it belongs to and its location in the layer
+    # Iterate through all layers and collect all the optimizable groups (single weight, structure, pattern, block)
+    # The values, resources and types of optimization of the groups are kept as flat arrays,
+    # With the groups of every layer in a contiguous range; its position in the range is the location in the layer
     # The values is normalised w.r.t to the to largest element in the group, to avoid bias towards large layers
     # We also keep track of total model resources, with respect to the objective
     # A detailed comment in the local masking function is given for
     # Considerations on exception of layer savings and how to address them
+    start = 0
     for layer in keras_model.layers:
+        if not (isinstance(layer, SUPPORTED_LAYERS) and model_attributes[layer.name].optimizable):
+            continue
+
         # Optimizable should be always enabled if either pruning or weight sharing are enabled
         # However, if the objectives are implemented incorrectly,
         # It is possible to have optimizatons enabled without any types of optimization (pruning, weight sharing) enabled
-        layer_optimizable = model_attributes[layer.name].optimizable and (
+        # Such layers have no groups and are masked entirely
+        weights = layer.get_weights()[0]
+        groups = None
+        if (
             model_attributes[layer.name].optimization_attributes.weight_sharing
             or model_attributes[layer.name].optimization_attributes.pruning
-        )
-        if isinstance(layer, SUPPORTED_LAYERS) and layer_optimizable:
-            value = layer.get_weights()[0]
-            structure_type = model_attributes[layer.name].optimization_attributes.structure_type
-            layer_savings = objective.layer_savings(model_attributes[layer.name])
-            total_resources.append(objective.layer_resources(model_attributes[layer.name]))
-
-            if metric == 'oracle':
-                value = np.abs(np.multiply(value, gradients[layer.name]))
-                norm = 1
-            elif metric == 'saliency':
-                value = np.multiply(np.square(value), hessians[layer.name])
-                norm = 1
-            elif metric == 'l1':
-                norm = 1
-            else:
-                norm = 2
-
-            if structure_type == SUPPORTED_STRUCTURES.UNSTRUCTURED:
-                if model_attributes[layer.name].optimization_attributes.weight_sharing:
-                    logging.warn('Weight sharing not suitable for unstructured pruning. Ignoring....')
-
-                if model_attributes[layer.name].optimization_attributes.pruning:
-                    value = np.abs(value)
-                    value = value / np.max(value)
-                    indices = np.indices(value.shape).reshape(value.ndim, -1).T
-                    for i in indices:
-                        group = __WeightGroups__(
-                            value[tuple(i)], layer_savings, tuple(i), structure_type, layer.name, 'pruning'
-                        )
-                        groups.append(group)
-
-            if structure_type == SUPPORTED_STRUCTURES.STRUCTURED:
-                if isinstance(layer, (Dense, QDense)):
-                    if model_attributes[layer.name].optimization_attributes.pruning:
-                        vals_norm = np.linalg.norm(value, axis=0, ord=norm)
-                        vals_norm = vals_norm / np.max(vals_norm)
-                    else:
-                        vals_norm = np.full((value.shape[1]), sys.float_info.max, dtype=value.dtype)
-
-                    if model_attributes[layer.name].optimization_attributes.weight_sharing:
-                        vals_var = np.var(value, axis=0)
-                    else:
-                        vals_var = np.full((value.shape[1]), sys.float_info.max, dtype=value.dtype)
-
-                    for i in range(vals_norm.shape[0]):
-                        if vals_norm[i] <= vals_var[i]:
-                            groups.append(
-                                __WeightGroups__(
-                                    vals_norm[i], layer_savings, i, structure_type, layer.name, optimization_type='pruning'
-                                )
-                            )
-                        else:
-                            groups.append(
-                                __WeightGroups__(
-                                    vals_var[i], layer_savings, i, structure_type, layer.name, optimization_type='sharing'
-                                )
-                            )
-
-                elif isinstance(layer, (Conv2D, QConv2D)):
-                    if model_attributes[layer.name].optimization_attributes.pruning:
-                        vals_norm = np.linalg.norm(np.linalg.norm(value, axis=(0, 1), ord='fro'), axis=0, ord=norm)
-                        vals_norm = vals_norm / np.max(vals_norm)
-                    else:
-                        vals_norm = np.full((value.shape[3]), sys.float_info.max, dtype=value.dtype)
-
-                    if model_attributes[layer.name].optimization_attributes.weight_sharing:
-                        vals_var = np.var(np.linalg.norm(value, axis=(0, 1), ord='fro'), axis=0)
-                    else:
-                        vals_var = np.full((value.shape[3]), sys.float_info.max, dtype=value.dtype)
-
-                    for i in range(vals_norm.shape[0]):
-                        if vals_norm[i] <= vals_var[i]:
-                            groups.append(
-                                __WeightGroups__(
-                                    vals_norm[i], layer_savings, i, structure_type, layer.name, optimization_type='pruning'
-                                )
-                            )
-                        else:
-                            groups.append(
-                                __WeightGroups__(
-                                    vals_var[i], layer_savings, i, structure_type, layer.name, optimization_type='sharing'
-                                )
-                            )
-
-            if structure_type == SUPPORTED_STRUCTURES.PATTERN:
-                pattern_offset = model_attributes[layer.name].optimization_attributes.pattern_offset
-                consecutive_patterns = model_attributes[layer.name].optimization_attributes.consecutive_patterns
-                if (np.prod(value.shape)) % pattern_offset != 0:
-                    raise Exception('Pattern offset needs to be a factor of matrix size')
-
-                if pattern_offset % consecutive_patterns != 0:
-                    raise Exception('Consecutive patterns need to be a factor of matrix size')
-
-                # Transpose, as done in hls4ml Resource strategy
-                if isinstance(layer, (Dense, QDense)):
-                    value = value.T
-                    transposed_shape = value.shape
-                elif isinstance(layer, (Conv2D, QConv2D)):
-                    value = np.transpose(value, axes=[3, 0, 1, 2])
-                    transposed_shape = value.shape
-
-                # Reshape weight matrix into [number_of_patterns, pattern_offset]
-                # Note, swapping the axis will mess up the weight order
-                # In the case of hls4ml, number_of_patterns is equivalent to reuse factor
-                # And, pattern_offset, is the number of multiplications done in parallel
-                number_of_patterns = np.prod(transposed_shape) // pattern_offset
-                target_shape = (pattern_offset, number_of_patterns)
-                reshaped = np.reshape(value, target_shape)
-
-                # Group consecutive patterns (rows) into blocks and reshape
-                total_blocks = pattern_offset // consecutive_patterns
-                blocks = np.reshape(
-                    tf.image.extract_patches(
-                        np.expand_dims(np.expand_dims(reshaped, 2), 0),
-                        [1, consecutive_patterns, number_of_patterns, 1],
-                        [1, consecutive_patterns, number_of_patterns, 1],
-                        [1, 1, 1, 1],
-                        'SAME',
-                    ).numpy(),
-                    (total_blocks, -1),
-                )
-
-                # If pruning enabled, find cost associated with pruning each neuron
-                if model_attributes[layer.name].optimization_attributes.pruning:
-                    vals_norm = np.linalg.norm(blocks, axis=1, ord=norm)
-                else:
-                    vals_norm = np.full((blocks.shape[0],), sys.float_info.max, dtype=value.dtype)
-
-                # If weight sharing enabled, find cost asociated with quantizing nerons to their mean
-                if model_attributes[layer.name].optimization_attributes.weight_sharing:
-                    vals_var = np.var(blocks, axis=1)
-                else:
-                    vals_var = np.full((blocks.shape[0],), sys.float_info.max, dtype=value.dtype)
-
-                # Choose min(pruning, weight sharing)
-                for i in range(vals_norm.shape[0]):
-                    if vals_norm[i] <= vals_var[i]:
-                        groups.append(
-                            __WeightGroups__(
-                                vals_norm[i], layer_savings, i, structure_type, layer.name, optimization_type='pruning'
-                            )
-                        )
-                    else:
-                        groups.append(
-                            __WeightGroups__(
-                                vals_var[i], layer_savings, i, structure_type, layer.name, optimization_type='sharing'
-                            )
-                        )
-
-            if structure_type == SUPPORTED_STRUCTURES.BLOCK:
-                if len(value.shape) != 2:
-                    raise Exception('Block pruning is supported for 2-dimensional weight matrices')
-
-                block_shape = model_attributes[layer.name].optimization_attributes.block_shape
-                if (value.shape[0] % block_shape[0]) != 0 or (value.shape[1] % block_shape[1] != 0):
-                    raise Exception('Block sizes need to be fators of weight matrix dimensions')
-
-                total_blocks = (value.shape[0] * value.shape[1]) // (block_shape[0] * block_shape[1])
-                blocks = np.reshape(
-                    tf.image.extract_patches(
-                        np.expand_dims(np.expand_dims(value, 2), 0),
-                        [1, block_shape[0], block_shape[1], 1],
-                        [1, block_shape[0], block_shape[1], 1],
-                        [1, 1, 1, 1],
-                        'SAME',
-                    ).numpy(),
-                    (total_blocks, block_shape[0] * block_shape[1]),
-                )
-
-                if model_attributes[layer.name].optimization_attributes.pruning:
-                    vals_norm = np.linalg.norm(blocks, axis=1, ord=norm)
-                    vals_norm = vals_norm / np.max(vals_norm)
-                else:
-                    vals_norm = np.full((blocks.shape[0]), sys.float_info.max, dtype=value.dtype)
-
-                if model_attributes[layer.name].optimization_attributes.weight_sharing:
-                    vals_var = np.var(blocks, axis=1)
-                else:
-                    vals_var = np.full((blocks.shape[0]), sys.float_info.max, dtype=value.dtype)
-
-                for i in range(vals_norm.shape[0]):
-                    if vals_norm[i] <= vals_var[i]:
-                        groups.append(
-                            __WeightGroups__(
-                                vals_norm[i], layer_savings, i, structure_type, layer.name, optimization_type='pruning'
-                            )
-                        )
-                    else:
-                        groups.append(
-                            __WeightGroups__(
-                                vals_var[i], layer_savings, i, structure_type, layer.name, optimization_type='sharing'
-                            )
-                        )
+        ):
+            layer_savings, layer_resources = __get_layer_resources(
+                layer.name, model_attributes[layer.name], objective, resource_estimates
+            )
+            total_resources.append(layer_resources)
+            groups = __get_weight_groups(
+                layer, weights, model_attributes[layer.name], metric, gradients, hessians, normalize=True
+            )
+
+        if groups is None:
+            layer_groups[layer.name] = (weights, None, None, None, None)
+        else:
+            layer_values, sharing, means = groups
+            values.append(layer_values)
+            resources.append(np.repeat(layer_savings[:, np.newaxis], layer_values.shape[0], axis=1))
+            layer_groups[layer.name] = (weights, start, start + layer_values.shape[0], sharing, means)
+            start += layer_values.shape[0]
 
     # The goal is to maximize network accuracy (values) subject to resorces (objective) staying under some threshold
     # This is a Knapsack problem; several implementations are provided in the helper functions
@@ -636,161 +241,250 @@ def __get_masks_global(keras_model, model_attributes, sparsity, objective, metri
     total_resources = np.sum(np.array(total_resources), axis=0)
     target_resources = ((1 - sparsity) * np.array(total_resources)).astype(int)
     _, selected = solve_knapsack(
-        np.array([s.value for s in groups]),
-        np.array([s.resources for s in groups]).T,
+        np.concatenate(values),
+        np.concatenate(resources, axis=1),
         target_resources,
         implementation=knapsack_solver,
+        state=knapsack_state,
     )
+    selected_groups = __to_boolean(selected, start)
+
     # Update masks and offsets
     masks = {}
     offsets = {}
-
     for layer in keras_model.layers:
-        if isinstance(layer, SUPPORTED_LAYERS) and model_attributes[layer.name].optimizable:
-            structure_type = model_attributes[layer.name].optimization_attributes.structure_type
-            selected_layer = [i for i in selected if groups[i].layer_name == layer.name]
-            not_selected_layer = [
-                i for i in range(len(groups)) if groups[i].layer_name == layer.name and i not in selected_layer
-            ]
-
-            if structure_type == SUPPORTED_STRUCTURES.UNSTRUCTURED:
-                mask = np.zeros(model_attributes[layer.name].weight_shape, layer.get_weights()[0].dtype)
-                for i in selected_layer:
-                    mask[groups[i].layer_position] = 1
-                masks[layer.name] = mask
-                offsets[layer.name] = np.zeros(model_attributes[layer.name].weight_shape, layer.get_weights()[0].dtype)
-
-            if structure_type == SUPPORTED_STRUCTURES.STRUCTURED:
-                mask = np.zeros(model_attributes[layer.name].weight_shape, layer.get_weights()[0].dtype)
-                offset = np.zeros(model_attributes[layer.name].weight_shape, layer.get_weights()[0].dtype)
-                if isinstance(layer, (Dense, QDense)):
-                    for i in selected_layer:
-                        mask[:, groups[i].layer_position] = 1
-                    for i in not_selected_layer:
-                        if groups[i].optimization_type == 'sharing':
-                            offset[:, groups[i].layer_position] = np.mean(layer.get_weights()[0][:, i])
-                if isinstance(layer, (Conv2D, QConv2D)):
-                    for i in selected_layer:
-                        mask[:, :, :, groups[i].layer_position] = 1
-                    for i in not_selected_layer:
-                        if groups[i].optimization_type == 'sharing':
-                            offset[
-                                :,
-                                :,
-                                :,
-                                groups[i].layer_position,
-                            ] = np.mean(layer.get_weights()[0][:, :, :, i])
-                masks[layer.name] = mask
-                offsets[layer.name] = offset
-
-            if structure_type == SUPPORTED_STRUCTURES.PATTERN:
-                pattern_offset = model_attributes[layer.name].optimization_attributes.pattern_offset
-                consecutive_patterns = model_attributes[layer.name].optimization_attributes.consecutive_patterns
-                number_of_patterns = np.prod(model_attributes[layer.name].weight_shape) // pattern_offset
-
-                # Transpose shape, as done in hls4ml Resource strategy
-                # We need the weights to recalculate the block means
-                weight_shape = model_attributes[layer.name].weight_shape
-                if isinstance(layer, (Dense, QDense)):
-                    value = layer.get_weights()[0].T
-                    transposed_shape = (weight_shape[1], weight_shape[0])
-                elif isinstance(layer, (Conv2D, QConv2D)):
-                    value = np.transpose(layer.get_weights()[0], (3, 0, 1, 2))
-                    transposed_shape = (weight_shape[3], weight_shape[0], weight_shape[1], weight_shape[2])
-
-                # Decode masks
-                mask = np.zeros((np.prod(transposed_shape),), layer.get_weights()[0].dtype)
-                for i in selected_layer:
-                    pos = groups[i].layer_position * number_of_patterns * consecutive_patterns
-                    for j in range(pos, pos + number_of_patterns * consecutive_patterns, number_of_patterns):
-                        mask[range(j, j + number_of_patterns)] = 1
-
-                        # Decode offsets
-                offset = np.zeros((np.prod(transposed_shape),), layer.get_weights()[0].dtype)
-
-                # Re-calculate the blocks, they are needed to calculate block means
-                target_shape = (pattern_offset, number_of_patterns)
-                reshaped = np.reshape(value, target_shape)
-
-                total_blocks = pattern_offset // consecutive_patterns
-                blocks = np.reshape(
-                    tf.image.extract_patches(
-                        np.expand_dims(np.expand_dims(reshaped, 2), 0),
-                        [1, consecutive_patterns, number_of_patterns, 1],
-                        [1, consecutive_patterns, number_of_patterns, 1],
-                        [1, 1, 1, 1],
-                        'SAME',
-                    ).numpy(),
-                    (total_blocks, -1),
+        if layer.name in layer_groups:
+            weights, layer_start, layer_end, sharing, means = layer_groups[layer.name]
+            if layer_start is None:
+                masks[layer.name] = np.zeros(weights.shape, weights.dtype)
+                offsets[layer.name] = np.zeros(weights.shape, weights.dtype)
+            else:
+                masks[layer.name], offsets[layer.name] = __decode_masks(
+                    layer,
+                    weights,
+                    model_attributes[layer.name],
+                    selected_groups[layer_start:layer_end],
+                    sharing,
+                    means,
                 )
 
-                for i in not_selected_layer:
-                    if groups[i].optimization_type == 'sharing':
-                        mean = np.mean(blocks[groups[i].layer_position, :])
-                        pos = groups[i].layer_position * number_of_patterns * consecutive_patterns
-                        for j in range(pos, pos + number_of_patterns * consecutive_patterns, number_of_patterns):
-                            offset[range(j, j + number_of_patterns)] = mean
-
-                            # Reshape into original shape and store result
-                if isinstance(layer, (Dense, QDense)):
-                    mask = np.reshape(mask, transposed_shape).T
-                    offset = np.reshape(offset, transposed_shape).T
-                elif isinstance(layer, (Conv2D, QConv2D)):
-                    mask = np.transpose(np.reshape(mask, transposed_shape), (1, 2, 3, 0))
-                    offset = np.transpose(np.reshape(offset, transposed_shape), (1, 2, 3, 0))
-                masks[layer.name] = mask
-                offsets[layer.name] = offset
-
-            if structure_type == SUPPORTED_STRUCTURES.BLOCK:
-                block_shape = model_attributes[layer.name].optimization_attributes.block_shape
-                total_blocks = np.prod(model_attributes[layer.name].weight_shape) // np.prod(block_shape)
-                blocks_in_row = model_attributes[layer.name].weight_shape[1] // block_shape[1]
-                blocks = np.reshape(
-                    tf.image.extract_patches(
-                        np.expand_dims(np.expand_dims(layer.get_weights()[0], 2), 0),
-                        [1, block_shape[0], block_shape[1], 1],
-                        [1, block_shape[0], block_shape[1], 1],
-                        [1, 1, 1, 1],
-                        'SAME',
-                    ).numpy(),
-                    (total_blocks, block_shape[0] * block_shape[1]),
-                )
+    return masks, offsets
 
-                mask = np.zeros(model_attributes[layer.name].weight_shape, layer.get_weights()[0].dtype)
-                for i in selected_layer:
-                    row = block_shape[0] * (groups[i].layer_position // blocks_in_row)
-                    col = block_shape[1] * (groups[i].layer_position % blocks_in_row)
-                    cols = np.linspace(col, col + block_shape[1], block_shape[1], endpoint=False, dtype=np.int32)
-                    rows = np.linspace(row, row + block_shape[0], block_shape[0], endpoint=False, dtype=np.int32)
-                    zeros = np.array(np.meshgrid(rows, cols)).T.reshape(-1, 2)
-                    mask[zeros[:, 0], zeros[:, 1]] = 1
-
-                offset = np.zeros(model_attributes[layer.name].weight_shape, layer.get_weights()[0].dtype)
-                for i in not_selected_layer:
-                    if groups[i].optimization_type == 'sharing':
-                        mean = np.mean(blocks[groups[i].layer_position, :])
-                        row = block_shape[0] * (groups[i].layer_position // blocks_in_row)
-                        col = block_shape[1] * (groups[i].layer_position % blocks_in_row)
-                        cols = np.linspace(col, col + block_shape[1], block_shape[1], endpoint=False, dtype=np.int32)
-                        rows = np.linspace(row, row + block_shape[0], block_shape[0], endpoint=False, dtype=np.int32)
-                        pos = np.array(np.meshgrid(rows, cols)).T.reshape(-1, 2)
-                        offset[pos[:, 0], pos[:, 1]] = mean
-
-                masks[layer.name] = mask
-                offsets[layer.name] = offset
 
-    return masks, offsets
+def __get_layer_resources(layer_name, layer_attributes, objective, resource_estimates):
+    '''
+    Helper function returning the savings of one group and the total resources of a layer, with respect to the objective
+    The estimates only depend on the layer attributes, so they are cached in resource_estimates
+    '''
+    if layer_name not in resource_estimates:
+        resource_estimates[layer_name] = (
+            np.array(objective.layer_savings(layer_attributes)),
+            np.array(objective.layer_resources(layer_attributes)),
+        )
+    return resource_estimates[layer_name]
+
+
+def __get_weight_groups(layer, weights, layer_attributes, metric, gradients, hessians, normalize):
+    '''
+    Helper function ranking the groups (single weight, structure, pattern, block) of a layer
+
+    Args:
+        layer (keras.layers.Layer): Layer to be masked
+        weights (np.array): Layer weights
+        layer_attributes (hls4ml.optimization.attributes.LayerAttributes): Layer attributes
+        metric (string): Weight ranking metric - l1, l2, Oracle, saliency
+        gradients (dict): A layer-wise dictionary of weight gradients
+        hessians (dict): A layer-wise dictionary of second gradients
+        normalize (boolean): Normalize the norms w.r.t. the largest one in the layer (global masking)
+
+    Returns:
+        tuple containing, or None if the layer has no groups
+
+        - values (np.array): Cost of pruning or weight sharing, for every group
+        - sharing (np.array): Boolean array, true for the groups considered for weight sharing (instead of pruning)
+        - means (np.array): Mean weight of every group, or None if weight sharing is disabled
+    '''
+    structure_type = layer_attributes.optimization_attributes.structure_type
+    pruning = layer_attributes.optimization_attributes.pruning
+    weight_sharing = layer_attributes.optimization_attributes.weight_sharing
+
+    value = weights
+    if metric == 'oracle':
+        value = np.abs(np.multiply(value, gradients[layer.name]))
+        norm = 1
+    elif metric == 'saliency':
+        value = np.multiply(np.square(value), hessians[layer.name])
+        norm = 1
+    elif metric == 'l1':
+        norm = 1
+    else:
+        norm = 2
+
+    if structure_type == SUPPORTED_STRUCTURES.UNSTRUCTURED:
+        if weight_sharing:
+            logging.warn('Weight sharing not suitable for unstructured pruning. Ignoring....')
+
+        if not pruning:
+            return None
+
+        # Since no norm is taken, calculate absolute value [avoids removing large negative weights]
+        # Weights are grouped in the order of np.ndarray.flatten, i.e. the position in the layer is the flat index
+        value = np.abs(value).flatten()
+        if normalize:
+            value = value / np.max(value)
+        return value, np.zeros(value.shape, dtype=bool), None
+
+    # Group the weights into rows, so that the norm and variance of every group are calculated along the second axis
+    if structure_type == SUPPORTED_STRUCTURES.STRUCTURED:
+        # Dense -> Masking neurons (columns)
+        # Conv2D -> Masking filters (W x H x C); the norm is taken over the norms of the channels
+        if isinstance(layer, (Conv2D, QConv2D)):
+            value = np.linalg.norm(value, axis=(0, 1), ord='fro')
+        blocks = value.T
+        weight_blocks = np.reshape(weights, (-1, weights.shape[-1])).T
+    elif structure_type == SUPPORTED_STRUCTURES.PATTERN:
+        blocks = __get_pattern_blocks(layer, value, layer_attributes)
+        weight_blocks = __get_pattern_blocks(layer, weights, layer_attributes)
+    elif structure_type == SUPPORTED_STRUCTURES.BLOCK:
+        blocks = __get_blocks(value, layer_attributes)
+        weight_blocks = __get_blocks(weights, layer_attributes)
+
+    # If pruning enabled, find cost associated with pruning each group
+    if pruning:
+        vals_norm = np.linalg.norm(blocks, axis=1, ord=norm)
+        if normalize:
+            vals_norm = vals_norm / np.max(vals_norm)
+    else:
+        vals_norm = np.full((blocks.shape[0],), sys.float_info.max, dtype=weights.dtype)
+
+    # If weight sharing enabled, find cost asociated with quantizing groups to their mean
+    if weight_sharing:
+        vals_var = np.var(blocks, axis=1)
+    else:
+        vals_var = np.full((blocks.shape[0],), sys.float_info.max, dtype=weights.dtype)
+
+    # Choose min(pruning, weight sharing)
+    sharing = vals_var < vals_norm
+    means = np.mean(weight_blocks, axis=1) if weight_sharing else None
+    return np.where(sharing, vals_var, vals_norm), sharing, means
 
 
-class __WeightGroups__:
+def __decode_masks(layer, weights, layer_attributes, selected, sharing, means):
     '''
-    A helper class containing information about a group of weights
+    Helper function scattering the selected groups of a layer into its mask and offset tensors
+
+    Args:
+        layer (keras.layers.Layer): Layer to be masked
+        weights (np.array): Layer weights
+        layer_attributes (hls4ml.optimization.attributes.LayerAttributes): Layer attributes
+        selected (np.array): Boolean array, true for the groups which are not masked
+        sharing (np.array): Boolean array, true for the groups considered for weight sharing
+        means (np.array): Mean weight of every group, or None if weight sharing is disabled
+
+    Returns:
+        tuple containing
+
+        - mask (np.array): Binary tensor of the layer
+        - offset (np.array): Offsets of the layer, the group means for the weight-shared groups
     '''
+    structure_type = layer_attributes.optimization_attributes.structure_type
+
+    # Masked groups can either be pruned or quantized; if quantized, the offset is the mean of the group
+    mask = selected.astype(weights.dtype)
+    if means is None:
+        offset = np.zeros(selected.shape, weights.dtype)
+    else:
+        offset = np.where(~selected & sharing, means, 0).astype(weights.dtype)
+
+    if structure_type == SUPPORTED_STRUCTURES.UNSTRUCTURED:
+        return np.reshape(mask, weights.shape), np.zeros(weights.shape, weights.dtype)
+
+    if structure_type == SUPPORTED_STRUCTURES.STRUCTURED:
+        # Neurons and filters are along the last axis
+        return np.broadcast_to(mask, weights.shape).copy(), np.broadcast_to(offset, weights.shape).copy()
 
-    def __init__(self, value, resources, layer_position, structure_type=None, layer_name=None, optimization_type=None):
-        self.value = value
-        self.resources = resources
-        self.layer_position = layer_position
-        self.structure_type = structure_type
-        self.layer_name = layer_name
-        self.optimization_type = optimization_type
+    if structure_type == SUPPORTED_STRUCTURES.PATTERN:
+        # Each group is a contiguous range of the transposed weight matrix
+        group_size = weights.size // selected.shape[0]
+        return (
+            __from_hls_order(layer, np.repeat(mask, group_size), weights.shape),
+            __from_hls_order(layer, np.repeat(offset, group_size), weights.shape),
+        )
+
+    if structure_type == SUPPORTED_STRUCTURES.BLOCK:
+        block_shape = layer_attributes.optimization_attributes.block_shape
+        grid_shape = (weights.shape[0] // block_shape[0], weights.shape[1] // block_shape[1])
+        return (
+            np.kron(np.reshape(mask, grid_shape), np.ones(block_shape, weights.dtype)),
+            np.kron(np.reshape(offset, grid_shape), np.ones(block_shape, weights.dtype)),
+        )
+
+
+def __get_pattern_blocks(layer, value, layer_attributes):
+    '''
+    Helper function grouping the weights into blocks of consecutive patterns, shape [total_blocks, block_size]
+    '''
+    pattern_offset = layer_attributes.optimization_attributes.pattern_offset
+    consecutive_patterns = layer_attributes.optimization_attributes.consecutive_patterns
+
+    if value.size % pattern_offset != 0:
+        raise Exception('Pattern offset needs to be a factor of matrix size')
+
+    if pattern_offset % consecutive_patterns != 0:
+        raise Exception('Consecutive patterns need to be a factor of matrix size')
+
+    # Reshape weight matrix into [pattern_offset, number_of_patterns]
+    # Note, swapping the axis will mess up the weight order
+    # In the case of hls4ml, number_of_patterns is equivalent to reuse factor
+    # And, pattern_offset, is the number of multiplications done in parallel
+    # Consecutive patterns (rows) are grouped into blocks, which are contiguous in the transposed weight matrix
+    total_blocks = pattern_offset // consecutive_patterns
+    return np.reshape(__to_hls_order(layer, value), (total_blocks, -1))
+
+
+def __get_blocks(value, layer_attributes):
+    '''
+    Helper function splitting a weight matrix into blocks, shape [total_blocks, block_size]
+    The blocks are numbered row by row and the weights in a block are also stored row by row
+    '''
+    if len(value.shape) != 2:
+        raise Exception('Block pruning is supported for 2-dimensional weight matrices')
+
+    block_shape = layer_attributes.optimization_attributes.block_shape
+    if (value.shape[0] % block_shape[0]) != 0 or (value.shape[1] % block_shape[1] != 0):
+        raise Exception('Block sizes need to be fators of weight matrix dimensions')
+
+    blocks = np.reshape(
+        value, (value.shape[0] // block_shape[0], block_shape[0], value.shape[1] // block_shape[1], block_shape[1])
+    )
+    return np.reshape(np.transpose(blocks, (0, 2, 1, 3)), (-1, block_shape[0] * block_shape[1]))
+
+
+def __to_hls_order(layer, value):
+    '''
+    Helper function transposing the weights, as done in hls4ml Resource strategy
+    '''
+    if isinstance(layer, (Dense, QDense)):
+        return value.T
+    elif isinstance(layer, (Conv2D, QConv2D)):
+        return np.transpose(value, (3, 0, 1, 2))
+
+
+def __from_hls_order(layer, value, weight_shape):
+    '''
+    Helper function reshaping a flat array in the transposed order into the original weight shape
+    '''
+    if isinstance(layer, (Dense, QDense)):
+        return np.reshape(value, (weight_shape[1], weight_shape[0])).T
+    elif isinstance(layer, (Conv2D, QConv2D)):
+        transposed_shape = (weight_shape[3], weight_shape[0], weight_shape[1], weight_shape[2])
+        return np.transpose(np.reshape(value, transposed_shape), (1, 2, 3, 0))
+
+
+def __to_boolean(selected, n_groups):
+    '''
+    Helper function converting the indices of the items selected by the knapsack solver into a boolean array
+    '''
+    selected_groups = np.zeros(n_groups, dtype=bool)
+    selected_groups[np.asarray(selected, dtype=int)] = True
+    return selected_groups
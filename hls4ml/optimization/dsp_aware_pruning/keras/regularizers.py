@@ -139,7 +139,7 @@ class DenseRegularizer(tf.keras.regularizers.Regularizer):
             'alpha': self.alpha,
             'beta': self.beta,
             'norm': self.norm,
-            'structure_type': self.structure_type,
+            'structure_type': self.structure_type.value,
             'block_shape': self.block_shape,
             'pattern_offset': self.pattern_offset,
             'consecutive_patterns': self.consecutive_patterns,
@@ -249,7 +249,7 @@ class Conv2DRegularizer(tf.keras.regularizers.Regularizer):
             'alpha': self.alpha,
             'beta': self.beta,
             'norm': self.norm,
-            'structure_type': self.structure_type,
+            'structure_type': self.structure_type.value,
             'pattern_offset': self.pattern_offset,
             'consecutive_patterns': self.consecutive_patterns,
         }
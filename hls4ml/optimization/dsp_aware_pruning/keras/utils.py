@@ -2,50 +2,107 @@ import numpy as np
 import tensorflow as tf
 
 
-@tf.function
-def get_model_gradients(model, loss_fn, X, y):
+def get_model_gradients(model, loss_fn, X, y, batch_size=None):
     '''
     Calculate model gradients with respect to weights
 
+    The gradients are accumulated over batches of samples, so memory utilization is bounded by the batch size,
+    instead of the size of the data set. The result is the gradient of the loss over all the samples,
+    assuming the loss is averaged over the samples, as with the default reduction of Keras losses.
+
     Args:
         model (keras.model): Input model
         loss_fn (keras.losses.Loss): Model loss function
         X (np.array): Input data
         y (np.array): Output data
+        batch_size (int): Number of samples processed at once; if None, all the samples are processed at once
 
     Returns:
         grads (dict): Per-layer gradients of loss with respect to weights
     '''
-    grads = {}
-    # While persistent GradientTape slows down execution,
-    # Is faster than performing forward pass and non-persistent for every layer
-    with tf.GradientTape(persistent=True) as tape:
-        output = model(X, training=True)
-        loss_value = loss_fn(y, output)
+    return _accumulate(_get_batch_gradients, model, loss_fn, X, y, batch_size)
 
-        for layer in model.layers:
-            if len(layer.trainable_weights) > 0:
-                grads[layer.name] = tape.gradient(loss_value, layer.kernel)
 
-    return grads
-
-
-@tf.function
-def get_model_hessians(model, loss_fn, X, y):
+def get_model_hessians(model, loss_fn, X, y, batch_size=None, hutchinson_samples=0):
     '''
     Calculate the second derivatives of the loss with repsect to model weights.
 
-    Note, only diagonal elements of the Hessian are computed.
+    Note, only diagonal elements of the Hessian are computed. By default, they are approximated by the derivatives of
+    the sum of the first derivatives of the loss, i.e., the row sums of the Hessian, which is exact when the Hessian
+    is diagonal. Alternatively, the diagonal can be
+    estimated with Hutchinson's method, diag(H) = E[z * Hz], for random vectors z of independent +1 / -1 entries,
+    averaged over a given number of random vectors.
+
+    The second derivatives are accumulated over batches of samples, so memory utilization is bounded by the batch size,
+    instead of the size of the data set (see get_model_gradients).
 
     Args:
         model (keras.model): Input model
         loss_fn (keras.losses.Loss): Model loss function
         X (np.array): Input data
         y (np.array): Output data
+        batch_size (int): Number of samples processed at once; if None, all the samples are processed at once
+        hutchinson_samples (int): Number of random vectors of the Hutchinson estimator, per batch;
+            if zero, the derivatives of the first derivatives are used instead
 
     Returns:
         grads (dict): Per-layer second derivatives of loss with respect to weights
     '''
+    if hutchinson_samples > 0:
+
+        def batch_hessians(model, loss_fn, X, y):
+            hessians = {}
+            for _ in range(hutchinson_samples):
+                for name, value in _get_batch_hessians_hutchinson(model, loss_fn, X, y).items():
+                    hessians[name] = hessians.get(name, 0) + value / hutchinson_samples
+            return hessians
+
+        return _accumulate(batch_hessians, model, loss_fn, X, y, batch_size)
+
+    return _accumulate(_get_batch_hessians, model, loss_fn, X, y, batch_size)
+
+
+def _accumulate(batch_fn, model, loss_fn, X, y, batch_size):
+    '''
+    Average the per-layer results of batch_fn over batches of the data set, weighted by the number of samples per batch
+    '''
+    n_samples = len(X)
+    if batch_size is None:
+        batch_size = n_samples
+
+    results = {}
+    for start in range(0, n_samples, batch_size):
+        X_batch = tf.convert_to_tensor(X[start : start + batch_size])
+        y_batch = tf.convert_to_tensor(y[start : start + batch_size])
+        weight = X_batch.shape[0] / n_samples
+        for name, value in batch_fn(model, loss_fn, X_batch, y_batch).items():
+            value = weight * value.numpy()
+            if name in results:
+                results[name] += value
+            else:
+                results[name] = value
+
+    return results
+
+
+@tf.function
+def _get_batch_gradients(model, loss_fn, X, y):
+    grads = {}
+    # While persistent GradientTape slows down execution,
+    # Is faster than performing forward pass and non-persistent for every layer
+    with tf.GradientTape(persistent=True) as tape:
+        output = model(X, training=True)
+        loss_value = loss_fn(y, output)
+
+        for layer in model.layers:
+            if len(layer.trainable_weights) > 0:
+                grads[layer.name] = tape.gradient(loss_value, layer.kernel)
+
+    return grads
+
+
+@tf.function
+def _get_batch_hessians(model, loss_fn, X, y):
     grads = {}
     with tf.GradientTape(persistent=True) as tape:
         output = model(X, training=False)
@@ -58,6 +115,28 @@ def get_model_hessians(model, loss_fn, X, y):
     return grads
 
 
+@tf.function
+def _get_batch_hessians_hutchinson(model, loss_fn, X, y):
+    kernels = {layer.name: layer.kernel for layer in model.layers if hasattr(layer, 'kernel')}
+
+    # Random vector with independent entries of +1 or -1 with equal probability (Rademacher distribution)
+    z = {
+        name: tf.cast(2 * tf.random.uniform(kernel.shape, 0, 2, dtype=tf.int32) - 1, kernel.dtype)
+        for name, kernel in kernels.items()
+    }
+
+    # Hessian-vector product, as the gradient of the product of the gradients and the random vector
+    with tf.GradientTape() as outer_tape:
+        with tf.GradientTape() as inner_tape:
+            output = model(X, training=False)
+            loss_value = loss_fn(y, output)
+        grads = inner_tape.gradient(loss_value, kernels)
+        product = tf.add_n([tf.reduce_sum(grads[name] * z[name]) for name in kernels])
+    hvp = outer_tape.gradient(product, kernels)
+
+    return {name: z[name] * hvp[name] for name in kernels}
+
+
 def get_model_sparsity(model):
     '''
     Calculate total and per-layer model sparsity
@@ -4,7 +4,7 @@ import time
 import numpy as np
 
 
-def solve_knapsack(values, weights, capacity, implementation='CBC_MIP', **kwargs):
+def solve_knapsack(values, weights, capacity, implementation='CBC_MIP', state=None, **kwargs):
     '''
     A function for solving the Knapsack problem
 
@@ -12,10 +12,16 @@ def solve_knapsack(values, weights, capacity, implementation='CBC_MIP', **kwargs
         - values (np.array, float): A one-dimensional array, where each entry is the value of an item
         - weights (np.array, int): An matrix, each row represents the weights of every item, in a given knapsack
         - capacity (np.array, int): A one-dimensional array, each entry is the maximum weights of a Knapsack
-        - implementation (string): Algorithm to solve Knapsack problem - dynamic programming, greedy, branch and bound
+        - implementation (string): Algorithm to solve Knapsack problem - dynamic programming, greedy, branch and bound,
+            CBC MIP or Lagrangian relaxation
+        - state (dict): Warm start of the Lagrangian relaxation, updated in place with the Lagrange multipliers,
+            the upper bound and the optimality gap of the solution; pass the same dictionary to a sequence of
+            similar problems (e.g. masking at increasing sparsities). Ignored by the other implementations
         - time_limit (float): Limit (in seconds) after which the CBC or Branch & Bound should
             stop looking for a solution and return optimal so far
         - scaling_factor (float): Scaling factor for floating points values in CBC or B&B
+        - iterations (int): Maximum number of subgradient iterations of the Lagrangian relaxation
+        - tolerance (float): Relative optimality gap at which the Lagrangian relaxation stops
 
     Returns:
         tuple containing
@@ -47,13 +53,19 @@ def solve_knapsack(values, weights, capacity, implementation='CBC_MIP', **kwargs
                 - Solution sub-optimal
                 - Time complexity: O(mn)
                 - Suitable for highly dimensional constraints or a very high number of items
+            - Lagrangian relaxation:
+                - Solution sub-optimal, with a reported bound on the optimality gap
+                - The constraints are relaxed with Lagrange multipliers, found by subgradient optimization;
+                    items are selected greedily, in order of their value per resources priced by the multipliers
+                - Time complexity: O(kmn + kn log n) for k iterations, no external dependencies
+                - Suitable for multi-dimensional constraints and a very high number of items
 
         - Most implementations require integer values of weights and capacities;
             For pruning & weight sharing this is never a problem
             In case non-integer weights and capacities are requires,
             All of the values should be scaled by an appropriate scaling factor
     '''
-    if implementation not in ('dynamic', 'greedy', 'branch_bound', 'CBC_MIP'):
+    if implementation not in ('dynamic', 'greedy', 'branch_bound', 'CBC_MIP', 'lagrangian'):
         raise Exception('Unknown algorithm for solving Knapsack')
 
     if len(values.shape) != 1:
@@ -90,7 +102,7 @@ def solve_knapsack(values, weights, capacity, implementation='CBC_MIP', **kwargs
         return np.sum(values), list(range(0, values.shape[0]))
 
     # Special case, all the item weights per knapsack are equal, so we can greedily select the ones with the highest value
-    if np.all([weights[i, :] == weights[i, 0] for i in range(weights.shape[0])]):
+    if np.all(weights == weights[:, :1]):
         return __solve_knapsack_equal_weights(values, weights, capacity)
 
     # General cases
@@ -103,6 +115,8 @@ def solve_knapsack(values, weights, capacity, implementation='CBC_MIP', **kwargs
         optimal_value, selected_items = __solve_knapsack_branch_and_bound(values, weights, capacity, **kwargs)
     elif implementation == 'CBC_MIP':
         optimal_value, selected_items = __solve_knapsack_cbc_mip(values, weights, capacity, **kwargs)
+    elif implementation == 'lagrangian':
+        optimal_value, selected_items = __solve_knapsack_lagrangian(values, weights, capacity, state=state, **kwargs)
     else:
         optimal_value, selected_items = __solve_knapsack_greedy(values, weights, capacity)
 
@@ -158,24 +172,17 @@ def __solve_knapsack_greedy(values, weights, capacity):
     # The weights are scaled for every dimension, to avoid inherent bias towards large weights in a single dimension
     weights_rescaled = weights / np.max(weights, axis=1)[:, np.newaxis]
     ratios = values / weights_rescaled.sum(axis=0)
-    indices = np.argsort(ratios)
+    indices = np.argsort(ratios)[::-1]
 
     # Greedily select item with the highest ratio (efficiency)
-    optimal = 0
-    selected = []
-    accum = np.zeros_like(capacity)
-    for i in reversed(indices):
-        if np.all((accum + weights[:, i]) <= capacity):
-            selected.append(i)
-            optimal += values[i]
-            accum += weights[:, i]
-        else:
-            break
+    selected = __select_prefix(weights, capacity, indices)
+    optimal = np.sum(values[selected])
 
     # The greedy algorithm can be sub-optimal;
     # However, selecting the above elements or the next element that could not fit into the knapsack
     # Will lead to solution that is at most (1/2) of the optimal solution;
     # Therefore, take whichever is higher and satisfies the constraints
+    i = indices[min(len(selected), len(indices) - 1)]
     if values[i] > optimal and np.all(weights[:, i]) <= capacity:
         return values[i], [i]
     else:
@@ -235,6 +242,110 @@ def __solve_knapsack_cbc_mip(values, weights, capacity, time_limit=sys.float_inf
     return optimal / scaling_factor, selected
 
 
+def __solve_knapsack_lagrangian(values, weights, capacity, state=None, iterations=100, tolerance=1e-3):
+    '''
+    Helper function to solve the n-dimensional Knapsack problem through Lagrangian relaxation
+
+    The weight constraints are moved into the objective, each with a multiplier (the price of a unit of resource):
+        L(u) = max_x (v - u.T @ A) @ x + u.T @ W, x_i = {0, 1}, u >= 0
+    For any multipliers, the relaxed problem is solved by selecting the items with a positive reduced value,
+    And L(u) is an upper bound on the optimal value. The bound is minimized with subgradient descent.
+    At every iteration, a feasible solution is built by greedily selecting the items
+    With the highest value per resources priced by the multipliers, skipping the items that don't fit
+
+    Additional args:
+        - state - Dictionary with the multipliers of a previous, similar problem as a warm start;
+            updated with the multipliers, upper bound, optimality gap and number of iterations
+        - iterations - Maximum number of subgradient iterations
+        - tolerance - Relative optimality gap, (upper_bound - optimal) / upper_bound, at which the search stops
+    '''
+    values = values.astype(np.float64)
+    weights = weights.astype(np.int64)
+    capacity = np.array(capacity, dtype=np.int64).reshape(-1)
+
+    # Items which don't fit into the knapsack on their own are never selected
+    # The constraints are scaled by the capacities, so that the multipliers of all the dimensions are of similar magnitude
+    fits = np.all(weights <= capacity[:, np.newaxis], axis=0)
+    scale = np.where(capacity > 0, capacity, 1).astype(np.float64)
+    scaled_weights = weights / scale[:, np.newaxis]
+    scaled_capacity = capacity / scale
+
+    if state is not None and np.shape(state.get('multipliers')) == capacity.shape:
+        multipliers = np.asarray(state['multipliers'], dtype=np.float64) * scale
+    else:
+        multipliers = np.zeros(capacity.shape)
+
+    best_multipliers = multipliers
+    upper_bound = np.inf
+    optimal, selected = 0, np.zeros(values.shape, dtype=bool)
+
+    # Step size of the subgradient descent, halved when the bound stops improving
+    step_scale = 2.0
+    stalled = 0
+    for iteration in range(iterations):
+        reduced_values = values - multipliers @ scaled_weights
+        relaxed = (reduced_values > 0) & fits
+        bound = np.sum(reduced_values[relaxed]) + multipliers @ scaled_capacity
+
+        if bound < upper_bound:
+            upper_bound = bound
+            best_multipliers = multipliers
+            stalled = 0
+        else:
+            stalled += 1
+            if stalled >= 5:
+                step_scale /= 2
+                stalled = 0
+
+        prices = multipliers @ scaled_weights
+        order = np.argsort(-values / np.maximum(prices, 1e-12 * np.max(values, initial=1)), kind='stable')
+        candidate = __select_first_fit(weights, capacity, order[fits[order]])
+        candidate_value = np.sum(values[candidate])
+        if candidate_value > optimal:
+            optimal, selected = candidate_value, candidate
+
+        if upper_bound - optimal <= tolerance * upper_bound:
+            break
+
+        # Subgradient of the bound; if it is zero, the relaxed solution is feasible and complementary, hence optimal
+        subgradient = scaled_capacity - scaled_weights[:, relaxed].sum(axis=1)
+        norm = subgradient @ subgradient
+        if norm == 0:
+            break
+        multipliers = np.maximum(multipliers - step_scale * (bound - optimal) / norm * subgradient, 0)
+
+    gap = (upper_bound - optimal) / upper_bound if upper_bound > 0 else 0.0
+    print(f'Lagrangian relaxation: {iteration + 1} iterations, upper bound {upper_bound}, optimality gap {gap * 100}%')
+    if state is not None:
+        state.update(
+            multipliers=best_multipliers / scale,
+            upper_bound=upper_bound,
+            gap=gap,
+            iterations=iteration + 1,
+        )
+
+    return optimal, list(np.flatnonzero(selected))
+
+
+def __select_first_fit(weights, capacity, indices):
+    '''
+    Helper function selecting items in the given order, skipping the items that don't fit into the knapsack
+    Runs of consecutive items are selected at once, until the next item doesn't fit;
+    Then, the items which no longer fit into the remaining capacity are discarded and the search continues
+    '''
+    selected = np.zeros(weights.shape[1], dtype=bool)
+    remaining = capacity.copy()
+    while indices.size > 0:
+        indices = indices[np.all(weights[:, indices] <= remaining[:, np.newaxis], axis=0)]
+        run = __select_prefix(weights, remaining, indices)
+        if not run:
+            break
+        selected[run] = True
+        remaining = remaining - np.sum(weights[:, run], axis=1)
+        indices = indices[len(run) :]
+    return selected
+
+
 def __solve_knapsack_equal_weights(values, weights, capacity):
     '''
     Helper function that solves the n-dimensional Knapsack algorithm with a greedy algorithm
@@ -242,21 +353,21 @@ def __solve_knapsack_equal_weights(values, weights, capacity):
     It occurs often in pruning - e.g. in pattern pruning, each DSP block saves one DSP; however, as a counter-example
     In structured pruning, each structure can save a different amount of FLOPs (Conv2D filter vs Dense neuron)
     '''
-    assert np.all([weights[i, :] == weights[i, 0] for i in range(weights.shape[0])])
+    assert np.all(weights == weights[:, :1])
 
     # Find items with the highest value
-    indices = np.argsort(values)
+    indices = np.argsort(values)[::-1]
 
     # Greedily select item with the highest ratio
-    optimal = 0
-    selected = []
-    accum = np.zeros_like(capacity)
-    for i in reversed(indices):
-        if np.all((accum + weights[:, i]) <= capacity):
-            selected.append(i)
-            optimal += values[i]
-            accum += weights[:, i]
-        else:
-            break
+    selected = __select_prefix(weights, capacity, indices)
+    return np.sum(values[selected]), selected
 
-    return optimal, selected
+
+def __select_prefix(weights, capacity, indices):
+    '''
+    Helper function selecting items in the given order, until the next item doesn't fit into the knapsack
+    As the weights are non-negative, the items fit as long as the cumulative weights are within the capacity
+    '''
+    cumulative_weights = np.cumsum(weights[:, indices], axis=1)
+    fits = np.all(cumulative_weights <= np.reshape(capacity, (-1, 1)), axis=0)
+    return list(indices[: np.argmin(fits) if not np.all(fits) else len(indices)])
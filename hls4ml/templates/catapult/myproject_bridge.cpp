@@ -5,6 +5,8 @@
 #include "nnet_helpers.h"
 #include <algorithm>
 #include <map>
+#include <thread>
+#include <vector>
 
 // hls-fpga-machine-learning insert weights dir
 
@@ -18,42 +20,67 @@ namespace nnet {
 bool trace_enabled = false;
 std::map<std::string, void *> *trace_outputs = NULL;
 size_t trace_type_size = sizeof(double);
+
+// Runs run_chunk(first, last) over the samples of a batch, split in up to n_threads chunks executed in parallel.
+// The first sample is always run on the calling thread before any other thread is started, this initializes the
+// static lookup tables of the activations and loads the weights from the txt files ahead of the parallel part.
+template <class chunk_T> void run_batch(size_t n_samples, size_t n_threads, chunk_T run_chunk) {
+    if (n_samples == 0) {
+        return;
+    }
+    run_chunk(0, 1);
+
+    // Tracing stores the layer outputs in shared buffers, so it always runs on a single thread
+    if (trace_enabled) {
+        n_threads = 1;
+    }
+    n_threads = std::min(n_threads, n_samples - 1);
+    if (n_threads <= 1) {
+        run_chunk(1, n_samples);
+        return;
+    }
+
+    std::vector<std::thread> workers;
+    size_t chunk_size = (n_samples - 1 + n_threads - 1) / n_threads;
+    for (size_t first = 1; first < n_samples; first += chunk_size) {
+        workers.push_back(std::thread(run_chunk, first, std::min(first + chunk_size, n_samples)));
+    }
+    for (size_t i = 0; i < workers.size(); i++) {
+        workers[i].join();
+    }
+}
 } // namespace nnet
 
 extern "C" {
 
-struct trace_data {
-    const char *name;
-    void *data;
-};
-
-void allocate_trace_storage(size_t element_size) {
-    nnet::trace_enabled = true;
-    nnet::trace_outputs = new std::map<std::string, void *>;
-    nnet::trace_type_size = element_size;
-    // hls-fpga-machine-learning insert trace_outputs
+// Names of the layers whose outputs are saved when tracing is enabled, terminated by NULL
+const char **get_trace_layers() {
+    static const char *trace_layers[] = {
+        // hls-fpga-machine-learning insert trace_layers
+        NULL};
+    return trace_layers;
 }
 
-void free_trace_storage() {
-    for (std::map<std::string, void *>::iterator i = nnet::trace_outputs->begin(); i != nnet::trace_outputs->end(); i++) {
-        void *ptr = i->second;
-        free(ptr);
+// Enables tracing, the outputs of layer layer_names[i] are written to buffers[i], one sample after the other, until
+// tracing is disabled. The buffers must be large enough to hold the outputs of all the samples that are run.
+void enable_trace(const char **layer_names, void **buffers, size_t n_buffers, size_t element_size) {
+    if (nnet::trace_outputs == NULL) {
+        nnet::trace_outputs = new std::map<std::string, void *>;
     }
     nnet::trace_outputs->clear();
+    for (size_t i = 0; i < n_buffers; i++) {
+        (*nnet::trace_outputs)[layer_names[i]] = buffers[i];
+    }
+    nnet::trace_type_size = element_size;
+    nnet::trace_enabled = true;
+}
+
+void disable_trace() {
     delete nnet::trace_outputs;
     nnet::trace_outputs = NULL;
     nnet::trace_enabled = false;
 }
 
-void collect_trace_output(struct trace_data *c_trace_outputs) {
-    int ii = 0;
-    for (std::map<std::string, void *>::iterator i = nnet::trace_outputs->begin(); i != nnet::trace_outputs->end(); i++) {
-        c_trace_outputs[ii].name = i->first.c_str();
-        c_trace_outputs[ii].data = i->second;
-        ii++;
-    }
-}
-
 // Wrapper of top level function for Python bridge
 void myproject_float(
     // hls-fpga-machine-learning insert header #float
@@ -67,6 +94,32 @@ void myproject_double(
 ) {
     // hls-fpga-machine-learning insert wrapper #double
 }
+
+// Wrapper taking and returning the bit patterns of the fixed-point input and output types as integers
+void myproject_raw(
+    // hls-fpga-machine-learning insert header #raw
+) {
+    // hls-fpga-machine-learning insert wrapper #raw
+}
+
+// Batched wrappers, process n_samples consecutive samples stored in contiguous buffers
+void myproject_float_batch(
+    // hls-fpga-machine-learning insert batch header #float
+) {
+    // hls-fpga-machine-learning insert batch wrapper #float
+}
+
+void myproject_double_batch(
+    // hls-fpga-machine-learning insert batch header #double
+) {
+    // hls-fpga-machine-learning insert batch wrapper #double
+}
+
+void myproject_raw_batch(
+    // hls-fpga-machine-learning insert batch header #raw
+) {
+    // hls-fpga-machine-learning insert batch wrapper #raw
+}
 }
 
 #endif
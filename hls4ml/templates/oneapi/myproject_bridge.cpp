@@ -18,38 +18,34 @@ size_t trace_type_size = sizeof(double);
 
 extern "C" {
 
-struct trace_data {
-    const char *name;
-    void *data;
-};
-
-void allocate_trace_storage(size_t element_size) {
-    nnet::trace_enabled = true;
-    nnet::trace_outputs = new std::map<std::string, void *>;
-    nnet::trace_type_size = element_size;
-    // hls-fpga-machine-learning insert trace_outputs
+// Names of the layers whose outputs are saved when tracing is enabled, terminated by NULL
+const char **get_trace_layers() {
+    static const char *trace_layers[] = {
+        // hls-fpga-machine-learning insert trace_layers
+        NULL};
+    return trace_layers;
 }
 
-void free_trace_storage() {
-    for (std::map<std::string, void *>::iterator i = nnet::trace_outputs->begin(); i != nnet::trace_outputs->end(); i++) {
-        void *ptr = i->second;
-        free(ptr);
+// Enables tracing, the outputs of layer layer_names[i] are written to buffers[i], one sample after the other, until
+// tracing is disabled. The buffers must be large enough to hold the outputs of all the samples that are run.
+void enable_trace(const char **layer_names, void **buffers, size_t n_buffers, size_t element_size) {
+    if (nnet::trace_outputs == NULL) {
+        nnet::trace_outputs = new std::map<std::string, void *>;
     }
     nnet::trace_outputs->clear();
+    for (size_t i = 0; i < n_buffers; i++) {
+        (*nnet::trace_outputs)[layer_names[i]] = buffers[i];
+    }
+    nnet::trace_type_size = element_size;
+    nnet::trace_enabled = true;
+}
+
+void disable_trace() {
     delete nnet::trace_outputs;
     nnet::trace_outputs = NULL;
     nnet::trace_enabled = false;
 }
 
-void collect_trace_output(struct trace_data *c_trace_outputs) {
-    int ii = 0;
-    for (std::map<std::string, void *>::iterator i = nnet::trace_outputs->begin(); i != nnet::trace_outputs->end(); i++) {
-        c_trace_outputs[ii].name = i->first.c_str();
-        c_trace_outputs[ii].data = i->second;
-        ii++;
-    }
-}
-
 // hls-fpga-machine-learning insert class def #float
 
 // Wrapper of top level function for Python bridge
@@ -72,6 +68,37 @@ void myproject_double(
 
     // hls-fpga-machine-learning insert wrapper #double
 }
+
+// Wrapper taking and returning the bit patterns of the fixed-point input and output types as integers
+// hls-fpga-machine-learning insert class def #raw
+
+void myproject_raw(
+    // hls-fpga-machine-learning insert header #raw
+) {
+    auto selector = sycl::ext::intel::fpga_emulator_selector_v;
+    static sycl::queue q(selector, fpga_tools::exception_handler, sycl::property::queue::enable_profiling{});
+
+    // hls-fpga-machine-learning insert wrapper #raw
+}
+
+// Batched wrappers, process n_samples consecutive samples stored in contiguous buffers
+void myproject_float_batch(
+    // hls-fpga-machine-learning insert batch header #float
+) {
+    // hls-fpga-machine-learning insert batch wrapper #float
+}
+
+void myproject_double_batch(
+    // hls-fpga-machine-learning insert batch header #double
+) {
+    // hls-fpga-machine-learning insert batch wrapper #double
+}
+
+void myproject_raw_batch(
+    // hls-fpga-machine-learning insert batch header #raw
+) {
+    // hls-fpga-machine-learning insert batch wrapper #raw
+}
 }
 
 #endif
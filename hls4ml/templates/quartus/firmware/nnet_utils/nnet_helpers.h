@@ -43,6 +43,43 @@ template <class srcType, class dstType, size_t SIZE> void convert_data_back(stre
     }
 }
 
+// The bit patterns of the fixed-point types as integers, used by the raw wrappers of the Python bridge. The integers
+// are sign-extended for signed types, i.e., they are the value of the number times 2^(number of fractional bits).
+template <class T> void set_raw_bits(T &dst, long long bits) { dst.set_slc(0, ac_int<T::width, T::sign>(bits)); }
+
+template <class T> long long get_raw_bits(const T &src) { return src.template slc<T::width>(0).to_int64(); }
+
+template <class srcType, class dstType, size_t SIZE> void convert_data_from_raw(srcType *src, dstType *dst) {
+    for (size_t i = 0; i < SIZE; i++) {
+        set_raw_bits(dst[i], src[i]);
+    }
+}
+
+template <class srcType, class dstType, size_t SIZE> void convert_data_from_raw(srcType *src, stream_in<dstType> &dst) {
+    for (size_t i = 0; i < SIZE / dstType::size; i++) {
+        dstType ctype;
+        for (size_t j = 0; j < dstType::size; j++) {
+            set_raw_bits(ctype[j], src[i * dstType::size + j]);
+        }
+        dst.write(ctype);
+    }
+}
+
+template <class srcType, class dstType, size_t SIZE> void convert_data_back_to_raw(srcType *src, dstType *dst) {
+    for (size_t i = 0; i < SIZE; i++) {
+        dst[i] = get_raw_bits(src[i]);
+    }
+}
+
+template <class srcType, class dstType, size_t SIZE> void convert_data_back_to_raw(stream_out<srcType> &src, dstType *dst) {
+    for (size_t i = 0; i < SIZE / srcType::size; i++) {
+        srcType ctype = src.read();
+        for (size_t j = 0; j < srcType::size; j++) {
+            dst[i * srcType::size + j] = get_raw_bits(ctype[j]);
+        }
+    }
+}
+
 extern bool trace_enabled;
 extern std::map<std::string, void *> *trace_outputs;
 extern size_t trace_type_size;
@@ -76,16 +113,19 @@ template <class data_T> void save_layer_output(data_T *data, const char *layer_n
         return;
 
     if (trace_outputs) {
-        if (trace_outputs->count(layer_name) > 0) {
+        // The outputs of consecutive samples are stored one after the other, so the position in the buffer of the
+        // layer is moved to the next sample after each save. Layers without a buffer are not traced.
+        std::map<std::string, void *>::iterator buffer = trace_outputs->find(layer_name);
+        if (buffer != trace_outputs->end()) {
             if (trace_type_size == 4) {
-                save_output_array(data, (float *)(*trace_outputs)[layer_name], layer_size);
+                save_output_array(data, (float *)buffer->second, layer_size);
+                buffer->second = (float *)buffer->second + layer_size;
             } else if (trace_type_size == 8) {
-                save_output_array(data, (double *)(*trace_outputs)[layer_name], layer_size);
+                save_output_array(data, (double *)buffer->second, layer_size);
+                buffer->second = (double *)buffer->second + layer_size;
             } else {
                 std::cout << "Unknown trace type!" << std::endl;
             }
-        } else {
-            std::cout << "Layer name: " << layer_name << " not found in debug storage!" << std::endl;
         }
     } else {
         std::ostringstream filename;
@@ -106,16 +146,19 @@ template <class data_T> void save_layer_output(stream<data_T> &data, const char
         return;
 
     if (trace_outputs) {
-        if (trace_outputs->count(layer_name) > 0) {
+        // The outputs of consecutive samples are stored one after the other, so the position in the buffer of the
+        // layer is moved to the next sample after each save. Layers without a buffer are not traced.
+        std::map<std::string, void *>::iterator buffer = trace_outputs->find(layer_name);
+        if (buffer != trace_outputs->end()) {
             if (trace_type_size == 4) {
-                save_output_array<data_T, float>(data, (float *)(*trace_outputs)[layer_name], layer_size);
+                save_output_array<data_T, float>(data, (float *)buffer->second, layer_size);
+                buffer->second = (float *)buffer->second + layer_size;
             } else if (trace_type_size == 8) {
-                save_output_array<data_T, double>(data, (double *)(*trace_outputs)[layer_name], layer_size);
+                save_output_array<data_T, double>(data, (double *)buffer->second, layer_size);
+                buffer->second = (double *)buffer->second + layer_size;
             } else {
                 std::cout << "Unknown trace type!" << std::endl;
             }
-        } else {
-            std::cout << "Layer name: " << layer_name << " not found in debug storage!" << std::endl;
         }
     } else {
         std::ostringstream filename;
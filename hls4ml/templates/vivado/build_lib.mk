@@ -0,0 +1,25 @@
+# Parallel and incremental build of the library, used by build_lib.sh when the layers are written to their own
+# translation units (WriterConfig 'SplitLayers'). The variables are set by build_lib.sh.
+
+OBJDIR := obj
+SOURCES := $(wildcard firmware/*.cpp firmware/layers/*.cpp) $(PROJECT)_bridge.cpp
+OBJECTS := $(patsubst %.cpp,$(OBJDIR)/%.o,$(SOURCES))
+
+ifeq ($(PCH),)
+WEIGHTSFLAGS := -D WEIGHTS_DIR='"$(BASEDIR)/firmware/weights"'
+else
+WEIGHTSFLAGS := -Winvalid-pch -include $(PCH)
+endif
+
+# The objects are rebuilt when the compiler or the flags change
+FLAGS := $(CC) $(CFLAGS) $(INCFLAGS) $(WEIGHTSFLAGS)
+$(shell mkdir -p $(OBJDIR) && (echo '$(subst ','\'',$(FLAGS))' | cmp -s - $(OBJDIR)/flags || echo '$(subst ','\'',$(FLAGS))' > $(OBJDIR)/flags))
+
+$(LIB): $(OBJECTS) $(EXTRA_OBJECTS)
+	$(CC) $(CFLAGS) $(INCFLAGS) -shared $^ -o $@
+
+$(OBJDIR)/%.o: %.cpp $(OBJDIR)/flags
+	@mkdir -p $(dir $@)
+	$(CC) $(CFLAGS) $(INCFLAGS) $(WEIGHTSFLAGS) -MMD -MP -c $< -o $@
+
+-include $(OBJECTS:.o=.d)
@@ -153,6 +153,9 @@ if {$opt(reset)} {
 }
 set_top ${project_name}
 add_files firmware/${project_name}.cpp -cflags "-std=c++0x"
+foreach layer_src [glob -nocomplain firmware/layers/*.cpp] {
+    add_files $layer_src -cflags "-std=c++0x"
+}
 add_files -tb ${project_name}_test.cpp -cflags "-std=c++0x"
 add_files -tb firmware/weights
 add_files -tb tb_data
@@ -0,0 +1,23 @@
+#include "../defines.h"
+
+#include "../nnet_utils/nnet_code_gen.h"
+#include "../nnet_utils/nnet_helpers.h"
+// hls-fpga-machine-learning insert includes
+
+// hls-fpga-machine-learning insert weights
+
+// hls-fpga-machine-learning insert namespace-start
+
+// hls-fpga-machine-learning insert layer-config
+
+void myproject_layer(
+    // hls-fpga-machine-learning insert header
+) {
+    #pragma HLS INLINE
+
+    // hls-fpga-machine-learning insert load weights
+
+    // hls-fpga-machine-learning insert layer
+}
+
+// hls-fpga-machine-learning insert namespace-end
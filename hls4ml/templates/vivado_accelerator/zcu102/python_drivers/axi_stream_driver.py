@@ -1,3 +1,5 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import numpy as np
@@ -6,13 +8,51 @@ from pynq import Overlay, allocate
 
 class NeuralNetworkOverlay(Overlay):
     def __init__(
-        self, bitfile_name, x_shape, y_shape, dtype=np.float32, dtbo=None, download=True, ignore_version=False, device=None
+        self,
+        bitfile_name,
+        x_shape,
+        y_shape,
+        dtype=np.float32,
+        dtbo=None,
+        download=True,
+        ignore_version=False,
+        device=None,
+        batch_size=None,
+        n_buffers=2,
+        n_workers=1,
     ):
-        super().__init__(bitfile_name, dtbo=None, download=True, ignore_version=False, device=None)
+        """Download the bitfile and allocate the buffers of the DMA transfers.
+
+        The inputs are sent to the accelerator in chunks of at most ``batch_size`` samples. Each of the ``n_buffers``
+        input/output buffer pairs holds one chunk, so while one chunk is transferred, the next one is encoded into a
+        free input buffer and the previous one is decoded from its output buffer by a pool of ``n_workers`` threads.
+
+        Args:
+            bitfile_name (str): The bitfile of the design.
+            x_shape (tuple): The shape of the inputs, the first dimension being the number of samples.
+            y_shape (tuple): The shape of the outputs, the first dimension being the number of samples.
+            dtype (dtype, optional): The data type of the elements of the input/output tensors, see ``predict``.
+                Defaults to np.float32.
+            batch_size (int, optional): The number of samples in one DMA transfer. Defaults to the number of samples
+                in ``x_shape`` divided by ``n_buffers``, so that the buffers take the same memory as one input/output
+                pair of ``x_shape``/``y_shape``.
+            n_buffers (int, optional): The number of input/output buffer pairs. Defaults to 2 (ping-pong buffers).
+            n_workers (int, optional): The number of threads encoding the inputs and decoding the outputs.
+                Defaults to 1.
+        """
+        super().__init__(bitfile_name, dtbo=dtbo, download=download, ignore_version=ignore_version, device=device)
+        if n_buffers < 1 or n_workers < 1:
+            raise ValueError('At least one buffer and one worker are needed')
+        if batch_size is None:
+            batch_size = -(-x_shape[0] // n_buffers)
+        self.batch_size = batch_size
+        self.n_workers = n_workers
         self.sendchannel = self.hier_0.axi_dma_0.sendchannel
         self.recvchannel = self.hier_0.axi_dma_0.recvchannel
-        self.input_buffer = allocate(shape=x_shape, dtype=dtype)
-        self.output_buffer = allocate(shape=y_shape, dtype=dtype)
+        self.input_buffers = [allocate(shape=(batch_size, *x_shape[1:]), dtype=dtype) for _ in range(n_buffers)]
+        self.output_buffers = [allocate(shape=(batch_size, *y_shape[1:]), dtype=dtype) for _ in range(n_buffers)]
+        self.input_buffer = self.input_buffers[0]
+        self.output_buffer = self.output_buffers[0]
 
     def _print_dt(self, timea, timeb, N):
         dt = timeb - timea
@@ -21,55 +61,129 @@ class NeuralNetworkOverlay(Overlay):
         print(f"Classified {N} samples in {dts} seconds ({rate} inferences / s)")
         return dts, rate
 
-    def predict(self, X, debug=False, profile=False, encode=None, decode=None):
+    def _split(self, X):
+        if isinstance(X, np.ndarray):
+            X = [X]
+        for chunk in X:
+            for start in range(0, len(chunk), self.batch_size):
+                yield chunk[start : start + self.batch_size]
+
+    @staticmethod
+    def _fill(buffer, chunk, encode):
+        buffer[:] = chunk if encode is None else encode(chunk)
+
+    @staticmethod
+    def _drain(buffer, decode):
+        y = buffer if decode is None else decode(buffer)
+        # The buffer is overwritten by the next transfer into it
+        if np.may_share_memory(y, buffer):
+            y = np.array(y)
+        return y
+
+    def predict_iter(self, X, encode=None, decode=None, debug=False):
+        """Stream the inputs through the accelerator and yield the predictions chunk by chunk.
+
+        While a chunk is transferred, the next one is encoded and the previous one is decoded, so that the work of
+        the PS overlaps with the DMA transfers. The inputs are only read one chunk ahead, so arbitrarily large inputs
+        can be streamed, e.g., from a memory-mapped file or a generator.
+
+        Args:
+            X (ndarray or iterable): The inputs, either one array or an iterable of arrays of any number of samples.
+            encode (Callable, optional): Function to transform a chunk of the inputs. Defaults to None.
+            decode (Callable, optional): Function to transform a chunk of the outputs. Defaults to None.
+            debug (bool, optional): If set, the function will print information about the data transfers status.
+                Defaults to False.
+
+        Yields:
+            ndarray: The outputs of each chunk of at most ``batch_size`` samples, in the order of the inputs.
         """
-        Obtain the predictions of the NN implemented in the FPGA.
-        Parameters:
-        - X : the input vector. Should be numpy ndarray.
-        - dtype : the data type of the elements of the input/output vectors.
-                  Note: it should be set depending on the interface of the accelerator; if it uses 'float'
-                  types for the 'data' AXI-Stream field, 'np.float32' dtype is the correct one to use.
-                  Instead if it uses 'ap_fixed<A,B>', 'np.intA' is the correct one to use (note that A cannot
-                  any integer value, but it can assume {..., 8, 16, 32, ...} values. Check `numpy`
-                  doc for more info).
-                  In this case the encoding/decoding has to be computed by the PS. For example for
-                  'ap_fixed<16,6>' type the following 2 functions are the correct one to use for encode/decode
-                  'float' -> 'ap_fixed<16,6>':
-                  ```
-                    def encode(xi):
-                        return np.int16(round(xi * 2**10)) # note 2**10 = 2**(A-B)
-                    def decode(yi):
-                        return yi * 2**-10
-                    encode_v = np.vectorize(encode) # to apply them element-wise
-                    decode_v = np.vectorize(decode)
-                  ```
-        - profile : boolean. Set it to `True` to print the performance of the algorithm in term of `inference/s`.
-        - encode/decode: function pointers. See `dtype` section for more information.
-        - return: an output array based on `np.ndarray` with a shape equal to `y_shape` and a `dtype` equal to
-                  the namesake parameter.
+        n_buffers = len(self.input_buffers)
+        chunks = self._split(X)
+        fills = deque()
+        drains = deque()
+        ready = deque()
+        in_flight = False
+        with ThreadPoolExecutor(self.n_workers) as executor:
+
+            def submit_fill(i):
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    slot = i % n_buffers
+                    n = len(chunk)
+                    fills.append((slot, n, executor.submit(self._fill, self.input_buffers[slot][:n], chunk, encode)))
+
+            try:
+                submit_fill(0)
+                i = 0
+                while fills:
+                    slot, n, fill = fills.popleft()
+                    fill.result()
+                    # The output buffer of the slot can only be reused once its previous chunk is decoded
+                    while len(drains) >= n_buffers:
+                        ready.append(drains.popleft().result())
+                    self.sendchannel.transfer(self.input_buffers[slot][:n])
+                    self.recvchannel.transfer(self.output_buffers[slot][:n])
+                    in_flight = True
+                    if debug:
+                        print(f"Transfer {i} OK")
+                    # The input buffer of the next chunk was last read by a transfer that has already finished, unless
+                    # it is the buffer being sent
+                    if n_buffers > 1:
+                        submit_fill(i + 1)
+                    while ready:
+                        yield ready.popleft()
+                    self.sendchannel.wait()
+                    self.recvchannel.wait()
+                    in_flight = False
+                    if debug:
+                        print(f"Receive {i} OK")
+                    if n_buffers == 1:
+                        submit_fill(i + 1)
+                    drains.append(executor.submit(self._drain, self.output_buffers[slot][:n], decode))
+                    i += 1
+                while drains:
+                    yield drains.popleft().result()
+            finally:
+                # If the generator is closed early, don't leave the DMA running into the buffers
+                if in_flight:
+                    self.sendchannel.wait()
+                    self.recvchannel.wait()
+
+    def predict(self, X, debug=False, profile=False, encode=None, decode=None):
+        """Obtain the predictions of the NN implemented in the FPGA.
+
+        Args:
+            X (ndarray or iterable): The inputs, either one array or an iterable of arrays (see ``predict_iter``).
+            debug (bool, optional): If set, the function will print information about the data transfers status.
+                Defaults to False.
+            profile (bool, optional): If set, the function will print the performance of the algorithm in terms of
+                inference/s. Defaults to False.
+            encode (Callable, optional): Function to transform a chunk of the inputs. Defaults to None.
+            decode (Callable, optional): Function to transform a chunk of the outputs. Defaults to None.
+
+                The ``dtype`` of the buffers should be set depending on the interface of the accelerator; if it uses
+                'float' data type for the 'data' AXI-Stream field, 'np.float32' dtype must be used. Instead if it uses
+                'ap_fixed<A,B>', 'np.intA' is the correct dtype to use. Note that A cannot any integer value, but it
+                can assume power of 2 values, i.e., {..., 8, 16, 32, ...}. Check `numpy` documentation for more
+                information. In this case the encoding/decoding has to be computed by the PS. For example for
+                'ap_fixed<16,6>' type the following 2 functions are the correct one to use for encode/decode
+                'float' -> 'ap_fixed<16,6>'::
+
+                    def encode(x):
+                        return np.round(x * 2**10).astype(np.int16) # note 2**10 = 2**(A-B)
+                    def decode(y):
+                        return y * 2**-10
+
+        Returns:
+            ndarray: The outputs of all the samples, or a tuple of the outputs, the time in seconds and the number of
+            inferences per second if ``profile`` is set.
         """
         if profile:
             timea = datetime.now()
-        if encode is not None:
-            X = encode(X)
-        self.input_buffer[:] = X
-        self.sendchannel.transfer(self.input_buffer)
-        self.recvchannel.transfer(self.output_buffer)
-        if debug:
-            print("Transfer OK")
-        self.sendchannel.wait()
-        if debug:
-            print("Send OK")
-        self.recvchannel.wait()
-        if debug:
-            print("Receive OK")
-        # result = self.output_buffer.copy()
-        if decode is not None:
-            self.output_buffer = decode(self.output_buffer)
-
+        y = np.concatenate(list(self.predict_iter(X, encode=encode, decode=decode, debug=debug)))
         if profile:
             timeb = datetime.now()
-            dts, rate = self._print_dt(timea, timeb, len(X))
-            return self.output_buffer, dts, rate
+            dts, rate = self._print_dt(timea, timeb, len(y))
+            return y, dts, rate
         else:
-            return self.output_buffer
+            return y
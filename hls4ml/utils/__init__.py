@@ -1,3 +1,4 @@
 from hls4ml.utils.config import config_from_keras_model, config_from_onnx_model, config_from_pytorch_model  # noqa: F401
 from hls4ml.utils.example_models import fetch_example_list, fetch_example_model  # noqa: F401
 from hls4ml.utils.plot import plot_model  # noqa: F401
+from hls4ml.utils.serialization import deserialize_model, serialize_model  # noqa: F401
@@ -0,0 +1,235 @@
+import hashlib
+import os
+import platform
+import re
+import subprocess
+import tempfile
+from pathlib import Path
+from shutil import copyfile
+
+# Sources of the C++ build found at the top of the output directory, everything in firmware/ is considered a source
+_source_suffixes = ('.cpp', '.h', '.hpp', '.sh', '.mk')
+
+# Build products
+_ignored_suffixes = ('.so', '.o', '.gch')
+
+_default_max_size = 2 * 1024**3  # 2 GB
+
+_compile_cache = None
+
+
+class CompileCache:
+    """On-disk cache of the libraries compiled by the ``build_lib.sh`` script of a project.
+
+    Libraries are stored under a key computed from the content of the generated project (firmware sources, ``nnet_utils``
+    and ``ap_types`` headers, weights, build script with its compiler flags) and the version of the compiler. When a
+    project is compiled again without changes, the stored library is reused and the compiler is not invoked.
+
+    The cache also holds the precompiled headers of the ``ap_types`` and ``nnet_utils`` template libraries, passed to
+    ``build_lib.sh`` through the ``PCH_DIR`` environment variable. They are shared by all projects, so the compilation of a
+    new project only parses the model-specific code.
+
+    The cache is bounded in size, the least recently used libraries and precompiled headers are removed once
+    ``max_size`` is exceeded.
+
+    Args:
+        path (str): Directory of the cache. Created if it doesn't exist.
+        max_size (int, optional): Maximum total size of the cache, in bytes. Defaults to 2 GB.
+        shared (bool, optional): If True, the cache directory and the stored libraries are made group-writable so that
+            the cache can be shared between users of the same group. Defaults to False.
+        precompiled_headers (bool, optional): If True, the template libraries are compiled into precompiled headers
+            reused by all projects. Defaults to True.
+    """
+
+    def __init__(self, path, max_size=_default_max_size, shared=False, precompiled_headers=True):
+        self.path = Path(path).expanduser().resolve()
+        self.max_size = int(max_size)
+        self.shared = shared
+        self.precompiled_headers = precompiled_headers
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        if self.precompiled_headers:
+            self.pch_path.mkdir(exist_ok=True)
+        if self.shared:
+            # The setgid bit makes the stored libraries inherit the group of the directory
+            for path in (self.path, self.pch_path):
+                try:
+                    if path.exists():
+                        path.chmod(0o2775)
+                except PermissionError:
+                    pass  # Directory created by another user of the group
+
+    @property
+    def pch_path(self):
+        """Directory of the precompiled headers."""
+        return self.path / 'pch'
+
+    def get_key(self, model):
+        """Compute the cache key of the generated project of the model.
+
+        Args:
+            model (ModelGraph): The model whose project was written.
+
+        Returns:
+            str: The key, a hex digest.
+        """
+        output_dir = Path(model.config.get_output_dir()).resolve()
+        stamp = model.config.get_config_value('Stamp', '').encode()
+
+        build_script = (output_dir / 'build_lib.sh').read_text()
+
+        h = hashlib.sha256()
+        h.update(platform.system().encode())
+        h.update(platform.machine().encode())
+        h.update(self._get_compiler_version(build_script).encode())
+
+        # Environment variables used by the build script (e.g., MGC_HOME for the include path of Catapult)
+        for var in sorted(set(re.findall(r'\$\{?([A-Za-z_][A-Za-z0-9_]*)', build_script))):
+            if var in os.environ:
+                h.update(f'{var}={os.environ[var]}'.encode())
+
+        # The weights read at run time are located through an absolute path compiled into the library
+        weights_dir = output_dir / 'firmware' / 'weights'
+        if 'WEIGHTS_DIR' in build_script and (any(weights_dir.glob('*.txt')) or any(weights_dir.glob('*.bin'))):
+            h.update(str(output_dir).encode())
+
+        sources = [file for file in output_dir.iterdir() if file.suffix in _source_suffixes]
+        sources += (output_dir / 'firmware').rglob('*')
+        for file in sorted(sources):
+            if not file.is_file() or file.suffix in _ignored_suffixes:
+                continue
+            h.update(str(file.relative_to(output_dir)).encode())
+            content = file.read_bytes()
+            if stamp:
+                # The stamp only makes the name of the library unique, it doesn't change its content
+                content = content.replace(stamp, b'')
+            h.update(hashlib.sha256(content).digest())
+
+        return h.hexdigest()
+
+    def load(self, key, lib_name):
+        """Copy the library stored under the given key to ``lib_name``.
+
+        Args:
+            key (str): The key of the library.
+            lib_name (str): Path where the library is expected by the model.
+
+        Returns:
+            bool: True if the library was found in the cache, False otherwise.
+        """
+        cached_lib = self.path / f'{key}.so'
+        try:
+            copyfile(cached_lib, lib_name)
+            os.utime(cached_lib)  # Mark as recently used
+        except FileNotFoundError:
+            return False
+
+        return True
+
+    def store(self, key, lib_name):
+        """Store the compiled library under the given key, evicting old entries if the cache is full.
+
+        Args:
+            key (str): The key of the library.
+            lib_name (str): Path of the compiled library.
+        """
+        # Copy to a temporary file first, so that concurrent readers never see a partially written library
+        fd, tmp_name = tempfile.mkstemp(suffix='.tmp', dir=self.path)
+        os.close(fd)
+        try:
+            copyfile(lib_name, tmp_name)
+            if self.shared:
+                os.chmod(tmp_name, 0o664)
+            os.replace(tmp_name, self.path / f'{key}.so')
+        finally:
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+
+        self.evict()
+
+    def _entries(self):
+        return [*self.path.glob('*.so'), *self.pch_path.glob('*.gch')]
+
+    def evict(self):
+        """Remove the least recently used entries until the total size fits within ``max_size``."""
+        entries = []
+        for lib in self._entries():
+            try:
+                stat = lib.stat()
+            except FileNotFoundError:
+                continue  # Removed by another process
+            entries.append((stat.st_mtime, stat.st_size, lib))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, lib in sorted(entries, key=lambda entry: entry[0]):
+            if total_size <= self.max_size:
+                break
+            try:
+                lib.unlink()
+            except FileNotFoundError:
+                pass
+            total_size -= size
+
+    def clear(self):
+        """Remove all the libraries and precompiled headers from the cache."""
+        for lib in self._entries():
+            try:
+                lib.unlink()
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _get_compiler_version(build_script):
+        match = re.search(r'^CC=(\S+)', build_script, re.MULTILINE)
+        compiler = match.group(1) if match else 'g++'
+        try:
+            ret_val = subprocess.run([compiler, '--version'], text=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        except OSError:
+            return compiler
+        return ret_val.stdout
+
+
+def set_compile_cache(path, max_size=_default_max_size, shared=False, precompiled_headers=True):
+    """Enable the cache of compiled libraries used by ``ModelGraph.compile()``.
+
+    The cache can also be enabled through the environment variables ``HLS4ML_COMPILE_CACHE`` (the directory),
+    ``HLS4ML_COMPILE_CACHE_SIZE`` (the maximum size in bytes), ``HLS4ML_COMPILE_CACHE_SHARED`` (set to 1 to share the
+    cache between the users of a group) and ``HLS4ML_COMPILE_CACHE_PCH`` (set to 0 to disable the precompiled headers).
+
+    Args:
+        path (str): Directory of the cache. If None, the cache is disabled.
+        max_size (int, optional): Maximum total size of the cache, in bytes. Defaults to 2 GB.
+        shared (bool, optional): If True, the cache can be shared between users of the same group. Defaults to False.
+        precompiled_headers (bool, optional): If True, the template libraries are compiled into precompiled headers
+            reused by all projects. Defaults to True.
+
+    Returns:
+        CompileCache: The enabled cache, or None if disabled.
+    """
+    global _compile_cache
+
+    if path is None:
+        _compile_cache = None
+    else:
+        _compile_cache = CompileCache(path, max_size=max_size, shared=shared, precompiled_headers=precompiled_headers)
+
+    return _compile_cache
+
+
+def get_compile_cache():
+    """Return the cache of compiled libraries, or None if the cache is not enabled.
+
+    Returns:
+        CompileCache: The cache.
+    """
+    global _compile_cache
+
+    if _compile_cache is None and os.environ.get('HLS4ML_COMPILE_CACHE'):
+        _compile_cache = CompileCache(
+            os.environ['HLS4ML_COMPILE_CACHE'],
+            max_size=int(os.environ.get('HLS4ML_COMPILE_CACHE_SIZE', _default_max_size)),
+            shared=os.environ.get('HLS4ML_COMPILE_CACHE_SHARED', '0') == '1',
+            precompiled_headers=os.environ.get('HLS4ML_COMPILE_CACHE_PCH', '1') == '1',
+        )
+
+    return _compile_cache
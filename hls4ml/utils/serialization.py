@@ -0,0 +1,184 @@
+import importlib
+import json
+import os
+import pickle
+from pathlib import Path
+from shutil import rmtree
+
+import numpy as np
+
+# Version of the layout of the saved model, increased on incompatible changes
+format_version = 1
+
+_metadata_file = 'hls4ml_model.json'
+_graph_file = 'graph.pkl'
+_arrays_dir = 'arrays'
+
+# Config entries holding the model of the source framework, they are not saved
+_framework_models = ('KerasModel', 'PytorchModel', 'OnnxModel')
+
+# Arrays smaller than this are stored in the pickle, the larger ones in their own .npy file
+_min_array_size = 1024
+
+_dynamic_classes = {}
+
+
+def _rebuild_class(name, bases, namespace):
+    """Recreate a class created at runtime with ``type()``, like the backend-specific layer and type classes."""
+    key = (name, bases)
+    if key not in _dynamic_classes:
+        _dynamic_classes[key] = type(name, bases, dict(namespace))
+    return _dynamic_classes[key]
+
+
+def _is_importable(cls):
+    try:
+        obj = importlib.import_module(cls.__module__)
+        for part in cls.__qualname__.split('.'):
+            obj = getattr(obj, part)
+    except (ImportError, AttributeError):
+        return False
+    return obj is cls
+
+
+def _new_object(cls):
+    return cls.__new__(cls)
+
+
+class _ModelPickler(pickle.Pickler):
+    def __init__(self, file, arrays_path):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.arrays_path = arrays_path
+        self.arrays = {}
+
+    def persistent_id(self, obj):
+        if type(obj) not in (np.ndarray, np.memmap) or obj.dtype.hasobject or obj.nbytes < _min_array_size:
+            return None
+        if id(obj) not in self.arrays:
+            file_name = f'{len(self.arrays)}.npy'
+            np.save(self.arrays_path / file_name, obj, allow_pickle=False)
+            self.arrays[id(obj)] = (file_name, obj)  # Keep the array alive, so its id isn't reused
+        return ('array', self.arrays[id(obj)][0])
+
+    def reducer_override(self, obj):
+        from hls4ml.backends.backend import Backend, get_backend
+        from hls4ml.model.graph import HLSConfig, ModelGraph
+
+        if isinstance(obj, type):
+            if _is_importable(obj):
+                return NotImplemented
+            namespace = {
+                key: value
+                for key, value in obj.__dict__.items()
+                if key not in ('__dict__', '__weakref__', '__module__', '__doc__', '__qualname__')
+            }
+            return _rebuild_class, (obj.__name__, obj.__bases__, namespace)
+        if isinstance(obj, Backend):
+            return get_backend, (obj.name,)
+        if isinstance(obj, HLSConfig):
+            state = dict(obj.__dict__)
+            state['config'] = {key: value for key, value in obj.config.items() if key not in _framework_models}
+            return _new_object, (type(obj),), state
+        if isinstance(obj, ModelGraph):
+            state = dict(obj.__dict__)
+            state['_top_function_lib'] = None
+            state['_top_functions'] = {}
+            return _new_object, (type(obj),), state
+        return NotImplemented
+
+
+class _ModelUnpickler(pickle.Unpickler):
+    def __init__(self, file, arrays_path, mmap_mode):
+        super().__init__(file)
+        self.arrays_path = arrays_path
+        self.mmap_mode = mmap_mode
+
+    def persistent_load(self, pid):
+        kind, file_name = pid
+        if kind != 'array':
+            raise pickle.UnpicklingError(f'Unknown persistent object: {kind}')
+        return np.load(self.arrays_path / file_name, mmap_mode=self.mmap_mode, allow_pickle=False)
+
+
+def serialize_model(model, path):
+    """Save a model, after its flows have been applied, to a directory.
+
+    The saved model contains the layers with their attributes, types and weights, the applied flows and the
+    configuration, so it can be written, compiled and used for predictions after loading it with ``deserialize_model``,
+    without converting it again. The model of the source framework (e.g., ``KerasModel``) is not saved. Large weight
+    arrays are stored in ``.npy`` files and memory-mapped when loaded.
+
+    If the model has been compiled, the path to the library is saved as well, and it is linked again when the model is
+    loaded, as long as the project in the output directory still exists.
+
+    Args:
+        model (ModelGraph): The model to save.
+        path (str): The directory to save the model to. Any existing content is replaced.
+    """
+    from hls4ml import __version__
+
+    path = Path(path)
+    if path.exists():
+        rmtree(path)
+    arrays_path = path / _arrays_dir
+    arrays_path.mkdir(parents=True)
+
+    with open(path / _graph_file, 'wb') as f:
+        pickler = _ModelPickler(f, arrays_path)
+        pickler.dump(model)
+        n_arrays = len(pickler.arrays)
+
+    library = model._top_function_lib._name if model._top_function_lib is not None else None
+    metadata = {
+        'format_version': format_version,
+        'hls4ml_version': __version__,
+        'backend': model.config.backend.name,
+        'project_name': model.config.get_project_name(),
+        'output_dir': model.config.get_output_dir(),
+        'applied_flows': [list(flows.keys()) for flows in model._applied_flows],
+        'layers': [[layer.name, layer.class_name] for layer in model.get_layers()],
+        'n_arrays': n_arrays,
+        'library': os.path.abspath(library) if library is not None else None,
+    }
+    with open(path / _metadata_file, 'w') as f:
+        json.dump(metadata, f, indent=2)
+
+
+def deserialize_model(path, output_dir=None, mmap_mode='c', link=True):
+    """Load a model saved with ``serialize_model``.
+
+    Args:
+        path (str): The directory the model was saved to.
+        output_dir (str, optional): Change the output directory of the model. If the output directory is changed, the
+            compiled library is not linked. Defaults to None (the original output directory).
+        mmap_mode (str, optional): Memory-map mode of the weight arrays, see ``numpy.load``. The default, 'c'
+            (copy-on-write), reads the weights when they are first accessed and allows changing them in memory without
+            changing the saved files. None reads all the weights immediately.
+        link (bool, optional): If True and the saved model had been compiled, link the compiled library if it still
+            exists, so that ``predict`` can be used without compiling the model again. Defaults to True.
+
+    Raises:
+        Exception: If the format of the saved model is not supported by this version of hls4ml.
+
+    Returns:
+        ModelGraph: The loaded model.
+    """
+    path = Path(path)
+    with open(path / _metadata_file) as f:
+        metadata = json.load(f)
+
+    if metadata['format_version'] > format_version:
+        raise Exception(
+            f'Model saved with a newer format (version {metadata["format_version"]}, hls4ml {metadata["hls4ml_version"]}), '
+            f'this version of hls4ml supports up to version {format_version}'
+        )
+
+    with open(path / _graph_file, 'rb') as f:
+        model = _ModelUnpickler(f, path / _arrays_dir, mmap_mode).load()
+
+    if output_dir is not None and output_dir != model.config.get_output_dir():
+        model.config.config['OutputDir'] = output_dir
+    elif link and metadata['library'] is not None and os.path.isfile(metadata['library']):
+        model._load_lib(metadata['library'])
+
+    return model
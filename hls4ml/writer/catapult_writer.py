@@ -10,7 +10,7 @@ import numpy as np
 import yaml
 
 from hls4ml.backends import get_backend
-from hls4ml.writer.writers import Writer
+from hls4ml.writer.writers import Writer, bridge_ctype
 
 config_filename = 'hls4ml_config.yml'
 
@@ -50,12 +50,10 @@ class CatapultWriter(Writer):
 
         # fill c++ array.
         # not including internal brackets for multidimensional case
-        sep = ''
-        for x in var:
-            h_file.write(sep + x)
-            if write_txt_file:
-                txt_file.write(sep + x)
-            sep = ", "
+        values = ", ".join(var.format_values())
+        h_file.write(values)
+        if write_txt_file:
+            txt_file.write(values)
         h_file.write("};\n")
         if write_txt_file:
             h_file.write("#endif\n")
@@ -346,10 +344,10 @@ class CatapultWriter(Writer):
                                 newline += '    ' + line + '\n'
                         if model.config.trace_output and layer.get_attr('trace', False):
                             newline += '#ifndef __SYNTHESIS__\n'
-                            for var in vars:
-                                newline += '    nnet::save_layer_output<{}>({}, "{}", {});\n'.format(
-                                    var.type.name, var.name, layer.name, var.size_cpp()
-                                )
+                            var = layer.get_output_variable()
+                            newline += '    nnet::save_layer_output<{}>({}, "{}", {});\n'.format(
+                                var.type.name, var.name, layer.name, var.size_cpp()
+                            )
                             newline += '#endif\n'
                         newline += '\n'
 
@@ -669,6 +667,10 @@ class CatapultWriter(Writer):
         model_outputs = model.get_output_variables()
         model_brams = [var for var in model.get_weight_variables() if var.storage.lower() == 'bram']
 
+        # Line buffers of io_stream layers and static recurrent layers are shared by all calls of the top function
+        io_type = model.config.get_config_value('IOType')
+        thread_safe = io_type == 'io_parallel' and not any(layer.get_attr('static', False) for layer in model.get_layers())
+
         indent = '    '
 
         for line in f.readlines():
@@ -689,7 +691,7 @@ class CatapultWriter(Writer):
                     for w in layer.get_weights():
                         newline += w.definition_cpp() + ";\n"
             elif '// hls-fpga-machine-learning insert header' in line:
-                dtype = line.split('#', 1)[1].strip()
+                dtype = bridge_ctype(line.split('#', 1)[1].strip())
                 inputs_str = ', '.join([f'{dtype} {i.name}[{i.size_cpp()}]' for i in model_inputs])
                 outputs_str = ', '.join([f'{dtype} {o.name}[{o.size_cpp()}]' for o in model_outputs])
 
@@ -698,11 +700,15 @@ class CatapultWriter(Writer):
                 newline += indent + outputs_str + '\n'
             elif '// hls-fpga-machine-learning insert wrapper' in line:
                 dtype = line.split('#', 1)[1].strip()
+                raw = dtype == 'raw'
+                convert_in = 'convert_data_from_raw' if raw else 'convert_data'
+                convert_out = 'convert_data_to_raw' if raw else 'convert_data'
+                dtype = bridge_ctype(dtype)
                 newline = ''
                 for i in model_inputs:
                     newline += indent + '{var};\n'.format(var=i.definition_cpp(name_suffix='_ap'))
-                    newline += indent + 'nnet::convert_data<{}, {}, {}>({}, {}_ap);\n'.format(
-                        dtype, i.type.name, i.size_cpp(), i.name, i.name
+                    newline += indent + 'nnet::{}<{}, {}, {}>({}, {}_ap);\n'.format(
+                        convert_in, dtype, i.type.name, i.size_cpp(), i.name, i.name
                     )
                 newline += '\n'
 
@@ -724,21 +730,43 @@ class CatapultWriter(Writer):
                 newline += '\n'
 
                 for o in model_outputs:
-                    newline += indent + 'nnet::convert_data<{}, {}, {}>({}_ap, {});\n'.format(
-                        o.type.name, dtype, o.size_cpp(), o.name, o.name
+                    newline += indent + 'nnet::{}<{}, {}, {}>({}_ap, {});\n'.format(
+                        convert_out, o.type.name, dtype, o.size_cpp(), o.name, o.name
                     )
-            elif '// hls-fpga-machine-learning insert trace_outputs' in line:
+            elif '// hls-fpga-machine-learning insert batch header' in line:
+                dtype = bridge_ctype(line.split('#', 1)[1].strip())
+                inputs_str = ', '.join([f'{dtype} *{i.name}' for i in model_inputs])
+                outputs_str = ', '.join([f'{dtype} *{o.name}' for o in model_outputs])
+
+                newline = ''
+                newline += indent + inputs_str + ',\n'
+                newline += indent + outputs_str + ',\n'
+                newline += indent + 'size_t n_samples,\n'
+                newline += indent + 'size_t n_threads\n'
+            elif '// hls-fpga-machine-learning insert batch wrapper' in line:
+                dtype = line.split('#', 1)[1].strip()
+                args = [f'&{i.name}[i_sample * {i.size_cpp()}]' for i in model_inputs]
+                args += [f'&{o.name}[i_sample * {o.size_cpp()}]' for o in model_outputs]
+
+                newline = ''
+                newline += indent + 'auto run_chunk = [=](size_t first, size_t last) {\n'
+                newline += indent * 2 + 'for (size_t i_sample = first; i_sample < last; i_sample++) {\n'
+                newline += indent * 3 + f'{model.config.get_project_name()}_{dtype}(\n'
+                newline += ',\n'.join([indent * 4 + arg for arg in args]) + '\n'
+                newline += indent * 3 + ');\n'
+                newline += indent * 2 + '}\n'
+                newline += indent + '};\n'
+                if thread_safe:
+                    newline += indent + 'nnet::run_batch(n_samples, n_threads, run_chunk);\n'
+                else:
+                    newline += indent + '// The layers keep state between samples, so they can only run on a single thread\n'
+                    newline += indent + 'nnet::run_batch(n_samples, 1, run_chunk);\n'
+            elif '// hls-fpga-machine-learning insert trace_layers' in line:
                 newline = ''
                 for layer in model.get_layers():
                     func = layer.get_attr('function_cpp', None)
                     if func and model.config.trace_output and layer.get_attr('trace', False):
-                        vars = layer.get_variables()
-                        for var in vars:
-                            newline += (
-                                indent
-                                + 'nnet::trace_outputs->insert(std::pair<std::string, void *>('
-                                + f'"{layer.name}", (void *) malloc({var.size_cpp()} * element_size)));\n'
-                            )
+                        newline += indent + f'"{layer.name}",\n'
 
             else:
                 newline = line
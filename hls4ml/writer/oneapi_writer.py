@@ -10,7 +10,7 @@ import yaml
 from hls4ml.backends import get_backend
 from hls4ml.utils.fixed_point_utils import FixedPointEmulator, ceil_log2, uint_to_binary
 from hls4ml.utils.string_utils import convert_to_pascal_case
-from hls4ml.writer.writers import Writer
+from hls4ml.writer.writers import Writer, bridge_ctype
 
 config_filename = 'hls4ml_config.yml'
 
@@ -77,10 +77,7 @@ class OneAPIWriter(Writer):
 
             # fill c++ array.
             # not including internal brackets for multidimensional case
-            sep = ''
-            for x in var:
-                h_file.write(sep + x)
-                sep = ", "
+            h_file.write(", ".join(var.format_values()))
             h_file.write("}};\n")
             h_file.write("\n#endif\n")
 
@@ -178,10 +175,10 @@ class OneAPIWriter(Writer):
                             newline += '    ' + func + '\n'
                             if model.config.trace_output and layer.get_attr('trace', False):
                                 newline += '#ifndef HLS_SYNTHESIS\n'
-                                for var in vars:
-                                    newline += '    nnet::save_layer_output<{}>({}, "{}", {});\n'.format(
-                                        var.type.name, var.name, layer.name, var.size_cpp()
-                                    )
+                                var = layer.get_output_variable()
+                                newline += '    nnet::save_layer_output<{}>({}, "{}", {});\n'.format(
+                                    var.type.name, var.name, layer.name, var.size_cpp()
+                                )
                                 newline += '#endif\n'
 
                 # Write the output
@@ -463,7 +460,7 @@ class OneAPIWriter(Writer):
                     newline = f'class {convert_to_pascal_case(project_name)}Class{dtype.capitalize()}_{stamp};\n'
 
                 elif '// hls-fpga-machine-learning insert header' in line:
-                    dtype = line.split('#', 1)[1].strip()
+                    dtype = bridge_ctype(line.split('#', 1)[1].strip())
                     inputs_str = ', '.join([f'{dtype} {i.name}[{i.size_cpp()}]' for i in model_inputs])
                     outputs_str = ', '.join([f'{dtype} {o.name}[{o.size_cpp()}]' for o in model_outputs])
 
@@ -473,9 +470,13 @@ class OneAPIWriter(Writer):
 
                 elif '// hls-fpga-machine-learning insert wrapper' in line:
                     dtype = line.split('#', 1)[1].strip()
+                    raw = dtype == 'raw'
+                    convert_in = 'convert_data_from_raw' if raw else 'convert_data'
+                    convert_out = 'convert_data_back_to_raw' if raw else 'convert_data_back'
+                    ctype = bridge_ctype(dtype)
                     newline = ''
                     for i in model_inputs:
-                        newline += indent + f'nnet::convert_data<{dtype}, {i.pipe_name}, {i.size_cpp()}>(q, {i.name});\n'
+                        newline += indent + f'nnet::{convert_in}<{ctype}, {i.pipe_name}, {i.size_cpp()}>(q, {i.name});\n'
 
                     newline += (
                         indent
@@ -485,23 +486,42 @@ class OneAPIWriter(Writer):
 
                     for o in model_outputs:
                         newline += (
-                            indent + f'nnet::convert_data_back<{o.pipe_name}, {dtype}, {o.size_cpp()}>(q, {o.name});\n'
+                            indent + f'nnet::{convert_out}<{o.pipe_name}, {ctype}, {o.size_cpp()}>(q, {o.name});\n'
                         )
                     newline += '\n'
                     newline += indent + 'q.wait();\n'
 
-                elif '// hls-fpga-machine-learning insert trace_outputs' in line:
+                elif '// hls-fpga-machine-learning insert batch header' in line:
+                    dtype = bridge_ctype(line.split('#', 1)[1].strip())
+                    inputs_str = ', '.join([f'{dtype} *{i.name}' for i in model_inputs])
+                    outputs_str = ', '.join([f'{dtype} *{o.name}' for o in model_outputs])
+
+                    newline = ''
+                    newline += indent + inputs_str + ',\n'
+                    newline += indent + outputs_str + ',\n'
+                    newline += indent + 'size_t n_samples,\n'
+                    newline += indent + 'size_t n_threads\n'
+
+                elif '// hls-fpga-machine-learning insert batch wrapper' in line:
+                    dtype = line.split('#', 1)[1].strip()
+                    args = [f'&{i.name}[i_sample * {i.size_cpp()}]' for i in model_inputs]
+                    args += [f'&{o.name}[i_sample * {o.size_cpp()}]' for o in model_outputs]
+
+                    # The pipes connecting the kernels are global, so the samples are always processed in sequence
+                    newline = ''
+                    newline += indent + '(void)n_threads;\n'
+                    newline += indent + 'for (size_t i_sample = 0; i_sample < n_samples; i_sample++) {\n'
+                    newline += indent * 2 + f'{project_name}_{dtype}(\n'
+                    newline += ',\n'.join([indent * 3 + arg for arg in args]) + '\n'
+                    newline += indent * 2 + ');\n'
+                    newline += indent + '}\n'
+
+                elif '// hls-fpga-machine-learning insert trace_layers' in line:
                     newline = ''
                     for layer in model.get_layers():
                         func = layer.get_attr('function_cpp')
                         if func and model.config.trace_output and layer.get_attr('trace', False):
-                            vars = layer.get_variables()
-                            for var in vars:
-                                newline += (
-                                    indent
-                                    + 'nnet::trace_outputs->insert(std::pair<std::string, void *>('
-                                    + f'"{layer.name}", (void *) malloc({var.size_cpp()} * element_size)));\n'
-                                )
+                            newline += indent + f'"{layer.name}",\n'
 
                 else:
                     newline = line
@@ -12,7 +12,7 @@ import yaml
 from hls4ml.backends import get_backend
 from hls4ml.model.layers import Conv1D, Conv2D, Conv2DBatchnorm, Dense
 from hls4ml.utils.fixed_point_utils import FixedPointEmulator, ceil_log2, uint_to_binary
-from hls4ml.writer.writers import Writer
+from hls4ml.writer.writers import Writer, bridge_ctype
 
 config_filename = 'hls4ml_config.yml'
 
@@ -111,10 +111,7 @@ class QuartusWriter(Writer):
 
         # fill c++ array.
         # not including internal brackets for multidimensional case
-        sep = ''
-        for x in var:
-            h_file.write(sep + x)
-            sep = ", "
+        h_file.write(", ".join(var.format_values()))
         h_file.write("};\n")
         h_file.write("\n#endif\n")
         h_file.close()
@@ -265,10 +262,10 @@ class QuartusWriter(Writer):
                         newline += '    ' + func + '\n'
                         if model.config.trace_output and layer.get_attr('trace', False):
                             newline += '#ifndef HLS_SYNTHESIS\n'
-                            for var in vars:
-                                newline += '    nnet::save_layer_output<{}>({}, "{}", {});\n'.format(
-                                    var.type.name, var.name, layer.name, var.size_cpp()
-                                )
+                            var = layer.get_output_variable()
+                            newline += '    nnet::save_layer_output<{}>({}, "{}", {});\n'.format(
+                                var.type.name, var.name, layer.name, var.size_cpp()
+                            )
                             newline += '#endif\n'
                         newline += '\n'
 
@@ -776,7 +773,7 @@ class QuartusWriter(Writer):
                     newline += f'#include \"firmware/weights/{bram.name}.h\"\n'
 
             elif '// hls-fpga-machine-learning insert header' in line:
-                dtype = line.split('#', 1)[1].strip()
+                dtype = bridge_ctype(line.split('#', 1)[1].strip())
                 if io_type == 'io_stream':
                     inputs_str = ', '.join([f'{dtype} {i.name}[{i.size_cpp()}]' for i in model_inputs])
                     outputs_str = ', '.join([f'{dtype} {o.name}[{o.size_cpp()}]' for o in model_outputs])
@@ -799,13 +796,17 @@ class QuartusWriter(Writer):
                     bram_params = ', ' + ','.join([b.name for b in model_brams])
 
                 dtype = line.split('#', 1)[1].strip()
+                raw = dtype == 'raw'
+                convert_in = 'convert_data_from_raw' if raw else 'convert_data'
+                convert_out = 'convert_data_back_to_raw' if raw else 'convert_data_back'
+                dtype = bridge_ctype(dtype)
                 if io_type == 'io_stream':
                     newline = ''
                     for i in model_inputs:
                         # Initialise stream object and store input data (C-array) to a 'stream' object
                         newline += indent + f'stream_in<{i.type.name}> {i.name}_input;\n'
-                        newline += indent + 'nnet::convert_data<{}, {}, {}>({}, {}_input);\n'.format(
-                            dtype, i.type.name, i.size_cpp(), i.name, i.name
+                        newline += indent + 'nnet::{}<{}, {}, {}>({}, {}_input);\n'.format(
+                            convert_in, dtype, i.type.name, i.size_cpp(), i.name, i.name
                         )
 
                     # Initialise stream output
@@ -825,8 +826,8 @@ class QuartusWriter(Writer):
 
                     # Store data from 'stream' output to C-array, to be then returned and handled in Python
                     for o in model_outputs:
-                        newline += indent + 'nnet::convert_data_back<{}, {}, {}>({}_output, {});\n'.format(
-                            o.type.name, dtype, o.size_cpp(), o.name, o.name
+                        newline += indent + 'nnet::{}<{}, {}, {}>({}_output, {});\n'.format(
+                            convert_out, o.type.name, dtype, o.size_cpp(), o.name, o.name
                         )
 
                 else:
@@ -834,8 +835,8 @@ class QuartusWriter(Writer):
                     newline = ''
                     newline += indent + 'input_data inputs_ap;\n'
                     for i in model_inputs:
-                        newline += indent + 'nnet::convert_data<{}, {}, {}>({}, inputs_ap.{});\n'.format(
-                            dtype, i.type.name, i.size_cpp(), i.member_name, i.member_name
+                        newline += indent + 'nnet::{}<{}, {}, {}>({}, inputs_ap.{});\n'.format(
+                            convert_in, dtype, i.type.name, i.size_cpp(), i.member_name, i.member_name
                         )
                     newline += '\n'
 
@@ -849,21 +850,57 @@ class QuartusWriter(Writer):
 
                     # Convert HLS outputs back to C-array
                     for o in model_outputs:
-                        newline += indent + 'nnet::convert_data_back<{}, {}, {}>(outputs_ap.{}, {});\n'.format(
-                            o.type.name, dtype, o.size_cpp(), o.member_name, o.member_name
+                        newline += indent + 'nnet::{}<{}, {}, {}>(outputs_ap.{}, {});\n'.format(
+                            convert_out, o.type.name, dtype, o.size_cpp(), o.member_name, o.member_name
                         )
-            elif '// hls-fpga-machine-learning insert trace_outputs' in line:
+            elif '// hls-fpga-machine-learning insert batch header' in line:
+                dtype = bridge_ctype(line.split('#', 1)[1].strip())
+                if io_type == 'io_stream':
+                    inputs_str = ', '.join([f'{dtype} *{i.name}' for i in model_inputs])
+                    outputs_str = ', '.join([f'{dtype} *{o.name}' for o in model_outputs])
+                else:
+                    inputs_str = ', '.join([f'{dtype} *{i.member_name}' for i in model_inputs])
+                    outputs_str = ', '.join([f'{dtype} *{o.member_name}' for o in model_outputs])
+
+                newline = ''
+                newline += indent + inputs_str + ',\n'
+                newline += indent + outputs_str + ',\n'
+                newline += indent + 'size_t n_samples,\n'
+                newline += indent + 'size_t n_threads\n'
+            elif '// hls-fpga-machine-learning insert batch wrapper' in line:
+                dtype = line.split('#', 1)[1].strip()
+                # Size arguments of the single-sample wrapper are unused, but must be bound to something
+                sizes = [f'const_size_in_{i}' for i in range(1, len(model_inputs) + 1)]
+                sizes += [f'const_size_out_{o}' for o in range(1, len(model_outputs) + 1)]
+                if io_type == 'io_stream':
+                    args = [f'&{i.name}[i_sample * {i.size_cpp()}]' for i in model_inputs]
+                    args += [f'&{o.name}[i_sample * {o.size_cpp()}]' for o in model_outputs]
+                else:
+                    args = [f'&{i.member_name}[i_sample * {i.size_cpp()}]' for i in model_inputs]
+                    args += [f'&{o.member_name}[i_sample * {o.size_cpp()}]' for o in model_outputs]
+                args += sizes
+
+                newline = ''
+                newline += indent + 'auto run_chunk = [=](size_t first, size_t last) {\n'
+                newline += indent * 2 + 'unsigned short {};\n'.format(', '.join(sizes))
+                newline += indent * 2 + 'for (size_t i_sample = first; i_sample < last; i_sample++) {\n'
+                newline += indent * 3 + f'{model.config.get_project_name()}_{dtype}(\n'
+                newline += ',\n'.join([indent * 4 + arg for arg in args]) + '\n'
+                newline += indent * 3 + ');\n'
+                newline += indent * 2 + '}\n'
+                newline += indent + '};\n'
+                if io_type == 'io_parallel':
+                    newline += indent + 'nnet::run_batch(n_samples, n_threads, run_chunk);\n'
+                else:
+                    # Line buffers of io_stream layers are shared by all calls of the top function
+                    newline += indent + '// The layers keep state between samples, so they can only run on a single thread\n'
+                    newline += indent + 'nnet::run_batch(n_samples, 1, run_chunk);\n'
+            elif '// hls-fpga-machine-learning insert trace_layers' in line:
                 newline = ''
                 for layer in model.get_layers():
                     func = layer.get_attr('function_cpp')
                     if func and model.config.trace_output and layer.get_attr('trace', False):
-                        vars = layer.get_variables()
-                        for var in vars:
-                            newline += (
-                                indent
-                                + 'nnet::trace_outputs->insert(std::pair<std::string, void *>('
-                                + f'"{layer.name}", (void *) malloc({var.size_cpp()} * element_size)));\n'
-                            )
+                        newline += indent + f'"{layer.name}",\n'
 
             else:
                 newline = line
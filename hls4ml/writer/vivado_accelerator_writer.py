@@ -1,8 +1,8 @@
 import os
-from distutils.dir_util import copy_tree
-from shutil import copyfile
+import re
 
 from hls4ml.writer.vivado_writer import VivadoWriter
+from hls4ml.writer.writers import copy_if_changed, copytree_if_changed, open_if_changed
 
 
 class VivadoAcceleratorWriter(VivadoWriter):
@@ -24,7 +24,7 @@ class VivadoAcceleratorWriter(VivadoWriter):
 
         filedir = os.path.dirname(os.path.abspath(__file__))
         f = open(os.path.join(filedir, '../templates/vivado_accelerator/myproject_axi.h'))
-        fout = open(f'{model.config.get_output_dir()}/firmware/{model.config.get_project_name()}_axi.h', 'w')
+        fout = open_if_changed(f'{model.config.get_output_dir()}/firmware/{model.config.get_project_name()}_axi.h')
 
         for line in f.readlines():
             if 'MYPROJECT' in line:
@@ -102,7 +102,7 @@ class VivadoAcceleratorWriter(VivadoWriter):
         #######################
 
         f = open(os.path.join(filedir, '../templates/vivado_accelerator/myproject_axi.cpp'))
-        fout = open(f'{model.config.get_output_dir()}/firmware/{model.config.get_project_name()}_axi.cpp', 'w')
+        fout = open_if_changed(f'{model.config.get_output_dir()}/firmware/{model.config.get_project_name()}_axi.cpp')
 
         io_type = model.config.get_config_value("IOType")
 
@@ -268,7 +268,7 @@ class VivadoAcceleratorWriter(VivadoWriter):
         ###################
 
         f = open(os.path.join(filedir, '../templates/vivado_accelerator/build_lib.sh'))
-        fout = open(f'{model.config.get_output_dir()}/build_lib.sh', 'w')
+        fout = open_if_changed(f'{model.config.get_output_dir()}/build_lib.sh')
 
         for line in f.readlines():
             line = line.replace('myproject', model.config.get_project_name())
@@ -339,7 +339,13 @@ class VivadoAcceleratorWriter(VivadoWriter):
         inp = model.get_input_variables()[0]
         out = model.get_output_variables()[0]
 
-        for line in f.readlines():
+        # The AXI types can be floating-point types or structs, which have no fixed-point bit patterns, so the raw
+        # wrappers are left out of the bridge
+        bridge = re.sub(
+            rf'\n(//[^\n]*\n)?void {model.config.get_project_name()}_raw(_batch)?\(.*?\n}}\n', '', f.read(), flags=re.DOTALL
+        )
+
+        for line in bridge.splitlines(keepends=True):
             if f'{model.config.get_project_name()}.h' in line:
                 newline = line.replace(f'{model.config.get_project_name()}.h', f'{model.config.get_project_name()}_axi.h')
             elif inp.definition_cpp(name_suffix='_ap') in line:
@@ -363,12 +369,39 @@ class VivadoAcceleratorWriter(VivadoWriter):
         fout.close()
         os.rename(newfile, oldfile)
 
+    def _make_project_tcl(self, model):
+        '''
+        Return the lines of the project.tcl script, with the board and interface of the VivadoAccelerator
+        '''
+        lines = [
+            'variable project_name\n',
+            f'set project_name "{model.config.get_project_name()}"\n',
+            'variable backend\n',
+            'set backend "vivadoaccelerator"\n',
+            'variable part\n',
+            f'set part "{self.vivado_accelerator_config.get_part()}"\n',
+            'variable clock_period\n',
+            'set clock_period {}\n'.format(model.config.get_config_value('ClockPeriod')),
+            'variable clock_uncertainty\n',
+            'set clock_uncertainty {}\n'.format(model.config.get_config_value('ClockUncertainty', '12.5%')),
+            'variable version\n',
+            'set version "{}"\n'.format(model.config.get_config_value('Version', '1.0.0')),
+            'variable maximum_size\n',
+            'set maximum_size {}\n'.format(model.config.get_config_value('MaximumSize', '4096')),
+        ]
+        if self.vivado_accelerator_config.get_interface() == 'axi_stream':
+            in_bit, out_bit = self.vivado_accelerator_config.get_io_bitwidth()
+            lines.append(f'set bit_width_hls_output {in_bit}\n')
+            lines.append(f'set bit_width_hls_input {out_bit}\n')
+
+        return lines
+
     def write_board_script(self, model):
         '''
         Write the tcl scripts and kernel sources to create a Vivado IPI project for the VivadoAccelerator
         '''
         filedir = os.path.dirname(os.path.abspath(__file__))
-        copyfile(
+        copy_if_changed(
             os.path.join(filedir, self.vivado_accelerator_config.get_tcl_file_path()),
             f'{model.config.get_output_dir()}/design.tcl',
         )
@@ -376,35 +409,11 @@ class VivadoAcceleratorWriter(VivadoWriter):
         if self.vivado_accelerator_config.get_board().startswith('alveo'):
             src_dir = os.path.join(filedir, self.vivado_accelerator_config.get_krnl_rtl_src_dir())
             dst_dir = os.path.abspath(model.config.get_output_dir()) + '/src'
-            copy_tree(src_dir, dst_dir)
-
-        ###################
-        # project.tcl
-        ###################
-        f = open(f'{model.config.get_output_dir()}/project.tcl', 'w')
-        f.write('variable project_name\n')
-        f.write(f'set project_name "{model.config.get_project_name()}"\n')
-        f.write('variable backend\n')
-        f.write('set backend "vivadoaccelerator"\n')
-        f.write('variable part\n')
-        f.write(f'set part "{self.vivado_accelerator_config.get_part()}"\n')
-        f.write('variable clock_period\n')
-        f.write('set clock_period {}\n'.format(model.config.get_config_value('ClockPeriod')))
-        f.write('variable clock_uncertainty\n')
-        f.write('set clock_uncertainty {}\n'.format(model.config.get_config_value('ClockUncertainty', '12.5%')))
-        f.write('variable version\n')
-        f.write('set version "{}"\n'.format(model.config.get_config_value('Version', '1.0.0')))
-        f.write('variable maximum_size\n')
-        f.write('set maximum_size {}\n'.format(model.config.get_config_value('MaximumSize', '4096')))
-        if self.vivado_accelerator_config.get_interface() == 'axi_stream':
-            in_bit, out_bit = self.vivado_accelerator_config.get_io_bitwidth()
-            f.write(f'set bit_width_hls_output {in_bit}\n')
-            f.write(f'set bit_width_hls_input {out_bit}\n')
-        f.close()
+            copytree_if_changed(src_dir, dst_dir)
 
     def write_driver(self, model):
         filedir = os.path.dirname(os.path.abspath(__file__))
-        copyfile(
+        copy_if_changed(
             os.path.join(filedir, self.vivado_accelerator_config.get_driver_path()),
             ('{}/' + self.vivado_accelerator_config.get_driver_file()).format(model.config.get_output_dir()),
         )
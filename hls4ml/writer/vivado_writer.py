@@ -1,21 +1,23 @@
 import glob
 import os
 import stat
+import struct
 import tarfile
 from collections import OrderedDict
 from pathlib import Path
-from shutil import copyfile, copytree, rmtree
+from shutil import rmtree
 
 import numpy as np
 import yaml
 
-from hls4ml.writer.writers import Writer
+from hls4ml.model.types import FixedPrecisionType, InplaceTensorVariable, UnspecifiedPrecisionType
+from hls4ml.writer.writers import Writer, bridge_ctype, copy_if_changed, copytree_if_changed, open_if_changed
 
 config_filename = 'hls4ml_config.yml'
 
 
 class VivadoWriter(Writer):
-    def print_array_to_cpp(self, var, odir, namespace=None, write_txt_file=True):
+    def print_array_to_cpp(self, var, odir, namespace=None, write_txt_file=True, write_bin_file=False, raw=False):
         """Write a weights array to C++ header files.
 
         Args:
@@ -23,11 +25,15 @@ class VivadoWriter(Writer):
             odir (str): Output directory
             namespace (str, optional): Writes a namespace for the weights to avoid clashes with global variables.
             write_txt_file (bool, optional): Write txt files in addition to .h files. Defaults to True.
+            write_bin_file (bool, optional): Write binary files in addition to .h files, loaded by the C++ simulation
+                instead of the txt files. Defaults to False.
+            raw (bool, optional): Write the integer codes of the fixed-point values instead of decimal literals. The
+                .h file sets the bits of the values with ``NNET_WEIGHT_BITS``. Defaults to False.
         """
 
-        h_file = open(f'{odir}/firmware/weights/{var.name}.h', 'w')
+        h_file = open_if_changed(f'{odir}/firmware/weights/{var.name}.h')
         if write_txt_file:
-            txt_file = open(f'{odir}/firmware/weights/{var.name}.txt', 'w')
+            txt_file = open_if_changed(f'{odir}/firmware/weights/{var.name}.txt')
 
         # meta data
         h_file.write(f'//Numpy array shape {var.shape}\n')
@@ -43,26 +49,37 @@ class VivadoWriter(Writer):
         if namespace is not None:
             h_file.write(f'namespace {namespace} {{\n\n')
 
-        if write_txt_file:
+        if write_txt_file or write_bin_file:
             h_file.write('#ifndef __SYNTHESIS__\n')
             h_file.write(var.definition_cpp() + ';\n')
             h_file.write('#else\n')
 
+        if raw:
+            raw_macro = f'{var.name.upper()}_BITS'
+            h_file.write(f'#define {raw_macro}(x) NNET_WEIGHT_BITS({var.type.name}, x)\n')
+
         h_file.write(var.definition_cpp() + ' = {')
 
         # fill c++ array.
         # not including internal brackets for multidimensional case
-        sep = ''
-        for x in var:
-            h_file.write(sep + x)
-            if write_txt_file:
-                txt_file.write(sep + x)
-            sep = ', '
+        values = var.format_values(raw=raw)
+        if raw:
+            h_file.write(', '.join(f'{raw_macro}({x})' for x in values))
+        else:
+            h_file.write(', '.join(values))
+        if write_txt_file:
+            txt_file.write(', '.join(values))
         h_file.write('};\n\n')
 
-        if write_txt_file:
+        if raw:
+            h_file.write(f'#undef {raw_macro}\n')
+
+        if write_txt_file or write_bin_file:
             h_file.write('#endif\n')
+        if write_txt_file:
             txt_file.close()
+        if write_bin_file:
+            self.print_array_to_bin(var, odir, raw=raw)
 
         if namespace is not None:
             h_file.write('}\n\n')
@@ -70,6 +87,44 @@ class VivadoWriter(Writer):
         h_file.write('\n#endif\n')
         h_file.close()
 
+    def print_array_to_bin(self, var, odir, raw=False):
+        """Write a weights array to a binary file read by ``nnet::load_weights_from_bin`` in the C++ simulation.
+
+        The file has a small header (see ``nnet_helpers.h``) with the shape and the precision of the weights, followed
+        by the values as little-endian doubles, rounded the same way as in the .h file, or as their integer codes.
+
+        Args:
+            var (WeightVariable): Weight to write
+            odir (str): Output directory
+            raw (bool, optional): Write the integer codes of the fixed-point values. Defaults to False.
+        """
+        precision = var.type.precision
+        if raw:
+            values = var.raw_values().reshape(-1, 1)
+        else:
+            if var.weight_class == 'CompressedWeightVariable':
+                values = np.array(var.data, dtype=np.float64).reshape(-1, 3)[:, [1, 0, 2]]
+            elif var.weight_class == 'ExponentWeightVariable':
+                values = var._format().astype(np.float64).reshape(-1, 2)
+            else:
+                values = np.asarray(var.data, dtype=np.float64).reshape(-1, 1)
+
+            if isinstance(precision, FixedPrecisionType):
+                values[:, -1] = np.round(values[:, -1], max(0, precision.fractional))
+            elif not isinstance(precision, UnspecifiedPrecisionType):
+                values[:, -1] = np.round(values[:, -1])
+
+        header = b'HLS4MLWB'
+        header += struct.pack('<IIIIQI', 0, 1, int(raw), values.shape[1], values.shape[0], len(var.shape))
+        header += struct.pack(f'<{len(var.shape)}Q', *var.shape)
+        header += str(precision).encode() + b'\0'
+        header += b'\0' * (-len(header) % 8)
+        header = header[:8] + struct.pack('<I', len(header)) + header[12:]
+
+        with open_if_changed(f'{odir}/firmware/weights/{var.name}.bin', 'wb') as bin_file:
+            bin_file.write(header)
+            bin_file.write(values.astype('<i8' if raw else '<f8').tobytes())
+
     def write_project_dir(self, model):
         """Write the base project directory
 
@@ -123,12 +178,15 @@ class VivadoWriter(Writer):
         filedir = os.path.dirname(os.path.abspath(__file__))
 
         f = open(os.path.join(filedir, '../templates/vivado/firmware/myproject.cpp'))
-        fout = open(f'{model.config.get_output_dir()}/firmware/{model.config.get_project_name()}.cpp', 'w')
+        fout = open_if_changed(f'{model.config.get_output_dir()}/firmware/{model.config.get_project_name()}.cpp')
 
         model_inputs = model.get_input_variables()
         model_outputs = model.get_output_variables()
         model_brams = [var for var in model.get_weight_variables() if var.storage.lower() == 'bram']
 
+        # With split layers, the weights and the layer configs of parameters.h are included by the layer units instead
+        split_layers = model.config.get_writer_config().get('SplitLayers', False)
+
         indent = '    '
 
         for line in f.readlines():
@@ -136,6 +194,9 @@ class VivadoWriter(Writer):
             if 'myproject' in line:
                 newline = line.replace('myproject', model.config.get_project_name())
 
+            elif '#include "parameters.h"' in line and split_layers:
+                newline = ''
+
             elif '// hls-fpga-machine-learning insert header' in line:
                 inputs_str = ', '.join([i.definition_cpp(as_reference=True) for i in model_inputs])
                 outputs_str = ', '.join([o.definition_cpp(as_reference=True) for o in model_outputs])
@@ -155,6 +216,12 @@ class VivadoWriter(Writer):
                 if namespace is not None:
                     newline += f'namespace {namespace} {{\n'
 
+                if split_layers:
+                    newline += '// Layers written to their own translation units in layers/\n'
+                    for layer in self._get_unit_layers(model):
+                        params, _, _ = self._get_layer_unit_signature(layer)
+                        newline += 'void {}({});\n'.format(self._get_layer_unit_name(model, layer), ', '.join(params))
+
             elif '// hls-fpga-machine-learning insert namespace-end' in line:
                 newline = ''
 
@@ -164,36 +231,8 @@ class VivadoWriter(Writer):
 
             elif '// hls-fpga-machine-learning insert load weights' in line:
                 newline = line
-                if model.config.get_writer_config()['WriteWeightsTxt']:
-
-                    newline += '#ifndef __SYNTHESIS__\n'
-                    newline += '    static bool loaded_weights = false;\n'
-                    newline += '    if (!loaded_weights) {\n'
-
-                    for layer in model.get_layers():
-                        for w in layer.get_weights():
-                            if w.weight_class == 'CompressedWeightVariable':
-                                newline += (
-                                    indent
-                                    + '    nnet::load_compressed_weights_from_txt<{}, {}>({}, "{}.txt");\n'.format(
-                                        w.type.name, w.nonzeros, w.name, w.name
-                                    )
-                                )
-                            elif w.weight_class == 'ExponentWeightVariable':
-                                newline += (
-                                    indent
-                                    + '    nnet::load_exponent_weights_from_txt<{}, {}>({}, "{}.txt");\n'.format(
-                                        w.type.name, w.data_length, w.name, w.name
-                                    )
-                                )
-                            else:
-                                newline += indent + '    nnet::load_weights_from_txt<{}, {}>({}, "{}.txt");\n'.format(
-                                    w.type.name, w.data_length, w.name, w.name
-                                )
-
-                    newline += '        loaded_weights = true;'
-                    newline += '    }\n'
-                    newline += '#endif'
+                if model.config.get_writer_config()['WriteWeightsTxt'] and not split_layers:
+                    newline += self._make_load_weights(model, model.get_layers())
 
             # Add input/output type
             elif '// hls-fpga-machine-learning insert IO' in line:
@@ -244,7 +283,12 @@ class VivadoWriter(Writer):
                                     newline += '    ' + self._make_array_pragma(var) + '\n\n'
                 for layer in model.get_layers():
                     func = layer.get_attr('function_cpp', None)
-                    if func:
+                    if func and split_layers:
+                        _, args, _ = self._get_layer_unit_signature(layer)
+                        newline += '    {}({}); // {}\n\n'.format(
+                            self._get_layer_unit_name(model, layer), ', '.join(args), layer.name
+                        )
+                    elif func:
                         if not isinstance(func, (list, set)):
                             func = [func]
                         if len(func) == 1:
@@ -254,12 +298,11 @@ class VivadoWriter(Writer):
                             for line in func:
                                 newline += '    ' + line + '\n'
                         if model.config.trace_output and layer.get_attr('trace', False):
-                            vars = layer.get_variables()
                             newline += '#ifndef __SYNTHESIS__\n'
-                            for var in vars:
-                                newline += '    nnet::save_layer_output<{}>({}, "{}", {});\n'.format(
-                                    var.type.name, var.name, layer.name, var.size_cpp()
-                                )
+                            var = layer.get_output_variable()
+                            newline += '    nnet::save_layer_output<{}>({}, "{}", {});\n'.format(
+                                var.type.name, var.name, layer.name, var.size_cpp()
+                            )
                             newline += '#endif\n'
                         newline += '\n'
 
@@ -272,6 +315,187 @@ class VivadoWriter(Writer):
         f.close()
         fout.close()
 
+    def _make_load_weights(self, model, layers):
+        ext = model.config.get_writer_config().get('WeightsFormat', 'txt')
+        indent = '    '
+        newline = '#ifndef __SYNTHESIS__\n'
+        newline += '    static bool loaded_weights = false;\n'
+        newline += '    if (!loaded_weights) {\n'
+
+        for layer in layers:
+            for w in layer.get_weights():
+                if w.weight_class == 'CompressedWeightVariable':
+                    newline += indent + '    nnet::load_compressed_weights_from_{}<{}, {}>({}, "{}.{}");\n'.format(
+                        ext, w.type.name, w.nonzeros, w.name, w.name, ext
+                    )
+                elif w.weight_class == 'ExponentWeightVariable':
+                    newline += indent + '    nnet::load_exponent_weights_from_{}<{}, {}>({}, "{}.{}");\n'.format(
+                        ext, w.type.name, w.data_length, w.name, w.name, ext
+                    )
+                elif ext == 'txt' and self._use_raw_values(model, w):
+                    newline += indent + '    nnet::load_raw_weights_from_txt<{}, {}>({}, "{}.txt");\n'.format(
+                        w.type.name, w.data_length, w.name, w.name
+                    )
+                else:
+                    newline += indent + '    nnet::load_weights_from_{}<{}, {}>({}, "{}.{}");\n'.format(
+                        ext, w.type.name, w.data_length, w.name, w.name, ext
+                    )
+
+        newline += '        loaded_weights = true;'
+        newline += '    }\n'
+        newline += '#endif'
+
+        return newline
+
+    @staticmethod
+    def _use_raw_values(model, var):
+        return model.config.get_writer_config().get('RawWeights', False) and var.supports_raw_values()
+
+    @staticmethod
+    def _get_unit_layers(model):
+        return [layer for layer in model.get_layers() if layer.get_attr('function_cpp', None)]
+
+    @staticmethod
+    def _get_layer_unit_name(model, layer):
+        return f'{model.config.get_project_name()}_layer{layer.index}'
+
+    @staticmethod
+    def _get_layer_unit_signature(layer):
+        """Get the parameters of the function of a layer written to its own translation unit.
+
+        Inplace variables are only aliases of the variable they are derived from, so the original variable is passed to
+        the function and the alias is defined again in its body.
+
+        Args:
+            layer (Layer): The layer.
+
+        Returns:
+            tuple: The parameter declarations, the arguments of the call and the alias definitions.
+        """
+        variables = [layer.get_input_variable(name) for name in layer.inputs]
+        variables += list(layer.get_variables())
+
+        params = []
+        args = []
+        aliases = []
+        for var in variables:
+            if var is None:
+                continue
+            chain = []
+            while isinstance(var, InplaceTensorVariable):
+                chain.insert(0, var)
+                var = var.input_var
+            for alias in chain:
+                if alias.definition_cpp() not in aliases:
+                    aliases.append(alias.definition_cpp())
+            if var.name not in args:
+                params.append(var.definition_cpp(as_reference=True))
+                args.append(var.name)
+
+        for w in layer.get_weights():
+            if w.storage.lower() == 'bram':
+                params.append(w.definition_cpp(as_reference=False))
+                args.append(w.name)
+
+        return params, args, aliases
+
+    def write_layer_units(self, model):
+        """Write each layer to its own translation unit (layers/layer<index>.cpp) if enabled with 'SplitLayers'
+
+        Args:
+            model (ModelGraph): the hls4ml model.
+        """
+        layers_dir = f'{model.config.get_output_dir()}/firmware/layers'
+        if not model.config.get_writer_config().get('SplitLayers', False):
+            if os.path.isdir(layers_dir):
+                rmtree(layers_dir)
+            return
+        os.makedirs(layers_dir, exist_ok=True)
+
+        filedir = os.path.dirname(os.path.abspath(__file__))
+        with open(os.path.join(filedir, '../templates/vivado/firmware/myproject_layer.cpp')) as f:
+            template = f.readlines()
+
+        namespace = model.config.get_writer_config().get('Namespace', None)
+        indent = '    '
+
+        unit_layers = self._get_unit_layers(model)
+
+        # Remove the units of layers that no longer exist, the others are only rewritten if they changed
+        unit_files = {f'layer{layer.index}.cpp' for layer in unit_layers}
+        for unit_file in os.listdir(layers_dir):
+            if unit_file not in unit_files:
+                os.remove(f'{layers_dir}/{unit_file}')
+
+        for layer in unit_layers:
+            params, _, aliases = self._get_layer_unit_signature(layer)
+            fout = open_if_changed(f'{layers_dir}/layer{layer.index}.cpp')
+
+            for line in template:
+                if 'myproject_layer' in line:
+                    newline = line.replace('myproject_layer', self._get_layer_unit_name(model, layer))
+
+                elif '// hls-fpga-machine-learning insert includes' in line:
+                    newline = line
+                    for include in sorted(set(layer.get_attr('include_header', []))):
+                        newline += f'#include "../{include}"\n'
+
+                elif '// hls-fpga-machine-learning insert weights' in line:
+                    newline = line
+                    for w in layer.get_weights():
+                        if w.storage.lower() != 'bram':
+                            newline += f'#include "../weights/{w.name}.h"\n'
+
+                elif '// hls-fpga-machine-learning insert namespace-start' in line:
+                    newline = ''
+                    if namespace is not None:
+                        newline += f'namespace {namespace} {{\n'
+
+                elif '// hls-fpga-machine-learning insert namespace-end' in line:
+                    newline = ''
+                    if namespace is not None:
+                        newline += '}\n'
+
+                elif '// hls-fpga-machine-learning insert layer-config' in line:
+                    newline = line
+                    config = layer.get_attr('config_cpp', None)
+                    if config:
+                        newline += '// ' + layer.name + '\n'
+                        newline += config + '\n'
+
+                elif '// hls-fpga-machine-learning insert header' in line:
+                    newline = ',\n'.join(indent + param for param in params) + '\n'
+
+                elif '// hls-fpga-machine-learning insert load weights' in line:
+                    newline = line
+                    if model.config.get_writer_config()['WriteWeightsTxt'] and len(layer.get_weights()) > 0:
+                        newline += self._make_load_weights(model, [layer]) + '\n'
+
+                elif '// hls-fpga-machine-learning insert layer' in line:
+                    newline = line
+                    for alias in aliases:
+                        newline += indent + alias + ';\n'
+                    func = layer.get_attr('function_cpp')
+                    if not isinstance(func, (list, set)):
+                        func = [func]
+                    newline += '    // ' + layer.name + '\n'
+                    for func_line in func:
+                        newline += '    ' + func_line + '\n'
+                    if model.config.trace_output and layer.get_attr('trace', False):
+                        newline += '#ifndef __SYNTHESIS__\n'
+                        var = layer.get_output_variable()
+                        newline += '    nnet::save_layer_output<{}>({}, "{}", {});\n'.format(
+                            var.type.name, var.name, layer.name, var.size_cpp()
+                        )
+                        newline += '#endif\n'
+
+                else:
+                    newline = line
+
+                fout.write(newline)
+
+            fout.close()
+
     def write_project_header(self, model):
         """Write the main architecture header file (myproject.h)
 
@@ -281,7 +505,7 @@ class VivadoWriter(Writer):
 
         filedir = os.path.dirname(os.path.abspath(__file__))
         f = open(os.path.join(filedir, '../templates/vivado/firmware/myproject.h'))
-        fout = open(f'{model.config.get_output_dir()}/firmware/{model.config.get_project_name()}.h', 'w')
+        fout = open_if_changed(f'{model.config.get_output_dir()}/firmware/{model.config.get_project_name()}.h')
 
         model_inputs = model.get_input_variables()
         model_outputs = model.get_output_variables()
@@ -337,7 +561,7 @@ class VivadoWriter(Writer):
         """
         filedir = os.path.dirname(os.path.abspath(__file__))
         f = open(os.path.join(filedir, '../templates/vivado/firmware/defines.h'))
-        fout = open(f'{model.config.get_output_dir()}/firmware/defines.h', 'w')
+        fout = open_if_changed(f'{model.config.get_output_dir()}/firmware/defines.h')
 
         for line in f.readlines():
             # Insert numbers
@@ -395,7 +619,7 @@ class VivadoWriter(Writer):
         """
         filedir = os.path.dirname(os.path.abspath(__file__))
         f = open(os.path.join(filedir, '../templates/vivado/firmware/parameters.h'))
-        fout = open(f'{model.config.get_output_dir()}/firmware/parameters.h', 'w')
+        fout = open_if_changed(f'{model.config.get_output_dir()}/firmware/parameters.h')
 
         for line in f.readlines():
             if '// hls-fpga-machine-learning insert includes' in line:
@@ -445,11 +669,19 @@ class VivadoWriter(Writer):
             model (ModelGraph): the hls4ml model.
         """
         namespace = model.config.get_writer_config().get('Namespace', None)
-        write_txt = model.config.get_writer_config().get('WriteWeightsTxt', True)
+        load_weights = model.config.get_writer_config().get('WriteWeightsTxt', True)
+        weights_format = model.config.get_writer_config().get('WeightsFormat', 'txt')
+        if weights_format not in ['txt', 'bin']:
+            raise Exception(f'Unsupported weights format: {weights_format}, expected one of "txt" or "bin"')
         for layer in model.get_layers():
             for weights in layer.get_weights():
                 self.print_array_to_cpp(
-                    weights, model.config.get_output_dir(), namespace=namespace, write_txt_file=write_txt
+                    weights,
+                    model.config.get_output_dir(),
+                    namespace=namespace,
+                    write_txt_file=load_weights and weights_format == 'txt',
+                    write_bin_file=load_weights and weights_format == 'bin',
+                    raw=self._use_raw_values(model, weights),
                 )
 
     def __make_dat_file(self, original_path, project_path):
@@ -475,7 +707,7 @@ class VivadoWriter(Writer):
                 f.write("\n")
 
         # Print out in dat file
-        with open(project_path, "w") as f:
+        with open_if_changed(project_path) as f:
             print_data(f)
 
     def write_test_bench(self, model):
@@ -495,20 +727,20 @@ class VivadoWriter(Writer):
 
         if input_data:
             if input_data[-3:] == "dat":
-                copyfile(input_data, f'{model.config.get_output_dir()}/tb_data/tb_input_features.dat')
+                copy_if_changed(input_data, f'{model.config.get_output_dir()}/tb_data/tb_input_features.dat')
             else:
                 self.__make_dat_file(input_data, f'{model.config.get_output_dir()}/tb_data/tb_input_features.dat')
 
         if output_predictions:
             if output_predictions[-3:] == "dat":
-                copyfile(output_predictions, f'{model.config.get_output_dir()}/tb_data/tb_output_predictions.dat')
+                copy_if_changed(output_predictions, f'{model.config.get_output_dir()}/tb_data/tb_output_predictions.dat')
             else:
                 self.__make_dat_file(
                     output_predictions, f'{model.config.get_output_dir()}/tb_data/tb_output_predictions.dat'
                 )
 
         f = open(os.path.join(filedir, '../templates/vivado/myproject_test.cpp'))
-        fout = open(f'{model.config.get_output_dir()}/{model.config.get_project_name()}_test.cpp', 'w')
+        fout = open_if_changed(f'{model.config.get_output_dir()}/{model.config.get_project_name()}_test.cpp')
 
         model_inputs = model.get_input_variables()
         model_outputs = model.get_output_variables()
@@ -607,12 +839,16 @@ class VivadoWriter(Writer):
 
         filedir = os.path.dirname(os.path.abspath(__file__))
         f = open(os.path.join(filedir, '../templates/vivado/myproject_bridge.cpp'))
-        fout = open(f'{model.config.get_output_dir()}/{model.config.get_project_name()}_bridge.cpp', 'w')
+        fout = open_if_changed(f'{model.config.get_output_dir()}/{model.config.get_project_name()}_bridge.cpp')
 
         model_inputs = model.get_input_variables()
         model_outputs = model.get_output_variables()
         model_brams = [var for var in model.get_weight_variables() if var.storage.lower() == 'bram']
 
+        # Line buffers of io_stream layers and static recurrent layers are shared by all calls of the top function
+        io_type = model.config.get_config_value('IOType')
+        thread_safe = io_type == 'io_parallel' and not any(layer.get_attr('static', False) for layer in model.get_layers())
+
         indent = '    '
 
         for line in f.readlines():
@@ -628,7 +864,7 @@ class VivadoWriter(Writer):
                     newline += f'#include \"firmware/weights/{bram.name}.h\"\n'
 
             elif '// hls-fpga-machine-learning insert header' in line:
-                dtype = line.split('#', 1)[1].strip()
+                dtype = bridge_ctype(line.split('#', 1)[1].strip())
                 inputs_str = ', '.join([f'{dtype} {i.name}[{i.size_cpp()}]' for i in model_inputs])
                 outputs_str = ', '.join([f'{dtype} {o.name}[{o.size_cpp()}]' for o in model_outputs])
 
@@ -638,11 +874,15 @@ class VivadoWriter(Writer):
 
             elif '// hls-fpga-machine-learning insert wrapper' in line:
                 dtype = line.split('#', 1)[1].strip()
+                raw = dtype == 'raw'
+                convert_in = 'convert_data_from_raw' if raw else 'convert_data'
+                convert_out = 'convert_data_to_raw' if raw else 'convert_data'
+                dtype = bridge_ctype(dtype)
                 newline = ''
                 for i in model_inputs:
                     newline += indent + '{var};\n'.format(var=i.definition_cpp(name_suffix='_ap'))
-                    newline += indent + 'nnet::convert_data<{}, {}, {}>({}, {}_ap);\n'.format(
-                        dtype, i.type.name, i.size_cpp(), i.name, i.name
+                    newline += indent + 'nnet::{}<{}, {}, {}>({}, {}_ap);\n'.format(
+                        convert_in, dtype, i.type.name, i.size_cpp(), i.name, i.name
                     )
                 newline += '\n'
 
@@ -664,22 +904,47 @@ class VivadoWriter(Writer):
                 newline += '\n'
 
                 for o in model_outputs:
-                    newline += indent + 'nnet::convert_data<{}, {}, {}>({}_ap, {});\n'.format(
-                        o.type.name, dtype, o.size_cpp(), o.name, o.name
+                    newline += indent + 'nnet::{}<{}, {}, {}>({}_ap, {});\n'.format(
+                        convert_out, o.type.name, dtype, o.size_cpp(), o.name, o.name
                     )
 
-            elif '// hls-fpga-machine-learning insert trace_outputs' in line:
+            elif '// hls-fpga-machine-learning insert batch header' in line:
+                dtype = bridge_ctype(line.split('#', 1)[1].strip())
+                inputs_str = ', '.join([f'{dtype} *{i.name}' for i in model_inputs])
+                outputs_str = ', '.join([f'{dtype} *{o.name}' for o in model_outputs])
+
+                newline = ''
+                newline += indent + inputs_str + ',\n'
+                newline += indent + outputs_str + ',\n'
+                newline += indent + 'size_t n_samples,\n'
+                newline += indent + 'size_t n_threads\n'
+
+            elif '// hls-fpga-machine-learning insert batch wrapper' in line:
+                dtype = line.split('#', 1)[1].strip()
+                # Each argument goes on its own line, the VivadoAccelerator writer rewrites the sizes per line
+                args = [f'&{i.name}[i_sample * {i.size_cpp()}]' for i in model_inputs]
+                args += [f'&{o.name}[i_sample * {o.size_cpp()}]' for o in model_outputs]
+
+                newline = ''
+                newline += indent + 'auto run_chunk = [=](size_t first, size_t last) {\n'
+                newline += indent * 2 + 'for (size_t i_sample = first; i_sample < last; i_sample++) {\n'
+                newline += indent * 3 + f'{model.config.get_project_name()}_{dtype}(\n'
+                newline += ',\n'.join([indent * 4 + arg for arg in args]) + '\n'
+                newline += indent * 3 + ');\n'
+                newline += indent * 2 + '}\n'
+                newline += indent + '};\n'
+                if thread_safe:
+                    newline += indent + 'nnet::run_batch(n_samples, n_threads, run_chunk);\n'
+                else:
+                    newline += indent + '// The layers keep state between samples, so they can only run on a single thread\n'
+                    newline += indent + 'nnet::run_batch(n_samples, 1, run_chunk);\n'
+
+            elif '// hls-fpga-machine-learning insert trace_layers' in line:
                 newline = ''
                 for layer in model.get_layers():
                     func = layer.get_attr('function_cpp', None)
                     if func and model.config.trace_output and layer.get_attr('trace', False):
-                        vars = layer.get_variables()
-                        for var in vars:
-                            newline += (
-                                indent
-                                + 'nnet::trace_outputs->insert(std::pair<std::string, void *>('
-                                + f'"{layer.name}", (void *) malloc({var.size_cpp()} * element_size)));\n'
-                            )
+                        newline += indent * 2 + f'"{layer.name}",\n'
 
             elif '// hls-fpga-machine-learning insert namespace' in line:
                 newline = ''
@@ -695,6 +960,32 @@ class VivadoWriter(Writer):
         f.close()
         fout.close()
 
+    def _make_project_tcl(self, model):
+        """Return the lines of the project.tcl script, with the variables of the project used by the build scripts
+
+        Args:
+            model (ModelGraph): the hls4ml model.
+
+        Returns:
+            list: The lines of the script.
+        """
+        return [
+            'variable project_name\n',
+            f'set project_name "{model.config.get_project_name()}"\n',
+            'variable backend\n',
+            'set backend "vivado"\n',
+            'variable part\n',
+            'set part "{}"\n'.format(model.config.get_config_value('Part')),
+            'variable clock_period\n',
+            'set clock_period {}\n'.format(model.config.get_config_value('ClockPeriod')),
+            'variable clock_uncertainty\n',
+            'set clock_uncertainty {}\n'.format(model.config.get_config_value('ClockUncertainty', '12.5%')),
+            'variable version\n',
+            'set version "{}"\n'.format(model.config.get_config_value('Version', '1.0.0')),
+            'variable maximum_size\n',
+            'set maximum_size {}\n'.format(model.config.get_config_value('MaximumSize', '4096')),
+        ]
+
     def write_build_script(self, model):
         """Write the TCL/Shell build scripts (project.tcl, build_prj.tcl, vivado_synth.tcl, build_lib.sh)
 
@@ -706,36 +997,23 @@ class VivadoWriter(Writer):
 
         # project.tcl
         prj_tcl_dst = Path(f'{model.config.get_output_dir()}/project.tcl')
-        with open(prj_tcl_dst, 'w') as f:
-            f.write('variable project_name\n')
-            f.write(f'set project_name "{model.config.get_project_name()}"\n')
-            f.write('variable backend\n')
-            f.write('set backend "vivado"\n')
-            f.write('variable part\n')
-            f.write('set part "{}"\n'.format(model.config.get_config_value('Part')))
-            f.write('variable clock_period\n')
-            f.write('set clock_period {}\n'.format(model.config.get_config_value('ClockPeriod')))
-            f.write('variable clock_uncertainty\n')
-            f.write('set clock_uncertainty {}\n'.format(model.config.get_config_value('ClockUncertainty', '12.5%')))
-            f.write('variable version\n')
-            f.write('set version "{}"\n'.format(model.config.get_config_value('Version', '1.0.0')))
-            f.write('variable maximum_size\n')
-            f.write('set maximum_size {}\n'.format(model.config.get_config_value('MaximumSize', '4096')))
+        with open_if_changed(prj_tcl_dst) as f:
+            f.writelines(self._make_project_tcl(model))
 
         # build_prj.tcl
         srcpath = (filedir / '../templates/vivado/build_prj.tcl').resolve()
         dstpath = f'{model.config.get_output_dir()}/build_prj.tcl'
-        copyfile(srcpath, dstpath)
+        copy_if_changed(srcpath, dstpath)
 
         # vivado_synth.tcl
         srcpath = (filedir / '../templates/vivado/vivado_synth.tcl').resolve()
         dstpath = f'{model.config.get_output_dir()}/vivado_synth.tcl'
-        copyfile(srcpath, dstpath)
+        copy_if_changed(srcpath, dstpath)
 
         # build_lib.sh
         build_lib_src = (filedir / '../templates/vivado/build_lib.sh').resolve()
         build_lib_dst = Path(f'{model.config.get_output_dir()}/build_lib.sh').resolve()
-        with open(build_lib_src) as src, open(build_lib_dst, 'w') as dst:
+        with open(build_lib_src) as src, open_if_changed(build_lib_dst) as dst:
             for line in src.readlines():
                 line = line.replace('myproject', model.config.get_project_name())
                 line = line.replace('mystamp', model.config.get_config_value('Stamp'))
@@ -743,6 +1021,21 @@ class VivadoWriter(Writer):
                 dst.write(line)
         build_lib_dst.chmod(build_lib_dst.stat().st_mode | stat.S_IEXEC)
 
+        # build_lib.mk, parallel and incremental build of the layer units
+        build_mk_dst = Path(f'{model.config.get_output_dir()}/build_lib.mk')
+        if model.config.get_writer_config().get('SplitLayers', False):
+            copy_if_changed((filedir / '../templates/vivado/build_lib.mk').resolve(), build_mk_dst)
+        elif build_mk_dst.exists():
+            build_mk_dst.unlink()
+
+    def _get_nnet_utils_headers(self):
+        """Return the nnet_utils headers of the backend, as a dictionary of the header name and its template path"""
+        filedir = os.path.dirname(os.path.abspath(__file__))
+
+        srcpath = os.path.join(filedir, '../templates/vivado/nnet_utils/')
+
+        return {os.path.basename(h): h for h in glob.glob(srcpath + '*.h')}
+
     def write_nnet_utils(self, model):
         """Copy the nnet_utils, AP types headers and any custom source to the project output directory
 
@@ -751,18 +1044,15 @@ class VivadoWriter(Writer):
         """
 
         # nnet_utils
-        filedir = os.path.dirname(os.path.abspath(__file__))
-
-        srcpath = os.path.join(filedir, '../templates/vivado/nnet_utils/')
         dstpath = f'{model.config.get_output_dir()}/firmware/nnet_utils/'
 
         if not os.path.exists(dstpath):
             os.mkdir(dstpath)
 
-        headers = [os.path.basename(h) for h in glob.glob(srcpath + '*.h')]
-
-        for h in headers:
-            copyfile(srcpath + h, dstpath + h)
+        for h, srcpath in self._get_nnet_utils_headers().items():
+            if h == 'nnet_code_gen.h':
+                continue  # Written by write_generated_code
+            copy_if_changed(srcpath, dstpath + h)
 
         # ap_types
         filedir = os.path.dirname(os.path.abspath(__file__))
@@ -770,18 +1060,13 @@ class VivadoWriter(Writer):
         srcpath = os.path.join(filedir, '../templates/vivado/ap_types/')
         dstpath = f'{model.config.get_output_dir()}/firmware/ap_types/'
 
-        if os.path.exists(dstpath):
-            rmtree(dstpath)
-
-        copytree(srcpath, dstpath)
+        copytree_if_changed(srcpath, dstpath)
 
         # custom source
-        filedir = os.path.dirname(os.path.abspath(__file__))
-
         custom_source = model.config.backend.get_custom_source()
         for dst, srcpath in custom_source.items():
             dstpath = f'{model.config.get_output_dir()}/firmware/{dst}'
-            copyfile(srcpath, dstpath)
+            copy_if_changed(srcpath, dstpath)
 
     def write_generated_code(self, model):
         """Write the generated code (nnet_code_gen.h)
@@ -790,10 +1075,10 @@ class VivadoWriter(Writer):
             model (ModelGraph): the hls4ml model.
         """
         path = f'{model.config.get_output_dir()}/firmware/nnet_utils/nnet_code_gen.h'
-        f = open(path)
+        f = open(self._get_nnet_utils_headers()['nnet_code_gen.h'])
         contents = f.readlines()
         f.close()
-        f = open(path, 'w')
+        f = open_if_changed(path)
         namespace = model.config.get_writer_config().get('Namespace', None)
 
         for line in contents:
@@ -831,7 +1116,7 @@ class VivadoWriter(Writer):
         except Exception:
             pass
 
-        with open(model.config.get_output_dir() + '/' + config_filename, 'w') as file:
+        with open_if_changed(model.config.get_output_dir() + '/' + config_filename) as file:
             yaml.dump(model.config.config, file)
 
     def write_tar(self, model):
@@ -853,6 +1138,7 @@ class VivadoWriter(Writer):
         print('Writing HLS project')
         self.write_project_dir(model)
         self.write_project_cpp(model)
+        self.write_layer_units(model)
         self.write_project_header(model)
         self.write_weights(model)
         self.write_defines(model)
@@ -1,3 +1,9 @@
+import filecmp
+import io
+import os
+from shutil import copyfile, rmtree
+
+
 class Writer:
     def __init__(self):
         pass
@@ -18,3 +24,147 @@ def register_writer(name, writer_cls):
 
 def get_writer(name):
     return writer_map[name]()
+
+
+def bridge_ctype(dtype):
+    """Return the C type of the arrays passed to the wrappers of the Python bridge of the given type.
+
+    The type is the one given in the markers of the wrappers in the bridge template, e.g., ``#float``. The raw wrappers
+    (``#raw``) take the bit patterns of the fixed-point input and output types as 64-bit integers.
+
+    Args:
+        dtype (str): Type of the wrapper.
+
+    Returns:
+        str: The C type.
+    """
+    return 'long long' if dtype == 'raw' else dtype
+
+
+def write_if_changed(path, content):
+    """Write the content to a file, unless the file already holds exactly that content.
+
+    Files that are left untouched keep their modification time, so the incremental builds of the project (``make``,
+    the HLS tools) don't consider them changed when a model is written again.
+
+    Args:
+        path (str): Path of the file.
+        content (str or bytes): The new content. Text is written with the platform's default encoding and newlines.
+
+    Returns:
+        bool: True if the file was written, False if it was already up to date.
+    """
+    binary = isinstance(content, bytes)
+    try:
+        if binary and os.path.getsize(path) != len(content):
+            raise FileNotFoundError  # Can't be equal, skip reading the file
+        with open(path, 'rb' if binary else 'r') as f:
+            if f.read() == content:
+                return False
+    except (FileNotFoundError, IsADirectoryError, UnicodeDecodeError):
+        pass
+
+    with open(path, 'wb' if binary else 'w') as f:
+        f.write(content)
+
+    return True
+
+
+class _FileBuffer:
+    """Mixin of the in-memory files returned by ``open_if_changed``."""
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+
+    def close(self):
+        if not self.closed:
+            content = self.getvalue()
+            super().close()
+            write_if_changed(self.path, content)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            super().close()  # Discard the partial content, the file on disk is left as it was
+            return False
+        return super().__exit__(exc_type, exc_value, traceback)
+
+
+class _TextFileBuffer(_FileBuffer, io.StringIO):
+    pass
+
+
+class _BinaryFileBuffer(_FileBuffer, io.BytesIO):
+    pass
+
+
+def open_if_changed(path, mode='w'):
+    """Open a file for writing in memory. When closed, the file on disk is only written if its content changed.
+
+    Can be used in place of ``open(path, mode)``, also as a context manager. If an exception is raised within the
+    ``with`` block, nothing is written.
+
+    Args:
+        path (str): Path of the file.
+        mode (str, optional): Either 'w' (text) or 'wb' (binary). Defaults to 'w'.
+
+    Returns:
+        A file-like object.
+    """
+    if mode == 'w':
+        return _TextFileBuffer(path)
+    elif mode == 'wb':
+        return _BinaryFileBuffer(path)
+    else:
+        raise Exception(f'Unsupported mode: {mode}, expected one of "w" or "wb"')
+
+
+def copy_if_changed(src, dst):
+    """Copy a file, unless the destination already has the same content.
+
+    Args:
+        src (str): Path of the source file.
+        dst (str): Path of the destination file.
+
+    Returns:
+        bool: True if the file was copied, False if it was already up to date.
+    """
+    if os.path.isfile(dst) and filecmp.cmp(src, dst, shallow=False):
+        return False
+
+    copyfile(src, dst)
+
+    return True
+
+
+def copytree_if_changed(src, dst):
+    """Make the destination directory a copy of the source directory, only copying the files that changed.
+
+    Files and directories of the destination that don't exist in the source are removed.
+
+    Args:
+        src (str): Path of the source directory.
+        dst (str): Path of the destination directory.
+    """
+    os.makedirs(dst, exist_ok=True)
+    src_entries = set(os.listdir(src))
+
+    for entry in os.listdir(dst):
+        if entry not in src_entries:
+            path = os.path.join(dst, entry)
+            if os.path.isdir(path) and not os.path.islink(path):
+                rmtree(path)
+            else:
+                os.remove(path)
+
+    for entry in sorted(src_entries):
+        src_path = os.path.join(src, entry)
+        dst_path = os.path.join(dst, entry)
+        if os.path.isdir(src_path):
+            if os.path.lexists(dst_path) and not os.path.isdir(dst_path):
+                os.remove(dst_path)
+            copytree_if_changed(src_path, dst_path)
+        else:
+            if os.path.isdir(dst_path) and not os.path.islink(dst_path):
+                rmtree(dst_path)
+            copy_if_changed(src_path, dst_path)
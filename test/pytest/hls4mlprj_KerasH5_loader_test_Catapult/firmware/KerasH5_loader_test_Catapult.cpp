@@ -0,0 +1,37 @@
+#include <iostream>
+
+#include "KerasH5_loader_test_Catapult.h"
+#include "parameters.h"
+
+#include <mc_scverify.h>
+
+#pragma hls_design top
+// hls-fpga-machine-learning insert IFSynPragmas
+void CCS_BLOCK(KerasH5_loader_test_Catapult)(
+    input_t input_3[N_INPUT_1_1] /* reshape */,
+    result_t layer2_out[N_INPUT_1_1] /* partition */
+) {
+
+    // hls-fpga-machine-learning insert IO
+    // #pragma HLS ARRAY_RESHAPE variable=input_3 complete dim=0
+    // #pragma HLS ARRAY_PARTITION variable=layer2_out complete dim=0
+    // #pragma HLS INTERFACE ap_vld port=input_3,layer2_out 
+    // #pragma HLS PIPELINE 
+
+#ifndef __SYNTHESIS__
+    static bool loaded_weights = false;
+    if (!loaded_weights) {
+        // hls-fpga-machine-learning insert load weights
+        loaded_weights = true;
+    }
+#endif
+
+    // ****************************************
+    // NETWORK INSTANTIATION
+    // ****************************************
+
+    // hls-fpga-machine-learning insert layers
+
+    nnet::relu<input_t, result_t, relu_config2>(input_3, layer2_out); // activation_2
+
+}
@@ -0,0 +1,16 @@
+#ifndef KERASH5_LOADER_TEST_CATAPULT_H_
+#define KERASH5_LOADER_TEST_CATAPULT_H_
+
+#include <ac_channel.h>
+#include <ac_fixed.h>
+#include <ac_int.h>
+
+#include "defines.h"
+
+// Prototype of top level function for C-synthesis
+void KerasH5_loader_test_Catapult(
+    input_t input_3[N_INPUT_1_1] /* reshape */,
+    result_t layer2_out[N_INPUT_1_1] /* partition */
+);
+
+#endif
@@ -0,0 +1,20 @@
+#ifndef DEFINES_H_
+#define DEFINES_H_
+
+#include "nnet_utils/nnet_types.h"
+#include <ac_channel.h>
+#include <ac_fixed.h>
+#include <ac_int.h>
+#include <cstddef>
+#include <cstdio>
+
+// hls-fpga-machine-learning insert numbers
+#define N_INPUT_1_1 10
+#define N_INPUT_1_1 10
+
+// hls-fpga-machine-learning insert layer-precision
+typedef ac_fixed<16,6,true> input_t;
+typedef ac_fixed<16,6,true> result_t;
+typedef ac_fixed<18,8,true> activation_2_table_t;
+
+#endif
@@ -0,0 +1,23 @@
+#ifndef NNET_PCH_H_
+#define NNET_PCH_H_
+
+// Precompiled header of the ac_types and the most common nnet_utils headers, used by build_lib.sh when PCH_DIR is set.
+// It is shared between all the projects compiled with the same version of the headers and the same compiler flags.
+
+#include <ac_channel.h>
+#include <ac_fixed.h>
+#include <ac_int.h>
+
+#include "nnet_activation.h"
+#include "nnet_activation_stream.h"
+#include "nnet_code_gen.h"
+#include "nnet_common.h"
+#include "nnet_dense.h"
+#include "nnet_dense_compressed.h"
+#include "nnet_dense_stream.h"
+#include "nnet_helpers.h"
+#include "nnet_mult.h"
+#include "nnet_stream.h"
+#include "nnet_types.h"
+
+#endif
@@ -0,0 +1,187 @@
+#ifndef KERASH5_LOADER_TEST_QUARTUS_BRIDGE_H_
+#define KERASH5_LOADER_TEST_QUARTUS_BRIDGE_H_
+
+#include "firmware/KerasH5_loader_test_Quartus.h"
+#include "firmware/nnet_utils/nnet_helpers.h"
+#include <algorithm>
+#include <map>
+#include <thread>
+#include <vector>
+
+// hls-fpga-machine-learning insert bram
+
+namespace nnet {
+bool trace_enabled = false;
+std::map<std::string, void *> *trace_outputs = NULL;
+size_t trace_type_size = sizeof(double);
+
+// Runs run_chunk(first, last) over the samples of a batch, split in up to n_threads chunks executed in parallel.
+// The first sample is always run on the calling thread before any other thread is started, this initializes the
+// static lookup tables of the activations and loads the weights from the txt files ahead of the parallel part.
+template <class chunk_T> void run_batch(size_t n_samples, size_t n_threads, chunk_T run_chunk) {
+    if (n_samples == 0) {
+        return;
+    }
+    run_chunk(0, 1);
+
+    // Tracing stores the layer outputs in shared buffers, so it always runs on a single thread
+    if (trace_enabled) {
+        n_threads = 1;
+    }
+    n_threads = std::min(n_threads, n_samples - 1);
+    if (n_threads <= 1) {
+        run_chunk(1, n_samples);
+        return;
+    }
+
+    std::vector<std::thread> workers;
+    size_t chunk_size = (n_samples - 1 + n_threads - 1) / n_threads;
+    for (size_t first = 1; first < n_samples; first += chunk_size) {
+        workers.push_back(std::thread(run_chunk, first, std::min(first + chunk_size, n_samples)));
+    }
+    for (size_t i = 0; i < workers.size(); i++) {
+        workers[i].join();
+    }
+}
+} // namespace nnet
+
+extern "C" {
+
+// Names of the layers whose outputs are saved when tracing is enabled, terminated by NULL
+const char **get_trace_layers() {
+    static const char *trace_layers[] = {
+        NULL};
+    return trace_layers;
+}
+
+// Enables tracing, the outputs of layer layer_names[i] are written to buffers[i], one sample after the other, until
+// tracing is disabled. The buffers must be large enough to hold the outputs of all the samples that are run.
+void enable_trace(const char **layer_names, void **buffers, size_t n_buffers, size_t element_size) {
+    if (nnet::trace_outputs == NULL) {
+        nnet::trace_outputs = new std::map<std::string, void *>;
+    }
+    nnet::trace_outputs->clear();
+    for (size_t i = 0; i < n_buffers; i++) {
+        (*nnet::trace_outputs)[layer_names[i]] = buffers[i];
+    }
+    nnet::trace_type_size = element_size;
+    nnet::trace_enabled = true;
+}
+
+void disable_trace() {
+    delete nnet::trace_outputs;
+    nnet::trace_outputs = NULL;
+    nnet::trace_enabled = false;
+}
+
+// Wrapper of top level function for Python bridge
+void KerasH5_loader_test_Quartus_float(
+    float input_2[N_INPUT_1_1],
+    float layer2_out[N_INPUT_1_1],
+    unsigned short &const_size_in_1,
+    unsigned short &const_size_out_1
+) {
+
+    input_data inputs_ap;
+    nnet::convert_data<float, input_t, N_INPUT_1_1>(input_2, inputs_ap.input_2);
+
+    output_data outputs_ap;
+    outputs_ap = KerasH5_loader_test_Quartus(inputs_ap);
+
+    nnet::convert_data_back<result_t, float, N_INPUT_1_1>(outputs_ap.layer2_out, layer2_out);
+}
+
+void KerasH5_loader_test_Quartus_double(
+    double input_2[N_INPUT_1_1],
+    double layer2_out[N_INPUT_1_1],
+    unsigned short &const_size_in_1,
+    unsigned short &const_size_out_1
+) {
+    input_data inputs_ap;
+    nnet::convert_data<double, input_t, N_INPUT_1_1>(input_2, inputs_ap.input_2);
+
+    output_data outputs_ap;
+    outputs_ap = KerasH5_loader_test_Quartus(inputs_ap);
+
+    nnet::convert_data_back<result_t, double, N_INPUT_1_1>(outputs_ap.layer2_out, layer2_out);
+}
+
+// Wrapper taking and returning the bit patterns of the fixed-point input and output types as integers
+void KerasH5_loader_test_Quartus_raw(
+    long long input_2[N_INPUT_1_1],
+    long long layer2_out[N_INPUT_1_1],
+    unsigned short &const_size_in_1,
+    unsigned short &const_size_out_1
+) {
+    input_data inputs_ap;
+    nnet::convert_data_from_raw<long long, input_t, N_INPUT_1_1>(input_2, inputs_ap.input_2);
+
+    output_data outputs_ap;
+    outputs_ap = KerasH5_loader_test_Quartus(inputs_ap);
+
+    nnet::convert_data_back_to_raw<result_t, long long, N_INPUT_1_1>(outputs_ap.layer2_out, layer2_out);
+}
+
+// Batched wrappers, process n_samples consecutive samples stored in contiguous buffers
+void KerasH5_loader_test_Quartus_float_batch(
+    float *input_2,
+    float *layer2_out,
+    size_t n_samples,
+    size_t n_threads
+) {
+    auto run_chunk = [=](size_t first, size_t last) {
+        unsigned short const_size_in_1, const_size_out_1;
+        for (size_t i_sample = first; i_sample < last; i_sample++) {
+            KerasH5_loader_test_Quartus_float(
+                &input_2[i_sample * N_INPUT_1_1],
+                &layer2_out[i_sample * N_INPUT_1_1],
+                const_size_in_1,
+                const_size_out_1
+            );
+        }
+    };
+    nnet::run_batch(n_samples, n_threads, run_chunk);
+}
+
+void KerasH5_loader_test_Quartus_double_batch(
+    double *input_2,
+    double *layer2_out,
+    size_t n_samples,
+    size_t n_threads
+) {
+    auto run_chunk = [=](size_t first, size_t last) {
+        unsigned short const_size_in_1, const_size_out_1;
+        for (size_t i_sample = first; i_sample < last; i_sample++) {
+            KerasH5_loader_test_Quartus_double(
+                &input_2[i_sample * N_INPUT_1_1],
+                &layer2_out[i_sample * N_INPUT_1_1],
+                const_size_in_1,
+                const_size_out_1
+            );
+        }
+    };
+    nnet::run_batch(n_samples, n_threads, run_chunk);
+}
+
+void KerasH5_loader_test_Quartus_raw_batch(
+    long long *input_2,
+    long long *layer2_out,
+    size_t n_samples,
+    size_t n_threads
+) {
+    auto run_chunk = [=](size_t first, size_t last) {
+        unsigned short const_size_in_1, const_size_out_1;
+        for (size_t i_sample = first; i_sample < last; i_sample++) {
+            KerasH5_loader_test_Quartus_raw(
+                &input_2[i_sample * N_INPUT_1_1],
+                &layer2_out[i_sample * N_INPUT_1_1],
+                const_size_in_1,
+                const_size_out_1
+            );
+        }
+    };
+    nnet::run_batch(n_samples, n_threads, run_chunk);
+}
+}
+
+#endif
@@ -0,0 +1,62 @@
+#include "KerasH5_loader_test_Quartus.h"
+#include "parameters.h"
+
+// hls-fpga-machine-learning insert weights
+
+/*
+ * Intel HLS requires that all 'stream' types are:
+ *     (1) Passed by reference to the top-level entity or
+ *     (2) Declared as global variables, outside of the main function
+ * Therefore, layer inputs/output (connections betweenn individual layers) are declared here
+ */
+// hls-fpga-machine-learning insert inter-task streams
+
+#ifndef __INTELFPGA_COMPILER__
+/*
+* The top-level function used during GCC compilation / hls4ml.predic(...) goes here
+* An important distinction is made between io_stream and io_parallel:
+*     (1) io_parallel:
+               - Top-level function takes a struct containing an array as function argument
+               - Returns a struct containing an array - the prediction
+      (2) io_stream:
+               - Top-level function is 'void' - no return value
+               - Instead, both the input and output are passed by reference
+               - This is due the HLS Streaming Interfaces; stream cannot be copied (implicitly deleted copy constructor)
+* This distinction is handled in quartus_writer.py
+*/
+output_data KerasH5_loader_test_Quartus(
+   input_data inputs
+) {
+#else
+// Maximum initiation interval, concurrency and frequency for HLS syntheis are defined here
+// hls-fpga-machine-learning insert cpragmas
+hls_max_concurrency(0)
+hls_component_ii(1)
+hls_scheduler_target_fmax_mhz(40)
+
+/*
+ * The top-level function used during HLS Synthesis goes here
+ * In a similar manner to GCC, there is a distinction between io_stream & io_parallel
+ */
+// hls-fpga-machine-learning instantiate HLS top-level
+component output_data KerasH5_loader_test_Quartus(
+   input_data inputs
+) {
+#endif
+// If using io_parallel, the output needs to be initialised and returned at the end of this function
+// If using io_stream, no output is initialised, as it is passed by reference to the top-level function
+// hls-fpga-machine-learning initialize input/output
+   hls_register output_data outputs;
+
+// ****************************************
+// NETWORK INSTANTIATION
+// ****************************************
+
+// hls-fpga-machine-learning insert layers
+
+    nnet::relu<input_t, result_t, relu_config2>(inputs.input_2, outputs.layer2_out);
+
+
+// hls-fpga-machine-learning return
+   return outputs;
+}
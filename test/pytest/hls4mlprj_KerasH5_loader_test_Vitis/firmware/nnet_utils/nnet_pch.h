@@ -0,0 +1,28 @@
+#ifndef NNET_PCH_H_
+#define NNET_PCH_H_
+
+// Precompiled header of the ap_types and the most common nnet_utils headers, used by build_lib.sh when PCH_DIR is set.
+// It is shared between all the projects compiled with the same version of the headers and the same compiler flags.
+
+// The weights directory is different for each project, so the loading functions refer to it through a variable that is
+// defined by build_lib.sh instead of the WEIGHTS_DIR string
+extern const char *hls4ml_weights_dir;
+#define WEIGHTS_DIR hls4ml_weights_dir
+
+#include "ap_fixed.h"
+#include "ap_int.h"
+#include "hls_stream.h"
+
+#include "nnet_activation.h"
+#include "nnet_activation_stream.h"
+#include "nnet_code_gen.h"
+#include "nnet_common.h"
+#include "nnet_dense.h"
+#include "nnet_dense_compressed.h"
+#include "nnet_dense_stream.h"
+#include "nnet_helpers.h"
+#include "nnet_mult.h"
+#include "nnet_stream.h"
+#include "nnet_types.h"
+
+#endif
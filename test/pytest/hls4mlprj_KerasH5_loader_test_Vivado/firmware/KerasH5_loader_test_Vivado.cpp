@@ -0,0 +1,33 @@
+#include <iostream>
+
+#include "KerasH5_loader_test_Vivado.h"
+#include "parameters.h"
+
+
+void KerasH5_loader_test_Vivado(
+    input_t input_1[N_INPUT_1_1],
+    result_t layer2_out[N_INPUT_1_1]
+) {
+
+    // hls-fpga-machine-learning insert IO
+    #pragma HLS ARRAY_RESHAPE variable=input_1 complete dim=0
+    #pragma HLS ARRAY_PARTITION variable=layer2_out complete dim=0
+    #pragma HLS INTERFACE ap_vld port=input_1,layer2_out 
+    #pragma HLS PIPELINE
+
+    // hls-fpga-machine-learning insert load weights
+#ifndef __SYNTHESIS__
+    static bool loaded_weights = false;
+    if (!loaded_weights) {
+        loaded_weights = true;    }
+#endif
+    // ****************************************
+    // NETWORK INSTANTIATION
+    // ****************************************
+
+    // hls-fpga-machine-learning insert layers
+
+    nnet::relu<input_t, result_t, relu_config2>(input_1, layer2_out); // activation
+
+}
+
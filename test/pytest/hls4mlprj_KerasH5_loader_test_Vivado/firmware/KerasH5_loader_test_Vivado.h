@@ -0,0 +1,18 @@
+#ifndef KERASH5_LOADER_TEST_VIVADO_H_
+#define KERASH5_LOADER_TEST_VIVADO_H_
+
+#include "ap_fixed.h"
+#include "ap_int.h"
+#include "hls_stream.h"
+
+#include "defines.h"
+
+
+// Prototype of top level function for C-synthesis
+void KerasH5_loader_test_Vivado(
+    input_t input_1[N_INPUT_1_1],
+    result_t layer2_out[N_INPUT_1_1]
+);
+
+
+#endif
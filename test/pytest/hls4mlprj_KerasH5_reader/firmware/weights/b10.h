@@ -0,0 +1,16 @@
+//Numpy array shape [16]
+//Min -3.264571666718
+//Max 0.818549633026
+//Number of zeros 0
+
+#ifndef B10_H_
+#define B10_H_
+
+#ifndef __SYNTHESIS__
+model_default_t b10[16];
+#else
+model_default_t b10[16] = {-0.0938164294, 0.2328417897, -0.6693978310, -0.7130194902, -0.1541235894, 0.5188431740, 0.4290099442, -0.1899626553, -0.3817104995, 0.2758259475, 0.1238425672, -3.2645716667, 0.8185496330, 0.4784920216, -0.9219087362, 0.2103495300};
+
+#endif
+
+#endif
@@ -0,0 +1,16 @@
+//Numpy array shape [4]
+//Min 0.097641810775
+//Max 0.777612864971
+//Number of zeros 0
+
+#ifndef B5_H_
+#define B5_H_
+
+#ifndef __SYNTHESIS__
+dense_2_bias_t b5[4];
+#else
+dense_2_bias_t b5[4] = {0.7776128650, 0.0976418108, 0.4868718088, 0.7023931742};
+
+#endif
+
+#endif
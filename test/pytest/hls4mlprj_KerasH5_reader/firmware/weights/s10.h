@@ -0,0 +1,16 @@
+//Numpy array shape [16]
+//Min 0.049510743469
+//Max 3.453014612198
+//Number of zeros 0
+
+#ifndef S10_H_
+#define S10_H_
+
+#ifndef __SYNTHESIS__
+model_default_t s10[16];
+#else
+model_default_t s10[16] = {0.6848207116, 1.3282685280, 1.5478841066, 0.7877627015, 0.6253197193, 0.4511044919, 1.7595100403, 0.5980597734, 0.7578530312, 0.0495107435, 0.6200194359, 3.4530146122, 0.1759003401, 1.0622293949, 1.7249293327, 0.5160976052};
+
+#endif
+
+#endif
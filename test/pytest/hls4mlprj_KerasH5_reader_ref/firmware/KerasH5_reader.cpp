@@ -0,0 +1,61 @@
+#include <iostream>
+
+#include "KerasH5_reader.h"
+#include "parameters.h"
+
+
+void KerasH5_reader(
+    input_t dense_1_input[N_INPUT_1_1],
+    result_t layer6_out[N_LAYER_5]
+) {
+
+    // hls-fpga-machine-learning insert IO
+    #pragma HLS ARRAY_RESHAPE variable=dense_1_input complete dim=0
+    #pragma HLS ARRAY_PARTITION variable=layer6_out complete dim=0
+    #pragma HLS INTERFACE ap_vld port=dense_1_input,layer6_out 
+    #pragma HLS PIPELINE
+
+    // hls-fpga-machine-learning insert load weights
+#ifndef __SYNTHESIS__
+    static bool loaded_weights = false;
+    if (!loaded_weights) {
+        nnet::load_weights_from_txt<dense_1_weight_t, 512>(w2, "w2.txt");
+        nnet::load_weights_from_txt<dense_1_bias_t, 64>(b2, "b2.txt");
+        nnet::load_weights_from_txt<model_default_t, 1024>(w8, "w8.txt");
+        nnet::load_weights_from_txt<model_default_t, 16>(b8, "b8.txt");
+        nnet::load_weights_from_txt<model_default_t, 16>(s10, "s10.txt");
+        nnet::load_weights_from_txt<model_default_t, 16>(b10, "b10.txt");
+        nnet::load_weights_from_txt<dense_2_weight_t, 64>(w5, "w5.txt");
+        nnet::load_weights_from_txt<dense_2_bias_t, 4>(b5, "b5.txt");
+        loaded_weights = true;    }
+#endif
+    // ****************************************
+    // NETWORK INSTANTIATION
+    // ****************************************
+
+    // hls-fpga-machine-learning insert layers
+
+    dense_1_result_t layer2_out[N_LAYER_2];
+    #pragma HLS ARRAY_PARTITION variable=layer2_out complete dim=0
+
+    layer8_t layer8_out[N_LAYER_8];
+    #pragma HLS ARRAY_PARTITION variable=layer8_out complete dim=0
+
+    layer10_t layer10_out[N_LAYER_8];
+    #pragma HLS ARRAY_PARTITION variable=layer10_out complete dim=0
+
+    dense_2_result_t layer5_out[N_LAYER_5];
+    #pragma HLS ARRAY_PARTITION variable=layer5_out complete dim=0
+
+    nnet::dense<input_t, dense_1_result_t, config2>(dense_1_input, layer2_out, w2, b2); // dense_1
+
+    nnet::dense<dense_1_result_t, layer8_t, config8>(layer2_out, layer8_out, w8, b8); // dense
+
+    nnet::normalize<layer8_t, layer10_t, config10>(layer8_out, layer10_out, s10, b10); // batch_normalization
+
+    nnet::dense<layer10_t, dense_2_result_t, config5>(layer10_out, layer5_out, w5, b5); // dense_2
+
+    nnet::softmax<dense_2_result_t, result_t, softmax_config6>(layer5_out, layer6_out); // dense_2_softmax
+
+}
+
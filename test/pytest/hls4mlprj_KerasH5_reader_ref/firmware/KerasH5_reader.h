@@ -0,0 +1,18 @@
+#ifndef KERASH5_READER_H_
+#define KERASH5_READER_H_
+
+#include "ap_fixed.h"
+#include "ap_int.h"
+#include "hls_stream.h"
+
+#include "defines.h"
+
+
+// Prototype of top level function for C-synthesis
+void KerasH5_reader(
+    input_t dense_1_input[N_INPUT_1_1],
+    result_t layer6_out[N_LAYER_5]
+);
+
+
+#endif
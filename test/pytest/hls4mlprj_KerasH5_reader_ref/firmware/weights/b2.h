@@ -0,0 +1,16 @@
+//Numpy array shape [64]
+//Min 0.017300849780
+//Max 0.983596980572
+//Number of zeros 0
+
+#ifndef B2_H_
+#define B2_H_
+
+#ifndef __SYNTHESIS__
+dense_1_bias_t b2[64];
+#else
+dense_1_bias_t b2[64] = {0.8160763979, 0.6875748038, 0.8845406771, 0.9426662922, 0.4910816550, 0.5175586343, 0.3964605927, 0.8465865254, 0.2661164403, 0.8027086854, 0.9772781730, 0.5342898369, 0.1464661956, 0.2491606176, 0.1542788893, 0.0308297630, 0.0446401164, 0.0173008498, 0.5325542688, 0.7828593850, 0.7869663835, 0.9161386490, 0.2069142908, 0.5567733049, 0.5449618697, 0.5655447841, 0.2055207193, 0.6683779955, 0.7736735940, 0.1394141018, 0.1430173218, 0.4602443278, 0.9134518504, 0.1926588416, 0.8180066347, 0.2557480931, 0.1439142674, 0.7527765036, 0.7041264176, 0.1303560436, 0.9621621966, 0.8523008823, 0.1435327232, 0.3479747772, 0.6233174801, 0.9506186843, 0.4368934333, 0.0709587038, 0.5136517286, 0.8807985783, 0.9456698298, 0.5354108214, 0.3233055770, 0.2418242991, 0.5249194503, 0.9835969806, 0.8457477689, 0.3308805823, 0.3751610816, 0.7788379192, 0.2399260998, 0.7224720716, 0.5305937529, 0.2163235247};
+
+#endif
+
+#endif
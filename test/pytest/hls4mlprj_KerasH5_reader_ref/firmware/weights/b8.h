@@ -0,0 +1,16 @@
+//Numpy array shape [16]
+//Min 0.227284729481
+//Max 0.900112926960
+//Number of zeros 0
+
+#ifndef B8_H_
+#define B8_H_
+
+#ifndef __SYNTHESIS__
+model_default_t b8[16];
+#else
+model_default_t b8[16] = {0.7062994242, 0.9001129270, 0.3703779280, 0.4855746031, 0.6550791264, 0.4455789328, 0.4121746421, 0.4846630096, 0.6048444510, 0.6521776319, 0.2272847295, 0.2644899189, 0.8443365097, 0.8846124411, 0.3227052391, 0.8496217132};
+
+#endif
+
+#endif
@@ -0,0 +1,16 @@
+//Numpy array shape [8, 64]
+//Min 0.002667972352
+//Max 0.999483168125
+//Number of zeros 0
+
+#ifndef W2_H_
+#define W2_H_
+
+#ifndef __SYNTHESIS__
+dense_1_weight_t w2[512];
+#else
+dense_1_weight_t w2[512] = {0.2924239337, 0.7525761127, 0.8621376753, 0.8825750947, 0.0226483718, 0.9334287643, 0.7911284566, 0.2498276383, 0.9994831681, 0.9579605460, 0.2495948970, 0.3806091249, 0.5852708817, 0.9898936749, 0.7650148869, 0.9780812860, 0.6118964553, 0.4031771421, 0.3298176527, 0.9974280596, 0.4231514931, 0.1239208207, 0.9670853615, 0.1169312224, 0.8029606342, 0.4521966875, 0.1053870320, 0.4032561481, 0.9230151176, 0.6981703043, 0.9531764388, 0.9834656715, 0.1882993877, 0.5779921412, 0.4205947220, 0.0092816306, 0.8044424653, 0.1010981947, 0.9882169962, 0.6222623587, 0.6374334097, 0.9969717264, 0.5652880669, 0.0026679724, 0.1630296260, 0.2159873992, 0.4090746045, 0.5543189049, 0.0108965850, 0.9318599105, 0.6977602243, 0.8718001842, 0.8425535560, 0.5248969197, 0.3532747924, 0.5428650379, 0.6791527867, 0.4666565657, 0.5669850111, 0.8595466018, 0.0352648273, 0.5888071060, 0.4562745988, 0.9954102039, 0.1159713492, 0.3194809258, 0.2718428671, 0.4427348375, 0.4593845010, 0.0207997821, 0.0261669252, 0.4195123315, 0.6243553758, 0.2836661935, 0.8863840103, 0.5201786160, 0.9977889657, 0.9002158046, 0.2094136626, 0.3486076593, 0.5683202744, 0.2615924776, 0.7597337961, 0.8790111542, 0.7395725846, 0.0806279555, 0.3335499465, 0.1140064001, 0.7651143074, 0.5146897435, 0.7463533282, 0.5259635448, 0.9179074764, 0.5590949655, 0.7209065557, 0.3903547525, 0.4800407290, 0.7595980167, 0.8335436583, 0.4489789009, 0.1337461323, 0.5943083167, 0.3562132418, 0.9182242155, 0.3820213974, 0.8583894372, 0.7014927268, 0.3734584749, 0.9811850190, 0.8850420117, 0.6164219379, 0.1776206344, 0.3130042255, 0.2520661354, 0.6447815299, 0.1856395453, 0.7796475291, 0.3364557922, 0.9482536912, 0.5429317355, 0.5203277469, 0.4022746682, 0.1245639697, 0.6209915280, 0.8525965214, 0.5610791445, 0.9273628592, 0.8798297048, 0.1743378043, 0.3301381767, 0.7872791290, 0.4557239115, 0.4234515429, 0.2916515172, 0.6359848976, 0.4685406983, 0.7644897699, 0.7530807257, 0.4966317415, 0.7711259127, 0.9291296601, 0.0515321232, 0.9767090082, 0.9531206489, 0.0569179542, 0.1425104290, 0.6869929433, 0.4862758815, 0.9802419543, 0.2373435944, 0.1501750797, 0.8149229288, 0.4583726227, 0.7543495893, 0.4032992125, 0.9475808144, 0.7580400705, 0.4279950261, 0.3241100907, 0.9607818127, 0.7405443788, 0.5244952440, 0.1306852400, 0.6720781326, 0.1413950920, 0.9579909444, 0.4127564430, 0.3713001907, 0.4188394248, 0.8180189133, 0.6288559437, 0.4009498656, 0.6828247905, 0.7506615520, 0.6549096704, 0.3825002909, 0.5820183754, 0.5539482832, 0.2900282741, 0.7405586839, 0.1359693408, 0.2297037840, 0.5862827301, 0.2073383182, 0.6830223203, 0.8128036261, 0.0853043422, 0.0085910577, 0.3925742507, 0.8866783977, 0.7599150538, 0.3333242536, 0.2368973494, 0.1582057923, 0.9831046462, 0.9782492518, 0.6422358155, 0.3820636868, 0.9903479815, 0.1222951338, 0.4057669938, 0.7397109866, 0.3066047132, 0.1019699201, 0.0228419267, 0.1164509207, 0.7128344178, 0.5217976570, 0.4207004607, 0.3993610144, 0.5446437001, 0.1031911224, 0.0178026743, 0.1828585565, 0.3918038905, 0.3602122962, 0.2671132982, 0.2978485823, 0.0832691342, 0.4195985794, 0.3045300245, 0.9179056287, 0.6613563299, 0.9478778839, 0.8042059541, 0.2186267823, 0.5045984983, 0.3804855049, 0.3897587359, 0.5562187433, 0.6158389449, 0.3266311884, 0.7939342260, 0.5573565960, 0.7172085047, 0.5927163959, 0.0687379837, 0.2721655369, 0.5010070205, 0.9683194757, 0.2640224397, 0.7769550085, 0.5446949601, 0.3073699474, 0.3115837574, 0.5890021324, 0.8755211234, 0.9299461842, 0.5634675026, 0.8879945278, 0.2425161898, 0.4673353732, 0.9263346791, 0.8954440355, 0.9267078042, 0.3849815428, 0.6165598631, 0.8975752592, 0.9320966005, 0.7592925429, 0.9383322001, 0.8664591312, 0.1826309711, 0.1230865270, 0.0856759846, 0.7136374712, 0.0668210015, 0.8291155696, 0.4448414743, 0.2475277334, 0.7105426788, 0.3212538660, 0.7531855106, 0.3812906146, 0.2365256101, 0.8396541476, 0.4543584883, 0.2865310013, 0.1866105050, 0.3467493057, 0.7816511989, 0.1018105820, 0.3467883766, 0.8838644028, 0.9549168944, 0.8459597826, 0.0673985183, 0.1860490292, 0.1425626129, 0.6167149544, 0.1929625720, 0.7806309462, 0.2086418718, 0.6559815407, 0.8904186487, 0.0425175801, 0.2082318366, 0.7935734391, 0.3925011456, 0.0161725152, 0.5088490844, 0.9574655294, 0.3863255978, 0.8201140165, 0.2070648819, 0.5059309006, 0.0109537039, 0.9542152286, 0.8140360713, 0.8017687798, 0.3425423205, 0.0416581072, 0.2347704321, 0.6659507155, 0.3676604629, 0.5941793919, 0.7869687676, 0.2834891975, 0.2247742116, 0.3119159639, 0.8653617501, 0.7290071845, 0.5148867369, 0.8580090404, 0.8180119991, 0.1481638551, 0.2738423049, 0.2830606401, 0.6983976364, 0.1021513119, 0.6776470542, 0.7599775791, 0.7297992110, 0.8661308289, 0.7166545391, 0.3336675763, 0.8338021636, 0.3510674834, 0.2451002151, 0.2105807364, 0.4303047061, 0.9153729081, 0.3488951027, 0.9245234132, 0.7801955938, 0.7317402959, 0.0052414248, 0.7498267293, 0.8546969295, 0.8452692628, 0.1093648523, 0.3159452975, 0.0995506197, 0.7820644975, 0.4132929742, 0.2325479537, 0.3243851066, 0.7380346656, 0.1736020297, 0.8326204419, 0.9768807292, 0.8310192227, 0.3133088648, 0.0904066414, 0.4124714732, 0.2134860158, 0.4790942073, 0.5009549856, 0.0039583044, 0.0951368883, 0.5770563483, 0.5551953316, 0.6536303759, 0.8277326822, 0.1496454328, 0.9853965640, 0.2409025580, 0.9022701383, 0.5105006099, 0.0734330490, 0.5617578626, 0.2445689589, 0.8539399505, 0.9799844027, 0.1604561806, 0.8367289305, 0.3216693699, 0.5522308946, 0.7328571081, 0.3669918180, 0.9530254602, 0.1172667295, 0.0972198397, 0.0567991361, 0.8635272980, 0.8664114475, 0.9437241554, 0.9570819139, 0.9580482841, 0.3946765661, 0.6661726832, 0.9103643894, 0.3358728290, 0.2532949150, 0.1780454665, 0.6641595364, 0.8967720270, 0.3475051224, 0.9474238753, 0.2238145471, 0.2298640907, 0.2426954508, 0.5201792717, 0.0468724146, 0.9940894842, 0.1359177232, 0.4547759295, 0.2483725250, 0.7973091602, 0.0255046766, 0.1202136949, 0.8657783866, 0.7327579260, 0.1387004405, 0.9212170243, 0.6220771074, 0.6955835819, 0.9228221774, 0.4165458381, 0.2568323016, 0.3215913177, 0.9004809856, 0.8881063461, 0.8440892696, 0.4243697524, 0.3505584300, 0.2160885334, 0.3978803754, 0.6545016170, 0.2674205303, 0.6269398332, 0.6488829255, 0.4088977575, 0.2410122901, 0.8524751067, 0.1097967774, 0.7440875769, 0.8503428698, 0.4295968711, 0.3772727549, 0.4987573624, 0.7063040733, 0.2709373236, 0.4222313762, 0.9072577357, 0.0044382252, 0.6808383465, 0.6402608156, 0.2119283825, 0.5047353506, 0.3895471692, 0.7368363142, 0.6148489714, 0.0781957433, 0.3612653613, 0.1881395578, 0.1427438557, 0.2594268024, 0.5675160885, 0.2894080579, 0.0755870864, 0.9420486689, 0.2525541484, 0.3900915682, 0.4323025644, 0.2454333603, 0.3099925816, 0.1466175169, 0.2041686028, 0.8635864258, 0.4032362103, 0.5433142781, 0.1378953010, 0.3855063021, 0.2318679839, 0.0095444312, 0.6841763854, 0.9803403020, 0.9877140522, 0.5674743652, 0.8825262189, 0.4600482881, 0.9767159224, 0.8751600385, 0.0056945407, 0.7339073420, 0.6091898084, 0.6847629547, 0.2073690146, 0.2875463068, 0.5429698825, 0.4764594734, 0.7172614932, 0.8026662469, 0.3508892655, 0.9417592883, 0.4866760969, 0.9169669151, 0.6076925993, 0.3617112339, 0.3453824818, 0.1397527605};
+
+#endif
+
+#endif
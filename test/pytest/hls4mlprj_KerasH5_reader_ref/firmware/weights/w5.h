@@ -0,0 +1,16 @@
+//Numpy array shape [16, 4]
+//Min 0.021442098543
+//Max 0.981969773769
+//Number of zeros 0
+
+#ifndef W5_H_
+#define W5_H_
+
+#ifndef __SYNTHESIS__
+dense_2_weight_t w5[64];
+#else
+dense_2_weight_t w5[64] = {0.9054617286, 0.3412317634, 0.5609704852, 0.8472602367, 0.3679929972, 0.7940651774, 0.3992238939, 0.3274856508, 0.4382741749, 0.0838549063, 0.9819697738, 0.9133770466, 0.3416580856, 0.3499171436, 0.6168230176, 0.7908183932, 0.2857954800, 0.5267835855, 0.7720758915, 0.8414734602, 0.3731089532, 0.3949859738, 0.2649600804, 0.6206923723, 0.9784257412, 0.9084165692, 0.0672829375, 0.2198075801, 0.0214420985, 0.4602639079, 0.2439512908, 0.2063203752, 0.7200586796, 0.1964160651, 0.7406242490, 0.3399182856, 0.3401409686, 0.4223323166, 0.7712238431, 0.4948948324, 0.2827319801, 0.7638809085, 0.6242184043, 0.4784114361, 0.2252110690, 0.4063810110, 0.6344053745, 0.5947368741, 0.1761059761, 0.6422390342, 0.5394292474, 0.0597029105, 0.1994488984, 0.7301191092, 0.1688379794, 0.6130402684, 0.8402352333, 0.8792324066, 0.1090359688, 0.8295456171, 0.6252717972, 0.2881140709, 0.9054551125, 0.3963099122};
+
+#endif
+
+#endif
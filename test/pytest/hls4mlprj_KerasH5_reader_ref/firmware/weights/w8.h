@@ -0,0 +1,16 @@
+//Numpy array shape [64, 16]
+//Min 0.000631512899
+//Max 0.999212801456
+//Number of zeros 0
+
+#ifndef W8_H_
+#define W8_H_
+
+#ifndef __SYNTHESIS__
+model_default_t w8[1024];
+#else
+model_default_t w8[1024] = {0.1242041886, 0.3079206347, 0.3576298356, 0.0667176619, 0.0323627330, 0.6619387269, 0.5168467164, 0.7010399699, 0.3271696568, 0.5573158264, 0.4213458896, 0.8700026870, 0.8323640823, 0.7284765840, 0.3727647662, 0.5819482207, 0.1128388718, 0.9443886280, 0.2759281397, 0.7553585172, 0.9505131841, 0.3334277868, 0.3686051071, 0.3551010191, 0.5329412222, 0.6704540253, 0.9385980964, 0.7982347608, 0.2590860128, 0.0956176296, 0.8617792726, 0.5702558160, 0.3286514282, 0.5526236296, 0.1148668155, 0.7001663446, 0.4166432619, 0.8291572928, 0.3043017387, 0.8445397615, 0.4628874660, 0.2735132277, 0.3132121861, 0.4736019969, 0.0527011864, 0.6986658573, 0.6594496965, 0.1306665093, 0.2705972791, 0.1529056579, 0.4107490182, 0.4564929903, 0.5594239235, 0.9443351626, 0.0236705840, 0.9893848300, 0.7459354997, 0.6576577425, 0.2176812440, 0.7326714993, 0.4066022635, 0.6524502635, 0.8728644252, 0.6916335225, 0.4756342769, 0.1467229277, 0.1598629504, 0.1002291143, 0.1988528669, 0.0504401065, 0.0893998072, 0.8620454073, 0.5880841017, 0.4118965566, 0.2319867462, 0.7761363387, 0.4528292716, 0.0398512222, 0.6445123553, 0.9311494827, 0.9942958355, 0.8310885429, 0.7575476766, 0.1307288408, 0.1968418509, 0.8342202306, 0.9024034739, 0.4906834066, 0.7080368996, 0.8897749782, 0.5402128696, 0.5869512558, 0.9969711304, 0.1824813038, 0.9695734978, 0.8331583738, 0.3585580289, 0.1823488772, 0.3404039741, 0.6914485693, 0.5921739936, 0.2886939943, 0.6479088664, 0.8637155294, 0.4116780758, 0.6144217849, 0.6843561530, 0.0567446426, 0.0404142439, 0.7886700630, 0.5055021048, 0.7385172248, 0.7857201695, 0.6938053370, 0.4785992503, 0.1871714294, 0.3281853497, 0.3965664506, 0.9490203857, 0.0728372708, 0.4054740965, 0.7678011060, 0.4503746033, 0.5266304612, 0.7150005102, 0.8942725062, 0.5832494497, 0.0201556589, 0.2593427002, 0.5579869747, 0.5731847882, 0.8108209372, 0.2603729367, 0.4189061821, 0.7340283990, 0.3413212001, 0.2969433367, 0.2106903195, 0.3790868223, 0.1380059570, 0.5732712746, 0.4092645347, 0.0233369917, 0.2914364934, 0.3253560066, 0.7128030062, 0.3155282140, 0.8801968098, 0.9637557864, 0.4003381729, 0.8387743235, 0.0359220766, 0.2396221161, 0.8074255586, 0.0669536218, 0.0602573492, 0.9949556589, 0.3440049589, 0.9485803843, 0.2861176729, 0.8480248451, 0.1800490022, 0.5707154274, 0.8189678192, 0.8514711857, 0.1977968812, 0.6099928617, 0.8729540110, 0.8039917350, 0.4195663631, 0.1599274129, 0.7309482694, 0.6610097289, 0.9906159043, 0.9401785731, 0.8446945548, 0.6943044066, 0.5248093009, 0.5529333949, 0.4682971835, 0.8395814300, 0.6027162075, 0.5704708099, 0.1683036536, 0.4166618884, 0.6954227090, 0.5882608294, 0.1740975380, 0.2244327366, 0.6576691866, 0.1557049602, 0.2204743922, 0.0171553008, 0.5326616764, 0.6515856981, 0.9350649118, 0.1919017136, 0.8468629122, 0.0858619139, 0.6265221834, 0.2851989865, 0.3923603594, 0.9076783061, 0.9831073880, 0.9175752997, 0.9771860242, 0.3768230379, 0.9961581826, 0.5972931981, 0.4883631170, 0.9122182131, 0.5026619434, 0.1683365852, 0.5147841573, 0.8049662113, 0.6177068353, 0.9427128434, 0.1206752583, 0.8941788673, 0.2047375292, 0.8082579970, 0.9559999704, 0.8288767934, 0.2877290845, 0.0196555797, 0.0435230136, 0.5657885075, 0.6523902416, 0.8987532854, 0.5735269189, 0.5875141621, 0.7248559594, 0.5836510062, 0.4170351624, 0.5301721096, 0.0809457600, 0.7943630219, 0.3776111603, 0.9232994914, 0.1413035095, 0.7160937786, 0.8578238487, 0.4319475591, 0.2036994398, 0.8107730746, 0.7761424184, 0.8984225392, 0.1548258960, 0.1155233607, 0.6770397425, 0.3254630268, 0.0827638432, 0.5809684396, 0.6060854197, 0.3834283650, 0.4542757273, 0.0715805888, 0.5941307545, 0.4977916181, 0.7899936438, 0.4408642054, 0.5816476941, 0.8436232805, 0.5784863830, 0.2304404378, 0.5332070589, 0.1661574841, 0.2620192766, 0.6946257353, 0.4026847780, 0.7228057981, 0.4958552122, 0.6422154903, 0.4498641491, 0.2539713681, 0.1172077730, 0.7831644416, 0.3343767226, 0.6321373582, 0.9566953778, 0.5882658958, 0.2059309930, 0.0046498105, 0.0308831930, 0.1721389294, 0.2295280695, 0.8610374331, 0.1524161845, 0.6131832600, 0.0835445076, 0.9984261394, 0.8716045022, 0.3292885423, 0.3748371005, 0.9464073181, 0.4339765608, 0.7214686871, 0.1031117216, 0.1274863183, 0.0902064219, 0.4243261516, 0.9572295547, 0.0240588691, 0.8209505677, 0.3688459098, 0.8898225427, 0.6054496169, 0.6567084789, 0.8405441642, 0.9180197120, 0.4147205055, 0.3060727417, 0.1472420990, 0.1067821011, 0.4250873923, 0.7708767056, 0.6841964126, 0.0698897094, 0.3403382301, 0.9861334562, 0.4510321319, 0.6613087654, 0.3479995728, 0.7430140972, 0.6054820418, 0.5228985548, 0.8123546243, 0.1626140624, 0.9992128015, 0.7507986426, 0.6582835317, 0.8538095355, 0.1754403561, 0.3810811639, 0.9335498214, 0.4214515090, 0.7316519022, 0.0943577662, 0.5352855921, 0.1674418747, 0.4973691404, 0.8070379496, 0.5696717501, 0.6488142014, 0.8852829337, 0.9774594307, 0.4415666461, 0.5050793290, 0.4487095475, 0.6231434345, 0.3808527291, 0.3178671598, 0.0172356479, 0.2381868809, 0.6607752442, 0.8756453395, 0.6824265122, 0.4558823407, 0.1024481431, 0.9378675222, 0.2524045706, 0.5775204897, 0.4405525029, 0.6628098488, 0.0423301607, 0.1579508930, 0.1301940978, 0.7992655039, 0.3350726366, 0.7359611392, 0.3025476933, 0.6589691639, 0.7264295220, 0.4836938083, 0.6656872034, 0.0879184529, 0.8086938262, 0.8404760361, 0.0645003766, 0.1942209303, 0.7018522024, 0.4987220466, 0.4378146231, 0.1303721815, 0.0610013232, 0.5894667506, 0.5612220764, 0.7970383167, 0.0322968327, 0.3629994094, 0.7964049578, 0.2090090066, 0.9681508541, 0.5692760944, 0.8397989869, 0.7455058098, 0.0795077533, 0.0015683027, 0.4018854797, 0.5016927123, 0.3800607920, 0.3806154132, 0.8759450316, 0.8250660300, 0.0006315129, 0.7067846060, 0.9260798097, 0.2753226459, 0.4509779513, 0.2003022581, 0.3690156341, 0.7336595654, 0.5223066211, 0.4090934694, 0.6151732206, 0.1963078529, 0.4374469519, 0.7306594849, 0.8907238841, 0.0192925520, 0.2067324072, 0.4874707460, 0.3327589035, 0.9553440213, 0.9406356812, 0.1292119920, 0.5191184878, 0.6405436993, 0.2439344078, 0.7216210961, 0.2815211713, 0.3109044731, 0.7316128612, 0.5687897205, 0.3008892238, 0.9764955044, 0.1931817383, 0.4711610675, 0.1668709517, 0.1834610105, 0.6374303699, 0.0850789547, 0.0281905979, 0.6570906639, 0.2895298004, 0.9689143300, 0.9436642528, 0.9391775727, 0.2506894767, 0.5485177636, 0.2782244980, 0.5948830247, 0.3248069286, 0.8957017064, 0.0245015845, 0.8108363748, 0.6880112290, 0.5183306336, 0.7853190303, 0.1181315407, 0.7766770720, 0.7268897891, 0.4620353580, 0.5537806749, 0.3152881265, 0.4455320537, 0.3838991225, 0.7694801092, 0.2070895731, 0.4712428153, 0.8914220333, 0.6101226211, 0.2989602685, 0.3045325577, 0.2456994057, 0.8010020852, 0.2150750458, 0.1237585023, 0.5860992670, 0.3553176820, 0.4543474317, 0.5852618814, 0.8616534472, 0.1550138146, 0.9844777584, 0.0742691308, 0.6993389726, 0.7736752629, 0.6982275248, 0.3317555785, 0.7396470308, 0.9940407276, 0.4264418483, 0.2607556283, 0.6240662336, 0.3659745455, 0.7077345252, 0.2434816211, 0.5243440866, 0.5335496068, 0.6671549678, 0.6241149306, 0.6419143677, 0.9427297115, 0.6741228700, 0.0923121423, 0.3085340858, 0.1387016475, 0.3770980835, 0.7187454104, 0.3089492917, 0.5216982365, 0.3869618773, 0.3750945926, 0.3390402794, 0.1131330803, 0.3795092106, 0.7488511801, 0.8504699469, 0.9228203297, 0.6684989333, 0.7203039527, 0.3968000114, 0.5909999609, 0.1073485762, 0.9722026587, 0.4131026566, 0.7190681100, 0.7731863856, 0.2577435672, 0.5906703472, 0.0485916808, 0.2634270489, 0.0101675671, 0.7246456742, 0.4394373894, 0.3884643018, 0.9904969931, 0.7457889915, 0.4233051240, 0.7915333509, 0.6804920435, 0.7210178375, 0.3525580466, 0.2237111479, 0.9932948351, 0.9658207297, 0.1903806627, 0.9704757929, 0.0882303789, 0.9089678526, 0.5553929806, 0.8253386617, 0.7615212202, 0.0783250853, 0.1861034930, 0.9614195824, 0.1865937859, 0.9676626325, 0.2786012590, 0.7064216733, 0.0562241264, 0.9149281979, 0.0015500424, 0.5042610765, 0.5138201714, 0.1814315617, 0.6894947290, 0.3386182487, 0.8735298514, 0.1211096793, 0.4509810507, 0.2228587419, 0.2553286254, 0.8892394900, 0.9520485997, 0.8264951706, 0.0522692539, 0.8967527747, 0.0971286818, 0.6366116405, 0.4123897851, 0.6260862350, 0.7987470031, 0.6853026152, 0.0760555044, 0.4935092032, 0.8793284893, 0.4861708283, 0.7781454325, 0.9197363853, 0.7939870954, 0.4787814021, 0.0534554012, 0.4551503062, 0.0824609399, 0.8323454261, 0.9850170016, 0.9766232371, 0.2640335262, 0.3979890943, 0.4518453479, 0.9335612655, 0.5873855948, 0.3032830954, 0.7960002422, 0.9273003936, 0.2764146626, 0.6757511497, 0.0335236266, 0.7194989324, 0.8916115761, 0.4326508939, 0.4151262641, 0.4640281498, 0.4131199419, 0.0687694997, 0.6855170727, 0.6538749337, 0.3126204014, 0.7007011771, 0.7723752856, 0.8791742325, 0.2927129865, 0.5875445008, 0.9506940842, 0.8050040007, 0.9458989501, 0.7677817345, 0.8106794357, 0.6881309152, 0.4960320592, 0.4979972541, 0.9108635783, 0.6847783923, 0.5242884159, 0.7868498564, 0.1431383491, 0.9581221938, 0.7927155495, 0.5756070018, 0.6384151578, 0.7377757430, 0.9579582810, 0.2491313666, 0.0360434428, 0.4219542146, 0.4295624793, 0.2493034303, 0.2300234735, 0.3095911443, 0.2521762848, 0.8049109578, 0.8281300068, 0.7961234450, 0.9419006705, 0.0787467882, 0.7139107585, 0.4273712337, 0.7535691857, 0.8630144596, 0.0229172036, 0.9043838382, 0.8862778544, 0.6243295670, 0.3160464168, 0.5789732933, 0.0012080495, 0.7213132381, 0.3994843066, 0.7098433375, 0.0945271328, 0.1791462153, 0.8154343367, 0.8452814817, 0.0123348953, 0.2268628478, 0.0188401304, 0.5339742303, 0.7664393783, 0.7309716344, 0.1468931884, 0.3625349104, 0.5800025463, 0.5703196526, 0.0106637105, 0.1592171788, 0.2831721902, 0.3600955009, 0.8517760634, 0.0174651183, 0.2209621370, 0.3926557302, 0.8327364326, 0.5441686511, 0.2850221992, 0.3115097284, 0.3203366101, 0.5024923086, 0.3844160736, 0.6368042827, 0.6136468053, 0.1910498738, 0.5067345500, 0.6056443453, 0.0284042750, 0.5126647949, 0.0955211222, 0.7867353559, 0.5927502513, 0.5415198803, 0.1058652997, 0.3310441971, 0.3383984268, 0.2148535848, 0.6381856203, 0.5440107584, 0.7951641679, 0.9836698771, 0.5183334351, 0.8925444484, 0.0474710427, 0.4790900350, 0.9882615805, 0.4368577003, 0.4071477950, 0.5762624741, 0.1944947094, 0.8486797810, 0.1984522790, 0.7477202415, 0.5590159297, 0.7521700859, 0.0551631004, 0.9657711387, 0.9134619236, 0.5910332203, 0.9703976512, 0.7858482599, 0.8433590531, 0.6758517027, 0.5794882774, 0.3012061715, 0.4328210652, 0.1794879586, 0.6956229210, 0.1233796328, 0.6486586928, 0.9799708128, 0.6763684154, 0.8320385218, 0.6906052232, 0.7188650370, 0.0968754962, 0.5574142933, 0.7111467719, 0.2011980265, 0.0024846552, 0.4674717188, 0.0325315036, 0.2214836031, 0.8684785962, 0.5234460831, 0.6236107349, 0.6996629238, 0.3033657968, 0.5298413038, 0.8023876548, 0.8226844072, 0.1314624548, 0.3945465386, 0.5914488435, 0.3446391225, 0.2230925858, 0.6847140789, 0.6531316042, 0.3793161511, 0.2820206881, 0.1665841639, 0.0277041253, 0.5377690792, 0.7490639687, 0.2519061565, 0.6075755358, 0.0990014821, 0.2581069767, 0.9433009028, 0.1098811254, 0.9715225101, 0.1391613185, 0.9291435480, 0.7897841334, 0.5272715092, 0.5319740176, 0.8768562675, 0.8542249799, 0.7004652619, 0.2169373035, 0.5135225058, 0.1368853301, 0.1788875014, 0.1864527315, 0.7263433337, 0.3649784923, 0.6351945400, 0.1725110859, 0.7486407757, 0.0880062059, 0.6203016043, 0.0031098344, 0.6807904840, 0.4329688847, 0.9120888114, 0.6753880978, 0.7570419312, 0.0034890114, 0.5968723893, 0.2427694947, 0.7746275663, 0.8255977035, 0.6193305254, 0.2739629149, 0.7439488769, 0.9791289568, 0.3867533505, 0.4503199756, 0.1213801354, 0.7605503201, 0.1114670783, 0.9836165905, 0.0083973985, 0.6230701208, 0.7755311728, 0.6250770688, 0.1864401102, 0.1139901504, 0.2258338332, 0.0776896477, 0.9684395194, 0.6504014134, 0.5547751188, 0.4564431310, 0.1849945635, 0.4718721509, 0.5495076776, 0.4673332274, 0.4358989298, 0.4770091474, 0.9061049819, 0.7073436379, 0.8965846896, 0.4721876979, 0.8611527681, 0.2268464714, 0.1031506807, 0.1565656215, 0.4798693955, 0.1107770354, 0.4223230481, 0.3389161527, 0.7475135922, 0.8460379839, 0.4725143611, 0.3636039495, 0.1707150787, 0.9708656073, 0.5910046101, 0.7059909701, 0.5914714336, 0.8841455579, 0.7421361208, 0.7956129313, 0.0263252016, 0.6318118572, 0.4455343187, 0.5315048099, 0.4441349208, 0.1765761673, 0.0222276058, 0.8579589128, 0.5178102255, 0.6534841657, 0.8347074986, 0.5368279815, 0.8635813594, 0.2910973728, 0.5924838781, 0.2070336789, 0.7112165093, 0.7019674182, 0.5650662780, 0.3672121167, 0.5091794729, 0.3514110148, 0.1103553623, 0.0728661865, 0.2030983567, 0.2724248469, 0.9877097607, 0.2455905229, 0.8940809965, 0.8174049854, 0.5514052510, 0.7328560352, 0.4076706767, 0.5540071130, 0.0764175877, 0.2775040567, 0.3951470852, 0.3323274851, 0.3695199192, 0.1809530109, 0.2567723691, 0.2438969314, 0.2905188501, 0.3683842421, 0.4002000988, 0.5893868208, 0.2370320112, 0.9693633914, 0.3960942924, 0.8913503289, 0.1644939184, 0.9307715297, 0.4899021983, 0.2463455498, 0.7215741873, 0.4483273625, 0.6128193736, 0.3470740318, 0.6599823833, 0.1730511487, 0.3929825425, 0.0315937176, 0.6174632907, 0.2292547971, 0.9102694988, 0.8945866823, 0.2725819647, 0.8356580734, 0.6393386722, 0.3616480231, 0.8865539432, 0.0448807590, 0.4770499170, 0.2434863001, 0.9467805028, 0.6646078825, 0.2166044116, 0.3825719357, 0.2185570449, 0.7561609149, 0.4222871959, 0.8478506804, 0.6891174912, 0.5093563795, 0.6036459804, 0.6722198129, 0.7871729136, 0.0266141128, 0.6708623171, 0.8295212984, 0.2771316767, 0.4636941552, 0.6410098672, 0.7970928550, 0.6718829870, 0.4639254212, 0.4590082467, 0.9323692918, 0.2213848829, 0.1332108527, 0.4914469421, 0.9889844060, 0.0414339751, 0.7972319722, 0.6662688255, 0.3934352398, 0.3783212900, 0.8544338942, 0.0900152698, 0.6895515919, 0.7876849771, 0.2515726984, 0.5729250908, 0.8581283689, 0.7326503396, 0.6727001667, 0.9757472873, 0.7872177958, 0.0092384489, 0.3382865489, 0.6406666040, 0.8801011443, 0.8190898299, 0.3161090016, 0.5311919451, 0.3363076746, 0.3499317467, 0.3414483666, 0.2080655843, 0.5756285191, 0.9552484155, 0.8474201560, 0.7965384126, 0.5881118774, 0.8857709765, 0.5425189137, 0.2108058929, 0.9156853557, 0.7887404561, 0.1819420904, 0.7398766875, 0.0420660116, 0.6819179654, 0.5901957154, 0.2817210257, 0.0364936814, 0.6295444369, 0.7688970566, 0.6977172494, 0.8606534600, 0.6719592810, 0.5329859853};
+
+#endif
+
+#endif
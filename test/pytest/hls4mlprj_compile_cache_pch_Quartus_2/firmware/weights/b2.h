@@ -0,0 +1,14 @@
+//Numpy array shape [1]
+//Min 1.000000000000
+//Max 1.000000000000
+//Number of zeros 0
+
+#ifndef B2_H_
+#define B2_H_
+
+#ifdef __INTELFPGA_COMPILER__
+hls_init_on_powerup
+#endif
+static const model_default_t b2[1] = {1.0000000000000000};
+
+#endif
@@ -0,0 +1,14 @@
+//Numpy array shape [1]
+//Min 2.000000000000
+//Max 2.000000000000
+//Number of zeros 0
+
+#ifndef W2_H_
+#define W2_H_
+
+#ifdef __INTELFPGA_COMPILER__
+hls_init_on_powerup
+#endif
+static const model_default_t w2[1] = {2.0000000000000000};
+
+#endif
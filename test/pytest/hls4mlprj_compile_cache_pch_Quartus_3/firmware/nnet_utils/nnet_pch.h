@@ -0,0 +1,46 @@
+#ifndef NNET_PCH_H_
+#define NNET_PCH_H_
+
+// Precompiled header of the ac_types and the most common nnet_utils headers, used by build_lib.sh when PCH_DIR is set.
+// It is shared between all the projects compiled with the same version of the headers and the same compiler flags.
+
+// Same definitions as the model-independent part of defines.h, the nnet_utils headers depend on them
+#ifndef __INTELFPGA_COMPILER__
+
+#include "ac_fixed.h"
+#include "ac_int.h"
+#define hls_register
+
+#include "stream.h"
+template <typename T> using stream = nnet::stream<T>;
+template <typename T> using stream_in = nnet::stream<T>;
+template <typename T> using stream_out = nnet::stream<T>;
+
+#else
+
+#include "HLS/ac_fixed.h"
+#include "HLS/ac_int.h"
+#include "HLS/hls.h"
+
+template <typename T> using stream = ihc::stream<T>;
+template <typename T> using stream_in = ihc::stream_in<T>;
+template <typename T> using stream_out = ihc::stream_out<T>;
+
+#endif
+
+#define DIV_ROUNDUP(n, d) ((n + d - 1) / d)
+#define MIN(n, d) (n > d ? d : n)
+#define MAX(n, d) (n < d ? d : n)
+
+#include "nnet_activation.h"
+#include "nnet_activation_stream.h"
+#include "nnet_common.h"
+#include "nnet_dense.h"
+#include "nnet_dense_compressed.h"
+#include "nnet_dense_stream.h"
+#include "nnet_helpers.h"
+#include "nnet_mult.h"
+#include "nnet_stream.h"
+#include "nnet_types.h"
+
+#endif
@@ -0,0 +1,16 @@
+//Numpy array shape [1]
+//Min 3.000000000000
+//Max 3.000000000000
+//Number of zeros 0
+
+#ifndef W2_H_
+#define W2_H_
+
+#ifndef __SYNTHESIS__
+model_default_t w2[1];
+#else
+model_default_t w2[1] = {3.0000000000000000};
+
+#endif
+
+#endif
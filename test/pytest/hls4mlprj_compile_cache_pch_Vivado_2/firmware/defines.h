@@ -0,0 +1,22 @@
+#ifndef DEFINES_H_
+#define DEFINES_H_
+
+#include "ap_fixed.h"
+#include "ap_int.h"
+#include "nnet_utils/nnet_types.h"
+#include <cstddef>
+#include <cstdio>
+
+// hls-fpga-machine-learning insert numbers
+#define N_INPUT_1_1 1
+#define N_LAYER_2 1
+
+
+// hls-fpga-machine-learning insert layer-precision
+typedef ap_fixed<32,16> input_t;
+typedef ap_fixed<32,16> model_default_t;
+typedef ap_fixed<32,16> result_t;
+typedef ap_uint<1> layer2_index;
+
+
+#endif
@@ -0,0 +1,18 @@
+#ifndef MYPRJ_H_
+#define MYPRJ_H_
+
+#include "ap_fixed.h"
+#include "ap_int.h"
+#include "hls_stream.h"
+
+#include "defines.h"
+
+
+// Prototype of top level function for C-synthesis
+void myprj(
+    input_t layer0_input[N_INPUT_1_1],
+    result_t layer2_out[N_LAYER_2]
+);
+
+
+#endif
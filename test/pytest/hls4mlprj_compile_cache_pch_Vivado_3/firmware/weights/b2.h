@@ -0,0 +1,16 @@
+//Numpy array shape [1]
+//Min 1.000000000000
+//Max 1.000000000000
+//Number of zeros 0
+
+#ifndef B2_H_
+#define B2_H_
+
+#ifndef __SYNTHESIS__
+model_default_t b2[1];
+#else
+model_default_t b2[1] = {1.0000000000000000};
+
+#endif
+
+#endif
@@ -0,0 +1,36 @@
+#include <iostream>
+
+#include "myproject.h"
+
+// Layers written to their own translation units in layers/
+void myproject_layer2(input_t dense_input[N_INPUT_1_1], dense_result_t layer2_out[N_LAYER_2]);
+void myproject_layer3(dense_result_t layer2_out[N_LAYER_2], result_t layer3_out[N_LAYER_2]);
+
+void myproject(
+    input_t dense_input[N_INPUT_1_1],
+    result_t layer3_out[N_LAYER_2]
+) {
+
+    // hls-fpga-machine-learning insert IO
+    #pragma HLS ARRAY_RESHAPE variable=dense_input complete dim=0
+    #pragma HLS ARRAY_PARTITION variable=layer3_out complete dim=0
+    #pragma HLS INTERFACE ap_vld port=dense_input,layer3_out 
+    #pragma HLS PIPELINE
+
+    // hls-fpga-machine-learning insert load weights
+
+    // ****************************************
+    // NETWORK INSTANTIATION
+    // ****************************************
+
+    // hls-fpga-machine-learning insert layers
+
+    dense_result_t layer2_out[N_LAYER_2];
+    #pragma HLS ARRAY_PARTITION variable=layer2_out complete dim=0
+
+    myproject_layer2(dense_input, layer2_out); // dense
+
+    myproject_layer3(layer2_out, layer3_out); // dense_softmax
+
+}
+
@@ -0,0 +1,50 @@
+#!/bin/bash
+set -e
+
+CC=g++
+if [[ "$OSTYPE" == "linux-gnu" ]]; then
+    CFLAGS="-O3 -fPIC -std=c++11 -pthread -fno-gnu-unique"
+elif [[ "$OSTYPE" == "darwin"* ]]; then
+    CFLAGS="-O3 -fPIC -std=c++11 -pthread"
+fi
+LDFLAGS=
+INCFLAGS="-Ifirmware/ap_types/"
+PROJECT=myproject
+LIB_STAMP=04094e3f
+BASEDIR="$(cd "$(dirname "$0")" && pwd)"
+WEIGHTS_DIR="\"${BASEDIR}/firmware/weights\""
+OBJECTS="${PROJECT}.o ${PROJECT}_bridge.o"
+EXTRA_OBJECTS=
+
+if [ -n "${PCH_DIR}" ]; then
+    # Precompiled header of the ap_types and nnet_utils, shared between projects through PCH_DIR. It is keyed by the
+    # compiler, the flags and the preprocessed content of the headers, so any change produces a new one.
+    PCH=firmware/nnet_utils/nnet_pch.h
+    PCH_DIR="$(mkdir -p "${PCH_DIR}" && cd "${PCH_DIR}" && pwd)"
+    if command -v sha256sum > /dev/null; then SHA256SUM=sha256sum; else SHA256SUM="shasum -a 256"; fi
+    PCH_KEY=$({ ${CC} --version; echo ${CFLAGS}; ${CC} ${CFLAGS} ${INCFLAGS} -E -x c++-header ${PCH}; } | ${SHA256SUM} | cut -c1-32)
+    PCH_FILE="${PCH_DIR}/${PCH_KEY}.gch"
+    if [ ! -f "${PCH_FILE}" ]; then
+        ${CC} ${CFLAGS} ${INCFLAGS} -x c++-header ${PCH} -o "${PCH_FILE}.$$"
+        mv -f "${PCH_FILE}.$$" "${PCH_FILE}"
+    fi
+    ln -sf "${PCH_FILE}" ${PCH}.gch
+    # The weights directory is passed through a variable, defining the macro would invalidate the precompiled header
+    echo "const char *hls4ml_weights_dir = ${WEIGHTS_DIR};" | ${CC} ${CFLAGS} -x c++ -c - -o ${PROJECT}_weights_dir.o
+    EXTRA_OBJECTS="${PROJECT}_weights_dir.o"
+    PCHFLAGS=(-Winvalid-pch -include ${PCH})
+else
+    PCHFLAGS=(-D WEIGHTS_DIR="${WEIGHTS_DIR}")
+fi
+
+if [ -f build_lib.mk ]; then
+    # One translation unit per layer, compiled in parallel, only the units whose sources changed are rebuilt
+    make -f build_lib.mk -j "${BUILD_JOBS:-$(getconf _NPROCESSORS_ONLN)}" CC="${CC}" CFLAGS="${CFLAGS}" \
+        INCFLAGS="${INCFLAGS}" PROJECT="${PROJECT}" BASEDIR="${BASEDIR}" PCH="${PCH}" \
+        EXTRA_OBJECTS="${EXTRA_OBJECTS}" LIB="firmware/${PROJECT}-${LIB_STAMP}.so"
+else
+    ${CC} ${CFLAGS} ${INCFLAGS} "${PCHFLAGS[@]}" -c firmware/${PROJECT}.cpp -o ${PROJECT}.o
+    ${CC} ${CFLAGS} ${INCFLAGS} "${PCHFLAGS[@]}" -c ${PROJECT}_bridge.cpp -o ${PROJECT}_bridge.o
+    ${CC} ${CFLAGS} ${INCFLAGS} -shared ${OBJECTS} ${EXTRA_OBJECTS} -o firmware/${PROJECT}-${LIB_STAMP}.so
+fi
+rm -f *.o firmware/nnet_utils/nnet_pch.h.gch
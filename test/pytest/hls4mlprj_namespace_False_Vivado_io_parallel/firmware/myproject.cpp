@@ -0,0 +1,40 @@
+#include <iostream>
+
+#include "myproject.h"
+#include "parameters.h"
+
+
+void myproject(
+    input_t dense_input[N_INPUT_1_1],
+    result_t layer3_out[N_LAYER_2]
+) {
+
+    // hls-fpga-machine-learning insert IO
+    #pragma HLS ARRAY_RESHAPE variable=dense_input complete dim=0
+    #pragma HLS ARRAY_PARTITION variable=layer3_out complete dim=0
+    #pragma HLS INTERFACE ap_vld port=dense_input,layer3_out 
+    #pragma HLS PIPELINE
+
+    // hls-fpga-machine-learning insert load weights
+#ifndef __SYNTHESIS__
+    static bool loaded_weights = false;
+    if (!loaded_weights) {
+        nnet::load_weights_from_txt<dense_weight_t, 150>(w2, "w2.txt");
+        nnet::load_weights_from_txt<dense_bias_t, 10>(b2, "b2.txt");
+        loaded_weights = true;    }
+#endif
+    // ****************************************
+    // NETWORK INSTANTIATION
+    // ****************************************
+
+    // hls-fpga-machine-learning insert layers
+
+    dense_result_t layer2_out[N_LAYER_2];
+    #pragma HLS ARRAY_PARTITION variable=layer2_out complete dim=0
+
+    nnet::dense<input_t, dense_result_t, config2>(dense_input, layer2_out, w2, b2); // dense
+
+    nnet::softmax<dense_result_t, result_t, softmax_config3>(layer2_out, layer3_out); // dense_softmax
+
+}
+
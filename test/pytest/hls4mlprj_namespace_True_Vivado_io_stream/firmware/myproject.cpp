@@ -0,0 +1,38 @@
+#include <iostream>
+
+#include "myproject.h"
+#include "parameters.h"
+
+
+void myproject(
+    hls::stream<input_t> &dense_input,
+    hls::stream<result_t> &layer3_out
+) {
+
+    // hls-fpga-machine-learning insert IO
+    #pragma HLS INTERFACE axis port=dense_input,layer3_out 
+    #pragma HLS DATAFLOW
+
+    // hls-fpga-machine-learning insert load weights
+#ifndef __SYNTHESIS__
+    static bool loaded_weights = false;
+    if (!loaded_weights) {
+        nnet::load_weights_from_txt<dense_weight_t, 150>(w2, "w2.txt");
+        nnet::load_weights_from_txt<dense_bias_t, 10>(b2, "b2.txt");
+        loaded_weights = true;    }
+#endif
+    // ****************************************
+    // NETWORK INSTANTIATION
+    // ****************************************
+
+    // hls-fpga-machine-learning insert layers
+
+    hls::stream<dense_result_t> layer2_out("layer2_out");
+    #pragma HLS STREAM variable=layer2_out depth=1
+
+    nnet::dense<input_t, dense_result_t, config2>(dense_input, layer2_out, w2, b2); // dense
+
+    nnet::softmax<dense_result_t, result_t, softmax_config3>(layer2_out, layer3_out); // dense_softmax
+
+}
+
@@ -0,0 +1,18 @@
+#ifndef MYPROJECT_H_
+#define MYPROJECT_H_
+
+#include "ap_fixed.h"
+#include "ap_int.h"
+#include "hls_stream.h"
+
+#include "defines.h"
+
+
+// Prototype of top level function for C-synthesis
+void myproject(
+    hls::stream<input_t> &dense_input,
+    hls::stream<result_t> &layer3_out
+);
+
+
+#endif
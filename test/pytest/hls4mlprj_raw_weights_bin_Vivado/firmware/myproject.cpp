@@ -0,0 +1,35 @@
+#include <iostream>
+
+#include "myproject.h"
+#include "parameters.h"
+
+
+void myproject(
+    input_t dense_1_input[N_INPUT_1_1],
+    result_t layer2_out[N_LAYER_2]
+) {
+
+    // hls-fpga-machine-learning insert IO
+    #pragma HLS ARRAY_RESHAPE variable=dense_1_input complete dim=0
+    #pragma HLS ARRAY_PARTITION variable=layer2_out complete dim=0
+    #pragma HLS INTERFACE ap_vld port=dense_1_input,layer2_out 
+    #pragma HLS PIPELINE
+
+    // hls-fpga-machine-learning insert load weights
+#ifndef __SYNTHESIS__
+    static bool loaded_weights = false;
+    if (!loaded_weights) {
+        nnet::load_weights_from_bin<dense_1_weight_t, 150>(w2, "w2.bin");
+        nnet::load_weights_from_bin<dense_1_bias_t, 10>(b2, "b2.bin");
+        loaded_weights = true;    }
+#endif
+    // ****************************************
+    // NETWORK INSTANTIATION
+    // ****************************************
+
+    // hls-fpga-machine-learning insert layers
+
+    nnet::dense<input_t, result_t, config2>(dense_1_input, layer2_out, w2, b2); // dense_1
+
+}
+
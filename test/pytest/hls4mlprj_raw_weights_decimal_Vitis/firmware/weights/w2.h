@@ -0,0 +1,16 @@
+//Numpy array shape [15, 10]
+//Min -0.485351562500
+//Max 0.472656250000
+//Number of zeros 0
+
+#ifndef W2_H_
+#define W2_H_
+
+#ifndef __SYNTHESIS__
+dense_2_weight_t w2[150];
+#else
+dense_2_weight_t w2[150] = {-0.3798828125, -0.4794921875, 0.0996093750, 0.2587890625, 0.4589843750, 0.3183593750, -0.3935546875, -0.4531250000, -0.1611328125, 0.2958984375, 0.0078125000, -0.2167968750, -0.3857421875, -0.0048828125, -0.2978515625, 0.0039062500, -0.0937500000, -0.0800781250, -0.2070312500, -0.1132812500, 0.0048828125, -0.2285156250, -0.4648437500, 0.2939453125, -0.0410156250, -0.4687500000, 0.2773437500, 0.1914062500, -0.1748046875, -0.1953125000, -0.3183593750, 0.1376953125, -0.1669921875, 0.4423828125, 0.1054687500, -0.2734375000, -0.3964843750, 0.2919921875, -0.1767578125, -0.4140625000, -0.1230468750, 0.1474609375, -0.2460937500, 0.0595703125, -0.2646484375, -0.4160156250, -0.1533203125, -0.2392578125, 0.0361328125, -0.2773437500, 0.0097656250, -0.2138671875, 0.2255859375, -0.1669921875, -0.4853515625, 0.3847656250, 0.2109375000, -0.4667968750, 0.4111328125, -0.2861328125, 0.1757812500, 0.0996093750, 0.0439453125, 0.4345703125, 0.2158203125, -0.2861328125, 0.4189453125, -0.4384765625, -0.2099609375, 0.4570312500, 0.1591796875, 0.3681640625, 0.1689453125, -0.3994140625, 0.3544921875, 0.4003906250, 0.4726562500, 0.1298828125, -0.3437500000, 0.1337890625, 0.3720703125, 0.0263671875, 0.0087890625, 0.0097656250, -0.2841796875, -0.0742187500, 0.3388671875, -0.2177734375, 0.2480468750, -0.0234375000, 0.0488281250, 0.4355468750, 0.4150390625, 0.3017578125, 0.0927734375, 0.1611328125, 0.1269531250, 0.3007812500, 0.1826171875, 0.1464843750, -0.0673828125, 0.4541015625, 0.0849609375, 0.1025390625, -0.1914062500, 0.2968750000, 0.3984375000, -0.3017578125, 0.4355468750, -0.3437500000, 0.2207031250, -0.3486328125, 0.4453125000, 0.4472656250, -0.1601562500, -0.3291015625, -0.0292968750, -0.1933593750, 0.1406250000, -0.1142578125, -0.4697265625, -0.3388671875, -0.2343750000, 0.1777343750, 0.4072265625, -0.4833984375, 0.0615234375, -0.0341796875, 0.2333984375, 0.0156250000, 0.0839843750, -0.1962890625, -0.2226562500, -0.4677734375, -0.1884765625, 0.2939453125, 0.1562500000, -0.1708984375, -0.2353515625, 0.2558593750, -0.2773437500, 0.1445312500, -0.1494140625, -0.2001953125, 0.0166015625, -0.4267578125, -0.3798828125, -0.2666015625, -0.4169921875, 0.2246093750};
+
+#endif
+
+#endif
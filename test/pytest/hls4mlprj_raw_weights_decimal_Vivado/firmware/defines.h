@@ -0,0 +1,24 @@
+#ifndef DEFINES_H_
+#define DEFINES_H_
+
+#include "ap_fixed.h"
+#include "ap_int.h"
+#include "nnet_utils/nnet_types.h"
+#include <cstddef>
+#include <cstdio>
+
+// hls-fpga-machine-learning insert numbers
+#define N_INPUT_1_1 15
+#define N_LAYER_2 10
+
+
+// hls-fpga-machine-learning insert layer-precision
+typedef ap_fixed<16,6> input_t;
+typedef ap_fixed<16,6> model_default_t;
+typedef ap_fixed<37,17> result_t;
+typedef ap_fixed<16,6> dense_1_weight_t;
+typedef ap_fixed<16,6> dense_1_bias_t;
+typedef ap_uint<1> layer2_index;
+
+
+#endif
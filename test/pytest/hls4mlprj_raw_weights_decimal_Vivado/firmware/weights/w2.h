@@ -0,0 +1,16 @@
+//Numpy array shape [15, 10]
+//Min -0.486328125000
+//Max 0.480468750000
+//Number of zeros 0
+
+#ifndef W2_H_
+#define W2_H_
+
+#ifndef __SYNTHESIS__
+dense_1_weight_t w2[150];
+#else
+dense_1_weight_t w2[150] = {-0.4355468750, -0.4794921875, -0.2636718750, -0.0058593750, 0.2724609375, -0.0830078125, 0.0927734375, 0.2675781250, 0.0234375000, 0.3769531250, -0.4394531250, 0.3515625000, 0.0283203125, 0.4003906250, -0.0244140625, 0.2558593750, 0.2128906250, 0.2070312500, 0.0087890625, -0.2109375000, -0.3427734375, -0.1464843750, 0.3486328125, 0.0634765625, -0.4140625000, -0.2099609375, 0.2695312500, 0.1035156250, 0.2421875000, -0.1416015625, 0.2783203125, -0.1904296875, -0.3886718750, 0.4355468750, -0.0654296875, 0.0322265625, 0.2226562500, 0.1279296875, 0.1396484375, 0.0488281250, -0.3359375000, 0.2382812500, -0.4111328125, -0.0732421875, 0.0937500000, -0.3779296875, 0.1152343750, 0.2363281250, 0.1914062500, 0.1250000000, -0.3164062500, -0.4296875000, 0.3525390625, 0.4687500000, -0.2041015625, 0.1982421875, -0.1318359375, 0.2734375000, 0.2265625000, 0.4130859375, 0.2353515625, 0.4550781250, -0.1455078125, -0.0888671875, -0.2607421875, 0.4472656250, -0.2939453125, -0.1689453125, -0.1865234375, -0.4609375000, -0.1767578125, -0.3779296875, -0.2119140625, 0.1718750000, 0.2158203125, 0.2197265625, 0.2822265625, -0.4287109375, -0.3515625000, 0.2382812500, 0.2626953125, 0.1689453125, 0.1582031250, 0.2871093750, 0.0302734375, -0.4697265625, 0.2500000000, 0.0634765625, 0.2294921875, 0.4482421875, 0.3427734375, -0.3740234375, -0.0292968750, 0.3984375000, 0.3056640625, -0.1455078125, -0.1025390625, 0.4003906250, -0.4042968750, -0.3906250000, 0.3398437500, 0.1181640625, 0.0146484375, -0.0078125000, 0.2431640625, 0.4667968750, -0.3583984375, 0.4023437500, -0.0068359375, 0.2314453125, 0.3808593750, 0.4687500000, -0.2695312500, 0.4238281250, 0.4638671875, -0.0732421875, -0.3720703125, -0.3398437500, 0.4804687500, -0.0224609375, -0.3408203125, 0.2216796875, -0.2324218750, 0.3720703125, 0.3964843750, -0.4316406250, -0.0917968750, -0.0136718750, 0.1425781250, -0.4785156250, 0.1474609375, 0.2285156250, -0.0869140625, -0.3007812500, -0.3496093750, 0.2822265625, 0.2255859375, -0.4599609375, 0.3535156250, -0.1152343750, -0.4775390625, -0.1660156250, -0.4863281250, 0.4042968750, 0.2910156250, -0.0156250000, 0.3535156250, -0.1347656250, 0.3291015625, 0.3085937500};
+
+#endif
+
+#endif
@@ -0,0 +1,14 @@
+//Numpy array shape [10]
+//Min 0.000000000000
+//Max 0.000000000000
+//Number of zeros 10
+
+#ifndef B2_H_
+#define B2_H_
+
+#define B2_BITS(x) NNET_WEIGHT_BITS(dense_2_bias_t, x)
+dense_2_bias_t b2[10] = {B2_BITS(0), B2_BITS(0), B2_BITS(0), B2_BITS(0), B2_BITS(0), B2_BITS(0), B2_BITS(0), B2_BITS(0), B2_BITS(0), B2_BITS(0)};
+
+#undef B2_BITS
+
+#endif
@@ -0,0 +1,14 @@
+//Numpy array shape [15, 10]
+//Min -0.485351562500
+//Max 0.472656250000
+//Number of zeros 0
+
+#ifndef W2_H_
+#define W2_H_
+
+#define W2_BITS(x) NNET_WEIGHT_BITS(dense_2_weight_t, x)
+dense_2_weight_t w2[150] = {W2_BITS(-389), W2_BITS(-491), W2_BITS(102), W2_BITS(265), W2_BITS(470), W2_BITS(326), W2_BITS(-403), W2_BITS(-464), W2_BITS(-165), W2_BITS(303), W2_BITS(8), W2_BITS(-222), W2_BITS(-395), W2_BITS(-5), W2_BITS(-305), W2_BITS(4), W2_BITS(-96), W2_BITS(-82), W2_BITS(-212), W2_BITS(-116), W2_BITS(5), W2_BITS(-234), W2_BITS(-476), W2_BITS(301), W2_BITS(-42), W2_BITS(-480), W2_BITS(284), W2_BITS(196), W2_BITS(-179), W2_BITS(-200), W2_BITS(-326), W2_BITS(141), W2_BITS(-171), W2_BITS(453), W2_BITS(108), W2_BITS(-280), W2_BITS(-406), W2_BITS(299), W2_BITS(-181), W2_BITS(-424), W2_BITS(-126), W2_BITS(151), W2_BITS(-252), W2_BITS(61), W2_BITS(-271), W2_BITS(-426), W2_BITS(-157), W2_BITS(-245), W2_BITS(37), W2_BITS(-284), W2_BITS(10), W2_BITS(-219), W2_BITS(231), W2_BITS(-171), W2_BITS(-497), W2_BITS(394), W2_BITS(216), W2_BITS(-478), W2_BITS(421), W2_BITS(-293), W2_BITS(180), W2_BITS(102), W2_BITS(45), W2_BITS(445), W2_BITS(221), W2_BITS(-293), W2_BITS(429), W2_BITS(-449), W2_BITS(-215), W2_BITS(468), W2_BITS(163), W2_BITS(377), W2_BITS(173), W2_BITS(-409), W2_BITS(363), W2_BITS(410), W2_BITS(484), W2_BITS(133), W2_BITS(-352), W2_BITS(137), W2_BITS(381), W2_BITS(27), W2_BITS(9), W2_BITS(10), W2_BITS(-291), W2_BITS(-76), W2_BITS(347), W2_BITS(-223), W2_BITS(254), W2_BITS(-24), W2_BITS(50), W2_BITS(446), W2_BITS(425), W2_BITS(309), W2_BITS(95), W2_BITS(165), W2_BITS(130), W2_BITS(308), W2_BITS(187), W2_BITS(150), W2_BITS(-69), W2_BITS(465), W2_BITS(87), W2_BITS(105), W2_BITS(-196), W2_BITS(304), W2_BITS(408), W2_BITS(-309), W2_BITS(446), W2_BITS(-352), W2_BITS(226), W2_BITS(-357), W2_BITS(456), W2_BITS(458), W2_BITS(-164), W2_BITS(-337), W2_BITS(-30), W2_BITS(-198), W2_BITS(144), W2_BITS(-117), W2_BITS(-481), W2_BITS(-347), W2_BITS(-240), W2_BITS(182), W2_BITS(417), W2_BITS(-495), W2_BITS(63), W2_BITS(-35), W2_BITS(239), W2_BITS(16), W2_BITS(86), W2_BITS(-201), W2_BITS(-228), W2_BITS(-479), W2_BITS(-193), W2_BITS(301), W2_BITS(160), W2_BITS(-175), W2_BITS(-241), W2_BITS(262), W2_BITS(-284), W2_BITS(148), W2_BITS(-153), W2_BITS(-205), W2_BITS(17), W2_BITS(-437), W2_BITS(-389), W2_BITS(-273), W2_BITS(-427), W2_BITS(230)};
+
+#undef W2_BITS
+
+#endif
@@ -0,0 +1,177 @@
+#ifndef MYPROJECT_BRIDGE_H_
+#define MYPROJECT_BRIDGE_H_
+
+#include "firmware/myproject.h"
+#include "firmware/nnet_utils/nnet_helpers.h"
+#include <algorithm>
+#include <map>
+#include <thread>
+#include <vector>
+
+// hls-fpga-machine-learning insert bram
+
+namespace nnet {
+bool trace_enabled = false;
+std::map<std::string, void *> *trace_outputs = NULL;
+size_t trace_type_size = sizeof(double);
+
+// Runs run_chunk(first, last) over the samples of a batch, split in up to n_threads chunks executed in parallel.
+// The first sample is always run on the calling thread before any other thread is started, this initializes the
+// static lookup tables of the activations and loads the weights from the txt files ahead of the parallel part.
+template <class chunk_T> void run_batch(size_t n_samples, size_t n_threads, chunk_T run_chunk) {
+    if (n_samples == 0) {
+        return;
+    }
+    run_chunk(0, 1);
+
+    // Tracing stores the layer outputs in shared buffers, so it always runs on a single thread
+    if (trace_enabled) {
+        n_threads = 1;
+    }
+    n_threads = std::min(n_threads, n_samples - 1);
+    if (n_threads <= 1) {
+        run_chunk(1, n_samples);
+        return;
+    }
+
+    std::vector<std::thread> workers;
+    size_t chunk_size = (n_samples - 1 + n_threads - 1) / n_threads;
+    for (size_t first = 1; first < n_samples; first += chunk_size) {
+        workers.push_back(std::thread(run_chunk, first, std::min(first + chunk_size, n_samples)));
+    }
+    for (size_t i = 0; i < workers.size(); i++) {
+        workers[i].join();
+    }
+}
+} // namespace nnet
+
+extern "C" {
+
+// Names of the layers whose outputs are saved when tracing is enabled, terminated by NULL
+const char **get_trace_layers() {
+    static const char *trace_layers[] = {
+        NULL};
+    return trace_layers;
+}
+
+// Enables tracing, the outputs of layer layer_names[i] are written to buffers[i], one sample after the other, until
+// tracing is disabled. The buffers must be large enough to hold the outputs of all the samples that are run.
+void enable_trace(const char **layer_names, void **buffers, size_t n_buffers, size_t element_size) {
+    if (nnet::trace_outputs == NULL) {
+        nnet::trace_outputs = new std::map<std::string, void *>;
+    }
+    nnet::trace_outputs->clear();
+    for (size_t i = 0; i < n_buffers; i++) {
+        (*nnet::trace_outputs)[layer_names[i]] = buffers[i];
+    }
+    nnet::trace_type_size = element_size;
+    nnet::trace_enabled = true;
+}
+
+void disable_trace() {
+    delete nnet::trace_outputs;
+    nnet::trace_outputs = NULL;
+    nnet::trace_enabled = false;
+}
+
+// Wrapper of top level function for Python bridge
+void myproject_float(
+    float dense_2_input[N_INPUT_1_1],
+    float layer2_out[N_LAYER_2]
+) {
+
+    input_t dense_2_input_ap[N_INPUT_1_1];
+    nnet::convert_data<float, input_t, N_INPUT_1_1>(dense_2_input, dense_2_input_ap);
+
+    result_t layer2_out_ap[N_LAYER_2];
+
+    myproject(dense_2_input_ap,layer2_out_ap);
+
+    nnet::convert_data<result_t, float, N_LAYER_2>(layer2_out_ap, layer2_out);
+}
+
+void myproject_double(
+    double dense_2_input[N_INPUT_1_1],
+    double layer2_out[N_LAYER_2]
+) {
+
+    input_t dense_2_input_ap[N_INPUT_1_1];
+    nnet::convert_data<double, input_t, N_INPUT_1_1>(dense_2_input, dense_2_input_ap);
+
+    result_t layer2_out_ap[N_LAYER_2];
+
+    myproject(dense_2_input_ap,layer2_out_ap);
+
+    nnet::convert_data<result_t, double, N_LAYER_2>(layer2_out_ap, layer2_out);
+}
+
+// Wrapper taking and returning the bit patterns of the fixed-point input and output types as integers
+void myproject_raw(
+    long long dense_2_input[N_INPUT_1_1],
+    long long layer2_out[N_LAYER_2]
+) {
+
+    input_t dense_2_input_ap[N_INPUT_1_1];
+    nnet::convert_data_from_raw<long long, input_t, N_INPUT_1_1>(dense_2_input, dense_2_input_ap);
+
+    result_t layer2_out_ap[N_LAYER_2];
+
+    myproject(dense_2_input_ap,layer2_out_ap);
+
+    nnet::convert_data_to_raw<result_t, long long, N_LAYER_2>(layer2_out_ap, layer2_out);
+}
+
+// Batched wrappers, process n_samples consecutive samples stored in contiguous buffers
+void myproject_float_batch(
+    float *dense_2_input,
+    float *layer2_out,
+    size_t n_samples,
+    size_t n_threads
+) {
+    auto run_chunk = [=](size_t first, size_t last) {
+        for (size_t i_sample = first; i_sample < last; i_sample++) {
+            myproject_float(
+                &dense_2_input[i_sample * N_INPUT_1_1],
+                &layer2_out[i_sample * N_LAYER_2]
+            );
+        }
+    };
+    nnet::run_batch(n_samples, n_threads, run_chunk);
+}
+
+void myproject_double_batch(
+    double *dense_2_input,
+    double *layer2_out,
+    size_t n_samples,
+    size_t n_threads
+) {
+    auto run_chunk = [=](size_t first, size_t last) {
+        for (size_t i_sample = first; i_sample < last; i_sample++) {
+            myproject_double(
+                &dense_2_input[i_sample * N_INPUT_1_1],
+                &layer2_out[i_sample * N_LAYER_2]
+            );
+        }
+    };
+    nnet::run_batch(n_samples, n_threads, run_chunk);
+}
+
+void myproject_raw_batch(
+    long long *dense_2_input,
+    long long *layer2_out,
+    size_t n_samples,
+    size_t n_threads
+) {
+    auto run_chunk = [=](size_t first, size_t last) {
+        for (size_t i_sample = first; i_sample < last; i_sample++) {
+            myproject_raw(
+                &dense_2_input[i_sample * N_INPUT_1_1],
+                &layer2_out[i_sample * N_LAYER_2]
+            );
+        }
+    };
+    nnet::run_batch(n_samples, n_threads, run_chunk);
+}
+}
+
+#endif
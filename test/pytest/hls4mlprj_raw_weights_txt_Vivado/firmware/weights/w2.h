@@ -0,0 +1,18 @@
+//Numpy array shape [15, 10]
+//Min -0.486328125000
+//Max 0.480468750000
+//Number of zeros 0
+
+#ifndef W2_H_
+#define W2_H_
+
+#ifndef __SYNTHESIS__
+dense_1_weight_t w2[150];
+#else
+#define W2_BITS(x) NNET_WEIGHT_BITS(dense_1_weight_t, x)
+dense_1_weight_t w2[150] = {W2_BITS(-446), W2_BITS(-491), W2_BITS(-270), W2_BITS(-6), W2_BITS(279), W2_BITS(-85), W2_BITS(95), W2_BITS(274), W2_BITS(24), W2_BITS(386), W2_BITS(-450), W2_BITS(360), W2_BITS(29), W2_BITS(410), W2_BITS(-25), W2_BITS(262), W2_BITS(218), W2_BITS(212), W2_BITS(9), W2_BITS(-216), W2_BITS(-351), W2_BITS(-150), W2_BITS(357), W2_BITS(65), W2_BITS(-424), W2_BITS(-215), W2_BITS(276), W2_BITS(106), W2_BITS(248), W2_BITS(-145), W2_BITS(285), W2_BITS(-195), W2_BITS(-398), W2_BITS(446), W2_BITS(-67), W2_BITS(33), W2_BITS(228), W2_BITS(131), W2_BITS(143), W2_BITS(50), W2_BITS(-344), W2_BITS(244), W2_BITS(-421), W2_BITS(-75), W2_BITS(96), W2_BITS(-387), W2_BITS(118), W2_BITS(242), W2_BITS(196), W2_BITS(128), W2_BITS(-324), W2_BITS(-440), W2_BITS(361), W2_BITS(480), W2_BITS(-209), W2_BITS(203), W2_BITS(-135), W2_BITS(280), W2_BITS(232), W2_BITS(423), W2_BITS(241), W2_BITS(466), W2_BITS(-149), W2_BITS(-91), W2_BITS(-267), W2_BITS(458), W2_BITS(-301), W2_BITS(-173), W2_BITS(-191), W2_BITS(-472), W2_BITS(-181), W2_BITS(-387), W2_BITS(-217), W2_BITS(176), W2_BITS(221), W2_BITS(225), W2_BITS(289), W2_BITS(-439), W2_BITS(-360), W2_BITS(244), W2_BITS(269), W2_BITS(173), W2_BITS(162), W2_BITS(294), W2_BITS(31), W2_BITS(-481), W2_BITS(256), W2_BITS(65), W2_BITS(235), W2_BITS(459), W2_BITS(351), W2_BITS(-383), W2_BITS(-30), W2_BITS(408), W2_BITS(313), W2_BITS(-149), W2_BITS(-105), W2_BITS(410), W2_BITS(-414), W2_BITS(-400), W2_BITS(348), W2_BITS(121), W2_BITS(15), W2_BITS(-8), W2_BITS(249), W2_BITS(478), W2_BITS(-367), W2_BITS(412), W2_BITS(-7), W2_BITS(237), W2_BITS(390), W2_BITS(480), W2_BITS(-276), W2_BITS(434), W2_BITS(475), W2_BITS(-75), W2_BITS(-381), W2_BITS(-348), W2_BITS(492), W2_BITS(-23), W2_BITS(-349), W2_BITS(227), W2_BITS(-238), W2_BITS(381), W2_BITS(406), W2_BITS(-442), W2_BITS(-94), W2_BITS(-14), W2_BITS(146), W2_BITS(-490), W2_BITS(151), W2_BITS(234), W2_BITS(-89), W2_BITS(-308), W2_BITS(-358), W2_BITS(289), W2_BITS(231), W2_BITS(-471), W2_BITS(362), W2_BITS(-118), W2_BITS(-489), W2_BITS(-170), W2_BITS(-498), W2_BITS(414), W2_BITS(298), W2_BITS(-16), W2_BITS(362), W2_BITS(-138), W2_BITS(337), W2_BITS(316)};
+
+#undef W2_BITS
+#endif
+
+#endif
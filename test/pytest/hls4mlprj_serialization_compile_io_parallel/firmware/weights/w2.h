@@ -0,0 +1,16 @@
+//Numpy array shape [3, 2, 4]
+//Min 0.001828564098
+//Max 1.742810606956
+//Number of zeros 0
+
+#ifndef W2_H_
+#define W2_H_
+
+#ifndef __SYNTHESIS__
+conv1d_weight_t w2[24];
+#else
+conv1d_weight_t w2[24] = {1.7428106070, 0.0038381063, 0.0697813779, 1.2262989283, 0.1717619002, 0.0106444424, 0.2485919446, 0.5532352924, 1.1499160528, 0.0197464433, 0.0824379176, 0.1475984901, 1.6552324295, 0.0150853926, 0.2775969803, 0.3719751835, 0.0908236131, 0.0159694385, 0.2013284117, 0.4348763227, 0.0966279954, 0.0018285641, 0.1320168376, 0.3351056576};
+
+#endif
+
+#endif
@@ -0,0 +1,16 @@
+//Numpy array shape [64, 5]
+//Min 0.008447779343
+//Max 0.999879240990
+//Number of zeros 0
+
+#ifndef W9_H_
+#define W9_H_
+
+#ifndef __SYNTHESIS__
+dense_1_weight_t w9[320];
+#else
+dense_1_weight_t w9[320] = {0.7471830845, 0.3635106385, 0.1117001399, 0.2888972163, 0.8061457276, 0.6127790213, 0.4088993371, 0.0352426805, 0.0095437523, 0.4277787209, 0.7254670262, 0.6264875531, 0.9103411436, 0.2488728762, 0.5537454486, 0.4716581404, 0.8060758114, 0.1967606694, 0.5450410843, 0.4455900788, 0.5651178360, 0.4425139725, 0.6897336841, 0.7004796267, 0.8648610115, 0.1227724999, 0.3070018291, 0.9302565455, 0.4304926991, 0.2081495523, 0.8310348988, 0.7844493389, 0.5685642362, 0.2019869685, 0.3612969220, 0.8175547719, 0.4976001382, 0.5061983466, 0.0501515940, 0.7396398187, 0.4742863476, 0.9923658371, 0.6933693290, 0.6601397395, 0.6711139679, 0.2909645140, 0.2463792562, 0.6558775306, 0.7769894600, 0.6963207722, 0.5072662234, 0.8496756554, 0.7012547255, 0.9385921359, 0.9027186036, 0.0582430698, 0.4555694461, 0.0275242031, 0.5399689674, 0.3176425099, 0.7045097351, 0.4166888595, 0.4590591788, 0.5098916292, 0.6607313156, 0.4411881566, 0.7364904284, 0.7007803321, 0.1294875741, 0.8883492947, 0.1318633258, 0.5349547267, 0.8612135053, 0.6515541673, 0.3506072164, 0.2833623588, 0.2813341022, 0.3394579887, 0.2301761806, 0.4482752085, 0.1873005480, 0.0520780608, 0.7985610366, 0.9694480300, 0.4393788874, 0.5532994270, 0.6067880392, 0.9034022689, 0.0983413085, 0.5009177923, 0.6779944897, 0.9998792410, 0.1360501796, 0.2234836221, 0.9622055888, 0.2326205522, 0.4268305898, 0.0159845073, 0.0947665870, 0.1864965707, 0.6636290550, 0.3199927509, 0.1526708603, 0.8155394197, 0.7037340403, 0.7345775962, 0.5634166002, 0.4075703025, 0.9724434614, 0.5077738166, 0.2046603411, 0.9732753634, 0.3518516123, 0.5954850316, 0.2111966014, 0.2409830838, 0.5984644294, 0.8048781157, 0.2822424471, 0.9213865995, 0.5905507803, 0.0739161521, 0.0226596184, 0.6793816090, 0.2648132145, 0.9062115550, 0.7450405955, 0.7756302953, 0.8104130626, 0.4760321081, 0.1282052398, 0.2740173340, 0.8322134018, 0.0927269161, 0.1881597936, 0.3962187171, 0.6929437518, 0.4065985680, 0.0562264174, 0.3868153989, 0.5984824300, 0.5575402379, 0.9044856429, 0.9302526116, 0.1896398664, 0.1179397032, 0.4974646270, 0.0723501518, 0.5164333582, 0.5568284392, 0.5348320007, 0.9417461157, 0.2211652249, 0.4293590188, 0.4421195388, 0.6610707045, 0.6239456534, 0.5148549676, 0.3057488203, 0.9626967311, 0.1049629599, 0.6976089478, 0.0844877958, 0.2212722450, 0.9065124989, 0.5311264992, 0.3953578770, 0.4371814728, 0.4098704457, 0.6516758800, 0.3935222924, 0.2574937642, 0.4618687928, 0.1242041960, 0.1340323538, 0.2345265895, 0.5854897499, 0.8508527875, 0.6879943013, 0.3682438731, 0.4823401868, 0.3668080568, 0.9745799303, 0.0693033189, 0.7889051437, 0.3999513686, 0.7068780661, 0.4438095391, 0.4373047054, 0.3330058157, 0.3877978623, 0.8741425872, 0.8828867078, 0.8819799423, 0.3225213289, 0.4247672856, 0.7831629515, 0.8875148296, 0.1994995028, 0.4733638167, 0.6637079120, 0.5232052207, 0.3655065894, 0.9022576809, 0.8118068576, 0.9150025845, 0.2071812004, 0.1890738755, 0.1378510594, 0.4876725376, 0.9724591970, 0.0434577428, 0.6294749379, 0.4413352609, 0.8258503675, 0.5833554268, 0.5290913582, 0.4943334460, 0.7564342618, 0.3376268148, 0.3425724804, 0.0266606063, 0.1628193706, 0.9680745602, 0.9649032950, 0.2499305755, 0.4671396911, 0.5281094909, 0.5380572677, 0.0721625835, 0.8511772156, 0.4960800707, 0.4967344999, 0.7330691814, 0.8379134536, 0.8655492067, 0.1038426235, 0.9231342077, 0.4062736034, 0.6008942723, 0.1152886227, 0.9517539144, 0.2029400617, 0.6446030140, 0.8210463524, 0.3230097890, 0.9147670269, 0.6489494443, 0.6470196843, 0.8287582994, 0.2957482338, 0.8871055841, 0.0964815542, 0.3414789140, 0.3777032495, 0.8902522326, 0.0513543487, 0.1606709361, 0.5111185312, 0.8572279215, 0.3913396001, 0.5892121196, 0.8177532554, 0.1374619007, 0.8390021324, 0.2216492742, 0.8734615445, 0.9381905198, 0.7207130790, 0.9862372279, 0.6853882670, 0.2572508752, 0.7424813509, 0.8622077703, 0.3551430404, 0.4485941827, 0.0632376745, 0.0843723491, 0.7039324045, 0.6338085532, 0.8019008040, 0.0414752550, 0.8991216421, 0.5409822464, 0.1935869157, 0.3138661683, 0.6111229658, 0.2413249165, 0.6036468744, 0.9929109812, 0.3120322526, 0.3597521782, 0.3742128611, 0.4186046124, 0.9584820271, 0.3735245168, 0.6134418249, 0.0214710683, 0.1672390997, 0.3283538818, 0.9789927602, 0.7137935758, 0.3847201765, 0.2685694098, 0.2884021699, 0.2936516702, 0.6950673461, 0.8229674101, 0.1998685002, 0.8727016449, 0.6625831127, 0.0218836516, 0.1165794656, 0.4721002579, 0.4046968222, 0.0084477793, 0.5936535597, 0.9464355707, 0.8574189544, 0.6944460273};
+
+#endif
+
+#endif
@@ -0,0 +1,16 @@
+//Numpy array shape [64]
+//Min 0.000270137971
+//Max 0.996090948582
+//Number of zeros 0
+
+#ifndef B7_H_
+#define B7_H_
+
+#ifndef __SYNTHESIS__
+dense_bias_t b7[64];
+#else
+dense_bias_t b7[64] = {0.0567710176, 0.2982427776, 0.0887868479, 0.3828382790, 0.5107469559, 0.2871114314, 0.3848623335, 0.9960909486, 0.7610234618, 0.6344744563, 0.1592682153, 0.3485516608, 0.2658224702, 0.1357322484, 0.6686016917, 0.3681415319, 0.7104494572, 0.5869776607, 0.2923685014, 0.3208300471, 0.4586058557, 0.4402098358, 0.0760275796, 0.9873210192, 0.4721005261, 0.8942380548, 0.4397334754, 0.9325424433, 0.8907655478, 0.4857597351, 0.2492802292, 0.0002701380, 0.7139107585, 0.3702164888, 0.1014088169, 0.0043977369, 0.7167462707, 0.6175089478, 0.2638840973, 0.9083493352, 0.1943611801, 0.8758032322, 0.2484589815, 0.8673318028, 0.4538771510, 0.1445384622, 0.2965809405, 0.1448236108, 0.0338195898, 0.7772499919, 0.6791356802, 0.8966599703, 0.2047313154, 0.5167388320, 0.5104734898, 0.6084039211, 0.4351181090, 0.3248765767, 0.9426232576, 0.3066912889, 0.0790766999, 0.3240248561, 0.0605468974, 0.4032850862};
+
+#endif
+
+#endif
@@ -0,0 +1,16 @@
+//Numpy array shape [5]
+//Min 0.255126029253
+//Max 0.886145532131
+//Number of zeros 0
+
+#ifndef B9_H_
+#define B9_H_
+
+#ifndef __SYNTHESIS__
+dense_1_bias_t b9[5];
+#else
+dense_1_bias_t b9[5] = {0.8080440164, 0.8861455321, 0.4646534920, 0.2551260293, 0.6641478539};
+
+#endif
+
+#endif
@@ -0,0 +1,58 @@
+#include <iostream>
+
+#include "myproject.h"
+#include "parameters.h"
+
+
+void myproject(
+    hls::stream<input_t> &conv1d_input,
+    hls::stream<result_t> &layer10_out
+) {
+
+    // hls-fpga-machine-learning insert IO
+    #pragma HLS INTERFACE axis port=conv1d_input,layer10_out 
+    #pragma HLS DATAFLOW
+
+    // hls-fpga-machine-learning insert load weights
+#ifndef __SYNTHESIS__
+    static bool loaded_weights = false;
+    if (!loaded_weights) {
+        nnet::load_weights_from_txt<conv1d_weight_t, 24>(w2, "w2.txt");
+        nnet::load_weights_from_txt<conv1d_bias_t, 4>(b2, "b2.txt");
+        nnet::load_weights_from_txt<dense_weight_t, 3584>(w7, "w7.txt");
+        nnet::load_weights_from_txt<dense_bias_t, 64>(b7, "b7.txt");
+        nnet::load_weights_from_txt<dense_1_weight_t, 320>(w9, "w9.txt");
+        nnet::load_weights_from_txt<dense_1_bias_t, 5>(b9, "b9.txt");
+        loaded_weights = true;    }
+#endif
+    // ****************************************
+    // NETWORK INSTANTIATION
+    // ****************************************
+
+    // hls-fpga-machine-learning insert layers
+
+    hls::stream<conv1d_result_t> layer2_out("layer2_out");
+    #pragma HLS STREAM variable=layer2_out depth=14
+
+    hls::stream<layer5_t> layer5_out("layer5_out");
+    #pragma HLS STREAM variable=layer5_out depth=14
+
+    auto& layer6_out = layer5_out;
+    hls::stream<dense_result_t> layer7_out("layer7_out");
+    #pragma HLS STREAM variable=layer7_out depth=1
+
+    hls::stream<dense_1_result_t> layer9_out("layer9_out");
+    #pragma HLS STREAM variable=layer9_out depth=1
+
+    nnet::conv_1d_cl<input_t, conv1d_result_t, config2>(conv1d_input, layer2_out, w2, b2); // conv1d
+
+    nnet::relu<conv1d_result_t, layer5_t, relu_config5>(layer2_out, layer5_out); // activation
+
+    nnet::dense<layer5_t, dense_result_t, config7>(layer6_out, layer7_out, w7, b7); // dense
+
+    nnet::dense<dense_result_t, dense_1_result_t, config9>(layer7_out, layer9_out, w9, b9); // dense_1
+
+    nnet::softmax<dense_1_result_t, result_t, softmax_config10>(layer9_out, layer10_out); // dense_1_softmax
+
+}
+
@@ -0,0 +1,16 @@
+//Numpy array shape [56, 64]
+//Min 0.000352027710
+//Max 0.999790966511
+//Number of zeros 0
+
+#ifndef W7_H_
+#define W7_H_
+
+#ifndef __SYNTHESIS__
+dense_weight_t w7[3584];
+#else
+dense_weight_t w7[3584] = {0.3923099935, 0.6323114038, 0.5770045519, 0.7606908083, 0.3561576605, 0.1505186707, 0.7626536489, 0.4072652757, 0.4463660419, 0.1503061205, 0.7192683816, 0.5646078587, 0.7887089849, 0.7274876833, 0.3074277639, 0.8954691887, 0.1131496802, 0.9488857388, 0.2905885875, 0.7235009074, 0.3715229034, 0.6313021183, 0.4628539681, 0.0863048658, 0.7789023519, 0.0382261276, 0.4835350513, 0.8132339716, 0.2200245410, 0.9893733263, 0.8394711018, 0.4793636799, 0.0487128720, 0.8819575310, 0.9969602227, 0.8140931726, 0.6410411596, 0.6740247011, 0.0014129928, 0.6432682872, 0.5080610514, 0.1401076764, 0.1844185144, 0.8554413915, 0.6705218554, 0.6682327986, 0.2431815565, 0.1067843884, 0.0871427208, 0.8730252981, 0.7449025512, 0.2143615335, 0.8261609077, 0.2137355804, 0.3531118035, 0.7901699543, 0.9761382937, 0.5347683430, 0.9892677665, 0.3147898912, 0.2419877648, 0.4314892590, 0.9413888454, 0.1566458046, 0.6588407159, 0.0527857952, 0.7753074169, 0.1665893346, 0.8295869827, 0.1500609517, 0.4510123730, 0.8602601886, 0.3091204464, 0.6169121265, 0.8542976975, 0.3724499941, 0.4324995279, 0.2879606187, 0.6297922134, 0.3213870525, 0.3628352880, 0.7571871281, 0.4520952404, 0.3628639281, 0.1337109804, 0.6578658819, 0.9425165653, 0.1569336206, 0.9759964943, 0.9847679138, 0.1130103469, 0.3640264273, 0.4711151421, 0.2820262015, 0.4988026321, 0.3096822798, 0.2222989053, 0.7858648300, 0.6015058160, 0.4447665811, 0.4803232551, 0.7652378678, 0.2317916453, 0.3810392916, 0.0543169118, 0.7275586128, 0.3027894199, 0.6116207838, 0.3733153641, 0.6623026729, 0.3623203039, 0.9793422818, 0.2554485798, 0.0899035558, 0.5831174850, 0.8113638759, 0.4887557328, 0.8756626248, 0.2660836279, 0.0553588085, 0.5702835321, 0.5844323635, 0.7663170695, 0.2946872115, 0.5510332584, 0.2838460505, 0.2021204233, 0.1372310072, 0.1681182534, 0.9192038178, 0.7292827964, 0.4639204144, 0.1622840762, 0.1919337958, 0.5886098146, 0.6248613596, 0.9118715525, 0.8461734056, 0.6350643039, 0.6253307462, 0.8814346194, 0.4387718439, 0.7246989012, 0.7072482109, 0.7912703156, 0.6533880830, 0.2927577496, 0.3363869190, 0.9450112581, 0.3908933997, 0.0502371527, 0.5686800480, 0.3571200967, 0.3568975031, 0.7324399948, 0.6496615410, 0.9347006679, 0.7758902907, 0.2987321913, 0.6319116950, 0.3775790930, 0.4900220633, 0.5076416731, 0.5633872747, 0.5728195310, 0.3707406521, 0.4061157703, 0.1515949517, 0.8676482439, 0.4197749794, 0.7203451991, 0.8978785872, 0.4321371913, 0.8658814430, 0.0159224533, 0.8399484158, 0.0021820609, 0.5085643530, 0.2096592486, 0.7936978936, 0.3190851808, 0.2087114751, 0.7407459021, 0.1454568207, 0.7795119882, 0.2256814092, 0.2402967364, 0.0512430966, 0.9546827674, 0.0968551040, 0.1805581301, 0.5581630468, 0.5270861387, 0.8730992079, 0.5998532772, 0.5395961404, 0.2551886439, 0.3828842044, 0.6033735871, 0.3058757484, 0.0218092073, 0.0307515301, 0.6021620035, 0.8907405138, 0.1871861219, 0.5736701488, 0.2379251719, 0.9903236032, 0.3395764530, 0.8256201148, 0.3993806541, 0.4318991005, 0.1265384406, 0.0083865542, 0.0641366616, 0.2202326208, 0.8060226440, 0.6484025121, 0.1424961239, 0.3368687630, 0.4558864534, 0.4630686045, 0.7107890248, 0.3956717253, 0.1452233493, 0.5929076672, 0.4810888767, 0.5939880013, 0.6311104894, 0.3522880375, 0.2365353107, 0.3065155149, 0.4006737471, 0.3197607398, 0.4282616079, 0.0782493725, 0.9175584316, 0.5611062050, 0.2552514374, 0.0803154111, 0.0133236535, 0.5354449153, 0.4048404396, 0.6320636272, 0.1624709219, 0.4434217513, 0.7670696974, 0.8720791936, 0.2016117275, 0.2336928695, 0.5431727171, 0.4394185543, 0.1286956221, 0.2559128404, 0.0713115782, 0.6806009412, 0.1683232486, 0.0865729898, 0.9403551817, 0.3277957737, 0.9926151037, 0.7034530640, 0.2924906909, 0.3551949561, 0.7987375259, 0.6816395521, 0.7902311087, 0.7054404616, 0.7670828700, 0.9422353506, 0.7598167658, 0.1440790445, 0.3577455878, 0.0135033028, 0.9071480632, 0.6647081971, 0.8680464029, 0.2978907228, 0.5112330914, 0.8170377016, 0.5954257846, 0.4640021026, 0.5456752181, 0.5781900883, 0.3980995417, 0.1415627748, 0.7732300758, 0.2361949384, 0.6069214344, 0.1047272608, 0.4096990824, 0.2578624785, 0.3984426856, 0.3323140144, 0.4631653726, 0.2694871724, 0.9271960855, 0.6301385760, 0.6760392189, 0.4844771028, 0.4546535909, 0.3506881595, 0.2810389400, 0.7221477032, 0.4205111265, 0.7065785527, 0.9094526768, 0.3753474355, 0.3706166148, 0.4129002094, 0.2134492695, 0.4913169146, 0.3086525798, 0.4768600464, 0.8295872808, 0.4439727664, 0.6046867967, 0.3944043517, 0.5468913317, 0.4079758227, 0.2172157317, 0.6229369640, 0.9476651549, 0.7956027389, 0.1828857362, 0.4434444010, 0.2571754754, 0.9710524678, 0.0671706870, 0.9368783832, 0.5975342393, 0.0242560841, 0.5293100476, 0.6574269533, 0.8946552277, 0.4138201177, 0.5523470640, 0.1325690299, 0.5802230239, 0.9404748082, 0.7316294312, 0.9199987054, 0.1816023290, 0.4069554210, 0.8110241890, 0.6890259385, 0.2288761288, 0.5243527889, 0.5941983461, 0.2559868693, 0.1177516058, 0.6011037827, 0.9938858747, 0.5294774771, 0.6697161794, 0.8376192451, 0.9352516532, 0.7379942536, 0.3749368489, 0.3612463474, 0.1937544495, 0.2057399601, 0.8637387156, 0.5274860859, 0.7403340936, 0.0555520393, 0.5822657943, 0.9332721233, 0.3866693676, 0.4979749024, 0.9294227958, 0.1155523956, 0.9804385900, 0.3800538182, 0.7699964046, 0.0749478787, 0.5780582428, 0.6871740222, 0.7971988320, 0.1369961649, 0.4169577956, 0.2676182687, 0.3011959791, 0.2961823642, 0.7222008705, 0.6718237400, 0.7376327515, 0.0531066805, 0.5739700794, 0.6544775963, 0.0918422937, 0.2991338372, 0.4981577694, 0.0179607794, 0.7490162849, 0.9107212424, 0.4718014002, 0.9470052123, 0.2165137529, 0.5879424214, 0.0608329922, 0.3375976682, 0.9052837491, 0.8038016558, 0.1782283187, 0.1545188278, 0.0371998586, 0.7134469748, 0.5059409142, 0.7879914045, 0.0821978673, 0.6314892173, 0.4882256389, 0.4231954813, 0.2036073804, 0.5813922286, 0.3510479629, 0.6267257929, 0.6848698258, 0.1384911686, 0.7078629136, 0.7654113770, 0.7471737862, 0.0685588643, 0.4957947731, 0.5799086094, 0.2337942719, 0.7881794572, 0.1424487978, 0.2777685225, 0.4056687057, 0.1164065152, 0.6595981717, 0.1502568275, 0.4624171853, 0.7195744514, 0.1437588334, 0.0310570598, 0.3932061791, 0.4690487087, 0.3251195550, 0.8619375825, 0.0120111797, 0.8752545714, 0.5671915412, 0.8188600540, 0.5181208849, 0.8741086721, 0.6226040721, 0.7947135568, 0.5607979298, 0.2270468771, 0.1348177642, 0.6651976705, 0.1752529740, 0.3053843081, 0.7751000524, 0.9019801021, 0.3639496863, 0.9154907465, 0.9969355464, 0.4738936424, 0.8013367057, 0.9268071651, 0.6424815655, 0.2111488581, 0.0262091961, 0.8368167281, 0.6289293170, 0.8884149790, 0.0959064886, 0.3900883496, 0.5000126362, 0.5740571618, 0.2035379410, 0.0940106586, 0.3820004165, 0.4418636858, 0.7099570632, 0.3861108124, 0.4575793147, 0.7175723910, 0.8618485928, 0.2405952364, 0.7932037711, 0.6643068194, 0.2452973723, 0.7659693956, 0.3779232204, 0.8841874003, 0.9957967997, 0.3619246185, 0.6395947337, 0.9606161714, 0.3278698623, 0.8051448464, 0.0289192721, 0.4677563310, 0.3052589297, 0.3178718090, 0.9898974299, 0.4398552477, 0.0453386791, 0.5379127264, 0.5253331065, 0.1070785150, 0.1639207006, 0.4390288293, 0.2431355715, 0.7700747252, 0.2152696252, 0.6460679770, 0.5665540695, 0.9857231379, 0.0302745476, 0.3344413042, 0.7184489369, 0.7777470350, 0.0445074178, 0.3787804544, 0.8693017960, 0.6704089642, 0.7053383589, 0.2663371563, 0.4295028746, 0.5460273623, 0.2066909969, 0.5935674310, 0.8357495666, 0.4323141277, 0.0083066616, 0.3141404688, 0.2146337628, 0.6999293566, 0.9918099046, 0.8272427917, 0.9860680699, 0.9599488974, 0.9910216928, 0.8132972121, 0.2178461254, 0.1799666435, 0.7091330886, 0.5374196172, 0.2357998341, 0.4245866835, 0.8295408487, 0.8739810586, 0.4341533780, 0.2219133973, 0.2321911007, 0.3391266167, 0.6602950692, 0.3870171309, 0.2846486568, 0.2006089240, 0.3881811798, 0.5940151215, 0.4978193641, 0.9185243249, 0.5202406049, 0.5939767957, 0.6343175769, 0.6670017838, 0.4076263905, 0.5075821877, 0.3572569489, 0.8006818891, 0.8438165784, 0.8857440948, 0.7139365673, 0.3801214397, 0.7505885363, 0.5678069592, 0.3053455949, 0.8402926326, 0.4153207541, 0.1059410498, 0.1373942196, 0.2200140506, 0.4544436932, 0.3851472735, 0.3758701980, 0.3201604784, 0.5185033679, 0.1588692218, 0.1783414781, 0.2997125387, 0.9854127169, 0.9230366349, 0.3108202815, 0.5349324942, 0.2518448532, 0.4979168177, 0.8758701086, 0.9912240505, 0.2096451819, 0.1283104867, 0.1639221758, 0.9704886079, 0.4257215858, 0.8243265152, 0.8850131631, 0.9945203066, 0.8362796903, 0.8674349189, 0.3813726902, 0.0811517909, 0.8549602628, 0.0942283198, 0.2182732224, 0.4911104441, 0.9990748763, 0.1340101361, 0.9143227935, 0.0742464587, 0.0317294970, 0.4444670975, 0.1236613840, 0.5723895431, 0.2923056483, 0.0429721922, 0.2107738107, 0.2429501861, 0.4667335749, 0.1096700653, 0.7878583074, 0.4247483313, 0.4131672382, 0.9149039388, 0.3703867197, 0.8253656030, 0.7742533684, 0.0016297519, 0.4969982207, 0.7902860641, 0.2683231831, 0.8751482368, 0.7896087766, 0.6338026524, 0.4189620614, 0.9249402881, 0.5424085855, 0.2992745042, 0.8893792033, 0.1473102868, 0.4657201767, 0.8880619407, 0.1439161748, 0.0975838304, 0.7494304180, 0.3588117957, 0.4809372425, 0.1096575782, 0.2304369211, 0.2218722105, 0.1886782050, 0.2275322080, 0.4345754683, 0.9553250670, 0.4010018110, 0.1640555412, 0.3545907438, 0.3249304593, 0.0442204624, 0.1428472698, 0.7163990736, 0.8645089269, 0.7609021068, 0.2888631821, 0.1622057706, 0.9446689487, 0.0098038111, 0.7678324580, 0.5826193690, 0.2951220870, 0.7079897523, 0.7287878990, 0.3830273449, 0.5931364894, 0.6312380433, 0.6851806045, 0.3210469186, 0.2414230406, 0.0445906818, 0.2143735141, 0.2152104527, 0.8741769195, 0.2149700522, 0.1139322892, 0.8935634494, 0.3487735689, 0.1207285449, 0.9640069008, 0.4703054428, 0.5497698784, 0.2656887174, 0.4796196222, 0.4365755320, 0.6917999387, 0.7326216698, 0.9875587821, 0.5379517674, 0.9202930331, 0.2625499964, 0.2336522490, 0.6017482877, 0.1051645577, 0.1489574909, 0.7450132966, 0.4288109541, 0.6155253649, 0.3186922371, 0.6313056350, 0.6699518561, 0.7844910622, 0.8904754519, 0.8848067522, 0.5347884297, 0.9517748356, 0.2357881814, 0.6305269003, 0.1321650147, 0.3546041250, 0.9126391411, 0.8563991785, 0.8726243377, 0.0573370345, 0.6379389167, 0.7205967307, 0.2855923474, 0.6391458511, 0.2494370043, 0.4218541980, 0.6191903949, 0.8568918705, 0.3480683863, 0.7116895914, 0.8719983101, 0.9845612645, 0.9399345517, 0.0190442633, 0.5740265846, 0.8297091722, 0.6115363836, 0.1015630066, 0.4371595085, 0.2272202969, 0.2283717990, 0.8528804183, 0.2097328305, 0.4961521327, 0.1974252015, 0.1584348232, 0.2396381050, 0.6214849353, 0.6416431665, 0.1600570232, 0.5045588017, 0.6028977633, 0.8883880973, 0.4444861412, 0.1186625808, 0.4216574132, 0.1174357310, 0.5407392383, 0.3371512890, 0.3494021893, 0.2394340485, 0.8159396052, 0.1191354617, 0.2732998729, 0.1371693611, 0.5032435060, 0.6838871241, 0.5547419786, 0.1685322821, 0.6694913507, 0.9310416579, 0.2474409342, 0.7810115218, 0.6845035553, 0.5303421617, 0.6702749729, 0.3634726107, 0.6760445237, 0.9215301275, 0.8310957551, 0.1385498196, 0.9956498742, 0.4705082476, 0.6280382276, 0.7475225329, 0.2247734219, 0.0514617153, 0.1599738151, 0.8173946142, 0.0068663582, 0.5092918873, 0.4710219204, 0.2571322620, 0.1344673634, 0.7941683531, 0.9449523091, 0.3696326315, 0.6211709380, 0.5203096867, 0.8777827621, 0.5923674107, 0.4207574129, 0.6066625714, 0.4547018409, 0.4941857457, 0.3355763555, 0.2598699927, 0.1335666925, 0.4062896371, 0.4469011128, 0.6398530602, 0.7852180004, 0.8283719420, 0.3732429743, 0.5224553347, 0.8156075478, 0.9656304121, 0.4833261669, 0.2543818951, 0.0973108858, 0.0053854086, 0.4276076555, 0.8443004489, 0.2533586323, 0.8310559392, 0.6011028886, 0.4378660321, 0.9907319546, 0.3155162930, 0.3408742249, 0.4921895862, 0.4538934529, 0.6110070944, 0.1735014170, 0.0221989080, 0.8972432613, 0.9672777653, 0.9173077941, 0.6278412938, 0.7771834731, 0.6217763424, 0.1864503026, 0.6033316255, 0.8823769093, 0.0933218077, 0.3387344778, 0.1978702545, 0.2065874487, 0.1281495094, 0.6607467532, 0.6880405545, 0.3025141060, 0.0269998219, 0.9837325215, 0.2859520018, 0.6537957191, 0.4778509140, 0.6078663468, 0.6242389083, 0.6063429117, 0.2115670741, 0.8126660585, 0.5777301192, 0.0552063175, 0.4959360063, 0.1438178569, 0.2376724631, 0.6762668490, 0.1387289613, 0.7780677676, 0.4289350510, 0.2605465651, 0.1762652695, 0.2872199714, 0.2781530321, 0.4475326240, 0.9060345888, 0.7291108966, 0.6745555401, 0.4421319664, 0.1415782720, 0.3722774088, 0.1391040534, 0.3640275598, 0.2799856067, 0.0051129833, 0.4476513267, 0.0010576139, 0.1500709504, 0.9678656459, 0.3611174226, 0.3326930106, 0.6957367063, 0.7429206371, 0.9880357981, 0.7301700711, 0.9206190109, 0.1594475359, 0.7251405120, 0.9896805882, 0.4812294543, 0.4137035012, 0.1944568604, 0.9475886226, 0.6520022154, 0.1652834862, 0.9563273787, 0.7243419886, 0.5386579037, 0.1942285299, 0.7374085784, 0.7765734196, 0.9514240026, 0.0531860217, 0.2467179000, 0.5957959294, 0.9333398342, 0.4141036272, 0.1949317753, 0.8244038224, 0.1744851768, 0.1376646012, 0.9287551641, 0.5329076648, 0.0286578964, 0.0808051303, 0.1495844424, 0.8141192794, 0.9252954125, 0.3939419091, 0.2532109618, 0.2732501924, 0.5679821968, 0.8977271318, 0.4317667484, 0.0782934055, 0.2458937615, 0.3679975271, 0.7239058018, 0.1870146096, 0.2403780222, 0.9032586813, 0.5384446383, 0.7712778449, 0.0847563818, 0.0568839051, 0.7611989379, 0.2880018055, 0.8944529891, 0.7626447678, 0.6615375280, 0.9358185530, 0.5755854249, 0.4505304098, 0.4878205657, 0.2518122792, 0.8670710325, 0.6719300747, 0.3395170569, 0.4346677959, 0.9210960269, 0.6577081084, 0.4881288111, 0.6054899096, 0.6862629056, 0.2708716393, 0.6679879427, 0.5445016623, 0.1353777945, 0.5201231837, 0.4545252621, 0.1454253197, 0.7638137341, 0.6519114971, 0.9997909665, 0.2054472715, 0.2782309949, 0.1083354652, 0.6195032597, 0.8149277568, 0.0403462462, 0.8443309665, 0.6162257195, 0.5790295601, 0.4729007781, 0.7533009052, 0.2612620890, 0.2180073559, 0.8255534172, 0.8582820892, 0.5439596176, 0.3585117161, 0.9556918740, 0.1547891945, 0.3263812661, 0.6859382987, 0.8280162811, 0.0807190090, 0.6746141315, 0.9450079799, 0.9797332883, 0.2166674286, 0.3346449435, 0.7422843575, 0.7222820520, 0.0696288943, 0.3080500960, 0.4373175204, 0.6327053308, 0.5368647575, 0.4603186250, 0.4215275943, 0.4750197828, 0.5566321611, 0.5791387558, 0.4455113709, 0.8907957673, 0.7777953744, 0.6702137589, 0.5239882469, 0.1870392710, 0.7161701918, 0.6927866936, 0.5629443526, 0.0422263071, 0.6943045855, 0.1654812545, 0.9407066703, 0.5222331285, 0.2362886071, 0.9065733552, 0.3658126593, 0.4504900575, 0.8763896823, 0.5522015095, 0.3302870989, 0.9301091433, 0.5937392116, 0.0592568889, 0.8252512217, 0.1715374738, 0.6417969465, 0.5679312944, 0.5832126737, 0.7850360870, 0.4106301665, 0.5329172015, 0.5204787850, 0.1001384407, 0.2070813328, 0.9409253001, 0.2512727380, 0.2045717984, 0.8738144636, 0.2003593594, 0.2795098424, 0.2511441708, 0.2901749611, 0.1585027277, 0.1680729985, 0.4752788544, 0.8364733458, 0.7708752751, 0.7597378492, 0.5340596437, 0.0607165247, 0.8814251423, 0.6335130334, 0.2912278771, 0.8286088705, 0.2298347801, 0.0816543847, 0.1387680173, 0.3273622692, 0.2806135118, 0.8078322411, 0.4025052190, 0.5128505826, 0.4078038037, 0.3827980459, 0.7466789484, 0.9871477485, 0.4618398845, 0.9336736202, 0.4824807942, 0.2073512375, 0.5183394551, 0.7362257242, 0.0506678969, 0.4524488449, 0.8763801455, 0.0731280670, 0.2076695859, 0.2900539637, 0.2379444093, 0.9235610366, 0.9938019514, 0.1158743799, 0.4816899896, 0.5961698294, 0.1210545376, 0.1859124750, 0.0272868760, 0.2667948902, 0.6805650592, 0.4939332902, 0.8568457961, 0.1533274353, 0.2893484831, 0.9835572839, 0.7105176449, 0.3942555785, 0.1768216640, 0.4671871066, 0.9863118529, 0.7192590237, 0.8620121479, 0.7184491754, 0.0738521293, 0.8014004827, 0.6999248266, 0.6909988523, 0.5737642050, 0.2602625191, 0.6299912930, 0.1576594263, 0.5963866115, 0.1747433394, 0.9468657970, 0.2798191905, 0.9617174864, 0.6235782504, 0.5288116932, 0.0818118304, 0.1305067837, 0.1308092922, 0.9560689926, 0.1853939891, 0.6755547523, 0.2303090543, 0.9532416463, 0.7667805552, 0.5362062454, 0.5571433902, 0.2478597164, 0.9429533482, 0.6313713193, 0.8188882470, 0.7027277350, 0.9636037946, 0.4971856177, 0.6505934000, 0.2157048583, 0.7364642620, 0.1673772186, 0.6408430934, 0.3795114160, 0.4426250160, 0.1046255156, 0.6986517906, 0.3970181346, 0.0557772294, 0.7205273509, 0.2290043235, 0.0277024545, 0.1419599056, 0.9421821833, 0.5970398188, 0.5162669420, 0.8056439757, 0.6067160368, 0.1704023182, 0.4152280092, 0.3598077893, 0.0628838688, 0.1312389821, 0.1008167788, 0.9055387378, 0.9447542429, 0.2588604391, 0.5969145298, 0.4781576693, 0.4243792593, 0.5152294040, 0.0138115911, 0.2073657513, 0.9270054102, 0.6887222528, 0.3094267249, 0.3553660512, 0.8822507858, 0.9198530912, 0.9947870970, 0.5974704027, 0.3198658228, 0.3492868543, 0.8115734458, 0.7839604020, 0.7443760037, 0.3755037189, 0.2349735051, 0.5581849813, 0.4540917277, 0.2328778654, 0.0517887250, 0.5260795951, 0.0377681032, 0.3050232530, 0.9616097212, 0.7600014210, 0.9359540343, 0.5130752921, 0.0442201793, 0.5199068189, 0.6533181667, 0.4223493636, 0.7289364338, 0.4858370721, 0.7239177227, 0.2894303203, 0.5118165612, 0.9326321483, 0.9247314930, 0.5421116352, 0.7255272269, 0.0992830470, 0.3319853544, 0.9605455399, 0.3223626316, 0.9607991576, 0.5828429461, 0.9428130984, 0.6431158185, 0.4916016161, 0.9934293628, 0.8831612468, 0.6089193821, 0.3064683080, 0.3214001656, 0.7315788269, 0.4958854616, 0.9783388376, 0.6528039575, 0.4042564332, 0.1209589988, 0.9386304021, 0.8650942445, 0.6221199036, 0.6331345439, 0.3446663022, 0.5168855190, 0.0921548381, 0.4340696633, 0.5830484629, 0.4174345732, 0.5893600583, 0.4558260143, 0.2293173373, 0.6503883004, 0.2661678195, 0.8864557147, 0.2980415821, 0.1187276542, 0.9587904811, 0.1217442527, 0.9334023595, 0.7377928495, 0.1649442911, 0.9453539252, 0.4810751379, 0.3396221995, 0.0958974734, 0.8259742260, 0.7362834215, 0.5889245272, 0.8365486860, 0.5008015037, 0.8471511006, 0.7732658386, 0.3186917603, 0.6405247450, 0.5037165880, 0.0118740927, 0.9670036435, 0.3275954723, 0.3667778075, 0.8021630645, 0.8627960682, 0.3825348616, 0.5395908952, 0.6070470810, 0.2915185690, 0.2021784484, 0.2079678923, 0.1086607352, 0.9683560133, 0.9562075734, 0.1906302422, 0.6691719294, 0.2265029699, 0.4677391946, 0.7953780293, 0.8285425305, 0.2761434317, 0.1566041112, 0.5036243796, 0.4732640982, 0.2924837470, 0.0161104165, 0.5929132104, 0.9942971468, 0.5731492639, 0.9931007028, 0.6402083039, 0.9647656679, 0.0095561845, 0.5274533033, 0.7621752024, 0.6000511050, 0.9206729531, 0.7790252566, 0.2237468660, 0.5725997090, 0.0879884511, 0.0909230635, 0.5971802473, 0.7729580998, 0.2494864911, 0.5311942101, 0.8414164186, 0.1949306577, 0.4282709956, 0.9147180319, 0.0940206945, 0.7152631879, 0.4816144109, 0.6096912026, 0.1006795466, 0.7416881323, 0.7050893903, 0.8802996874, 0.5793098211, 0.2467206120, 0.0884682089, 0.0066739810, 0.9984889030, 0.7663202286, 0.3368207514, 0.1282162368, 0.6762196422, 0.4590539038, 0.0609854497, 0.8683086038, 0.9549797773, 0.0351904333, 0.5305355787, 0.5321579576, 0.2218283862, 0.3918571770, 0.1766660362, 0.7504371405, 0.2301988453, 0.5284097195, 0.2378499359, 0.7042589784, 0.7842283845, 0.0549069047, 0.4558183253, 0.9446288347, 0.3360298276, 0.4544088542, 0.9946317673, 0.2035185099, 0.0563970134, 0.2559302449, 0.6357229948, 0.5982323289, 0.0057049277, 0.7930889726, 0.4756200314, 0.7446405888, 0.7268369198, 0.4025489688, 0.8128305674, 0.6726416349, 0.1709520817, 0.3023540676, 0.3115774691, 0.5886758566, 0.3201386929, 0.1613568366, 0.3833606839, 0.5869554877, 0.1117340401, 0.2563003302, 0.0280295387, 0.6671685576, 0.2372466177, 0.7751660347, 0.8329225183, 0.3427434862, 0.5088083744, 0.7369484305, 0.9635813236, 0.7628145218, 0.8234236240, 0.7561430931, 0.1504363865, 0.4213052988, 0.5823871493, 0.6511816978, 0.9513503313, 0.0131538957, 0.3994441628, 0.3544508815, 0.6113228202, 0.9457077980, 0.1147638485, 0.3973635733, 0.6055871844, 0.6707242727, 0.0269836485, 0.0955354571, 0.6026995182, 0.7208869457, 0.0755585805, 0.6769406199, 0.9414657354, 0.8901366591, 0.2699798346, 0.8037152290, 0.6899914742, 0.0213480145, 0.8756233454, 0.9724918604, 0.6525502801, 0.0532029718, 0.2302736193, 0.3968341649, 0.1298393607, 0.5299014449, 0.6893851161, 0.5408474207, 0.0979394987, 0.8411830664, 0.3647046387, 0.9644949436, 0.3155989945, 0.8188266158, 0.1867217273, 0.2460914850, 0.6916090250, 0.9254650474, 0.8828625083, 0.0911734179, 0.1132048517, 0.8537789583, 0.5291222334, 0.4915642738, 0.4942168295, 0.0421365313, 0.7812606096, 0.6428963542, 0.0441351384, 0.3996917009, 0.3119717240, 0.8596417308, 0.5600371361, 0.2789233625, 0.9748954773, 0.7149629593, 0.3432536721, 0.6030373573, 0.3948434889, 0.9878584743, 0.2668825090, 0.8152543306, 0.0307103004, 0.4222208858, 0.4362209439, 0.6500046253, 0.4020331204, 0.5220125914, 0.1431736499, 0.0216102190, 0.5987333655, 0.7332147360, 0.5725464821, 0.8593600392, 0.6431248188, 0.4309558570, 0.9729862213, 0.2017103434, 0.0046456289, 0.7221394777, 0.1177289113, 0.7157254219, 0.0170885604, 0.3159429431, 0.9015219212, 0.1521186531, 0.9411718845, 0.1163152978, 0.0840217471, 0.9536591172, 0.7459018826, 0.7167869806, 0.1710792482, 0.4216113389, 0.0509067848, 0.9891062379, 0.5308858752, 0.8218401074, 0.4640982747, 0.9853966236, 0.3566586673, 0.3971004486, 0.1223252267, 0.3680031598, 0.5023953319, 0.2153901309, 0.9718310833, 0.8313452005, 0.9860033989, 0.7481234074, 0.3621875644, 0.0693108067, 0.6905636787, 0.7951607704, 0.9847065210, 0.0304340012, 0.5330433249, 0.5769462585, 0.3725036681, 0.0461165234, 0.5646792054, 0.4645336866, 0.3940739632, 0.7167607546, 0.7346121669, 0.6273232102, 0.2937439680, 0.9588651657, 0.0116311861, 0.6140328646, 0.8501550555, 0.6009920835, 0.8273696899, 0.1361009330, 0.3169413209, 0.2465545684, 0.2180652916, 0.5664446950, 0.7574977875, 0.1223515049, 0.9166877270, 0.8589372635, 0.4997047782, 0.0509826578, 0.3709890842, 0.3268811405, 0.7219507098, 0.5965916514, 0.7941697240, 0.7018160820, 0.5627044439, 0.5849676728, 0.0485267900, 0.5903816819, 0.9976199865, 0.8709512949, 0.4130219817, 0.0403015167, 0.5558850765, 0.6791298985, 0.5068258047, 0.5248994827, 0.2370055467, 0.3190897107, 0.1336979866, 0.1038857326, 0.0037311777, 0.0626119673, 0.2581802309, 0.3863533139, 0.0245405305, 0.9581650496, 0.7632230520, 0.6462952495, 0.2685043216, 0.5198068023, 0.0502965078, 0.8711931109, 0.7908806801, 0.4716139138, 0.1183526218, 0.0852423310, 0.4724273086, 0.7530815005, 0.9423367381, 0.1628680676, 0.2768674791, 0.1879549026, 0.2668684721, 0.8816149831, 0.9520081282, 0.0794819891, 0.5826239586, 0.4435202181, 0.4906611741, 0.8165611625, 0.7622789145, 0.1464361995, 0.2399816811, 0.3948039114, 0.0283932760, 0.1988312453, 0.2325180024, 0.4834676981, 0.9989365339, 0.1553155035, 0.4265536070, 0.6846555471, 0.3485158086, 0.5323897004, 0.6282519698, 0.6571463943, 0.4877255261, 0.1974286139, 0.3702051640, 0.5700919032, 0.1433810145, 0.6923987269, 0.8676311970, 0.0115878340, 0.0676669627, 0.8575822711, 0.2359311134, 0.7102304697, 0.0181900933, 0.3165073097, 0.8452299237, 0.4709821045, 0.5354022384, 0.9222402573, 0.8513365388, 0.9675956964, 0.6308671832, 0.2044961601, 0.2162128985, 0.5836413503, 0.8782748580, 0.8205031753, 0.7363280058, 0.0874729380, 0.0315373652, 0.6103300452, 0.1676215082, 0.3322652876, 0.7085433602, 0.6850520968, 0.4822062552, 0.8750558496, 0.6758410335, 0.6164347529, 0.4047367573, 0.8425908089, 0.2178364992, 0.1440612376, 0.5909338593, 0.9989240766, 0.0576720200, 0.6044996977, 0.2324449718, 0.3743900657, 0.0118082818, 0.6591885090, 0.6521500349, 0.7868876457, 0.6317890286, 0.7535806298, 0.3228686750, 0.6532118917, 0.9968181849, 0.3347457647, 0.8955730200, 0.3349561691, 0.5949519277, 0.0997895747, 0.0919901729, 0.9085917473, 0.7141831517, 0.1005639806, 0.2762994170, 0.3223187923, 0.0003520277, 0.7686277628, 0.1496001035, 0.8633199334, 0.2715979517, 0.0607206151, 0.2821823061, 0.0380654447, 0.9029126763, 0.9696642160, 0.9632812738, 0.3184299767, 0.3329160810, 0.1754160076, 0.7241161466, 0.9082822800, 0.8848108649, 0.8805533051, 0.0194403306, 0.5921267271, 0.4412244558, 0.1251580864, 0.1797710061, 0.5638274550, 0.1787211448, 0.1512070745, 0.4685532451, 0.1066715717, 0.9477159381, 0.7179515958, 0.6868522763, 0.2101238817, 0.3118452728, 0.0934039652, 0.8787260652, 0.8147104383, 0.6214279532, 0.7762285471, 0.0850708485, 0.2362549752, 0.6624122858, 0.0202077106, 0.5988450050, 0.6583704948, 0.5723592639, 0.6626819968, 0.4481961131, 0.4942946136, 0.8541182280, 0.2630612850, 0.4237085581, 0.0596117117, 0.0532456525, 0.9005268216, 0.8667258620, 0.4528067708, 0.4310731888, 0.3113718033, 0.2046827376, 0.8902164102, 0.1247342005, 0.1673765332, 0.1980271488, 0.0134783871, 0.3293447495, 0.0281991530, 0.8045611382, 0.8153492212, 0.1257450134, 0.0535568483, 0.5793659687, 0.8227538466, 0.5865240097, 0.6173772216, 0.8204426169, 0.8442500830, 0.4785363376, 0.6834665537, 0.9332922101, 0.3082633018, 0.1559571028, 0.4637213349, 0.3762382269, 0.1087065861, 0.3201385736, 0.0854265466, 0.7903857827, 0.7366104126, 0.3986259401, 0.5227637887, 0.7376947999, 0.8551566601, 0.3635484576, 0.4655979276, 0.4418248236, 0.8841946125, 0.7744737267, 0.4700770676, 0.1108049378, 0.4406678081, 0.9560449719, 0.1833096743, 0.8828579783, 0.8058756590, 0.7609461546, 0.4789356291, 0.9341493249, 0.9187000990, 0.6384280920, 0.7479345202, 0.0110826874, 0.5121876001, 0.3877424598, 0.5930077434, 0.3435141742, 0.4832127094, 0.6780783534, 0.6864765286, 0.6773238182, 0.9767996073, 0.4386961162, 0.9132117629, 0.5310507417, 0.6897837520, 0.7418649793, 0.4634839594, 0.7887191772, 0.4429560006, 0.3532742560, 0.9705665708, 0.7335340977, 0.3070202768, 0.0200917777, 0.4919478297, 0.9947076440, 0.6327857971, 0.1048567221, 0.7503871918, 0.1524554640, 0.5709716678, 0.1436084062, 0.8016651273, 0.9181947708, 0.2792409360, 0.9739503264, 0.5300047398, 0.9429857135, 0.8258767128, 0.9502012134, 0.2473784834, 0.9852446914, 0.8518322110, 0.8111362457, 0.1368929893, 0.3716373146, 0.9321618676, 0.1555537879, 0.8131671548, 0.4739854336, 0.0160564184, 0.8049254417, 0.7489868999, 0.4305872917, 0.2961754799, 0.8650515079, 0.7386158705, 0.2827741802, 0.7815401554, 0.4649183452, 0.0991156474, 0.0783126429, 0.4116801023, 0.3519174457, 0.9964285493, 0.8136039376, 0.5079423785, 0.8464072943, 0.2338220775, 0.8522745967, 0.6785098910, 0.0137223611, 0.9717102051, 0.5721008182, 0.2882795036, 0.8092339039, 0.3334335089, 0.7853457332, 0.6586880088, 0.5814850330, 0.2532729805, 0.2401156873, 0.3521651924, 0.9900544286, 0.9116744399, 0.0353531539, 0.7449236512, 0.4250630736, 0.2603299022, 0.2000986785, 0.4706325233, 0.9255868793, 0.9704233408, 0.4463805556, 0.9699465632, 0.7192515135, 0.5421447754, 0.5340929627, 0.2235602438, 0.9571589231, 0.7073158026, 0.1190394461, 0.3242747784, 0.2380955666, 0.3761562407, 0.1911694258, 0.5991817117, 0.5949956775, 0.5403618813, 0.9322862625, 0.6312049031, 0.8040711880, 0.4528831542, 0.8056524992, 0.6848978996, 0.4923756421, 0.5225178003, 0.8172703981, 0.8907880187, 0.2812850177, 0.3124063611, 0.9157313704, 0.6023458838, 0.2144122422, 0.1940834522, 0.6483176947, 0.9477812648, 0.9034327269, 0.9865388274, 0.2528447509, 0.7038760781, 0.4300874770, 0.4801628590, 0.7627384067, 0.3523295224, 0.4856880605, 0.5329024792, 0.8850166798, 0.2260378450, 0.5330270529, 0.0103055630, 0.0687237158, 0.2107842565, 0.6439819336, 0.3944153190, 0.2236439139, 0.9517678022, 0.4633954763, 0.6525653601, 0.4687431753, 0.0164233074, 0.5688109994, 0.4671548605, 0.5594219565, 0.0572327487, 0.7915166020, 0.8485048413, 0.5096635222, 0.5222772956, 0.3314641416, 0.6621866822, 0.2849774063, 0.0821338296, 0.0357915908, 0.8429104686, 0.8413015604, 0.4642966688, 0.1519374698, 0.4117062688, 0.3306622505, 0.1907802373, 0.6864353418, 0.2860522568, 0.3214294910, 0.4448406100, 0.0693380162, 0.4776945710, 0.5451356769, 0.0355702862, 0.5447374582, 0.0443569310, 0.9995696545, 0.1415034086, 0.9979852438, 0.4065366387, 0.4757174551, 0.9000744224, 0.6578561068, 0.9067468643, 0.6406660080, 0.2477123290, 0.5796017647, 0.6658034921, 0.8836356401, 0.5256012082, 0.7028276324, 0.9899117351, 0.7995045781, 0.2790762186, 0.3469316661, 0.5860974789, 0.3096106946, 0.3334266543, 0.6662710905, 0.2747338414, 0.5560632944, 0.9065669775, 0.0721998736, 0.3857591450, 0.8738433123, 0.5606846213, 0.2601183057, 0.3954824805, 0.9072482586, 0.0472899228, 0.2222302705, 0.0730427057, 0.4183517396, 0.7359589934, 0.0712532029, 0.5064461827, 0.4009948373, 0.0411178656, 0.6033710241, 0.0052974061, 0.3522032499, 0.4343501329, 0.1535822004, 0.7436860204, 0.9143840671, 0.1681746691, 0.1766848266, 0.3761621714, 0.8510550857, 0.9531387091, 0.2829015255, 0.4563178420, 0.9892183542, 0.0035254632, 0.4345549047, 0.9604374766, 0.2175333649, 0.5503115058, 0.2108035684, 0.5872978568, 0.6231806874, 0.5416286588, 0.0607315674, 0.0219391119, 0.7850779891, 0.1216343567, 0.3862539232, 0.4683485031, 0.5026823878, 0.8431316614, 0.4462018311, 0.4766125679, 0.0833773315, 0.8511910439, 0.3966857791, 0.6859014034, 0.4166367054, 0.8015251160, 0.3384422660, 0.0246566199, 0.5534611940, 0.0773368776, 0.0161755197, 0.9321749806, 0.6318099499, 0.1504098028, 0.2688548863, 0.7666574121, 0.3444184661, 0.8530926108, 0.6490810513, 0.6057139635, 0.3398787677, 0.0192569830, 0.8095564246, 0.7062893510, 0.6008213758, 0.7149674296, 0.7969887257, 0.7187321782, 0.2196721286, 0.1611298174, 0.3179827034, 0.8425953388, 0.0574370027, 0.3617188632, 0.2822249830, 0.9509398937, 0.8730472326, 0.7743605971, 0.2953323424, 0.9751446247, 0.6202087402, 0.8866838217, 0.8405093551, 0.2516427040, 0.1317420304, 0.0487301834, 0.9996578693, 0.6420257092, 0.0455254465, 0.2955715656, 0.9461299777, 0.2791070044, 0.0447837561, 0.0551853403, 0.1354644150, 0.3987142742, 0.4155998230, 0.9059269428, 0.1079636440, 0.6011692286, 0.9577605128, 0.7978867292, 0.9309536815, 0.5241838694, 0.1809068173, 0.1677124351, 0.4130423069, 0.5698184371, 0.3521368206, 0.9038003087, 0.2052593976, 0.9081873298, 0.4361298978, 0.3131034970, 0.8602368832, 0.6471219659, 0.5763102770, 0.0452880040, 0.4152196348, 0.2639432549, 0.4113052785, 0.1156856641, 0.8911537528, 0.7486702204, 0.2831435800, 0.3098324835, 0.3890507221, 0.0705879927, 0.2971324325, 0.6614809632, 0.0526495464, 0.1891292483, 0.6576374769, 0.3957411945, 0.1514748335, 0.3517734110, 0.7844328284, 0.5694228411, 0.4425826967, 0.8268089294, 0.3689901233, 0.5892061591, 0.0787537694, 0.6799734831, 0.6134599447, 0.4001022875, 0.1540859491, 0.3633368909, 0.8253114820, 0.2090160698, 0.7330470681, 0.4617452025, 0.1949534565, 0.8310600519, 0.8453045487, 0.3207009137, 0.0186713915, 0.0658798665, 0.1353405118, 0.0418459140, 0.6546776891, 0.0140708694, 0.0135065801, 0.7694759369, 0.9077908993, 0.3531954885, 0.6740269065, 0.3841003180, 0.7320896983, 0.2951523960, 0.2708039880, 0.9712206721, 0.1896185428, 0.3647133708, 0.8603054285, 0.1526331306, 0.3510349691, 0.5375735164, 0.0605799593, 0.9342558980, 0.4122142494, 0.5643566847, 0.3967091739, 0.1684267670, 0.5610111952, 0.2705645561, 0.6436548233, 0.2796345651, 0.9456375837, 0.8209047318, 0.2748839557, 0.7187232375, 0.7408701181, 0.2290019989, 0.8950892687, 0.9220336676, 0.2466865033, 0.8053064346, 0.9093796015, 0.0135598257, 0.5429777503, 0.9225080013, 0.5592688918, 0.1967344880, 0.1394847184, 0.3819569945, 0.9400693178, 0.3441047668, 0.8817942142, 0.1015041023, 0.3896122277, 0.4533442855, 0.8172811866, 0.2318708450, 0.1393599063, 0.3642656207, 0.7497212291, 0.3362207711, 0.5988240242, 0.1240353286, 0.6983296275, 0.7017959356, 0.4997813702, 0.9396716356, 0.8876798749, 0.9831334949, 0.0247779880, 0.0652971268, 0.5914224982, 0.4999584556, 0.9511116147, 0.7387163043, 0.2934665382, 0.3708194494, 0.0929324180, 0.7035729885, 0.5196372867, 0.4259073734, 0.0508646742, 0.2224059999, 0.7663229704, 0.7201321721, 0.1171238869, 0.1141495854, 0.4692813754, 0.9702683091, 0.2022633702, 0.8508640528, 0.4611828923, 0.5376698375, 0.6954745054, 0.2632848620, 0.8266261220, 0.8124155998, 0.9712088108, 0.1018801555, 0.4389522374, 0.4603040516, 0.6637616158, 0.2131837159, 0.2688545883, 0.2771772444, 0.0548935160, 0.1226970777, 0.0448333248, 0.1810436547, 0.1837379783, 0.2875483930, 0.1326844692, 0.0676802993, 0.3329752088, 0.7171636224, 0.3255466223, 0.7211515307, 0.6963088512, 0.7505282164, 0.6746468544, 0.9890980124, 0.4233328998, 0.5531591773, 0.1372153461, 0.1205489263, 0.4314298630, 0.3473579586, 0.5737830400, 0.5037417412, 0.3441242874, 0.0377972312, 0.6484987736, 0.4720397592, 0.7798507214, 0.4357712865, 0.3604620099, 0.9915325642, 0.3342287540, 0.7651667595, 0.3945558369, 0.3016108572, 0.5282767415, 0.2354200035, 0.1431716383, 0.1781232506, 0.3048273027, 0.4775684476, 0.3865225315, 0.3496805429, 0.4469959736, 0.6062294245, 0.8265469670, 0.7027460933, 0.6003381014, 0.5005695224, 0.3674014211, 0.2410256863, 0.5408439636, 0.8032340407, 0.7944348454, 0.6960042119, 0.0550128333, 0.9298188686, 0.6444571614, 0.2512660325, 0.0359651074, 0.4048529267, 0.3336036205, 0.3602888882, 0.9182822108, 0.4947898686, 0.4778788388, 0.8074632883, 0.6821964979, 0.9706959128, 0.8018404841, 0.1838428974, 0.0033622147, 0.3347468674, 0.8769711852, 0.5296921730, 0.8263303041, 0.4632117748, 0.1138648614, 0.1967781335, 0.1379830390, 0.7084752321, 0.4122619033, 0.0095868232, 0.3836052418, 0.9182620049, 0.2815193534, 0.8100102544, 0.4542051554, 0.0507276431, 0.5559055805, 0.1490315348, 0.9382701516, 0.5401405096, 0.1828612685, 0.0544930883, 0.8420676589, 0.5789160132, 0.2663093209, 0.2396693826, 0.1661774814, 0.2260024399, 0.9841395617, 0.4781255424, 0.8292454481, 0.7385677099, 0.3522373736, 0.1814307868, 0.5172615051, 0.2222199440, 0.0011810199, 0.0807635263, 0.5191719532, 0.2664699554, 0.1549129039, 0.6530045271, 0.9282042384, 0.4703814685, 0.2755874097, 0.4814977944, 0.5637854338, 0.8035612106, 0.2534448504, 0.1628024280, 0.0946775526, 0.7336621284, 0.2941483855, 0.2626497746, 0.4243126512, 0.2490205467, 0.9065515995, 0.0848888233, 0.8602179289, 0.2156939358, 0.3180757463, 0.9665278196, 0.5854644775, 0.2309906036, 0.0817145333, 0.6195739508, 0.5875916481, 0.9499522448, 0.3210708797, 0.6181189418, 0.3286612928, 0.0363139436, 0.2842394114, 0.8004232049, 0.3834462762, 0.9586653113, 0.7896637917, 0.1981976181, 0.3519225121, 0.8666735888, 0.3391388953, 0.9182189107, 0.1156018376, 0.6206139326, 0.6469193697, 0.1030360088, 0.6271405816, 0.0019069811, 0.2041324526, 0.4761263430, 0.2622559667, 0.2535680234, 0.4893630743, 0.7911339998, 0.2077280134, 0.9921864271, 0.5523468852, 0.4111197889, 0.8380046487, 0.9556704164, 0.3990512788, 0.3626824021, 0.9473322630, 0.0680784732, 0.4944491088, 0.5676504970, 0.0376513787, 0.3394692242, 0.9594661593, 0.4606192410, 0.1161975265, 0.3594207466, 0.6825069785, 0.3069005013, 0.8576214910, 0.7838943005, 0.1378559917, 0.4876600206, 0.6361434460, 0.3717387021, 0.4368418157, 0.5804747343, 0.7310023904, 0.9721606970, 0.7409614921, 0.8703849316, 0.7240014672, 0.6738058925, 0.1193773597, 0.0065241382, 0.5318835974, 0.5661029816, 0.1108781099, 0.3291402161, 0.2257509679, 0.0514196940, 0.0698214695, 0.6979810596, 0.4967646301, 0.4313236177, 0.8469777703, 0.8751004934, 0.9107724428, 0.4849687219, 0.0535035245, 0.0169941764, 0.4828434289, 0.6927354932, 0.4227525294, 0.0188895948, 0.7126809359, 0.2401460260, 0.0862019882, 0.8500173092, 0.5050643682, 0.2711411417, 0.0169736203, 0.4929710925, 0.1455443054, 0.3952206969, 0.1112856865, 0.2153676450, 0.9484126568, 0.2996243834, 0.1263635457, 0.1675837189, 0.2972622514, 0.7870541215, 0.5701718926, 0.2360094041, 0.3477410376, 0.2710087299, 0.4207212329, 0.3236128688, 0.7419646978, 0.4514924586, 0.0567966923, 0.6868560314, 0.4170076549, 0.0878201798, 0.0129418103, 0.7903922796, 0.2691489756, 0.2054733932, 0.7213490605, 0.5070368648, 0.1033820882, 0.2362880707, 0.2634310424, 0.1744844168, 0.2055219412, 0.8014989495, 0.0781772137, 0.9842821360, 0.2391880453, 0.6015396118, 0.3606270850, 0.2630085647, 0.1312228590, 0.2615314126, 0.0082144178, 0.3169689476, 0.7513039708, 0.4131301641, 0.1771136820, 0.8692048192, 0.6321512461, 0.4114408493, 0.9393451810, 0.6219807863, 0.7447595000, 0.9418262243, 0.8666031361, 0.9326272607, 0.6094709039, 0.7380073071, 0.7383887172, 0.8865253329, 0.1132378951, 0.7970628142, 0.8012031317, 0.6293885708, 0.9495968223, 0.2543193996, 0.7077538371, 0.5576937199, 0.2365309447, 0.3050884604, 0.7453198433, 0.6229108572, 0.1335145682, 0.7117285132, 0.0966148302, 0.7566501498, 0.7678463459, 0.7679852843, 0.3975887299, 0.1595266163, 0.7248345613, 0.2614553869, 0.9894965291, 0.5731526017, 0.2328770310, 0.1222670898, 0.7074818015, 0.7306245565, 0.5298443437, 0.1054752171, 0.1776863784, 0.2792764306, 0.8663479090, 0.2131406963, 0.3862123489, 0.5812420845, 0.4765644670, 0.3221104741, 0.1140807644, 0.1980256587, 0.9651449919, 0.0782856420, 0.3570013344, 0.2903439701, 0.3568674624, 0.1193211004, 0.6145961285, 0.2668595314, 0.8935683966, 0.8489172459, 0.3095287383, 0.5012086630, 0.2241657823, 0.7120381594, 0.7502955198, 0.5364589095, 0.9435514808, 0.9075728655, 0.1233799607, 0.2361088693, 0.5222209692, 0.2862448990, 0.9855686426, 0.2972302437, 0.7305710316, 0.8521706462, 0.3284623623, 0.6287298799, 0.6720229387, 0.9017798901, 0.7767776847, 0.0791798458, 0.1154247895, 0.1148417965, 0.5060127378, 0.8903360963, 0.8919528127, 0.1094948724, 0.1807422489, 0.1788277477, 0.5979296565, 0.5753059983, 0.6523712277, 0.4142498970, 0.1208147779, 0.3753239512, 0.9625520706, 0.1553161442, 0.8688812852, 0.7580512166, 0.4734930396, 0.2752642632, 0.7554056048, 0.8486290574, 0.9977756143, 0.3378621936, 0.6109514832, 0.2463858575, 0.0499531403, 0.6082927585, 0.5293549299, 0.1660859734, 0.0373108014, 0.3464286923, 0.1646003127, 0.0130018182, 0.7745707631, 0.4273620546, 0.6507807374, 0.2726004720, 0.2521581650, 0.5276461244, 0.7887634635, 0.5697463751, 0.1374518573, 0.2723312378, 0.9871698618, 0.3816009164, 0.1821086258, 0.0345897153, 0.3961936831, 0.7117126584, 0.5871990919, 0.9761496186, 0.5154483914, 0.7990732789, 0.2617583573, 0.3461477160, 0.8397584558, 0.5370748043, 0.5607022643, 0.7477866411, 0.0446242727, 0.1191577390, 0.4756568074, 0.9978515506, 0.4971213639, 0.8539225459, 0.9995734096, 0.2252370268, 0.8199499249, 0.0038691498, 0.4222893417, 0.7533197999, 0.1024201959, 0.9505804777, 0.9523913860, 0.0266965646, 0.0137022873, 0.5536903739, 0.4990284443, 0.1444913149, 0.7819315195, 0.8198036551, 0.5009635687, 0.9540163279, 0.1649705768, 0.2789101899, 0.2728050649, 0.9744434953, 0.5153465271, 0.9147881866, 0.9649431109, 0.6492278576, 0.9651066065, 0.2174914777, 0.1878569722, 0.5186825991, 0.2799206078, 0.6782440543, 0.3454824090, 0.1464521587, 0.7327647209, 0.1150765270, 0.5768687129, 0.3467476070, 0.0903378725, 0.5547367334, 0.1159903035, 0.3169696629, 0.2999873459, 0.6066057086, 0.5237975717, 0.3537903428, 0.8960390687, 0.2128047943, 0.4172974229, 0.3859505653, 0.9021972418, 0.1604686379, 0.3113895059, 0.1744850725, 0.3932586610, 0.7180839777, 0.3374956548, 0.5795282125, 0.7110267282, 0.4942747653, 0.5515527129, 0.8983954787, 0.7204726338, 0.6488645673, 0.4898959398, 0.4681120813, 0.4482846856, 0.9649087787, 0.6962869763, 0.8552571535, 0.7507811189, 0.0873849541, 0.1313656569, 0.5120428801, 0.1895001382, 0.1643900275, 0.4674724936, 0.8084926605, 0.6358018517, 0.6547549367, 0.3295555413, 0.5865309834, 0.9620548487, 0.6787899137, 0.7060500979, 0.2475828230, 0.9150737524, 0.2380310893, 0.6173917055, 0.8061924577, 0.5721902251, 0.3042944074, 0.1055624783, 0.3667130470, 0.8983058929, 0.6725613475, 0.4145723581, 0.1248441339, 0.1908687800, 0.0244326275, 0.2705822289, 0.1044620052, 0.2375831902, 0.0071423394, 0.5848001838, 0.3134537339, 0.0927832946, 0.8346012235, 0.9281138182, 0.1162135750, 0.0476071797, 0.8252582550, 0.3023175597, 0.9389535785, 0.3704865277, 0.1061502695, 0.1517368406, 0.5818558931, 0.0633985847, 0.1103518158, 0.2871476412, 0.9642909169, 0.9334849715, 0.6435548067, 0.6593043804, 0.0126960566, 0.1146632135, 0.8206884265, 0.0789935440, 0.3292253315, 0.7225806713, 0.1898539811, 0.5062881112, 0.2982816696, 0.8892892003, 0.8707681894, 0.7425407767, 0.6684978008, 0.2821817398, 0.7781862617, 0.9906039834, 0.4580972195, 0.5441473722, 0.1444193721, 0.1037382632, 0.0615408234, 0.9799353480, 0.4068668485, 0.8165425062, 0.0170822740, 0.1560622454, 0.7627376914, 0.6685640216, 0.0917997062, 0.8080766201, 0.3461782932, 0.3500312865, 0.0367848687, 0.5795137286, 0.0109878648, 0.1147907972, 0.5724000931, 0.9711813331, 0.5776393414, 0.1722245067, 0.7964783311, 0.2711298764, 0.9826220870, 0.2643266916, 0.1732801646, 0.0371949300, 0.9401311278, 0.5883798003, 0.4156229794, 0.1207509115, 0.2842034101, 0.6701596379, 0.9129178524, 0.4231925607, 0.9279046059, 0.9171594381, 0.0411388166, 0.2032364458, 0.9336636066, 0.2685084939, 0.6799752116, 0.2184536010, 0.4483481050, 0.8023278713, 0.4379149675, 0.6107710600, 0.0903069004, 0.5973502398, 0.9782598615, 0.8939964175, 0.6549727321, 0.5025368333, 0.7880414724, 0.7830491662, 0.6463606954, 0.4699508250, 0.4670467973, 0.8597785234, 0.6813794374, 0.5777842402, 0.1603297442, 0.2557141483, 0.6860457063, 0.8585629463, 0.7466382980, 0.0328679159, 0.0495946556, 0.2118013054, 0.1877345294, 0.3405221701, 0.9197296500, 0.8691371679, 0.2902743518, 0.7474697828, 0.9798831940, 0.3539796770, 0.7836993337, 0.0492655560, 0.0028494480, 0.8217760921, 0.4436686337, 0.2850558162, 0.2248662412, 0.1841160059, 0.8873206973, 0.6574888229, 0.6972273588, 0.2143806964, 0.1969070137, 0.1973746270, 0.5277239084, 0.0387784205, 0.1152710244, 0.9211743474, 0.8067856431, 0.1624012142, 0.8201943636, 0.7727927566, 0.0197990295, 0.3198464513, 0.9045041203, 0.5664937496, 0.4751452208, 0.9298770428, 0.0183086060, 0.1251038760, 0.5962311625, 0.0896230191, 0.7818965912, 0.3293921053, 0.8526853323, 0.9846765995, 0.8348539472, 0.3194304705, 0.8579965234, 0.0578509793, 0.3933429420, 0.5432085991, 0.9182536602, 0.4232436717, 0.2426555157, 0.7866260409, 0.2693330050, 0.1751146317, 0.0149026839, 0.0725046024, 0.4796485305, 0.7353890538, 0.9355911613, 0.4216780663, 0.2373150438, 0.3765857518, 0.1276087463, 0.8983622193, 0.1009725332, 0.9422737956, 0.3063798249, 0.6991632581, 0.5502789617, 0.4310226440, 0.2533639371, 0.2141520977, 0.5253362656, 0.4113282561, 0.9993147850, 0.4371742904, 0.8497669697, 0.3637056947, 0.0337702557, 0.5189172029, 0.9295420051, 0.3303316236, 0.4175569415, 0.5036099553, 0.1738157272, 0.5299249887, 0.8195640445, 0.4012556672, 0.8544187546, 0.8332028389, 0.5537053347, 0.1311528236, 0.5166661739, 0.6411118507, 0.9365821481, 0.8965920210, 0.1203566790, 0.9250523448, 0.3575017452, 0.0677503496, 0.8333941698, 0.7283884287, 0.2291382700, 0.5336354375, 0.6027506590, 0.7590832114, 0.2789750695, 0.2425022423, 0.8733389378, 0.5961565971, 0.0744896010, 0.7805349827, 0.2829613388, 0.3412331343, 0.0980591327, 0.1796306223, 0.5116034746, 0.6055940390, 0.9993713498, 0.6172441840, 0.3674446642, 0.3052124679, 0.1675825566, 0.3539507687, 0.6569175720, 0.3004997969, 0.9646832943, 0.1601292193, 0.6443226933, 0.1136576161, 0.3686640859, 0.2585733235, 0.3487241566, 0.9531292915, 0.4770163000, 0.2903905511, 0.8208773732, 0.2568989396, 0.5882705450, 0.3323196769, 0.4779036641, 0.3763137460, 0.9511837363, 0.1168363765, 0.9543142319, 0.2102029920, 0.4638005197, 0.7789932489, 0.3749539852, 0.1111769900, 0.6461330056, 0.4817448258, 0.6052153111, 0.4099225998, 0.4433912039, 0.0931366235, 0.6462196708, 0.1236954853, 0.2134025246, 0.9146859050, 0.5577327609, 0.5950957537, 0.5727197528, 0.1791156381, 0.8350248337, 0.5554360747, 0.8031629920, 0.3819143474, 0.0292400438, 0.5487336516, 0.4678822458, 0.0342343673, 0.9516777992, 0.7224298120, 0.7461839318, 0.3773870468, 0.5131367445, 0.2083095312, 0.4514315128, 0.1757253855, 0.2510272264, 0.5200845599, 0.9056897759, 0.5360438228, 0.2441264540, 0.5741924644, 0.6644177437, 0.5071949363, 0.9702409506, 0.2398717999, 0.5813457370, 0.4067041576, 0.9802210331, 0.6239985824, 0.3427696824, 0.4842645228, 0.3801376522, 0.5354306698, 0.6689950228, 0.8644760847, 0.1890261769, 0.7649493814, 0.7374402285, 0.9929804206, 0.6627945304, 0.5319303870, 0.6041612625, 0.5599236488, 0.1451985985, 0.8803341985, 0.9013246894, 0.9965583086, 0.7597202659, 0.8554423451, 0.4514248073, 0.9379108548, 0.2748430073, 0.2215842903, 0.8417752385, 0.2392590046, 0.6526051164, 0.5171684027, 0.3318055570, 0.3233769238, 0.3485955596, 0.8960444331, 0.2182348073, 0.0314638242, 0.2966991067, 0.4611668289, 0.2451441586, 0.9483669400, 0.4814185202, 0.2301164269, 0.9818531871, 0.8622955084, 0.8718701005, 0.1479237080, 0.6668744683, 0.4470453262, 0.3250599205, 0.1467782557, 0.5306152105, 0.4997299314, 0.2234447002, 0.0761390328, 0.3920120895, 0.6902595162, 0.5911840796, 0.8471816182, 0.6469184160, 0.7035019398, 0.0482093953, 0.6006464362, 0.5790665746, 0.9256152511, 0.1611465514, 0.3190862834, 0.4234040678, 0.1906434894, 0.6403100491, 0.9953679442, 0.2684392929, 0.0350855589, 0.9819648266, 0.9272018075, 0.9680514932, 0.1208682731, 0.6801799536, 0.5700222254, 0.9320428371, 0.0794108734, 0.9733714461, 0.9885270000, 0.3975370824, 0.7568649650, 0.6419109106, 0.6038377881, 0.0822011903, 0.3555796742, 0.2375314534, 0.8091709614, 0.7703715563, 0.0604219995, 0.7699260116, 0.6995203495, 0.4105941653, 0.1661541611, 0.2999337316, 0.6592288017, 0.1973460019, 0.4158886671, 0.9255557060, 0.3802486062, 0.5752711296, 0.9788123965, 0.4638193548, 0.6024058461, 0.6308128834, 0.6972076297, 0.0221692715, 0.8815687299, 0.8998243809, 0.0782732144, 0.7373631597, 0.4947201312, 0.6553933620, 0.3819375634, 0.9731516838, 0.9897015095, 0.4666753709, 0.0241248757, 0.3494913578, 0.4939182401, 0.9713585973, 0.0284023341, 0.3330141008, 0.9615455866, 0.1250504255, 0.9343959093, 0.0503961705, 0.2217125446, 0.7929786444, 0.7347807288, 0.1455209404, 0.3811211586, 0.2760300636, 0.4252323806, 0.1524006724, 0.4411578476, 0.6757594943, 0.8948637843, 0.1175612733, 0.6200916171, 0.0611399300, 0.8474861383, 0.7789643407, 0.8287312984, 0.4355468750, 0.6836515665, 0.5967869759, 0.9536908269, 0.0970779732, 0.3703476191, 0.7514303923, 0.9970745444, 0.2972998023, 0.7148491144, 0.0703260154, 0.8756357431, 0.4827764928, 0.2315267026, 0.8670392036, 0.9039902091, 0.7598413825, 0.5641558170, 0.1453021616, 0.0283390768, 0.8103026152, 0.8472745419, 0.3163950741, 0.0796058550, 0.2627190053, 0.3927192986, 0.6254547238, 0.4037719965, 0.8468101621, 0.8604364991, 0.5323449969, 0.4758833647, 0.8909564614, 0.4103986919, 0.3036858439, 0.3147858381, 0.9631966949, 0.6552855372, 0.0898596644, 0.7582626343, 0.4912536442, 0.4642568827, 0.4560961127, 0.0424716510, 0.7817948461, 0.4262453020, 0.5910372138, 0.9159098864, 0.4443810880, 0.2673049867, 0.3349557519, 0.0651870370, 0.8344513774, 0.3555746078, 0.6994013786, 0.8303597569, 0.7730720639, 0.5056301355, 0.5512385368, 0.8631983399, 0.2920765877, 0.7082335353, 0.5210028291, 0.9420823455, 0.0780553520, 0.9869869947, 0.6694197059, 0.8170810938, 0.8142117262, 0.8354808092, 0.9632841945, 0.6169818044, 0.8287045956, 0.0485860966, 0.4305866957, 0.5070610046, 0.4348067045, 0.2754455507, 0.1057517603, 0.2419096082, 0.2711437643, 0.2467620820, 0.7604993582, 0.0512518100, 0.5019888878, 0.0544219837, 0.4242412746, 0.6147323251, 0.6091562510, 0.0492309593, 0.6822062135, 0.1228614971, 0.7200939655, 0.3873539567, 0.1615873575, 0.1285951734, 0.3142786026, 0.8377108574, 0.0143198231, 0.9452127218, 0.8676074147, 0.3464574814, 0.2299401164, 0.4238233566, 0.7444404960, 0.2842746675, 0.3475421667, 0.4515824616, 0.4061024189, 0.5072777271, 0.6916244030, 0.7399436831, 0.1339147687, 0.8470349312, 0.2736009061, 0.9161651731, 0.2145228535, 0.8197026253, 0.4357188940, 0.4793126285, 0.1878176033, 0.0033408727, 0.4665594697, 0.7141302228, 0.4815289080, 0.1709755808, 0.8890871406, 0.4769825339, 0.8533289433, 0.4192250669, 0.5382133722, 0.8439967036, 0.6368190050, 0.1753472984, 0.3729657531, 0.4325054288, 0.1195575371, 0.6318938136, 0.6334742308, 0.0022472872, 0.3396160603, 0.8310812116, 0.3704505563, 0.0938813761, 0.2399778366, 0.2419875860, 0.6573725939, 0.7197431922, 0.3412268758, 0.6616492271, 0.9614614844, 0.0241970327, 0.2718939483, 0.9164864421, 0.8933777809, 0.9880793691, 0.3753185570, 0.1958552599, 0.9140393138, 0.4635290802, 0.6336171031, 0.1596896648, 0.5734411478, 0.3253072500, 0.9685553908, 0.0961315557, 0.1612238586, 0.3337151110, 0.4595068097, 0.7585902810, 0.3027629554, 0.4953374863, 0.8097634912, 0.8437174559, 0.8801387548, 0.1229101419, 0.1946214586, 0.4082213640, 0.2244971246, 0.6504552960, 0.3312778175, 0.9782899022, 0.6995807290, 0.5361781716, 0.2622573674, 0.7038592696, 0.7877352238, 0.3439020813, 0.4752141833, 0.8952496648, 0.5836726427, 0.6304138303, 0.0356527530, 0.6122139692, 0.1668584049, 0.8854916692, 0.0393869393, 0.5066962242, 0.5133082867, 0.5916047096, 0.0657361597, 0.4647845328, 0.8854456544, 0.4579891264, 0.0401293449, 0.1570795625, 0.4307921231, 0.4250132442, 0.5020807981, 0.0863880143, 0.5550807714, 0.8689809442, 0.6392524838, 0.8816496730, 0.9821317792, 0.9702126980, 0.8024783731, 0.0837929100, 0.2081798166, 0.9590135217, 0.5302886963, 0.3312814236, 0.3167215288, 0.4922682643, 0.4251655340, 0.6486814022, 0.0772428066, 0.9233161807, 0.6472855806, 0.6612980366, 0.2602806687, 0.9086092710, 0.4832087457, 0.4263238609, 0.9211614132, 0.2327579111, 0.7612525821, 0.0180544239, 0.8523836136, 0.4878110588, 0.0352691561, 0.9699110389, 0.7258943319, 0.6913054585, 0.5940048099, 0.3664346635, 0.0876483768, 0.9537367225, 0.0560003482, 0.5535984039, 0.1812616438, 0.5584629178, 0.6264646053, 0.7846252322, 0.5317841768, 0.5898584723, 0.1672900468, 0.2205289006, 0.1610257924, 0.6494809985, 0.0872025192, 0.4227910638, 0.1080275849, 0.0236762967, 0.4299282730, 0.2447014153, 0.1502147168, 0.2529263496, 0.8167496920, 0.6375074983, 0.5927038193, 0.8306409717, 0.2856203914, 0.8594636321, 0.6422336698, 0.5368315578, 0.9055161476, 0.7115239501, 0.7262650728, 0.9575293660, 0.2097884268, 0.6619368196, 0.3046171665, 0.2552867234, 0.4393327832, 0.8599429131, 0.8390522599, 0.8417548537, 0.9598159790, 0.3629972339, 0.8523796201, 0.3388574123, 0.0057827448, 0.0665373281, 0.3739044666, 0.5004979372, 0.7100685835, 0.4887318909, 0.2108410299, 0.0722057521, 0.0537132323, 0.9712464809, 0.2985229194, 0.7539714575, 0.3571634293, 0.5679759383, 0.1241775602, 0.7041552067, 0.7425100803, 0.8784170747};
+
+#endif
+
+#endif
@@ -0,0 +1,16 @@
+//Numpy array shape [4]
+//Min -0.201217234135
+//Max 0.947910726070
+//Number of zeros 0
+
+#ifndef B2_H_
+#define B2_H_
+
+#ifndef __SYNTHESIS__
+conv1d_bias_t b2[4];
+#else
+conv1d_bias_t b2[4] = {0.8132661581, 0.9479107261, 0.6934335828, -0.2012172341};
+
+#endif
+
+#endif
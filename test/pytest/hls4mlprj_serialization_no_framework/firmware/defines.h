@@ -0,0 +1,45 @@
+#ifndef DEFINES_H_
+#define DEFINES_H_
+
+#include "ap_fixed.h"
+#include "ap_int.h"
+#include "nnet_utils/nnet_types.h"
+#include <cstddef>
+#include <cstdio>
+
+// hls-fpga-machine-learning insert numbers
+#define N_INPUT_1_1 16
+#define N_INPUT_2_1 2
+#define N_OUTPUTS_2 14
+#define N_FILT_2 4
+#define N_OUTPUTS_2 14
+#define N_FILT_2 4
+#define N_SIZE_0_6 56
+#define N_LAYER_7 64
+#define N_LAYER_9 5
+#define N_LAYER_9 5
+
+
+// hls-fpga-machine-learning insert layer-precision
+typedef ap_fixed<16,6> input_t;
+typedef ap_fixed<16,6> model_default_t;
+typedef ap_fixed<36,16> conv1d_result_t;
+typedef ap_fixed<16,6> conv1d_weight_t;
+typedef ap_fixed<16,6> conv1d_bias_t;
+typedef ap_fixed<16,6> layer5_t;
+typedef ap_fixed<18,8> activation_table_t;
+typedef ap_fixed<39,19> dense_result_t;
+typedef ap_fixed<16,6> dense_weight_t;
+typedef ap_fixed<16,6> dense_bias_t;
+typedef ap_uint<1> layer7_index;
+typedef ap_fixed<62,32> dense_1_result_t;
+typedef ap_fixed<16,6> dense_1_weight_t;
+typedef ap_fixed<16,6> dense_1_bias_t;
+typedef ap_uint<1> layer9_index;
+typedef ap_fixed<16,6> result_t;
+typedef ap_fixed<18,8> dense_1_softmax_table_t;
+typedef ap_fixed<18,8,AP_RND,AP_SAT,0> dense_1_softmax_exp_table_t;
+typedef ap_fixed<18,8,AP_RND,AP_SAT,0> dense_1_softmax_inv_table_t;
+
+
+#endif
@@ -0,0 +1,636 @@
+#ifndef NNET_HELPERS_H
+#define NNET_HELPERS_H
+
+#include "ap_fixed.h"
+#include "hls_stream.h"
+#include <algorithm>
+#include <cstring>
+#include <fstream>
+#include <iostream>
+#include <map>
+#include <math.h>
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <vector>
+
+#if !defined(__SYNTHESIS__) && (defined(__unix__) || defined(__APPLE__))
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#define NNET_WEIGHTS_MMAP
+#endif
+
+namespace nnet {
+
+// Sets the bits of a weight from the integer code written by the VivadoWriter with RawWeights enabled
+template <class T> void set_weight_bits(T &w, long long bits) { w = bits; }
+
+template <int W, int I, ap_q_mode Q, ap_o_mode O, int N> void set_weight_bits(ap_fixed<W, I, Q, O, N> &w, long long bits) {
+    w.range() = bits;
+}
+
+template <int W, int I, ap_q_mode Q, ap_o_mode O, int N> void set_weight_bits(ap_ufixed<W, I, Q, O, N> &w, long long bits) {
+    w.range() = bits;
+}
+
+template <class T> T weight_from_bits(long long bits) {
+    T w;
+    set_weight_bits(w, bits);
+    return w;
+}
+
+// Initializer of a weight of type T from the integer code of its bits, used in the weight headers
+#ifdef __SYNTHESIS__
+#define NNET_WEIGHT_BITS(T, x) T::bitsToFixed(x)
+#else
+#define NNET_WEIGHT_BITS(T, x) nnet::weight_from_bits<T>(x)
+#endif
+
+#ifndef __SYNTHESIS__
+
+#ifndef WEIGHTS_DIR
+#define WEIGHTS_DIR "weights"
+#endif
+
+template <class T, size_t SIZE> void load_weights_from_txt(T *w, const char *fname) {
+
+    std::string full_path = std::string(WEIGHTS_DIR) + "/" + std::string(fname);
+    std::ifstream infile(full_path.c_str(), std::ios::binary);
+
+    if (infile.fail()) {
+        std::cerr << "ERROR: file " << std::string(fname) << " does not exist" << std::endl;
+        exit(1);
+    }
+
+    std::string line;
+    if (std::getline(infile, line)) {
+        std::istringstream iss(line);
+        std::string token;
+
+        size_t i = 0;
+        while (std::getline(iss, token, ',')) {
+            std::istringstream(token) >> w[i];
+            i++;
+        }
+
+        if (SIZE != i) {
+            std::cerr << "ERROR: Expected " << SIZE << " values";
+            std::cerr << " but read only " << i << " values" << std::endl;
+        }
+    }
+}
+
+template <class T, size_t SIZE> void load_raw_weights_from_txt(T *w, const char *fname) {
+
+    std::string full_path = std::string(WEIGHTS_DIR) + "/" + std::string(fname);
+    std::ifstream infile(full_path.c_str(), std::ios::binary);
+
+    if (infile.fail()) {
+        std::cerr << "ERROR: file " << std::string(fname) << " does not exist" << std::endl;
+        exit(1);
+    }
+
+    std::string line;
+    if (std::getline(infile, line)) {
+        std::istringstream iss(line);
+        std::string token;
+
+        size_t i = 0;
+        while (std::getline(iss, token, ',')) {
+            long long bits;
+            std::istringstream(token) >> bits;
+            set_weight_bits(w[i], bits);
+            i++;
+        }
+
+        if (SIZE != i) {
+            std::cerr << "ERROR: Expected " << SIZE << " values";
+            std::cerr << " but read only " << i << " values" << std::endl;
+        }
+    }
+}
+
+template <class T, size_t SIZE> void load_compressed_weights_from_txt(T *w, const char *fname) {
+
+    std::string full_path = std::string(WEIGHTS_DIR) + "/" + std::string(fname);
+    std::ifstream infile(full_path.c_str(), std::ios::binary);
+
+    if (infile.fail()) {
+        std::cerr << "ERROR: file " << std::string(fname) << " does not exist" << std::endl;
+        exit(1);
+    }
+
+    std::string line;
+    if (std::getline(infile, line)) {
+        std::istringstream iss(line);
+        std::string token;
+        std::string extra_chars = "} ";
+
+        size_t i = 0;
+        while (std::getline(iss, token, '{')) {
+            if (token.length() == 0) {
+                continue;
+            }
+            for (char c : extra_chars) {
+                token.erase(std::remove(token.begin(), token.end(), c), token.end());
+            }
+            if (token.back() == ',') {
+                token.erase(token.end() - 1);
+            }
+
+            std::replace(token.begin(), token.end(), ',', ' ');
+            std::istringstream structss(token);
+
+            if (!(structss >> w[i].row_index >> w[i].col_index >> w[i].weight)) {
+                std::cerr << "ERROR: Unable to parse file " << std::string(fname);
+                exit(1);
+            }
+            i++;
+        }
+
+        if (SIZE != i) {
+            std::cerr << "ERROR: Expected " << SIZE << " values";
+            std::cerr << " but read only " << i << " values" << std::endl;
+        }
+    }
+}
+
+template <class T, size_t SIZE> void load_exponent_weights_from_txt(T *w, const char *fname) {
+
+    std::string full_path = std::string(WEIGHTS_DIR) + "/" + std::string(fname);
+    std::ifstream infile(full_path.c_str(), std::ios::binary);
+
+    if (infile.fail()) {
+        std::cerr << "ERROR: file " << std::string(fname) << " does not exist" << std::endl;
+        exit(1);
+    }
+
+    std::string line;
+    if (std::getline(infile, line)) {
+        std::istringstream iss(line);
+        std::string token;
+        std::string extra_chars = "} ";
+
+        size_t i = 0;
+        while (std::getline(iss, token, '{')) {
+            if (token.length() == 0) {
+                continue;
+            }
+            for (char c : extra_chars) {
+                token.erase(std::remove(token.begin(), token.end(), c), token.end());
+            }
+            if (token.back() == ',') {
+                token.erase(token.end() - 1);
+            }
+
+            std::replace(token.begin(), token.end(), ',', ' ');
+            std::istringstream structss(token);
+
+            if (!(structss >> w[i].sign >> w[i].weight)) {
+                std::cerr << "ERROR: Unable to parse file " << std::string(fname);
+                exit(1);
+            }
+            i++;
+        }
+
+        if (SIZE != i) {
+            std::cerr << "ERROR: Expected " << SIZE << " values";
+            std::cerr << " but read only " << i << " values" << std::endl;
+        }
+    }
+}
+// Binary weight files written by the VivadoWriter with WeightsFormat: bin. The file starts with a header:
+//   char     magic[8]     "HLS4MLWB"
+//   uint32   header_size  offset of the data, a multiple of 8
+//   uint32   version      1
+//   uint32   dtype        0 = float64, 1 = int64 codes of fixed-point values (see set_weight_bits)
+//   uint32   n_fields     number of values per element (1, or 2 for exponent and 3 for compressed weights)
+//   uint64   n_elem       number of elements
+//   uint32   ndim         followed by ndim uint64 dimensions and the precision as a null-terminated string
+// followed by n_elem * n_fields little-endian values, 8 bytes each.
+const char weights_bin_magic[8] = {'H', 'L', 'S', '4', 'M', 'L', 'W', 'B'};
+const unsigned weights_bin_version = 1;
+
+template <class T> T read_weights_bin_value(const char *ptr) {
+    T value;
+    std::memcpy(&value, ptr, sizeof(T));
+#if defined(__BYTE_ORDER__) && __BYTE_ORDER__ == __ORDER_BIG_ENDIAN__
+    char *bytes = reinterpret_cast<char *>(&value);
+    std::reverse(bytes, bytes + sizeof(T));
+#endif
+    return value;
+}
+
+// Maps (or reads, where mmap is not available) the weight file and returns a pointer to its values
+class weights_bin_file {
+  public:
+    weights_bin_file(const char *fname, size_t n_elem, unsigned n_fields) : buffer(NULL), size(0), mapped(false) {
+        std::string full_path = std::string(WEIGHTS_DIR) + "/" + std::string(fname);
+
+#ifdef NNET_WEIGHTS_MMAP
+        int fd = open(full_path.c_str(), O_RDONLY);
+        struct stat st;
+        if (fd >= 0 && fstat(fd, &st) == 0 && st.st_size > 0) {
+            size = st.st_size;
+            void *addr = mmap(NULL, size, PROT_READ, MAP_PRIVATE, fd, 0);
+            if (addr != MAP_FAILED) {
+                buffer = static_cast<const char *>(addr);
+                mapped = true;
+            }
+        }
+        if (fd >= 0) {
+            close(fd);
+        }
+#endif
+        if (!mapped) {
+            FILE *infile = fopen(full_path.c_str(), "rb");
+            if (infile != NULL) {
+                fseek(infile, 0, SEEK_END);
+                size = ftell(infile);
+                fseek(infile, 0, SEEK_SET);
+                char *data = new char[size];
+                if (fread(data, 1, size, infile) != size) {
+                    size = 0;
+                }
+                fclose(infile);
+                buffer = data;
+            }
+        }
+
+        if (buffer == NULL) {
+            std::cerr << "ERROR: file " << std::string(fname) << " does not exist" << std::endl;
+            exit(1);
+        }
+
+        if (size < 40 || std::memcmp(buffer, weights_bin_magic, sizeof(weights_bin_magic)) != 0 ||
+            read_weights_bin_value<uint32_t>(buffer + 12) != weights_bin_version) {
+            std::cerr << "ERROR: Unable to parse file " << std::string(fname) << std::endl;
+            exit(1);
+        }
+
+        header_size = read_weights_bin_value<uint32_t>(buffer + 8);
+        dtype = read_weights_bin_value<uint32_t>(buffer + 16);
+        uint32_t file_fields = read_weights_bin_value<uint32_t>(buffer + 20);
+        uint64_t file_elem = read_weights_bin_value<uint64_t>(buffer + 24);
+
+        if (dtype > 1 || file_fields != n_fields || size < header_size + file_elem * file_fields * sizeof(double)) {
+            std::cerr << "ERROR: Unable to parse file " << std::string(fname) << std::endl;
+            exit(1);
+        }
+
+        if (file_elem != n_elem) {
+            std::cerr << "ERROR: Expected " << n_elem << " values";
+            std::cerr << " but read only " << file_elem << " values" << std::endl;
+        }
+        n_values = std::min<uint64_t>(n_elem, file_elem) * n_fields;
+    }
+
+    ~weights_bin_file() {
+#ifdef NNET_WEIGHTS_MMAP
+        if (mapped) {
+            munmap(const_cast<char *>(buffer), size);
+            return;
+        }
+#endif
+        delete[] buffer;
+    }
+
+    size_t n_read() const { return n_values; }
+
+    bool raw() const { return dtype == 1; }
+
+    double operator[](size_t i) const { return read_weights_bin_value<double>(buffer + header_size + i * sizeof(double)); }
+
+    long long bits(size_t i) const { return read_weights_bin_value<int64_t>(buffer + header_size + i * sizeof(int64_t)); }
+
+  private:
+    const char *buffer;
+    size_t size;
+    bool mapped;
+    uint32_t header_size;
+    uint32_t dtype;
+    size_t n_values;
+};
+
+template <class T, size_t SIZE> void load_weights_from_bin(T *w, const char *fname) {
+    weights_bin_file infile(fname, SIZE, 1);
+    for (size_t i = 0; i < infile.n_read(); i++) {
+        if (infile.raw()) {
+            set_weight_bits(w[i], infile.bits(i));
+        } else {
+            w[i] = infile[i];
+        }
+    }
+}
+
+template <class T, size_t SIZE> void load_compressed_weights_from_bin(T *w, const char *fname) {
+    weights_bin_file infile(fname, SIZE, 3);
+    for (size_t i = 0; i < infile.n_read() / 3; i++) {
+        w[i].row_index = infile[3 * i];
+        w[i].col_index = infile[3 * i + 1];
+        w[i].weight = infile[3 * i + 2];
+    }
+}
+
+template <class T, size_t SIZE> void load_exponent_weights_from_bin(T *w, const char *fname) {
+    weights_bin_file infile(fname, SIZE, 2);
+    for (size_t i = 0; i < infile.n_read() / 2; i++) {
+        w[i].sign = infile[2 * i];
+        w[i].weight = infile[2 * i + 1];
+    }
+}
+
+template <class srcType, class dstType, size_t SIZE> void convert_data(srcType *src, dstType *dst) {
+    for (size_t i = 0; i < SIZE; i++) {
+        dst[i] = dstType(src[i]);
+    }
+}
+
+template <class srcType, class dstType, size_t SIZE> void convert_data(srcType *src, hls::stream<dstType> &dst) {
+    for (size_t i = 0; i < SIZE / dstType::size; i++) {
+        dstType ctype;
+        for (size_t j = 0; j < dstType::size; j++) {
+            ctype[j] = typename dstType::value_type(src[i * dstType::size + j]);
+        }
+        dst.write(ctype);
+    }
+}
+
+template <class srcType, class dstType, size_t SIZE> void convert_data(hls::stream<srcType> &src, dstType *dst) {
+    for (size_t i = 0; i < SIZE / srcType::size; i++) {
+        srcType ctype = src.read();
+        for (size_t j = 0; j < srcType::size; j++) {
+            dst[i * srcType::size + j] = dstType(ctype[j]);
+        }
+    }
+}
+
+// Integer codes of the bits of the fixed-point types, the reverse of set_weight_bits, used by the raw wrappers of the
+// Python bridge. The codes of signed types are sign-extended, i.e., they are the value times 2^(fractional bits).
+template <int W, bool S> long long get_raw_bits(const ap_int_base<W, S> &src) { return src.to_int64(); }
+
+template <int W, int I, bool S, ap_q_mode Q, ap_o_mode O, int N>
+long long get_raw_bits(const ap_fixed_base<W, I, S, Q, O, N> &src) {
+    ap_int_base<W, S> bits;
+    bits.V = src.V;
+    return bits.to_int64();
+}
+
+template <class srcType, class dstType, size_t SIZE> void convert_data_from_raw(srcType *src, dstType *dst) {
+    for (size_t i = 0; i < SIZE; i++) {
+        set_weight_bits(dst[i], src[i]);
+    }
+}
+
+template <class srcType, class dstType, size_t SIZE> void convert_data_from_raw(srcType *src, hls::stream<dstType> &dst) {
+    for (size_t i = 0; i < SIZE / dstType::size; i++) {
+        dstType ctype;
+        for (size_t j = 0; j < dstType::size; j++) {
+            set_weight_bits(ctype[j], src[i * dstType::size + j]);
+        }
+        dst.write(ctype);
+    }
+}
+
+template <class srcType, class dstType, size_t SIZE> void convert_data_to_raw(srcType *src, dstType *dst) {
+    for (size_t i = 0; i < SIZE; i++) {
+        dst[i] = get_raw_bits(src[i]);
+    }
+}
+
+template <class srcType, class dstType, size_t SIZE> void convert_data_to_raw(hls::stream<srcType> &src, dstType *dst) {
+    for (size_t i = 0; i < SIZE / srcType::size; i++) {
+        srcType ctype = src.read();
+        for (size_t j = 0; j < srcType::size; j++) {
+            dst[i * srcType::size + j] = get_raw_bits(ctype[j]);
+        }
+    }
+}
+
+extern bool trace_enabled;
+extern std::map<std::string, void *> *trace_outputs;
+extern size_t trace_type_size;
+
+template <class data_T, class save_T> void save_output_array(data_T *data, save_T *ptr, size_t layer_size) {
+    for (int i = 0; i < layer_size; i++) {
+        ptr[i] = save_T(data[i]);
+    }
+}
+
+template <class data_T, class save_T> void save_output_array(hls::stream<data_T> &data, save_T *ptr, size_t layer_size) {
+    for (size_t i = 0; i < layer_size / data_T::size; i++) {
+        data_T ctype = data.read();
+        for (size_t j = 0; j < data_T::size; j++) {
+            ptr[i * data_T::size + j] = save_T(ctype[j]);
+        }
+        data.write(ctype);
+    }
+}
+
+// We don't want to include save_T in this function because it will be inserted into myproject.cpp
+// so a workaround with element size is used
+template <class data_T> void save_layer_output(data_T *data, const char *layer_name, size_t layer_size) {
+    if (!trace_enabled)
+        return;
+
+    if (trace_outputs) {
+        // The outputs of consecutive samples are stored one after the other, so the position in the buffer of the
+        // layer is moved to the next sample after each save. Layers without a buffer are not traced.
+        std::map<std::string, void *>::iterator buffer = trace_outputs->find(layer_name);
+        if (buffer != trace_outputs->end()) {
+            if (trace_type_size == 4) {
+                save_output_array<data_T, float>(data, (float *)buffer->second, layer_size);
+                buffer->second = (float *)buffer->second + layer_size;
+            } else if (trace_type_size == 8) {
+                save_output_array<data_T, double>(data, (double *)buffer->second, layer_size);
+                buffer->second = (double *)buffer->second + layer_size;
+            } else {
+                std::cout << "Unknown trace type!" << std::endl;
+            }
+        }
+    } else {
+        std::ostringstream filename;
+        filename << "./tb_data/" << layer_name << "_output.log"; // TODO if run as a shared lib, path should be ../tb_data
+        std::fstream out;
+        out.open(filename.str(), std::ios::app);
+        assert(out.is_open());
+        for (int i = 0; i < layer_size; i++) {
+            out << float(data[i]) << " "; // We don't care about precision in text files
+        }
+        out << std::endl;
+        out.close();
+    }
+}
+
+template <class data_T> void save_layer_output(hls::stream<data_T> &data, const char *layer_name, size_t layer_size) {
+    if (!trace_enabled)
+        return;
+
+    if (trace_outputs) {
+        // The outputs of consecutive samples are stored one after the other, so the position in the buffer of the
+        // layer is moved to the next sample after each save. Layers without a buffer are not traced.
+        std::map<std::string, void *>::iterator buffer = trace_outputs->find(layer_name);
+        if (buffer != trace_outputs->end()) {
+            if (trace_type_size == 4) {
+                save_output_array<data_T, float>(data, (float *)buffer->second, layer_size);
+                buffer->second = (float *)buffer->second + layer_size;
+            } else if (trace_type_size == 8) {
+                save_output_array<data_T, double>(data, (double *)buffer->second, layer_size);
+                buffer->second = (double *)buffer->second + layer_size;
+            } else {
+                std::cout << "Unknown trace type!" << std::endl;
+            }
+        }
+    } else {
+        std::ostringstream filename;
+        filename << "./tb_data/" << layer_name << "_output.log"; // TODO if run as a shared lib, path should be ../tb_data
+        std::fstream out;
+        out.open(filename.str(), std::ios::app);
+        assert(out.is_open());
+        for (size_t i = 0; i < layer_size / data_T::size; i++) {
+            data_T ctype = data.read();
+            for (size_t j = 0; j < data_T::size; j++) {
+                out << float(ctype[j]) << " "; // We don't care about precision in text files
+            }
+            data.write(ctype);
+        }
+        out << std::endl;
+        out.close();
+    }
+}
+
+#endif
+
+template <class src_T, class dst_T, size_t OFFSET, size_t SIZE> void copy_data(std::vector<src_T> src, dst_T dst[SIZE]) {
+    typename std::vector<src_T>::const_iterator in_begin = src.cbegin() + OFFSET;
+    typename std::vector<src_T>::const_iterator in_end = in_begin + SIZE;
+    std::copy(in_begin, in_end, dst);
+}
+
+template <class src_T, class dst_T, size_t OFFSET, size_t SIZE>
+void copy_data(std::vector<src_T> src, hls::stream<dst_T> &dst) {
+    typename std::vector<src_T>::const_iterator in_begin = src.cbegin() + OFFSET;
+    typename std::vector<src_T>::const_iterator in_end = in_begin + SIZE;
+
+    size_t i_pack = 0;
+    dst_T dst_pack;
+    for (typename std::vector<src_T>::const_iterator i = in_begin; i != in_end; ++i) {
+        dst_pack[i_pack++] = typename dst_T::value_type(*i);
+        if (i_pack == dst_T::size) {
+            i_pack = 0;
+            dst.write(dst_pack);
+        }
+    }
+}
+
+template <class src_T, class dst_T, size_t OFFSET, size_t SIZE> void copy_data_axi(std::vector<src_T> src, dst_T dst[SIZE]) {
+    for (auto i = 0; i < SIZE; i++)
+        if (i == SIZE - 1) {
+            dst[i].data = src[i];
+            dst[i].last = 1;
+        } else {
+            dst[i].data = src[i];
+            dst[i].last = 0;
+        }
+}
+
+template <class res_T, size_t SIZE> void print_result(res_T result[SIZE], std::ostream &out, bool keep = false) {
+    for (int i = 0; i < SIZE; i++) {
+        out << result[i] << " ";
+    }
+    out << std::endl;
+}
+
+template <class res_T, size_t SIZE> void print_result(hls::stream<res_T> &result, std::ostream &out, bool keep = false) {
+    for (int i = 0; i < SIZE / res_T::size; i++) {
+        res_T res_pack = result.read();
+        for (int j = 0; j < res_T::size; j++) {
+            out << res_pack[j] << " ";
+        }
+        if (keep)
+            result.write(res_pack);
+    }
+    out << std::endl;
+}
+
+template <class data_T, size_t SIZE> void fill_zero(data_T data[SIZE]) { std::fill_n(data, SIZE, 0.); }
+
+template <class data_T, size_t SIZE> void fill_zero(hls::stream<data_T> &data) {
+    for (int i = 0; i < SIZE / data_T::size; i++) {
+        data_T data_pack;
+        for (int j = 0; j < data_T::size; j++) {
+            data_pack[j] = 0.;
+        }
+        data.write(data_pack);
+    }
+}
+
+template <class dataType, unsigned int nrows> int read_file_1D(const char *filename, dataType data[nrows]) {
+    FILE *fp;
+    fp = fopen(filename, "r");
+    if (fp == 0) {
+        return -1;
+    }
+    // Read data from file
+    float newval;
+    for (int ii = 0; ii < nrows; ii++) {
+        if (fscanf(fp, "%f\n", &newval) != 0) {
+            data[ii] = newval;
+        } else {
+            return -2;
+        }
+    }
+    fclose(fp);
+    return 0;
+}
+
+template <class dataType, unsigned int nrows, unsigned int ncols>
+int read_file_2D(const char *filename, dataType data[nrows][ncols]) {
+    FILE *fp;
+    fp = fopen(filename, "r");
+    if (fp == 0) {
+        return -1;
+    }
+    // Read data from file
+    float newval;
+    for (int ii = 0; ii < nrows; ii++) {
+        for (int jj = 0; jj < ncols; jj++) {
+            if (fscanf(fp, "%f\n", &newval) != 0) {
+                data[ii][jj] = newval;
+            } else {
+                return -2;
+            }
+        }
+    }
+    fclose(fp);
+    return 0;
+}
+
+template <class in_T, class out_T, int N_IN> void change_type(hls::stream<in_T> &in, hls::stream<out_T> &out) {
+    in_T datareg;
+    hls::stream<out_T> input_trunc;
+    for (int ii = 0; ii < N_IN; ii++) {
+        out << (out_T)in.read();
+    }
+}
+
+template <class data_T, int N_IN> void hls_stream_debug(hls::stream<data_T> &data, hls::stream<data_T> &res) {
+    data_T datareg;
+    for (int ii = 0; ii < N_IN; ii++) {
+        datareg = data.read();
+        std::cout << "[" << ii << "]: " << datareg << std::endl;
+        res << datareg;
+    }
+}
+
+constexpr int ceillog2(int x) { return (x <= 2) ? 1 : 1 + ceillog2((x + 1) / 2); }
+
+constexpr int floorlog2(int x) { return (x < 2) ? 0 : 1 + floorlog2(x / 2); }
+
+constexpr int pow2(int x) { return x == 0 ? 1 : 2 * pow2(x - 1); }
+
+} // namespace nnet
+
+#endif
@@ -0,0 +1,16 @@
+//Numpy array shape [15, 10]
+//Min -0.486890912056
+//Max 0.486912995577
+//Number of zeros 0
+
+#ifndef W2_H_
+#define W2_H_
+
+#ifndef __SYNTHESIS__
+dense_weight_t w2[150];
+#else
+dense_weight_t w2[150] = {0.2060224116, -0.1640237868, -0.1987091899, -0.0831094682, 0.0807454288, -0.1720100343, -0.3103383780, 0.0108437836, 0.4680881798, -0.1414722502, 0.0875608623, -0.1163485050, 0.3005553782, 0.1035138667, -0.0589296222, -0.1895789802, 0.3994897306, -0.1971036494, 0.4353269637, 0.4062158167, 0.2184086740, 0.2042998374, -0.2111065388, -0.3778533041, -0.1334860027, 0.0655513704, -0.2868367434, 0.2518834174, -0.0360528827, 0.4734608233, 0.2283728421, 0.2746691406, 0.4001948535, 0.3559786379, -0.3689109087, -0.1993950307, 0.2182154953, -0.2229432464, 0.4169050753, -0.1949093044, -0.4672296047, -0.0032021999, 0.1715636551, 0.4129574001, -0.0622172058, 0.2020969689, 0.0107411444, -0.1440272629, 0.3629838526, -0.1840557158, -0.3757145405, 0.3137666881, -0.2632556260, -0.3807491362, -0.0528143942, 0.3466674984, 0.2982547581, 0.3698228896, -0.4865083694, 0.0983875692, -0.3204313517, 0.1823677123, -0.0092933774, -0.2260230482, 0.0795147121, -0.2218872309, -0.2791081667, -0.0081642568, -0.4775450826, -0.4813995063, 0.0288486183, 0.1053110659, -0.2343175411, 0.0046181977, 0.3064362705, -0.3732945621, -0.3171891868, -0.1967824399, -0.1597410440, 0.4869129956, -0.4799507260, -0.3649306893, -0.2110489607, 0.2404108942, -0.3114396930, 0.0656802356, -0.4828000665, 0.1164437234, 0.4196083844, -0.1199842989, -0.0648543239, -0.0680990517, 0.2246741951, -0.2585718036, 0.3971696794, 0.1576618850, -0.0880790055, 0.4508535564, 0.0652427971, -0.2249414623, 0.0256377757, -0.0477569103, 0.3560217321, 0.1167123616, 0.1648646295, 0.4686976373, 0.1738353074, -0.1979873478, 0.0937306583, 0.1215947568, -0.1937514544, 0.1086987555, -0.4303270876, -0.3541497588, 0.0985338390, -0.1199777424, 0.3530738056, -0.4868909121, 0.0295265615, 0.2482555807, 0.1154554784, 0.4388502538, 0.1780918539, 0.4563457668, -0.3681171238, 0.4076876938, 0.3455062807, 0.1498073637, 0.2414558232, -0.4373058081, 0.0325712860, 0.1682929695, -0.0831347108, 0.0912213027, -0.1658156216, 0.4634028375, -0.4705064297, 0.2121446431, 0.4505906403, -0.0864068866, -0.2241761982, -0.4321968257, 0.1953481138, -0.4378774464, 0.0384920537, -0.2945165336, -0.3559283912, 0.2276971638, 0.0697090328, -0.2211961448};
+
+#endif
+
+#endif
@@ -0,0 +1,38 @@
+#include "../defines.h"
+
+#include "../nnet_utils/nnet_code_gen.h"
+#include "../nnet_utils/nnet_helpers.h"
+// hls-fpga-machine-learning insert includes
+#include "../nnet_utils/nnet_activation.h"
+#include "../nnet_utils/nnet_activation_stream.h"
+
+// hls-fpga-machine-learning insert weights
+
+
+// hls-fpga-machine-learning insert layer-config
+// dense_softmax
+struct softmax_config3 : nnet::activ_config {
+    static const unsigned n_in = 10;
+    static const unsigned table_size = 1024;
+    static const unsigned io_type = nnet::io_parallel;
+    static const unsigned reuse_factor = 1;
+    static const unsigned axis = -1;
+    static const nnet::softmax_implementation implementation = nnet::softmax_implementation::stable;
+    typedef dense_softmax_exp_table_t exp_table_t;
+    typedef dense_softmax_inv_table_t inv_table_t;
+};
+
+
+void myproject_layer3(
+    dense_result_t layer2_out[N_LAYER_2],
+    result_t layer3_out[N_LAYER_2]
+) {
+    #pragma HLS INLINE
+
+    // hls-fpga-machine-learning insert load weights
+
+    // hls-fpga-machine-learning insert layer
+    // dense_softmax
+    nnet::softmax<dense_result_t, result_t, softmax_config3>(layer2_out, layer3_out);
+}
+
@@ -0,0 +1,57 @@
+#include "../defines.h"
+
+#include "../nnet_utils/nnet_code_gen.h"
+#include "../nnet_utils/nnet_helpers.h"
+// hls-fpga-machine-learning insert includes
+#include "../nnet_utils/nnet_dense.h"
+#include "../nnet_utils/nnet_dense_compressed.h"
+#include "../nnet_utils/nnet_dense_stream.h"
+
+// hls-fpga-machine-learning insert weights
+#include "../weights/w2.h"
+#include "../weights/b2.h"
+
+
+// hls-fpga-machine-learning insert layer-config
+// dense
+struct config2 : nnet::dense_config {
+    static const unsigned n_in = 15;
+    static const unsigned n_out = 10;
+    static const unsigned io_type = nnet::io_parallel;
+    static const unsigned strategy = nnet::latency;
+    static const unsigned reuse_factor = 1;
+    static const unsigned n_zeros = 0;
+    static const unsigned n_nonzeros = 150;
+    static const unsigned multiplier_limit = DIV_ROUNDUP(n_in * n_out, reuse_factor) - n_zeros / reuse_factor;
+    static const bool store_weights_in_bram = false;
+    typedef model_default_t accum_t;
+    typedef dense_bias_t bias_t;
+    typedef dense_weight_t weight_t;
+    typedef layer2_index index_t;
+    template<class data_T, class res_T, class CONFIG_T>
+    using kernel = nnet::DenseLatency<data_T, res_T, CONFIG_T>;
+    template<class x_T, class y_T>
+    using product = nnet::product::mult<x_T, y_T>;
+};
+
+
+void myproject_layer2(
+    input_t dense_input[N_INPUT_1_1],
+    dense_result_t layer2_out[N_LAYER_2]
+) {
+    #pragma HLS INLINE
+
+    // hls-fpga-machine-learning insert load weights
+#ifndef __SYNTHESIS__
+    static bool loaded_weights = false;
+    if (!loaded_weights) {
+        nnet::load_weights_from_txt<dense_weight_t, 150>(w2, "w2.txt");
+        nnet::load_weights_from_txt<dense_bias_t, 10>(b2, "b2.txt");
+        loaded_weights = true;    }
+#endif
+
+    // hls-fpga-machine-learning insert layer
+    // dense
+    nnet::dense<input_t, dense_result_t, config2>(dense_input, layer2_out, w2, b2);
+}
+
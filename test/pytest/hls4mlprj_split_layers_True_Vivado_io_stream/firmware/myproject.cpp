@@ -0,0 +1,34 @@
+#include <iostream>
+
+#include "myproject.h"
+
+// Layers written to their own translation units in layers/
+void myproject_layer2(hls::stream<input_t> &dense_input, hls::stream<dense_result_t> &layer2_out);
+void myproject_layer3(hls::stream<dense_result_t> &layer2_out, hls::stream<result_t> &layer3_out);
+
+void myproject(
+    hls::stream<input_t> &dense_input,
+    hls::stream<result_t> &layer3_out
+) {
+
+    // hls-fpga-machine-learning insert IO
+    #pragma HLS INTERFACE axis port=dense_input,layer3_out 
+    #pragma HLS DATAFLOW
+
+    // hls-fpga-machine-learning insert load weights
+
+    // ****************************************
+    // NETWORK INSTANTIATION
+    // ****************************************
+
+    // hls-fpga-machine-learning insert layers
+
+    hls::stream<dense_result_t> layer2_out("layer2_out");
+    #pragma HLS STREAM variable=layer2_out depth=1
+
+    myproject_layer2(dense_input, layer2_out); // dense
+
+    myproject_layer3(layer2_out, layer3_out); // dense_softmax
+
+}
+
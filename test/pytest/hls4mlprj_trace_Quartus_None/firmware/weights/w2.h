@@ -0,0 +1,14 @@
+//Numpy array shape [1, 2]
+//Min 3.196082115173
+//Max 7.813365459442
+//Number of zeros 0
+
+#ifndef W2_H_
+#define W2_H_
+
+#ifdef __INTELFPGA_COMPILER__
+hls_init_on_powerup
+#endif
+static const dense_weight_t w2[2] = {3.1960821152, 7.8133654594};
+
+#endif
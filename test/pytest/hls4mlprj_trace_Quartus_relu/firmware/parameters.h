@@ -0,0 +1,62 @@
+#ifndef PARAMETERS_H_
+#define PARAMETERS_H_
+
+#include "defines.h"
+
+#include "nnet_utils/nnet_helpers.h"
+// hls-fpga-machine-learning insert includes
+#include "nnet_utils/nnet_activation.h"
+#include "nnet_utils/nnet_activation_stream.h"
+#include "nnet_utils/nnet_dense.h"
+#include "nnet_utils/nnet_dense_compressed.h"
+#include "nnet_utils/nnet_dense_stream.h"
+
+// hls-fpga-machine-learning insert layer-config
+struct config2 : nnet::dense_config {
+    static const unsigned n_in = 1;
+    static const unsigned n_out = 2;
+    static const unsigned io_type = nnet::io_parallel;
+    static const unsigned n_zeros = 0;
+    static const unsigned n_nonzeros = 2;
+    static const bool store_weights_in_bram = false;
+
+    static const unsigned rf_pad = 0;
+    static const unsigned bf_pad = 0;
+
+    static const unsigned reuse_factor = 1;
+    static const unsigned compressed_block_factor = DIV_ROUNDUP(n_nonzeros, reuse_factor);
+    static const unsigned reuse_factor_rounded = reuse_factor + rf_pad;
+    static const unsigned block_factor = DIV_ROUNDUP(n_in*n_out, reuse_factor);
+    static const unsigned block_factor_rounded = block_factor + bf_pad;
+    static const unsigned multiplier_factor = MIN(n_in, reuse_factor);
+    static const unsigned multiplier_limit = DIV_ROUNDUP(n_in*n_out, multiplier_factor);
+    static const unsigned multiplier_scale = multiplier_limit/n_out;
+
+    typedef Dense_accum_t accum_t;
+    typedef dense_bias_t bias_t;
+    typedef dense_weight_t weight_t;
+    typedef layer2_index index_t;
+
+    template<class x_T, class y_T>
+    using product = nnet::product::mult<x_T, y_T>;
+};
+
+struct relu_config3 : nnet::activ_config {
+    static const unsigned n_in = 2;
+    static const unsigned table_size = 1024;
+    static const unsigned io_type = nnet::io_parallel;
+    static const unsigned reuse_factor = 1;
+    typedef Dense_relu_table_t table_t;
+};
+
+struct elu_config4 : nnet::activ_config {
+    static const unsigned n_in = 2;
+    static const unsigned table_size = 1024;
+    static const unsigned io_type = nnet::io_parallel;
+    static const unsigned reuse_factor = 1;
+    typedef Activation_table_t table_t;
+    typedef activation_param_t param_t;
+};
+
+
+#endif
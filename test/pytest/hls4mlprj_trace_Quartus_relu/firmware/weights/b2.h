@@ -0,0 +1,14 @@
+//Numpy array shape [2]
+//Min 0.000000000000
+//Max 0.000000000000
+//Number of zeros 2
+
+#ifndef B2_H_
+#define B2_H_
+
+#ifdef __INTELFPGA_COMPILER__
+hls_init_on_powerup
+#endif
+static const dense_bias_t b2[2] = {0.0000000000, 0.0000000000};
+
+#endif
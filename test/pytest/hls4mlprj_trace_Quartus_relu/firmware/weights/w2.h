@@ -0,0 +1,14 @@
+//Numpy array shape [1, 2]
+//Min 8.362213134766
+//Max 9.207587242126
+//Number of zeros 0
+
+#ifndef W2_H_
+#define W2_H_
+
+#ifdef __INTELFPGA_COMPILER__
+hls_init_on_powerup
+#endif
+static const dense_weight_t w2[2] = {9.2075872421, 8.3622131348};
+
+#endif
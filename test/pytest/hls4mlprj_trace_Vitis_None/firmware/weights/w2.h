@@ -0,0 +1,16 @@
+//Numpy array shape [1, 2]
+//Min 3.463820457458
+//Max 4.426703453064
+//Number of zeros 0
+
+#ifndef W2_H_
+#define W2_H_
+
+#ifndef __SYNTHESIS__
+dense_weight_t w2[2];
+#else
+dense_weight_t w2[2] = {4.4267034531, 3.4638204575};
+
+#endif
+
+#endif
@@ -0,0 +1,16 @@
+//Numpy array shape [1, 2]
+//Min 2.030137777328
+//Max 5.130288600922
+//Number of zeros 0
+
+#ifndef W2_H_
+#define W2_H_
+
+#ifndef __SYNTHESIS__
+dense_weight_t w2[2];
+#else
+dense_weight_t w2[2] = {2.0301377773, 5.1302886009};
+
+#endif
+
+#endif
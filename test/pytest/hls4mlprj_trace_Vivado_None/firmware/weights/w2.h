@@ -0,0 +1,16 @@
+//Numpy array shape [1, 2]
+//Min 6.772313117981
+//Max 8.988049507141
+//Number of zeros 0
+
+#ifndef W2_H_
+#define W2_H_
+
+#ifndef __SYNTHESIS__
+dense_weight_t w2[2];
+#else
+dense_weight_t w2[2] = {6.7723131180, 8.9880495071};
+
+#endif
+
+#endif